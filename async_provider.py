@@ -0,0 +1,87 @@
+"""
+Async provider client
+One aiohttp session for OpenAI, Anthropic, Perplexity and Google Custom Search,
+so the v5.0 stages can run as coroutines on a single event loop.
+
+Requests go straight to the REST endpoints (same payloads the SDKs send).
+Non-2xx responses raise HTTPStatusError, which provider_client.classify_error
+maps onto TransientAPIError / PermanentAPIError like the SDK exceptions.
+
+Usage:
+    async with AsyncProviderClient() as client:
+        data = await client.openai_chat({"model": "gpt-5-mini", "messages": [...]})
+"""
+
+import os
+import asyncio
+from typing import Dict, Optional
+
+OPENAI_URL = "https://api.openai.com/v1/chat/completions"
+ANTHROPIC_URL = "https://api.anthropic.com/v1/messages"
+ANTHROPIC_VERSION = "2023-06-01"
+PERPLEXITY_URL = "https://api.perplexity.ai/chat/completions"
+GOOGLE_CSE_URL = "https://www.googleapis.com/customsearch/v1"
+
+REQUEST_TIMEOUT_SECONDS = 300
+CONNECTION_LIMIT = 50
+
+# Same 1-second pause the sync call_* wrappers use before every request
+REQUEST_DELAY_SECONDS = 1.0
+
+class HTTPStatusError(Exception):
+    """Non-2xx response; carries status_code + response.headers for classify_error/_retry_after"""
+
+    def __init__(self, status_code: int, message: str, response=None):
+        super().__init__(f"HTTP {status_code}: {message}")
+        self.status_code = status_code
+        self.response = response
+
+class AsyncProviderClient:
+    """aiohttp session shared by every async call_* wrapper in a run"""
+
+    def __init__(self, openai_api_key: Optional[str] = None, anthropic_api_key: Optional[str] = None,
+                 perplexity_api_key: Optional[str] = None, request_delay: float = REQUEST_DELAY_SECONDS):
+        self.openai_api_key = openai_api_key or os.getenv("OPENAI_API_KEY")
+        self.anthropic_api_key = anthropic_api_key or os.getenv("ANTHROPIC_API_KEY")
+        self.perplexity_api_key = perplexity_api_key or os.getenv("PERPLEXITY_API_KEY")
+        self.request_delay = request_delay
+        self.session = None  # aiohttp.ClientSession while the client is open
+
+    async def __aenter__(self):
+        import aiohttp  # deferred: importing the pipelines shouldn't pay for aiohttp
+        self.session = aiohttp.ClientSession(
+            timeout=aiohttp.ClientTimeout(total=REQUEST_TIMEOUT_SECONDS),
+            connector=aiohttp.TCPConnector(limit=CONNECTION_LIMIT),
+        )
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.session.close()
+        self.session = None
+
+    async def _request(self, method: str, url: str, **kwargs) -> Dict:
+        await asyncio.sleep(self.request_delay)
+        async with self.session.request(method, url, **kwargs) as response:
+            if response.status >= 400:
+                body = await response.text()
+                raise HTTPStatusError(response.status, body[:300], response)
+            return await response.json(content_type=None)
+
+    async def openai_chat(self, params: Dict) -> Dict:
+        """POST /v1/chat/completions → raw JSON (choices[0].message.content)"""
+        headers = {"Authorization": f"Bearer {self.openai_api_key}"}
+        return await self._request("POST", OPENAI_URL, json=params, headers=headers)
+
+    async def anthropic_messages(self, params: Dict) -> Dict:
+        """POST /v1/messages → raw JSON (content[0].text)"""
+        headers = {"x-api-key": self.anthropic_api_key, "anthropic-version": ANTHROPIC_VERSION}
+        return await self._request("POST", ANTHROPIC_URL, json=params, headers=headers)
+
+    async def perplexity_chat(self, params: Dict) -> Dict:
+        """Perplexity speaks the OpenAI chat completions format"""
+        headers = {"Authorization": f"Bearer {self.perplexity_api_key}"}
+        return await self._request("POST", PERPLEXITY_URL, json=params, headers=headers)
+
+    async def google_search(self, params: Dict) -> Dict:
+        """GET Custom Search JSON API (params: key, cx, q, num)"""
+        return await self._request("GET", GOOGLE_CSE_URL, params=params)
@@ -0,0 +1,372 @@
+#!/usr/bin/env python3
+"""
+Compressed, deduplicated snapshots of the ideas bank
+
+Replaces full hand-made copies like ideas_bank_v3.1_backup.json. A snapshot
+is a gzip'd manifest listing one chunk per idea. Chunks live in a
+content-addressed store (blob_store.py), so an idea that didn't change
+between snapshots is stored once. Big fields (kill reasons, analyses) are
+chunks of their own, so a status change only stores the small row again.
+
+    ideas_bank.snapshots/
+        manifests/20251008-101500-before-rescore.json.gz   {"ideas": [[key, row chunk], ...], ...}
+        chunks/3f/3f2a9c...e1.json.z
+
+    python bank_snapshots.py create --name before-rescore     # ideas_bank.json + journal as it is now
+    python bank_snapshots.py create --source old.json --pin   # import a JSON backup, never pruned
+    python bank_snapshots.py list
+    python bank_snapshots.py diff 20251008-101500 20251009    # ids or unique prefixes
+    python bank_snapshots.py restore 20251008-101500          # becomes the bank (current bank snapshotted first)
+    python bank_snapshots.py restore v3.1 --output old.json   # write a plain JSON file instead
+    python bank_snapshots.py prune                            # apply the retention policy now
+
+Retention runs after every create. Pinned snapshots are always kept. Of the
+rest, the policy keeps the newest SNAPSHOT_KEEP_LAST, plus the newest of each
+of the last SNAPSHOT_KEEP_DAILY days and SNAPSHOT_KEEP_WEEKLY weeks. Chunks
+that no kept snapshot uses are then deleted.
+
+Moving old hand-made backups into snapshots is left to you; import each
+file pinned, check it restores byte for byte, then delete the original:
+
+    python bank_snapshots.py create --source ideas_bank_v3.1_backup.json --name v3.1 --pin
+    python bank_snapshots.py restore v3.1 --output /tmp/v3.1.json
+    cmp ideas_bank_v3.1_backup.json /tmp/v3.1.json && rm ideas_bank_v3.1_backup.json
+
+ideas_bank.snapshots/ is local data (git-ignored), like the bank itself.
+"""
+
+import os
+import re
+import sys
+import gzip
+import json
+import time
+import argparse
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from blob_store import BlobStore, blobs_dir, is_ref, REF_KEY
+from ideas_journal import IDEAS_BANK_FILE, file_lock, keyed, materialize, replace_bank
+
+SNAPSHOT_KEEP_LAST = int(os.getenv("SNAPSHOT_KEEP_LAST", "10"))
+SNAPSHOT_KEEP_DAILY = int(os.getenv("SNAPSHOT_KEEP_DAILY", "7"))
+SNAPSHOT_KEEP_WEEKLY = int(os.getenv("SNAPSHOT_KEEP_WEEKLY", "4"))
+
+def snapshots_dir(bank_path: str) -> str:
+    return os.path.splitext(bank_path)[0] + ".snapshots"
+
+def read_backup(path: str) -> Tuple[List[Dict], Dict, Optional[List[str]]]:
+    """(ideas, other top-level fields, top-level key order) of a bank JSON file ({"ideas": [...]} or a list)"""
+    with open(path, 'r') as f:
+        data = json.load(f)
+    if isinstance(data, list):
+        return data, {}, None
+    extra = {k: v for k, v in data.items() if k != "ideas"}
+    return data.get("ideas", []), extra, list(data)
+
+def plan_retention(manifests: List[Dict], keep_last: int, keep_daily: int, keep_weekly: int,
+                   now: Optional[datetime] = None) -> Set[str]:
+    """Ids of the snapshots the retention policy keeps"""
+    now = now or datetime.now()
+    keep = {m["id"] for m in manifests if m.get("pinned")}
+    rolling = sorted((m for m in manifests if not m.get("pinned")), key=lambda m: m["created"], reverse=True)
+    keep.update(m["id"] for m in rolling[:keep_last])
+    days, weeks = set(), set()
+    for m in rolling:
+        created = datetime.fromisoformat(m["created"])
+        day, week = created.date(), created.isocalendar()[:2]
+        if created > now - timedelta(days=keep_daily) and day not in days:
+            days.add(day)
+            keep.add(m["id"])
+        if created > now - timedelta(weeks=keep_weekly) and week not in weeks:
+            weeks.add(week)
+            keep.add(m["id"])
+    return keep
+
+# ═══════════════════════════════════════════════════════════
+# STORE
+# ═══════════════════════════════════════════════════════════
+
+class SnapshotStore:
+    """The snapshots of one bank file: gzip'd manifests + a shared chunk store"""
+
+    def __init__(self, bank_path: str = IDEAS_BANK_FILE):
+        self.bank_path = bank_path
+        self.root = snapshots_dir(bank_path)
+        self.manifests_dir = os.path.join(self.root, "manifests")
+        self.chunks = BlobStore(os.path.join(self.root, "chunks"))
+        self.bank_blobs = BlobStore(blobs_dir(bank_path))
+
+    # ── manifests ──
+
+    def manifest_path(self, snapshot_id: str) -> str:
+        return os.path.join(self.manifests_dir, snapshot_id + ".json.gz")
+
+    def ids(self) -> List[str]:
+        if not os.path.isdir(self.manifests_dir):
+            return []
+        return sorted(name[:-len(".json.gz")] for name in os.listdir(self.manifests_dir) if name.endswith(".json.gz"))
+
+    def read(self, snapshot_id: str) -> Dict:
+        with gzip.open(self.manifest_path(snapshot_id), 'rt') as f:
+            return json.load(f)
+
+    def manifests(self) -> List[Dict]:
+        return [self.read(snapshot_id) for snapshot_id in self.ids()]
+
+    def resolve(self, ref: str) -> str:
+        """A snapshot id from an id, a unique id prefix or a unique name"""
+        ids = self.ids()
+        if ref in ids:
+            return ref
+        matches = [i for i in ids if i.startswith(ref) or i.endswith("-" + ref)]
+        if len(matches) != 1:
+            problem = "No snapshot" if not matches else f"{len(matches)} snapshots"
+            raise KeyError(f"{problem} matching '{ref}' (python bank_snapshots.py list)")
+        return matches[0]
+
+    def _write_manifest(self, manifest: Dict):
+        os.makedirs(self.manifests_dir, exist_ok=True)
+        path = self.manifest_path(manifest["id"])
+        tmp_path = path + ".tmp"
+        with gzip.open(tmp_path, 'wt') as f:
+            json.dump(manifest, f)
+        os.replace(tmp_path, path)
+
+    def _new_id(self, name: Optional[str]) -> str:
+        base = datetime.now().strftime("%Y%m%d-%H%M%S")
+        if name:
+            base += "-" + re.sub(r"[^A-Za-z0-9_.]+", "-", name).strip("-")
+        snapshot_id, n = base, 2
+        while os.path.exists(self.manifest_path(snapshot_id)):
+            snapshot_id, n = f"{base}-{n}", n + 1
+        return snapshot_id
+
+    # ── create ──
+
+    def _store_idea(self, idea: Dict) -> str:
+        """Chunk digest of an idea's row; big fields become chunks of their own"""
+        row = {}
+        for field, value in dict.items(idea):
+            if is_ref(value):
+                # Already a blob in the live bank: same digest here, copy the compressed file as-is
+                self.chunks.copy_from(self.bank_blobs, value[REF_KEY])
+                row[field] = value
+            else:
+                row[field] = self.chunks.slim_field(field, value)
+        return self.chunks.put(row)[REF_KEY]
+
+    def create(self, name: Optional[str] = None, source: Optional[str] = None, pinned: bool = False,
+               prune: bool = True) -> Dict:
+        """Snapshot the bank (snapshot + journal) or a JSON backup file; returns the manifest"""
+        if source:
+            ideas, extra, layout = read_backup(source)
+        else:
+            ideas, extra, layout = list(materialize(self.bank_path)[0].values()), {}, ["ideas"]
+        started = time.time()
+        written, written_bytes = self.chunks.written, self.chunks.written_bytes
+
+        with file_lock(self.root):
+            entries = [[key, self._store_idea(idea)] for key, idea in keyed(ideas)]
+            manifest = {
+                "id": self._new_id(name),
+                "name": name,
+                "created": datetime.now().isoformat(timespec="seconds"),
+                "source": source or self.bank_path,
+                "pinned": pinned,
+                "count": len(entries),
+                "layout": layout,
+                "extra": self.chunks.put(extra)[REF_KEY] if extra else None,
+                "new_chunks": self.chunks.written - written,
+                "new_kb": round((self.chunks.written_bytes - written_bytes) / 1024, 1),
+                "ideas": entries,
+            }
+            manifest["seconds"] = round(time.time() - started, 2)
+            self.chunks.sync()  # chunks before the manifest that lists them
+            self._write_manifest(manifest)
+
+        if prune:
+            self.prune()
+        return manifest
+
+    # ── read back ──
+
+    def rows(self, manifest: Dict) -> List[Dict]:
+        """The snapshot's idea rows, big fields still as references"""
+        cache: Dict[str, Dict] = {}
+        rows = []
+        for _, digest in manifest["ideas"]:
+            if digest not in cache:
+                cache[digest] = self.chunks.get({REF_KEY: digest})
+            rows.append(dict(cache[digest]))
+        return rows
+
+    def hydrate(self, row: Dict) -> Dict:
+        return {field: self.chunks.get(value) if is_ref(value) else value for field, value in row.items()}
+
+    def restore(self, snapshot_id: str, output: Optional[str] = None) -> int:
+        """Write the snapshot to `output`, or make it the bank; returns ideas restored"""
+        manifest = self.read(snapshot_id)
+        rows = self.rows(manifest)
+        extra = self.chunks.get({REF_KEY: manifest["extra"]}) if manifest.get("extra") else {}
+
+        if output:
+            ideas = [self.hydrate(row) for row in rows]
+            layout = manifest.get("layout")
+            data = ideas if layout is None else {k: ideas if k == "ideas" else extra[k] for k in layout}
+            with open(output, 'w') as f:
+                json.dump(data, f, indent=2)
+            return len(ideas)
+
+        if extra:
+            print(f"⚠️  {', '.join(extra)} not restored into the bank (use --output for the full file)")
+        self.create(name="pre-restore", prune=False)
+        # Bodies go to the bank's blob store as compressed files; rows keep their references
+        for row in rows:
+            for value in row.values():
+                if is_ref(value):
+                    self.bank_blobs.copy_from(self.chunks, value[REF_KEY])
+        self.bank_blobs.sync()
+        replace_bank(self.bank_path, rows)
+        return len(rows)
+
+    def diff(self, old_id: str, new_id: str) -> Dict:
+        """Ideas added, removed and changed between two snapshots; only changed rows are read"""
+        old, new = self.read(old_id), self.read(new_id)
+        old_keys, new_keys = dict(old["ideas"]), dict(new["ideas"])
+        changed = []
+        for key, digest in new_keys.items():
+            if key in old_keys and old_keys[key] != digest:
+                before = self.chunks.get({REF_KEY: old_keys[key]})
+                after = self.chunks.get({REF_KEY: digest})
+                fields = [f for f in list(before) + [f for f in after if f not in before]
+                          if f != "status" and before.get(f) != after.get(f)]
+                changed.append({"key": key, "business": after.get("business"), "from": before.get("status"),
+                                "to": after.get("status"), "fields": fields})
+        return {
+            "added": [k for k in new_keys if k not in old_keys],
+            "removed": [k for k in old_keys if k not in new_keys],
+            "changed": changed,
+            "unchanged": sum(1 for k, d in new_keys.items() if old_keys.get(k) == d),
+        }
+
+    # ── retention ──
+
+    def delete(self, snapshot_id: str):
+        os.remove(self.manifest_path(snapshot_id))
+
+    def prune(self, keep_last: int = SNAPSHOT_KEEP_LAST, keep_daily: int = SNAPSHOT_KEEP_DAILY,
+              keep_weekly: int = SNAPSHOT_KEEP_WEEKLY) -> Tuple[List[str], int]:
+        """Apply the retention policy, then drop unused chunks; returns (snapshots deleted, chunks deleted)"""
+        with file_lock(self.root):
+            manifests = self.manifests()
+            keep = plan_retention(manifests, keep_last, keep_daily, keep_weekly)
+            deleted = [m["id"] for m in manifests if m["id"] not in keep]
+            for snapshot_id in deleted:
+                self.delete(snapshot_id)
+            chunks_deleted = self.chunks.gc(self._live_chunks(m for m in manifests if m["id"] in keep),
+                                            grace_seconds=0) if deleted else 0
+        return deleted, chunks_deleted
+
+    def _live_chunks(self, manifests: Iterable[Dict]) -> Set[str]:
+        live: Set[str] = set()
+        for manifest in manifests:
+            if manifest.get("extra"):
+                live.add(manifest["extra"])
+            for _, digest in manifest["ideas"]:
+                if digest in live:
+                    continue
+                live.add(digest)
+                live.update(v[REF_KEY] for v in self.chunks.get({REF_KEY: digest}).values() if is_ref(v))
+        return live
+
+# ═══════════════════════════════════════════════════════════
+# CLI
+# ═══════════════════════════════════════════════════════════
+
+def print_diff(result: Dict, limit: int):
+    print(f"➕ {len(result['added'])} added   ➖ {len(result['removed'])} removed   "
+          f"✏️  {len(result['changed'])} changed   {result['unchanged']} unchanged")
+    for change in result["changed"][:limit]:
+        status = f"{change['from']} → {change['to']}" if change["from"] != change["to"] else change["to"]
+        fields = f" ({', '.join(change['fields'])})" if change["fields"] else ""
+        print(f"   {change['key']:<16} {str(change['business'])[:30]:<30} {status}{fields}")
+    if len(result["changed"]) > limit:
+        print(f"   ... {len(result['changed']) - limit} more")
+
+def find(store: SnapshotStore, ref: str) -> str:
+    try:
+        return store.resolve(ref)
+    except KeyError as e:
+        print(f"❌ {e.args[0]}")
+        sys.exit(1)
+
+def main():
+    parser = argparse.ArgumentParser(description="Compressed, deduplicated snapshots of the ideas bank")
+    parser.add_argument("--bank", default=IDEAS_BANK_FILE)
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p_create = sub.add_parser("create", help="Snapshot the bank (or import a JSON backup)")
+    p_create.add_argument("--name", type=str)
+    p_create.add_argument("--source", type=str, help="Bank JSON file to import instead of the live bank")
+    p_create.add_argument("--pin", action="store_true", help="Never remove this snapshot when pruning")
+
+    sub.add_parser("list", help="Snapshots with sizes")
+
+    p_diff = sub.add_parser("diff", help="Ideas added / removed / changed between two snapshots")
+    p_diff.add_argument("old")
+    p_diff.add_argument("new", nargs="?", help="Default: the newest snapshot")
+    p_diff.add_argument("--limit", type=int, default=30, help="Changed ideas to list")
+
+    p_restore = sub.add_parser("restore", help="Make a snapshot the bank, or write it to a file")
+    p_restore.add_argument("snapshot")
+    p_restore.add_argument("--output", type=str, help="Write a plain JSON bank file instead")
+
+    p_prune = sub.add_parser("prune", help="Apply the retention policy and drop unused chunks")
+    p_prune.add_argument("--keep-last", type=int, default=SNAPSHOT_KEEP_LAST)
+    p_prune.add_argument("--keep-daily", type=int, default=SNAPSHOT_KEEP_DAILY)
+    p_prune.add_argument("--keep-weekly", type=int, default=SNAPSHOT_KEEP_WEEKLY)
+
+    args = parser.parse_args()
+    store = SnapshotStore(args.bank)
+
+    if args.command == "create":
+        manifest = store.create(args.name, args.source, args.pin)
+        print(f"📸 Snapshot {manifest['id']}: {manifest['count']} ideas, {manifest['new_chunks']} new chunks "
+              f"({manifest['new_kb']} KB) in {manifest['seconds']}s")
+
+    elif args.command == "list":
+        manifests = store.manifests()
+        if not manifests:
+            print("No snapshots yet. Run: python bank_snapshots.py create")
+            return
+        print(f"{'id':<42}{'ideas':>8}{'new KB':>10}  source")
+        for m in manifests:
+            pin = " 📌" if m.get("pinned") else ""
+            print(f"{m['id']:<42}{m['count']:>8}{m['new_kb']:>10}  {m['source']}{pin}")
+        stored = sum(os.path.getsize(store.chunks.path(d)) for d in store.chunks.digests())
+        print(f"💾 {len(manifests)} snapshots, {stored / 1024 / 1024:.1f} MB of chunks")
+
+    elif args.command == "diff":
+        old = find(store, args.old)
+        new = find(store, args.new) if args.new else max(store.manifests(), key=lambda m: m["created"])["id"]
+        print(f"🔍 {old} → {new}")
+        print_diff(store.diff(old, new), args.limit)
+
+    elif args.command == "restore":
+        snapshot_id = find(store, args.snapshot)
+        started = time.time()
+        restored = store.restore(snapshot_id, args.output)
+        target = args.output or f"{args.bank} (previous bank kept as a pre-restore snapshot)"
+        print(f"♻️  Restored {restored} ideas from {snapshot_id} → {target} in {time.time() - started:.1f}s")
+        if not args.output:
+            print("   Restart running pipelines so they reload the bank")
+
+    elif args.command == "prune":
+        deleted, chunks = store.prune(args.keep_last, args.keep_daily, args.keep_weekly)
+        print(f"🧹 Removed {len(deleted)} snapshots and {chunks} chunks")
+        for snapshot_id in deleted:
+            print(f"   {snapshot_id}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,289 @@
+"""
+Batched binary filter stages
+Evaluates N ideas per LLM call for the cheap PASS/KILL stages (white space,
+build feasibility, founder fit) instead of re-sending the same instruction
+block - and for Stage 6 the whole founder profile - once per idea.
+
+The model returns {"results": [{"id": <idea id>, ...stage fields...}, ...]}.
+Every item is validated against the stage's required fields; ideas that are
+missing or malformed are re-run individually through the normal stage
+function, so a batched stage never produces a verdict the single path
+wouldn't.
+
+Usage in a pipeline:
+    stage = BatchedStage(spec, single_fn, call_openai, max_batch=10)
+    stage.prefetch(ideas)                     # batched calls
+    run_stage_batch(ideas, stage, "Stage 3: Build")   # cached results, single fallback
+
+AsyncBatchedStage is the same for coroutine stages (v5.0): prefetch() and
+the stage call are awaited, and a stage's batches run concurrently.
+"""
+
+import json
+import asyncio
+from typing import Callable, Dict, List, Optional
+
+from provider_client import ProviderError, set_dedup_scope
+from v5_stages_2_through_7 import (
+    STAGE3_CRITERIA, STAGE3_FIELDS, stage3_prevalidated, evaluate_stage3,
+    STAGE6_ASSESSMENT, STAGE6_FIELDS, STAGE6_RULE, founder_profile_block, evaluate_stage6,
+)
+
+# ═══════════════════════════════════════════════════════════
+# TOKEN BUDGET
+# ═══════════════════════════════════════════════════════════
+
+# Per call. Output is the binding limit: the wrappers cap completions at 4000-8000
+# tokens and gpt-5-mini spends part of that on reasoning.
+OUTPUT_TOKEN_BUDGET = 4000
+REASONING_RESERVE_TOKENS = 1200
+INPUT_TOKEN_BUDGET = 12000
+
+DEFAULT_MAX_BATCH = 10
+
+def estimate_tokens(text: str) -> int:
+    """~4 characters per token"""
+    return len(text) // 4 + 1
+
+def idea_line(idea: Dict) -> str:
+    return f"[ID {idea['id']}] Business: {idea['business']}\n         Pain: {idea['pain']}"
+
+def plan_batches(ideas: List[Dict], spec: Dict, max_batch: int = DEFAULT_MAX_BATCH,
+                 output_budget: int = OUTPUT_TOKEN_BUDGET, input_budget: int = INPUT_TOKEN_BUDGET) -> List[List[Dict]]:
+    """
+    Greedy packing: add ideas to a batch until max_batch, the output budget
+    (per-idea answer size) or the input budget (shared instructions + idea lines) is hit
+    """
+    shared_tokens = estimate_tokens(spec["instructions"]) + estimate_tokens(spec["fields"]) + 150
+    output_per_idea = spec["output_tokens_per_idea"]
+
+    batches = []
+    current, input_used, output_used = [], shared_tokens, REASONING_RESERVE_TOKENS
+    for idea in ideas:
+        idea_tokens = estimate_tokens(idea_line(idea))
+        full = current and (
+            len(current) >= max_batch or
+            output_used + output_per_idea > output_budget or
+            input_used + idea_tokens > input_budget
+        )
+        if full:
+            batches.append(current)
+            current, input_used, output_used = [], shared_tokens, REASONING_RESERVE_TOKENS
+        current.append(idea)
+        input_used += idea_tokens
+        output_used += output_per_idea
+    if current:
+        batches.append(current)
+    return batches
+
+# ═══════════════════════════════════════════════════════════
+# PROMPT + VALIDATION
+# ═══════════════════════════════════════════════════════════
+
+def build_batch_prompt(batch: List[Dict], spec: Dict) -> str:
+    ideas_block = "\n\n".join(idea_line(idea) for idea in batch)
+    return f"""{spec['header']}
+
+Evaluate EACH idea below independently. Do not compare ideas with each other.
+
+IDEAS ({len(batch)}):
+{ideas_block}
+
+{spec['instructions']}
+
+Return JSON with exactly one result per idea ID listed above:
+{{
+  "results": [
+    {{
+  "id": <idea ID>,
+{spec['fields']}    }}
+  ]
+}}
+"""
+
+def parse_batch_response(response: Optional[str], batch: List[Dict], spec: Dict) -> Dict[str, Dict]:
+    """Valid per-idea results keyed by str(idea id); anything else is left out"""
+    if not response:
+        return {}
+    try:
+        data = json.loads(response)
+    except json.JSONDecodeError:
+        return {}
+
+    items = data.get("results") if isinstance(data, dict) else data
+    if not isinstance(items, list):
+        return {}
+
+    wanted = {str(idea["id"]) for idea in batch}
+    valid = {}
+    for item in items:
+        if not isinstance(item, dict):
+            continue
+        idea_id = str(item.get("id"))
+        if idea_id not in wanted or idea_id in valid:
+            continue
+        if any(key not in item for key in spec["required_keys"]):
+            continue
+        if item.get("decision") not in ("PASS", "KILL"):
+            continue
+        valid[idea_id] = {k: v for k, v in item.items() if k != "id"}
+    return valid
+
+# ═══════════════════════════════════════════════════════════
+# BATCHED STAGE
+# ═══════════════════════════════════════════════════════════
+
+class BatchedStage:
+    """
+    Callable stage function backed by batched prefetching
+
+    spec keys:
+        header, instructions, fields   prompt pieces (shared with the single prompt)
+        required_keys                  fields every per-idea result must have
+        evaluate(data) -> result       same evaluator the single path uses
+        skip(idea) -> result | None    optional short-circuit (no LLM call)
+        model, output_tokens_per_idea
+    """
+
+    def __init__(self, spec: Dict, single_fn: Callable, call_openai_fn: Callable,
+                 max_batch: int = DEFAULT_MAX_BATCH, output_budget: int = OUTPUT_TOKEN_BUDGET):
+        self.spec = spec
+        self.single_fn = single_fn
+        self.call_openai_fn = call_openai_fn
+        self.max_batch = max_batch
+        self.output_budget = output_budget
+        self.results: Dict[str, Dict] = {}
+        self.skipped: Dict[str, Optional[Dict]] = {}  # skip(idea) outcomes from _plan, so it runs once
+        self.stats = {"batches": 0, "batched_ideas": 0, "fallbacks": 0}
+
+    def _plan(self, ideas: List[Dict], stage_name: Optional[str]) -> List[List[Dict]]:
+        set_dedup_scope(stage_name or self.spec["name"])
+        skip = self.spec.get("skip")
+        pending = []
+        for idea in ideas:
+            key = str(idea["id"])
+            if key in self.results:
+                continue
+            if skip:
+                self.skipped[key] = skip(idea)
+                if self.skipped[key]:
+                    continue
+            pending.append(idea)
+        if not pending:
+            return []
+
+        batches = plan_batches(pending, self.spec, self.max_batch, self.output_budget)
+        print(f"\n📦 Batched {self.spec['name']}: {len(pending)} ideas in {len(batches)} call(s)")
+        return batches
+
+    def _collect(self, batch: List[Dict], response: Optional[str]):
+        valid = parse_batch_response(response, batch, self.spec)
+        self.results.update(valid)
+        self.stats["batches"] += 1
+        self.stats["batched_ideas"] += len(valid)
+        missing = len(batch) - len(valid)
+        if missing:
+            print(f"   ⚠️  {missing}/{len(batch)} results missing or malformed - re-running individually")
+
+    def _batch_failed(self, error: ProviderError):
+        # Single-idea calls will retry (and defer) each idea on their own
+        print(f"   ⚠️  Batch call failed ({error}) - falling back to single calls")
+
+    def _cached(self, idea: Dict) -> Optional[Dict]:
+        """Skip result or batched verdict; None means the single-idea call is needed"""
+        skip = self.spec.get("skip")
+        if skip:
+            key = str(idea["id"])
+            skipped = self.skipped.pop(key) if key in self.skipped else skip(idea)
+            if skipped:
+                return skipped
+
+        data = self.results.pop(str(idea["id"]), None)
+        if data is None:
+            self.stats["fallbacks"] += 1
+            return None
+
+        print(f"   📦 Idea #{idea['id']} (batched result)")
+        return self.spec["evaluate"](data)
+
+    def prefetch(self, ideas: List[Dict], stage_name: Optional[str] = None):
+        """Run batched calls for every idea that needs the LLM"""
+        for batch in self._plan(ideas, stage_name):
+            try:
+                response = self.call_openai_fn(build_batch_prompt(batch, self.spec),
+                                               model=self.spec["model"], response_format="json")
+            except ProviderError as e:
+                self._batch_failed(e)
+                continue
+            self._collect(batch, response)
+
+    def __call__(self, idea: Dict) -> Dict:
+        result = self._cached(idea)
+        return result if result is not None else self.single_fn(idea)
+
+class AsyncBatchedStage(BatchedStage):
+    """BatchedStage for coroutine stages: single_fn and call_openai_fn are async"""
+
+    async def prefetch(self, ideas: List[Dict], stage_name: Optional[str] = None):
+        async def run_batch(batch):
+            try:
+                response = await self.call_openai_fn(build_batch_prompt(batch, self.spec),
+                                                     model=self.spec["model"], response_format="json")
+            except ProviderError as e:
+                self._batch_failed(e)
+                return
+            self._collect(batch, response)
+
+        await asyncio.gather(*(run_batch(batch) for batch in self._plan(ideas, stage_name)))
+
+    async def __call__(self, idea: Dict) -> Dict:
+        result = self._cached(idea)
+        return result if result is not None else await self.single_fn(idea)
+
+# ═══════════════════════════════════════════════════════════
+# STAGE SPECS
+# ═══════════════════════════════════════════════════════════
+
+def required_keys(fields: str) -> List[str]:
+    """Field names from a prompt's JSON field block ('  "decision": "PASS"/"KILL",' → 'decision')"""
+    keys = []
+    for line in fields.splitlines():
+        line = line.strip()
+        if line.startswith('"') and '":' in line:
+            keys.append(line[1:line.index('":')])
+    return keys
+
+def stage_spec(name: str, header: str, instructions: str, fields: str, evaluate: Callable,
+               skip: Optional[Callable] = None, output_tokens_per_idea: int = 200) -> Dict:
+    return {
+        "name": name,
+        "model": "gpt-5-mini",
+        "header": header,
+        "instructions": instructions,
+        "fields": fields,
+        "required_keys": required_keys(fields),
+        "evaluate": evaluate,
+        "skip": skip,
+        "output_tokens_per_idea": output_tokens_per_idea,
+    }
+
+STAGE3_BATCH_SPEC = stage_spec(
+    "Stage 3: Build",
+    "Analyze build feasibility for each business idea below.",
+    STAGE3_CRITERIA,
+    STAGE3_FIELDS,
+    evaluate_stage3,
+    skip=stage3_prevalidated,
+    output_tokens_per_idea=220,
+)
+
+def stage6_batch_spec(founder_profile: Dict) -> Dict:
+    """The founder profile is sent once per batch instead of once per idea"""
+    return stage_spec(
+        "Stage 6: Founder Fit",
+        f"Founder-market fit analysis for each idea below.\n\n{founder_profile_block(founder_profile)}",
+        f"{STAGE6_ASSESSMENT}\n\n{STAGE6_RULE}",
+        STAGE6_FIELDS,
+        evaluate_stage6,
+        output_tokens_per_idea=260,
+    )
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+ANALYTICS BENCHMARK - stage funnel from the JSON bank vs the Parquet export
+
+Per bank size (synthetic, benchmarks/synthetic_bank.py):
+- dict walk: load_bank + the dashboard's passed_stage loop for stages 1-6
+- export: parquet_export.py from scratch, then again after one status change
+  (only that idea's run is rewritten)
+- query: the same funnel from analytics/stage_verdicts with pyarrow, and
+  with DuckDB if installed
+
+Usage:
+    python benchmarks/bench_analytics.py
+    python benchmarks/bench_analytics.py --sizes 10000,100000 --payload-scale 0.1
+"""
+
+import os
+import sys
+import time
+import shutil
+import argparse
+import tempfile
+import contextlib
+from typing import Dict, List
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_DIR = os.path.dirname(BENCH_DIR)
+sys.path.insert(0, REPO_DIR)
+sys.path.insert(0, BENCH_DIR)
+
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+
+from ideas_journal import load_bank, open_journal
+from parquet_export import export
+from synthetic_bank import write_bank
+
+FUNNEL_SQL = """
+SELECT stage, count(*) FILTER (WHERE passed) AS passed
+FROM read_parquet('analytics/stage_verdicts/*/*.parquet', hive_partitioning=1)
+GROUP BY stage ORDER BY stage
+"""
+
+# ═══════════════════════════════════════════════════════════
+# MEASUREMENTS
+# ═══════════════════════════════════════════════════════════
+
+def passed_stage(idea: Dict, stage_num: int) -> bool:
+    """dashboard.py's check, verbatim in behaviour"""
+    status = idea.get("status", "")
+    if status == "FINALIST" or status == "WINNER":
+        return True
+    if status.startswith("killed_stage"):
+        try:
+            killed_stage = int(status.replace("killed_stage", "").replace("killed_", "").strip())
+            return killed_stage > stage_num
+        except (ValueError, AttributeError):
+            pass
+    stage_key = f"stage_{stage_num}_"
+    return any(key.startswith(stage_key) for key in idea.keys())
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, round(time.perf_counter() - start, 3)
+
+def dict_funnel() -> List[int]:
+    ideas = load_bank()
+    return [sum(1 for idea in ideas if passed_stage(idea, stage)) for stage in range(1, 7)]
+
+def arrow_funnel() -> Dict[int, int]:
+    table = ds.dataset("analytics/stage_verdicts", format="parquet", partitioning="hive").to_table(
+        columns=["stage", "passed"], filter=pc.field("passed"))
+    counts = table.group_by("stage").aggregate([("passed", "count")])
+    return dict(zip(counts["stage"].to_pylist(), counts["passed_count"].to_pylist()))
+
+def duckdb_funnel():
+    import duckdb
+    return duckdb.sql(FUNNEL_SQL).fetchall()
+
+def run_size(size: int, payload_scale: float, seed: int) -> Dict:
+    workdir = tempfile.mkdtemp(prefix=f"bench_analytics_{size}_")
+    cwd = os.getcwd()
+    try:
+        os.chdir(workdir)
+        write_bank("ideas_bank.json", size, seed=seed, payload_scale=payload_scale)
+        result = {"size": size}
+        _, result["dict_funnel_s"] = timed(dict_funnel)
+
+        with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+            summary, result["export_s"] = timed(lambda: export(full=True))
+            result["partitions"] = summary["ideas"]["partitions"]
+
+            journal = open_journal()
+            bank = journal.load()
+            bank[len(bank) // 2]["status"] = "killed_stage3"
+            journal.save(bank)
+            journal.sync()
+            summary, result["reexport_s"] = timed(export)
+            result["rewritten"] = summary["ideas"]["written"]
+
+        _, result["arrow_query_ms"] = timed(arrow_funnel)
+        result["arrow_query_ms"] = round(result["arrow_query_ms"] * 1000, 1)
+        result["duckdb_query_ms"] = None
+        try:
+            duckdb_funnel()  # first call loads the extension
+            _, seconds = timed(duckdb_funnel)
+            result["duckdb_query_ms"] = round(seconds * 1000, 1)
+        except ImportError:
+            pass
+        return result
+    finally:
+        os.chdir(cwd)
+        shutil.rmtree(workdir, ignore_errors=True)
+
+# ═══════════════════════════════════════════════════════════
+# MAIN
+# ═══════════════════════════════════════════════════════════
+
+def main():
+    parser = argparse.ArgumentParser(description="Funnel query: JSON dict walk vs Parquet export")
+    parser.add_argument("--sizes", type=str, default="10000,100000")
+    parser.add_argument("--payload-scale", type=float, default=0.1)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    print("="*80)
+    print("📊 ANALYTICS BENCHMARK")
+    print("="*80)
+    results = []
+    for size in [int(s) for s in args.sizes.split(",") if s.strip()]:
+        print(f"⏱️  {size:,} ideas...", flush=True)
+        results.append(run_size(size, args.payload_scale, args.seed))
+
+    print(f"\n{'IDEAS':>9} {'DICT WALK':>10} {'EXPORT':>8} {'RE-EXPORT':>10} {'RUNS':>11} "
+          f"{'ARROW':>9} {'DUCKDB':>9}")
+    print("-" * 72)
+    for r in results:
+        duck = f"{r['duckdb_query_ms']}ms" if r["duckdb_query_ms"] is not None else "n/a"
+        print(f"{r['size']:>9,} {r['dict_funnel_s']:>9}s {r['export_s']:>7}s {r['reexport_s']:>9}s "
+              f"{r['rewritten']:>4}/{r['partitions']:<6} {r['arrow_query_ms']:>7}ms {duck:>9}")
+
+if __name__ == "__main__":
+    main()
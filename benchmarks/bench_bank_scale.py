@@ -0,0 +1,288 @@
+#!/usr/bin/env python3
+"""
+IDEAS BANK SCALE BENCHMARK - load time, memory and query latency at 10k-1M ideas
+
+Generates synthetic banks (benchmarks/synthetic_bank.py) and measures, per size:
+- load_ideas_bank: wall time and RSS growth
+- idea_exists: p50/p95 latency for hits and misses
+- Stage 0 dedupe: the v6.0 main() loop over a batch of new ideas
+- save_ideas_bank: wall time of a save after Stage 0 and of a one-status save (journal appends)
+- journal compaction: wall time and snapshot size (big fields moved to the blob store)
+- reload: load_ideas_bank on the compacted bank, bodies left in the blob store
+- dashboard.py: first render via streamlit's AppTest (skipped if streamlit is missing)
+
+Usage:
+    python benchmarks/bench_bank_scale.py
+    python benchmarks/bench_bank_scale.py --sizes 10000,100000,1000000 --payload-scale 0.1
+    python benchmarks/bench_bank_scale.py --sizes 10000 --no-dashboard
+
+Each size runs in its own subprocess so memory numbers don't bleed across sizes.
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import shutil
+import argparse
+import resource
+import tempfile
+import subprocess
+import contextlib
+from datetime import datetime
+from typing import Dict, List
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_DIR = os.path.dirname(BENCH_DIR)
+sys.path.insert(0, REPO_DIR)
+sys.path.insert(0, BENCH_DIR)
+
+from ideas_journal import IdeasJournal, journal_path
+from pipeline_versions import load_pipeline
+from synthetic_bank import write_bank
+from synthetic_ideas import make_idea
+from bench_pipelines import load_results, save_results, compare
+
+RESULTS_FILE = os.path.join(BENCH_DIR, "bank_scale_results.json")
+
+LOWER_IS_BETTER = ["load_s", "load_rss_mb", "exists_hit_p95_ms", "exists_miss_p95_ms",
+                   "dedupe_batch_s", "save_s", "save_one_s", "compact_s", "reload_s", "dashboard_s"]
+
+# The bank functions are identical across v4.0-v6.0; benchmark the current generation
+BANK_VERSION = "v6.0"
+
+# ═══════════════════════════════════════════════════════════
+# MEASUREMENTS
+# ═══════════════════════════════════════════════════════════
+
+def rss_mb() -> float:
+    """Peak RSS of this process so far (Linux reports KB)"""
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+def percentile(samples: List[float], pct: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct))]
+
+def time_queries(module, bank: List[Dict], queries: List[Dict]) -> Dict:
+    """Per-call idea_exists latency in ms"""
+    samples = []
+    for q in queries:
+        start = time.perf_counter()
+        module.idea_exists(bank, q["business"], q["pain"])
+        samples.append((time.perf_counter() - start) * 1000)
+    return {"p50": round(percentile(samples, 0.50), 3), "p95": round(percentile(samples, 0.95), 3)}
+
+def dedupe_batch(module, bank: List[Dict], new_ideas: List[Dict]) -> int:
+    """Stage 0 duplicate filter exactly as ultimate_winner_machine_v6.0.main() runs it"""
+    kept = 0
+    next_id = len(bank) + 1
+    for idea in new_ideas:
+        if not module.idea_exists(bank, idea["business"], idea["pain"]):
+            idea["id"] = next_id
+            idea["hash"] = module.generate_idea_hash(idea["business"], idea["pain"])
+            bank.append(idea)
+            next_id += 1
+            kept += 1
+    return kept
+
+def render_dashboard(timeout: int) -> float:
+    """Seconds for one full dashboard.py script run against ./ideas_bank.json"""
+    from streamlit.testing.v1 import AppTest
+
+    app = AppTest.from_file(os.path.join(REPO_DIR, "dashboard.py"), default_timeout=timeout)
+    start = time.perf_counter()
+    app.run()
+    elapsed = time.perf_counter() - start
+    if app.exception:
+        raise RuntimeError(str(app.exception[0].message))
+    return elapsed
+
+def run_worker(bank_file: str, result_file: str, queries: int, batch: int, seed: int, dashboard: bool, timeout: int):
+    os.environ.setdefault("OPENAI_API_KEY", "bench-dummy-key")
+    os.environ.setdefault("ANTHROPIC_API_KEY", "bench-dummy-key")
+
+    # Pipelines and the dashboard use ./ideas_bank.json
+    os.chdir(os.path.dirname(bank_file))
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        module = load_pipeline(BANK_VERSION)
+
+    rng = random.Random(seed)
+    result = {"file_mb": round(os.path.getsize(bank_file) / 1024 / 1024, 1)}
+
+    # Load
+    rss_before = rss_mb()
+    start = time.perf_counter()
+    bank = module.load_ideas_bank()
+    result["load_s"] = round(time.perf_counter() - start, 3)
+    result["load_rss_mb"] = round(rss_mb() - rss_before, 1)
+    result["ideas"] = len(bank)
+
+    # Lookups: hits sampled from the bank, misses are fresh ideas
+    hits = rng.sample(bank, min(queries, len(bank)))
+    misses = [make_idea(rng, 0) for _ in range(queries)]
+    hit_stats = time_queries(module, bank, hits)
+    miss_stats = time_queries(module, bank, misses)
+    result["exists_hit_p50_ms"], result["exists_hit_p95_ms"] = hit_stats["p50"], hit_stats["p95"]
+    result["exists_miss_p50_ms"], result["exists_miss_p95_ms"] = miss_stats["p50"], miss_stats["p95"]
+
+    # Stage 0 dedupe: a realistic batch with ~10% already in the bank
+    new_ideas = [make_idea(rng, 0) for _ in range(batch)]
+    for idea in rng.sample(new_ideas, batch // 10):
+        source = rng.choice(bank)
+        idea["business"], idea["pain"] = source["business"], source["pain"]
+    start = time.perf_counter()
+    result["dedupe_kept"] = dedupe_batch(module, bank, new_ideas)
+    result["dedupe_batch_s"] = round(time.perf_counter() - start, 3)
+
+    # Save, as every pipeline run does after each stage: journals the new ideas from the dedupe batch
+    start = time.perf_counter()
+    module.save_ideas_bank(bank)
+    result["save_s"] = round(time.perf_counter() - start, 3)
+
+    # One status change - the common case mid-run
+    bank[rng.randrange(len(bank))]["status"] = "killed_stage1"
+    start = time.perf_counter()
+    module.save_ideas_bank(bank)
+    result["save_one_s"] = round(time.perf_counter() - start, 3)
+    result["journal_kb"] = round(os.path.getsize(journal_path(bank_file)) / 1024, 1)
+    del bank
+
+    # Fold the journal into a new snapshot (runs on a background thread in the pipelines)
+    start = time.perf_counter()
+    IdeasJournal(bank_file).compact()
+    result["compact_s"] = round(time.perf_counter() - start, 3)
+    result["saved_file_mb"] = round(os.path.getsize(bank_file) / 1024 / 1024, 1)
+
+    # Load again: the snapshot now holds blob references, bodies are read on first use
+    start = time.perf_counter()
+    bank = module.load_ideas_bank()
+    result["reload_s"] = round(time.perf_counter() - start, 3)
+    del bank
+
+    # Dashboard reads ./ideas_bank.json, same file the pipeline just saved
+    result["dashboard_s"] = None
+    if dashboard:
+        try:
+            result["dashboard_s"] = round(render_dashboard(timeout), 3)
+        except ImportError:
+            result["dashboard_error"] = "streamlit not installed"
+        except Exception as e:
+            result["dashboard_error"] = str(e)[:200]
+
+    result["peak_rss_mb"] = round(rss_mb(), 1)
+
+    with open(result_file, 'w') as f:
+        json.dump(result, f, indent=2)
+
+# ═══════════════════════════════════════════════════════════
+# MAIN
+# ═══════════════════════════════════════════════════════════
+
+def print_table(results: List[Dict]):
+    print(f"\n{'IDEAS':>9} {'FILE MB':>8} {'LOAD':>8} {'RSS MB':>8} {'HIT p95':>9} {'MISS p95':>9} "
+          f"{'DEDUPE':>8} {'SAVE':>8} {'SAVE 1':>8} {'COMPACT':>8} {'RELOAD':>8} {'DASH':>8}")
+    print("-" * 113)
+    for r in results:
+        if "error" in r:
+            print(f"{r['size']:>9,} ❌ {r['error'][:70]}")
+            continue
+        dash = f"{r['dashboard_s']}s" if r["dashboard_s"] is not None else "n/a"
+        print(f"{r['ideas']:>9,} {r['file_mb']:>8} {r['load_s']:>7}s {r['load_rss_mb']:>8} "
+              f"{r['exists_hit_p95_ms']:>7}ms {r['exists_miss_p95_ms']:>7}ms {r['dedupe_batch_s']:>7}s "
+              f"{r['save_s']:>7}s {r['save_one_s']:>7}s {r['compact_s']:>7}s {r['reload_s']:>7}s {dash:>8}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark ideas bank operations at scale")
+    parser.add_argument("--sizes", type=str, default="10000,100000", help="Comma-separated bank sizes")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--payload-scale", type=float, default=1.0, help="Multiplier on analysis/kill_reason sizes")
+    parser.add_argument("--dup-rate", type=float, default=0.01)
+    parser.add_argument("--near-dup-rate", type=float, default=0.03)
+    parser.add_argument("--queries", type=int, default=200, help="idea_exists calls per hit/miss sample")
+    parser.add_argument("--batch", type=int, default=100, help="New ideas in the Stage 0 dedupe batch")
+    parser.add_argument("--no-dashboard", action="store_true", help="Skip the dashboard render")
+    parser.add_argument("--dashboard-timeout", type=int, default=600)
+    parser.add_argument("--results", type=str, default=RESULTS_FILE, help="JSON results history file")
+    parser.add_argument("--worker", type=str, help=argparse.SUPPRESS)
+    parser.add_argument("--result-file", type=str, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        run_worker(args.worker, args.result_file, args.queries, args.batch, args.seed,
+                   not args.no_dashboard, args.dashboard_timeout)
+        return
+
+    sizes = [int(s) for s in args.sizes.split(",") if s.strip()]
+
+    print("="*80)
+    print("📊 IDEAS BANK SCALE BENCHMARK")
+    print("="*80)
+    print(f"Sizes: {', '.join(f'{s:,}' for s in sizes)} | Payload scale: {args.payload_scale} | "
+          f"Dup rate: {args.dup_rate} | Near-dup rate: {args.near_dup_rate}")
+
+    results = []
+    for size in sizes:
+        tmpdir = tempfile.mkdtemp(prefix=f"bench_bank_{size}_")
+        bank_file = os.path.join(tmpdir, "ideas_bank.json")
+        result_file = os.path.join(tmpdir, "result.json")
+
+        print(f"\n🏭 Generating {size:,} ideas...", flush=True)
+        stats = write_bank(bank_file, size, seed=args.seed, dup_rate=args.dup_rate,
+                           near_dup_rate=args.near_dup_rate, payload_scale=args.payload_scale)
+        print(f"   {stats['file_mb']} MB, {stats['unique_hashes']:,} unique hashes, shapes {stats['shapes']}")
+
+        print(f"⏱️  Measuring...", flush=True)
+        cmd = [sys.executable, os.path.abspath(__file__), "--worker", bank_file, "--result-file", result_file,
+               "--queries", str(args.queries), "--batch", str(args.batch), "--seed", str(args.seed),
+               "--dashboard-timeout", str(args.dashboard_timeout)]
+        if args.no_dashboard:
+            cmd.append("--no-dashboard")
+        proc = subprocess.run(cmd, capture_output=True, text=True)
+
+        if proc.returncode != 0 or not os.path.exists(result_file):
+            error = (proc.stderr.strip().splitlines() or ["worker failed"])[-1]
+            print(f"   ❌ {error}")
+            results.append({"size": size, "error": error})
+        else:
+            with open(result_file, 'r') as f:
+                result = json.load(f)
+            result["size"] = size
+            result["unique_hashes"] = stats["unique_hashes"]
+            result["shapes"] = stats["shapes"]
+            if result.get("dashboard_error"):
+                print(f"   ⚠️  Dashboard: {result['dashboard_error']}")
+            results.append(result)
+
+        shutil.rmtree(tmpdir, ignore_errors=True)
+
+    print_table(results)
+
+    runs = load_results(args.results)
+    previous = next((r for r in reversed(runs) if r["payload_scale"] == args.payload_scale), None)
+    if previous:
+        previous_by_size = {r["size"]: r for r in previous["results"]}
+        print(f"\n🔍 Compared with run {previous['timestamp']}:")
+        found = False
+        for r in results:
+            if "error" in r or r["size"] not in previous_by_size:
+                continue
+            for line in compare(previous_by_size[r["size"]], r, LOWER_IS_BETTER, []):
+                print(f"   ⚠️  {r['size']:,} ideas {line}")
+                found = True
+        if not found:
+            print("   ✅ No regressions")
+
+    runs.append({
+        "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        "seed": args.seed,
+        "payload_scale": args.payload_scale,
+        "dup_rate": args.dup_rate,
+        "near_dup_rate": args.near_dup_rate,
+        "results": results,
+    })
+    save_results(args.results, runs)
+    print(f"\n💾 Results saved: {args.results}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,312 @@
+#!/usr/bin/env python3
+"""
+PIPELINE BENCHMARK - ideas/minute and cost/finalist across winner machine versions
+
+Runs every pipeline generation against the same synthetic idea set through a
+mock provider with realistic latency. Stage 0 (idea generation) is skipped so
+all versions filter identical input.
+
+Usage:
+    python benchmarks/bench_pipelines.py
+    python benchmarks/bench_pipelines.py --ideas 50 --versions v5.0,v6.0
+    python benchmarks/bench_pipelines.py --time-scale 0.01 --results my_results.json
+
+Each version runs in its own subprocess so peak RSS is measured per version.
+Results are appended to benchmarks/pipeline_results.json and compared with the
+previous run for regressions.
+"""
+
+import os
+import sys
+import json
+import time
+import shutil
+import asyncio
+import argparse
+import resource
+import tempfile
+import subprocess
+import contextlib
+from datetime import datetime
+from typing import Dict, List
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_DIR = os.path.dirname(BENCH_DIR)
+sys.path.insert(0, REPO_DIR)
+sys.path.insert(0, BENCH_DIR)
+
+import providers
+from pipeline_versions import PIPELINE_VERSIONS, SHEETS_VERSIONS, load_pipeline
+from synthetic_ideas import generate_ideas
+from mock_provider import MockProvider, ScaledClock, MockSheetsClient, install
+
+RESULTS_FILE = os.path.join(BENCH_DIR, "pipeline_results.json")
+
+# Metrics where a higher number is a regression
+LOWER_IS_BETTER = ["projected_wall_clock_s", "calls_per_idea", "tokens_per_idea", "peak_rss_mb", "cost_per_finalist"]
+HIGHER_IS_BETTER = ["ideas_per_minute"]
+REGRESSION_THRESHOLD = 0.10
+
+# ═══════════════════════════════════════════════════════════
+# VERSION ADAPTERS (Stage 1 → finalists, no Stage 0)
+# ═══════════════════════════════════════════════════════════
+
+def run_v1(m, ideas: List[Dict]) -> List[Dict]:
+    survivors, _ = m.stage1_instant_kills(ideas)
+    survivors, _ = m.stage2_budget_check(survivors)
+    survivors, _ = m.stage3_urgency_validation(survivors)
+    survivors, _ = m.stage4_competitive_moat(survivors)
+    return m.stage5_final_research(survivors) if survivors else []
+
+def run_v2(m, ideas: List[Dict]) -> List[Dict]:
+    survivors, _ = m.stage1_growth_feasibility(ideas)
+    survivors, _ = m.stage2_budget_check(survivors)
+    survivors, _ = m.stage3_urgency_validation(survivors)
+    survivors, _ = m.stage4_gap_proof(survivors)
+    if not survivors:
+        return []
+    winners = m.stage5_complete_research(survivors)
+    true_winners, _ = m.stage6_founder_check(winners)
+    return true_winners
+
+def run_v31(m, ideas: List[Dict]) -> List[Dict]:
+    survivors, _ = m.stage1_technical_feasibility(ideas)
+    survivors, _ = m.stage2_budget_retention_check(survivors)
+    survivors, _ = m.stage3_evidence_engine(survivors)
+    if not survivors:
+        return []
+    winners = m.stage5_complete_research(survivors)
+    true_winners, _ = m.stage6_founder_check(winners)
+    return true_winners
+
+def run_v4(m, ideas: List[Dict]) -> List[Dict]:
+    stages = [
+        m.stage1_white_space_check, m.stage2_build_feasibility, m.stage3_pain_cost_calculator,
+        m.stage4_evidence_engine, m.stage5_gtm_fit, m.stage6_founder_reality,
+    ]
+    winners = []
+    for idea in ideas:
+        if all(stage(idea)["verdict"] != "KILL" for stage in stages):
+            winners.append(idea)
+    return winners
+
+def run_v5(m, ideas: List[Dict]) -> List[Dict]:
+    founder_profile = m.load_founder_profile()
+    # Stages 1-6 on one event loop, default --workers concurrency
+    survivors = asyncio.run(m.run_funnel({0: ideas}, founder_profile)) or []
+    for idea in survivors:
+        m.stage7_validation_playbook(idea, idea.get("stage_2:_evidence_result", {}))
+    return survivors
+
+def run_v6(m, ideas: List[Dict]) -> List[Dict]:
+    founder_profile = m.load_founder_profile()
+    survivors = ideas
+    for stage_func, stage_name in [
+        (m.stage1_white_space, "Stage 1: White Space"),
+        (m.stage2_economic_proof, "Stage 2: Evidence"),
+        (m.stage3_build_feasibility, "Stage 3: Build"),
+        (m.stage4_cost_analysis, "Stage 4: Cost"),
+        (m.stage5_gtm_validation, "Stage 5: GTM"),
+        (lambda idea: m.stage6_founder_fit(idea, founder_profile), "Stage 6: Founder"),
+    ]:
+        survivors, _ = m.run_stage_batch(survivors, stage_func, stage_name)
+    for idea in survivors:
+        m.stage7_validation_playbook(idea)
+    return survivors
+
+ADAPTERS = {
+    "v1.0": run_v1,
+    "v2.0": run_v2,
+    "v3.1": run_v31,
+    "v4.0": run_v4,
+    "v5.0": run_v5,
+    "v6.0": run_v6,
+}
+
+# ═══════════════════════════════════════════════════════════
+# WORKER (one version, one subprocess)
+# ═══════════════════════════════════════════════════════════
+
+def load_with_mocks(version: str):
+    """Import a pipeline; Sheets versions get a fake spreadsheet from the provider registry"""
+    if version in SHEETS_VERSIONS:
+        providers.register("google_sheet", lambda: MockSheetsClient().open("Pain Point Research"))
+    return load_pipeline(version)
+
+def run_worker(version: str, ideas_file: str, result_file: str, time_scale: float, seed: int):
+    with open(ideas_file, 'r') as f:
+        ideas = json.load(f)
+
+    for key in ("OPENAI_API_KEY", "ANTHROPIC_API_KEY", "PERPLEXITY_API_KEY",
+                "GOOGLE_API_KEY", "GOOGLE_CSE_ID", "SERPAPI_KEY"):
+        os.environ.setdefault(key, "bench-dummy-key")
+
+    # Pipelines write reports and banks to cwd - keep them out of the repo
+    workdir = tempfile.mkdtemp(prefix=f"bench_{version}_")
+    shutil.copy(os.path.join(REPO_DIR, "founder_profile.json"), workdir)
+    os.chdir(workdir)
+
+    clock = ScaledClock(time_scale)
+    provider = MockProvider(ideas, seed=seed, clock=clock)
+
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        module = load_with_mocks(version)
+        install(module, provider)
+        if "v5_stages_2_through_7" in sys.modules:
+            install(sys.modules["v5_stages_2_through_7"], provider)
+
+        start = time.perf_counter()
+        finalists = ADAPTERS[version](module, ideas)
+        wall_clock = time.perf_counter() - start
+
+    shutil.rmtree(workdir, ignore_errors=True)
+
+    stats = provider.stats
+    projected = wall_clock - clock.slept + clock.requested
+    tokens = stats["input_tokens"] + stats["output_tokens"]
+    result = {
+        "version": version,
+        "ideas": len(ideas),
+        "finalists": len(finalists),
+        "wall_clock_s": round(wall_clock, 3),
+        "projected_wall_clock_s": round(projected, 1),
+        "calls": stats["calls"],
+        "calls_per_idea": round(stats["calls"] / len(ideas), 2),
+        "tokens_per_idea": round(tokens / len(ideas)),
+        "ideas_per_minute": round(len(ideas) / (projected / 60), 3) if projected else None,
+        "peak_rss_mb": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+        "cost_usd": round(stats["cost_usd"], 4),
+        "cost_per_finalist": round(stats["cost_usd"] / len(finalists), 4) if finalists else None,
+        "by_model": stats["by_model"],
+    }
+
+    with open(result_file, 'w') as f:
+        json.dump(result, f, indent=2)
+
+# ═══════════════════════════════════════════════════════════
+# RESULTS HISTORY
+# ═══════════════════════════════════════════════════════════
+
+def load_results(path: str) -> List[Dict]:
+    if os.path.exists(path):
+        with open(path, 'r') as f:
+            return json.load(f).get("runs", [])
+    return []
+
+def save_results(path: str, runs: List[Dict]):
+    with open(path, 'w') as f:
+        json.dump({"runs": runs}, f, indent=2)
+
+def compare(previous: Dict, current: Dict, lower_is_better: List[str] = LOWER_IS_BETTER,
+            higher_is_better: List[str] = HIGHER_IS_BETTER) -> List[str]:
+    """Metric regressions of more than REGRESSION_THRESHOLD vs the previous run"""
+    regressions = []
+    for metric in lower_is_better + higher_is_better:
+        old, new = previous.get(metric), current.get(metric)
+        if not old or new is None:
+            continue
+        change = (new - old) / old
+        if (metric in lower_is_better and change > REGRESSION_THRESHOLD) or \
+           (metric in higher_is_better and change < -REGRESSION_THRESHOLD):
+            regressions.append(f"{metric}: {old} → {new} ({change:+.0%})")
+    return regressions
+
+def print_table(results: List[Dict]):
+    print(f"\n{'VERSION':<8} {'FINAL':>5} {'CALLS/IDEA':>10} {'TOKENS/IDEA':>11} {'IDEAS/MIN':>9} "
+          f"{'PROJ WALL':>10} {'RSS MB':>7} {'COST':>8} {'$/FINALIST':>10}")
+    print("-" * 86)
+    for r in results:
+        if "error" in r:
+            print(f"{r['version']:<8} ❌ {r['error'][:70]}")
+            continue
+        per_finalist = f"${r['cost_per_finalist']:.3f}" if r["cost_per_finalist"] is not None else "n/a"
+        print(f"{r['version']:<8} {r['finalists']:>5} {r['calls_per_idea']:>10} {r['tokens_per_idea']:>11} "
+              f"{r['ideas_per_minute']:>9} {r['projected_wall_clock_s']:>9}s {r['peak_rss_mb']:>7} "
+              f"${r['cost_usd']:>7.3f} {per_finalist:>10}")
+
+# ═══════════════════════════════════════════════════════════
+# MAIN
+# ═══════════════════════════════════════════════════════════
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark winner machine versions against a mock provider")
+    parser.add_argument("--ideas", type=int, default=20, help="Synthetic ideas per version")
+    parser.add_argument("--seed", type=int, default=42, help="Seed for ideas, verdicts and latency")
+    parser.add_argument("--versions", type=str, default=",".join(PIPELINE_VERSIONS), help="Comma-separated versions")
+    parser.add_argument("--time-scale", type=float, default=0.001, help="Fraction of simulated latency actually slept")
+    parser.add_argument("--results", type=str, default=RESULTS_FILE, help="JSON results history file")
+    parser.add_argument("--worker", type=str, help=argparse.SUPPRESS)
+    parser.add_argument("--ideas-file", type=str, help=argparse.SUPPRESS)
+    parser.add_argument("--result-file", type=str, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        run_worker(args.worker, args.ideas_file, args.result_file, args.time_scale, args.seed)
+        return
+
+    versions = [v.strip() for v in args.versions.split(",") if v.strip()]
+    for version in versions:
+        if version not in ADAPTERS:
+            print(f"❌ Unknown version: {version} (known: {', '.join(ADAPTERS)})")
+            return
+
+    print("="*80)
+    print("📊 PIPELINE BENCHMARK")
+    print("="*80)
+    print(f"Ideas: {args.ideas} | Seed: {args.seed} | Time scale: {args.time_scale}")
+
+    tmpdir = tempfile.mkdtemp(prefix="bench_pipelines_")
+    ideas_file = os.path.join(tmpdir, "ideas.json")
+    with open(ideas_file, 'w') as f:
+        json.dump(generate_ideas(args.ideas, seed=args.seed, run_id="bench"), f)
+
+    results = []
+    for version in versions:
+        print(f"\n⏱️  {version} ({PIPELINE_VERSIONS[version]})...", flush=True)
+        result_file = os.path.join(tmpdir, f"{version}.json")
+        proc = subprocess.run(
+            [sys.executable, os.path.abspath(__file__), "--worker", version,
+             "--ideas-file", ideas_file, "--result-file", result_file,
+             "--time-scale", str(args.time_scale), "--seed", str(args.seed)],
+            capture_output=True, text=True
+        )
+        if proc.returncode != 0 or not os.path.exists(result_file):
+            error = (proc.stderr.strip().splitlines() or ["worker failed"])[-1]
+            print(f"   ❌ {error}")
+            results.append({"version": version, "error": error})
+            continue
+        with open(result_file, 'r') as f:
+            results.append(json.load(f))
+        print(f"   ✅ {results[-1]['finalists']} finalists, ${results[-1]['cost_usd']:.3f}")
+
+    shutil.rmtree(tmpdir, ignore_errors=True)
+    print_table(results)
+
+    # Compare against the previous run with the same idea set
+    runs = load_results(args.results)
+    previous = next((r for r in reversed(runs) if r["ideas"] == args.ideas and r["seed"] == args.seed), None)
+    if previous:
+        previous_by_version = {r["version"]: r for r in previous["results"]}
+        print(f"\n🔍 Compared with run {previous['timestamp']}:")
+        found = False
+        for r in results:
+            if "error" in r or r["version"] not in previous_by_version:
+                continue
+            for line in compare(previous_by_version[r["version"]], r):
+                print(f"   ⚠️  {r['version']} {line}")
+                found = True
+        if not found:
+            print("   ✅ No regressions")
+
+    runs.append({
+        "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        "ideas": args.ideas,
+        "seed": args.seed,
+        "time_scale": args.time_scale,
+        "results": results,
+    })
+    save_results(args.results, runs)
+    print(f"\n💾 Results saved: {args.results}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+SHEETS WRITER BENCHMARK - API calls per batch, direct vs buffered (sheets_writer.py)
+
+Replays the pain_finder_v4.py / researcher_v1.py write pattern (one status
+update_cell per idea, result rows appended for survivors) against in-memory
+worksheets (mock_provider.MockWorksheet) and checks:
+- API calls per batch, direct gspread calls vs BufferedWorksheet
+- both paths leave identical sheet contents
+- injected 429 quota errors are retried and nothing is lost
+
+Usage:
+    python benchmarks/bench_sheets_writer.py
+    python benchmarks/bench_sheets_writer.py --ideas 100,500 --flush-rows 50 --quota-errors 3
+"""
+
+import os
+import sys
+import random
+import argparse
+from typing import Dict, List
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_DIR = os.path.dirname(BENCH_DIR)
+sys.path.insert(0, REPO_DIR)
+sys.path.insert(0, BENCH_DIR)
+
+from mock_provider import MockWorksheet
+from sheets_writer import buffered
+
+HEADER = ["#", "Business Type", "Pain Point", "Status", "Date"]
+
+def make_sheets(n_ideas: int) -> Dict[str, MockWorksheet]:
+    queue = [HEADER] + [[str(i), f"niche {i}", f"pain {i}", "Pending", "2025-01-01"] for i in range(1, n_ideas + 1)]
+    return {
+        "queue": MockWorksheet("Ideas Queue", queue),
+        "verified": MockWorksheet("Verified Pains", [HEADER]),
+        "winners": MockWorksheet("Winners", [HEADER]),
+    }
+
+def replay(sheets: Dict, n_ideas: int, seed: int, wrap=None):
+    """The pain_finder_v4.py main() loop minus the research calls"""
+    rng = random.Random(seed)
+    queue, verified, winners = (wrap(sheets[k]) if wrap else sheets[k] for k in ("queue", "verified", "winners"))
+    for i, row in enumerate(queue.get_all_values()[1:], start=2):
+        roll = rng.random()
+        status = "KILLED: Stage 1" if roll < 0.8 else "✅ VERIFIED WINNER!"
+        queue.update_cell(i, 4, status)
+        if roll >= 0.8:
+            verified.append_row([row[0], row[1], row[2], "research...", "2025-01-01"])
+            if roll >= 0.95:
+                winners.append_row([row[0], row[1], row[2], "research...", "2025-01-01"])
+    if wrap:
+        for worksheet in (queue, verified, winners):
+            worksheet.flush()
+
+def write_calls(sheets: Dict) -> int:
+    return sum(ws.api_calls - ws.calls.get("get_all_values", 0) for ws in sheets.values())
+
+def run_size(n_ideas: int, flush_rows: int, quota_errors: int, seed: int) -> Dict:
+    direct = make_sheets(n_ideas)
+    replay(direct, n_ideas, seed)
+
+    batched = make_sheets(n_ideas)
+    batched["queue"].fail_next = quota_errors
+    replay(batched, n_ideas, seed,
+           wrap=lambda ws: buffered(ws, max_pending=flush_rows, max_age_s=0, sleep=lambda s: None))
+
+    same = all(direct[k].rows == batched[k].rows for k in direct)
+    return {"ideas": n_ideas, "direct": write_calls(direct), "buffered": write_calls(batched), "identical": same}
+
+def main():
+    parser = argparse.ArgumentParser(description="Sheets write batching benchmark")
+    parser.add_argument("--ideas", default="50,100,500,1000", help="Comma-separated batch sizes")
+    parser.add_argument("--flush-rows", type=int, default=50, help="BufferedWorksheet max_pending")
+    parser.add_argument("--quota-errors", type=int, default=2, help="429s injected into the buffered run")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    results: List[Dict] = [run_size(int(n), args.flush_rows, args.quota_errors, args.seed)
+                           for n in args.ideas.split(",")]
+
+    print(f"\n📊 Sheets write calls (flush every {args.flush_rows} writes, {args.quota_errors} injected 429s)")
+    print(f"{'ideas':>8} {'direct':>8} {'buffered':>9} {'saved':>7}  contents")
+    for r in results:
+        saved = 1 - r["buffered"] / r["direct"] if r["direct"] else 0
+        print(f"{r['ideas']:>8} {r['direct']:>8} {r['buffered']:>9} {saved:>6.0%}  {'✅ identical' if r['identical'] else '❌ DIFFER'}")
+
+    if not all(r["identical"] for r in results):
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
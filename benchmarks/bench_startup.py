@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+STARTUP BENCHMARK - import cost of every entry point (python -X importtime)
+
+Imports each module in a fresh interpreter, from an empty directory with no
+API keys in the environment, and checks:
+- the import finishes within its budget (ms, best of --runs)
+- no provider SDK or heavy library is imported (clients are built on first
+  use through providers.py, so importing must not pull in openai, gspread...)
+- nothing needs credentials: a module that exits or raises on import fails
+
+The slowest direct imports from -X importtime are listed for any module
+over budget. Exits 1 on any failure, so it can gate a commit.
+
+Usage:
+    python benchmarks/bench_startup.py
+    python benchmarks/bench_startup.py --runs 5 --budget-scale 2   # slow machine
+"""
+
+import os
+import sys
+import argparse
+import tempfile
+import subprocess
+from typing import Dict, List, Optional, Tuple
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_DIR = os.path.dirname(BENCH_DIR)
+
+# label → (import statement, budget ms)
+# About 1.7x the best-of-3 measured on python 3.11 with python-dotenv 1.2 installed
+# (dotenv alone is ~30-50 ms of most entry points); --budget-scale for slower machines
+STARTUP_BUDGETS_MS = {
+    "providers": ("import providers", 40),
+    "sheets_client": ("import sheets_client", 120),
+    "stage1_growth_filter": ("import stage1_growth_filter", 120),
+    "stage2_budget_validator": ("import stage2_budget_validator", 120),
+    "stage3_deep_research": ("import stage3_deep_research", 120),
+    "run_winner_pipeline": ("import run_winner_pipeline", 120),
+    "pain_finder_v4": ("import pain_finder_v4", 120),
+    "researcher_v1": ("import researcher_v1", 100),
+    "distributed_pipeline": ("import distributed_pipeline", 200),
+    "pipeline_daemon": ("import pipeline_daemon", 180),
+}
+# v2.0+ pull in asyncio through provider_client
+for _version, _budget in (("v1.0", 100), ("v2.0", 200), ("v3.1", 120), ("v4.0", 100), ("v5.0", 200), ("v6.0", 200)):
+    STARTUP_BUDGETS_MS[f"pipeline {_version}"] = (
+        f"from pipeline_versions import load_pipeline; load_pipeline({_version!r})", _budget)
+
+# Must not be imported by any entry point until a provider is actually used
+FORBIDDEN_MODULES = [
+    "openai", "anthropic", "gspread", "google.oauth2", "google.auth",
+    "bs4", "aiohttp", "requests", "pandas", "numpy", "streamlit", "google.generativeai",
+]
+
+# Keys are dropped so an import that builds a client fails loudly
+CREDENTIAL_ENV = ["OPENAI_API_KEY", "ANTHROPIC_API_KEY", "PERPLEXITY_API_KEY", "GOOGLE_API_KEY", "SERPAPI_KEY"]
+
+CHILD = """
+import sys, time
+sys.stderr.write("STARTUP_BEGIN\\n")
+_t = time.perf_counter()
+{statement}
+print("STARTUP_MS", (time.perf_counter() - _t) * 1000)
+"""
+
+# ═══════════════════════════════════════════════════════════
+# MEASUREMENT
+# ═══════════════════════════════════════════════════════════
+
+def parse_importtime(stderr: str) -> List[Tuple[str, int, int]]:
+    """-X importtime lines after the child's marker → [(module, cumulative µs, nesting depth)]"""
+    entries = []
+    lines = stderr.splitlines()
+    if "STARTUP_BEGIN" in lines:
+        lines = lines[lines.index("STARTUP_BEGIN") + 1:]  # skip interpreter startup (site, encodings...)
+    for line in lines:
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3 or not parts[1].strip().isdigit():
+            continue  # the header line
+        name = parts[2].rstrip()
+        depth = (len(name) - len(name.lstrip())) // 2
+        entries.append((name.strip(), int(parts[1]), depth))
+    return entries
+
+def forbidden_in(modules: List[str]) -> List[str]:
+    return sorted({f for f in FORBIDDEN_MODULES for m in modules if m == f or m.startswith(f + ".")})
+
+def measure(statement: str, workdir: str) -> Dict:
+    env = {k: v for k, v in os.environ.items() if k not in CREDENTIAL_ENV}
+    env["PYTHONPATH"] = os.pathsep.join(p for p in (REPO_DIR, os.environ.get("PYTHONPATH")) if p)
+    env["PYTHONDONTWRITEBYTECODE"] = "1"
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", CHILD.format(statement=statement)],
+                          cwd=workdir, env=env, capture_output=True, text=True, timeout=120)
+    ms: Optional[float] = None
+    for line in proc.stdout.splitlines():
+        if line.startswith("STARTUP_MS "):
+            ms = float(line.split()[1])
+    entries = parse_importtime(proc.stderr)
+    error = None
+    if proc.returncode != 0 or ms is None:
+        tail = [l for l in proc.stderr.splitlines()
+                if not l.startswith("import time:") and l != "STARTUP_BEGIN"][-1:]
+        error = (tail[0] if tail else "") or f"exit code {proc.returncode}"
+    return {"ms": ms, "entries": entries, "error": error}
+
+def slowest(entries: List[Tuple[str, int, int]], n: int = 5) -> List[Tuple[str, int]]:
+    """The costliest imports the measured code pulls in directly"""
+    top = [(name, us) for name, us, depth in entries if depth == 0]
+    if len(top) == 1:  # a plain `import X`: look one level down
+        top = [(name, us) for name, us, depth in entries if depth == 1]
+    return sorted(top, key=lambda item: -item[1])[:n]
+
+# ═══════════════════════════════════════════════════════════
+# MAIN
+# ═══════════════════════════════════════════════════════════
+
+def main():
+    parser = argparse.ArgumentParser(description="Import-time budget for every entry point")
+    parser.add_argument("--runs", type=int, default=3, help="Imports per module (best run counts)")
+    parser.add_argument("--budget-scale", type=float, default=1.0, help="Multiply every budget (slow machines)")
+    parser.add_argument("--only", type=str, help="Comma-separated labels to measure")
+    args = parser.parse_args()
+
+    labels = args.only.split(",") if args.only else list(STARTUP_BUDGETS_MS)
+    failures = 0
+
+    print(f"\n{'='*72}")
+    print(f"🚀 STARTUP BENCHMARK ({args.runs} runs each, budget x{args.budget_scale:g})")
+    print(f"{'='*72}")
+    print(f"{'module':<26}{'best ms':>10}{'budget':>10}   result")
+
+    with tempfile.TemporaryDirectory() as workdir:
+        for label in labels:
+            statement, budget = STARTUP_BUDGETS_MS[label]
+            budget *= args.budget_scale
+            runs = [measure(statement, workdir) for _ in range(args.runs)]
+            errors = [r["error"] for r in runs if r["error"]]
+            if errors:
+                failures += 1
+                print(f"{label:<26}{'-':>10}{budget:>10.0f}   ❌ import failed: {errors[0]}")
+                continue
+
+            best = min(runs, key=lambda r: r["ms"])
+            heavy = forbidden_in([name for name, _, _ in best["entries"]])
+            problems = []
+            if best["ms"] > budget:
+                problems.append("over budget")
+            if heavy:
+                problems.append(f"imports {', '.join(heavy)}")
+            status = "✅" if not problems else "❌ " + "; ".join(problems)
+            print(f"{label:<26}{best['ms']:>10.1f}{budget:>10.0f}   {status}")
+            if problems:
+                failures += 1
+                for name, us in slowest(best["entries"]):
+                    print(f"{'':<6}{us / 1000:>8.1f} ms  {name}")
+
+    print(f"{'='*72}")
+    if failures:
+        print(f"❌ {failures} module(s) failed the startup budget")
+        sys.exit(1)
+    print("✅ Every entry point imports within budget, without provider SDKs or credentials")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,452 @@
+"""
+Mock provider for pipeline benchmarks
+Fake OpenAI / Perplexity / Anthropic / search clients with realistic latency,
+token accounting and pricing. Verdicts are drawn from each synthetic idea's
+hidden quality so every pipeline version sees the same ground truth.
+"""
+
+import json
+import math
+import time
+import asyncio
+import random
+import hashlib
+import threading
+from typing import Dict, List, Optional
+
+# ═══════════════════════════════════════════════════════════
+# LATENCY + PRICING PROFILES
+# ═══════════════════════════════════════════════════════════
+
+# (median seconds, lognormal sigma) - measured from RUN_SUMMARY timings
+LATENCY_PROFILES = {
+    "gpt-5-mini": (7.0, 0.55),
+    "gpt-4o": (9.0, 0.50),
+    "gpt-4o-mini": (4.0, 0.45),
+    "o4-mini-2025-04-16": (14.0, 0.60),
+    "sonar": (5.0, 0.60),
+    "claude-3-5-sonnet-20241022": (15.0, 0.50),
+    "google-cse": (0.6, 0.40),
+    "reddit-search": (0.9, 0.50),
+}
+DEFAULT_LATENCY = (6.0, 0.5)
+
+# $ per 1M tokens (input, output)
+MODEL_PRICING = {
+    "gpt-5-mini": (0.25, 2.00),
+    "gpt-4o": (2.50, 10.00),
+    "gpt-4o-mini": (0.15, 0.60),
+    "o4-mini-2025-04-16": (1.10, 4.40),
+    "sonar": (1.00, 1.00),
+    "claude-3-5-sonnet-20241022": (3.00, 15.00),
+}
+
+# Flat $ per request on top of tokens
+REQUEST_FEES = {
+    "sonar": 0.005,
+    "google-cse": 0.005,
+}
+
+def estimate_tokens(text: str) -> int:
+    """~4 characters per token"""
+    return max(1, len(text or "") // 4)
+
+# ═══════════════════════════════════════════════════════════
+# SCALED CLOCK
+# ═══════════════════════════════════════════════════════════
+
+class ScaledClock:
+    """
+    Stand-in for the `time` module inside a pipeline script.
+    sleep() is compressed by `scale` but the requested duration is recorded,
+    so the benchmark can project real wall-clock time.
+    """
+
+    def __init__(self, scale: float):
+        self.scale = scale
+        self.requested = 0.0
+        self.slept = 0.0
+        self._lock = threading.Lock()
+
+    def sleep(self, seconds: float):
+        actual = max(0.0, seconds) * self.scale
+        with self._lock:
+            self.requested += max(0.0, seconds)
+            self.slept += actual
+        time.sleep(actual)
+
+    def __getattr__(self, name):
+        return getattr(time, name)
+
+# ═══════════════════════════════════════════════════════════
+# RESPONSE SYNTHESIS
+# ═══════════════════════════════════════════════════════════
+
+FILLER = ("Operators in this segment describe the workaround as fragile and time-consuming; "
+          "several threads cite spreadsheets, missed follow-ups and end-of-month scrambles. ")
+
+PASS_FIELDS = {
+    "decision": "PASS",
+    "verdict": "PASS",
+    "market_type": "WHITE_SPACE",
+    "switching_cost": "LOW",
+    "dominant_players": [],
+    "dominant_player": None,
+    "standalone_viable": True,
+    "score": 4,
+    "tam": 50_000_000,
+    "total_businesses": 40_000,
+    "tam_estimate": "$50M",
+    "calculated_annual_cost": 38_000,
+    "mentions": [{"source": "forum", "quote": "We lose a day a week to this", "time_stated": "8 hours/week"}],
+    "digital_only": True,
+    "public_api_feasible": True,
+    "solo_buildable": True,
+    "no_certifications": True,
+    "total_annual_cost": 45_000,
+    "viable_channels": ["SEO", "LinkedIn ads", "Communities"],
+    "cac_estimate": 220,
+    "time_to_first_10_customers_days": 60,
+    "domain_fit": "HIGH",
+    "content_authenticity": "CAN",
+    "staying_power": "HIGH",
+    "hard_constraints_pass": True,
+    "reasoning": "Evidence supports a fragmented market with a quantified, recurring pain.",
+}
+
+KILL_FIELDS = {
+    "decision": "KILL",
+    "verdict": "KILL",
+    "market_type": "SATURATED",
+    "switching_cost": "HIGH",
+    "dominant_players": ["ServiceTitan"],
+    "dominant_player": "ServiceTitan",
+    "market_share_leader": "ServiceTitan",
+    "standalone_viable": False,
+    "score": 0,
+    "tam": 0,
+    "total_businesses": 0,
+    "tam_estimate": "$0.5M",
+    "calculated_annual_cost": 900,
+    "mentions": [],
+    "digital_only": False,
+    "public_api_feasible": False,
+    "solo_buildable": False,
+    "no_certifications": False,
+    "total_annual_cost": 2_000,
+    "viable_channels": ["Cold calling"],
+    "cac_estimate": 1_200,
+    "time_to_first_10_customers_days": 180,
+    "domain_fit": "LOW",
+    "content_authenticity": "CANNOT",
+    "staying_power": "LOW",
+    "hard_constraints_pass": False,
+    "reasoning": "A dominant platform already covers this workflow.",
+}
+
+# ═══════════════════════════════════════════════════════════
+# MOCK PROVIDER
+# ═══════════════════════════════════════════════════════════
+
+class MockProvider:
+    """Shared state for every fake client: latency, verdicts, usage stats"""
+
+    def __init__(self, ideas: List[Dict], seed: int = 42, clock: Optional[ScaledClock] = None):
+        self.seed = seed
+        self.clock = clock or ScaledClock(0.0)
+        self.quality = {idea["business"]: idea.get("_bench_quality", 0.5) for idea in ideas}
+        self.stats = {"calls": 0, "input_tokens": 0, "output_tokens": 0, "cost_usd": 0.0, "by_model": {}}
+        self._lock = threading.Lock()
+
+    def _rng(self, *parts) -> random.Random:
+        digest = hashlib.sha256("||".join([str(self.seed)] + [str(p) for p in parts]).encode()).hexdigest()
+        return random.Random(int(digest[:16], 16))
+
+    def _business_for(self, text: str) -> Optional[str]:
+        # Longest match first so "HVAC contractors ($5-20M...)" beats a shorter prefix
+        for business in sorted(self.quality, key=len, reverse=True):
+            if business in text:
+                return business
+        return None
+
+    def _passes(self, prompt: str, business: Optional[str]) -> bool:
+        # Conversion prompts carry the upstream research text - reuse its verdict
+        if "VERDICT: KILL" in prompt:
+            return False
+        if "VERDICT: PASS" in prompt:
+            return True
+        quality = self.quality.get(business, 0.5)
+        return self._rng("verdict", prompt).random() < quality
+
+    def _record(self, model: str, prompt: str, output: str):
+        in_tokens = estimate_tokens(prompt)
+        out_tokens = estimate_tokens(output)
+        in_price, out_price = MODEL_PRICING.get(model, (0.0, 0.0))
+        cost = (in_tokens * in_price + out_tokens * out_price) / 1_000_000 + REQUEST_FEES.get(model, 0.0)
+        with self._lock:
+            self.stats["calls"] += 1
+            self.stats["input_tokens"] += in_tokens
+            self.stats["output_tokens"] += out_tokens
+            self.stats["cost_usd"] += cost
+            per_model = self.stats["by_model"].setdefault(model, {"calls": 0, "tokens": 0, "cost_usd": 0.0})
+            per_model["calls"] += 1
+            per_model["tokens"] += in_tokens + out_tokens
+            per_model["cost_usd"] += cost
+        return in_tokens, out_tokens
+
+    def _wait(self, model: str, prompt: str):
+        median, sigma = LATENCY_PROFILES.get(model, DEFAULT_LATENCY)
+        latency = median * math.exp(self._rng("latency", model, prompt).gauss(0, sigma))
+        self.clock.sleep(latency)
+
+    def complete(self, model: str, prompt: str, json_mode: bool = False) -> str:
+        """Produce a response for one chat/completions call"""
+        self._wait(model, prompt)
+        business = self._business_for(prompt)
+        passed = self._passes(prompt, business)
+        rng = self._rng("length", model, prompt)
+
+        wants_json = json_mode or "Return JSON" in prompt or "return ONLY valid JSON" in prompt
+        if wants_json:
+            payload = dict(PASS_FIELDS if passed else KILL_FIELDS)
+            if passed:
+                payload["score"] = rng.choice([3, 4, 4, 5])
+            target_tokens = int(250 * math.exp(rng.gauss(0, 0.4)))
+            payload["notes"] = (FILLER * (1 + target_tokens * 4 // len(FILLER)))[:target_tokens * 4]
+            output = json.dumps(payload)
+        else:
+            target_tokens = int(700 * math.exp(rng.gauss(0, 0.5)))
+            body = (FILLER * (1 + target_tokens * 4 // len(FILLER)))[:target_tokens * 4]
+            verdict = ("VERDICT: PASS\nDECISION: PASS\nPROCEED TO STRATEGIST? YES\nFINAL VERDICT: YES"
+                       if passed else
+                       "VERDICT: KILL - insufficient evidence\nDECISION: KILL - insufficient evidence")
+            output = f"Research notes for: {business or 'unknown business'}\n\n{body}\n\n{verdict}\n"
+
+        self._record(model, prompt, output)
+        return output
+
+    def search(self, kind: str, query: str) -> Dict:
+        """Google CSE / Reddit JSON payloads"""
+        model = "google-cse" if kind == "google" else "reddit-search"
+        self._wait(model, query)
+        rng = self._rng("search", kind, query)
+        hits = rng.randint(0, 10)
+        self._record(model, query, "")
+
+        if kind == "google":
+            return {"items": [
+                {"title": f"Result {i} for {query[:40]}", "link": f"https://example.com/{i}", "snippet": FILLER[:160]}
+                for i in range(hits)
+            ]}
+        return {"data": {"children": [
+            {"data": {"title": f"Thread {i}: {query[:40]}", "selftext": FILLER, "subreddit": "smallbusiness",
+                      "author": "operator", "created_utc": 1_735_000_000, "permalink": f"/r/smallbusiness/{i}",
+                      "ups": rng.randint(1, 200)}}
+            for i in range(hits)
+        ]}}
+
+# ═══════════════════════════════════════════════════════════
+# FAKE CLIENTS
+# ═══════════════════════════════════════════════════════════
+
+class _Obj:
+    def __init__(self, **kwargs):
+        self.__dict__.update(kwargs)
+
+def _flatten_messages(messages: List[Dict]) -> str:
+    return "\n".join(str(m.get("content", "")) for m in messages)
+
+class MockOpenAIClient:
+    """Mimics openai.OpenAI(...).chat.completions.create (also used for Perplexity)"""
+
+    def __init__(self, provider: MockProvider):
+        self._provider = provider
+        self.chat = _Obj(completions=_Obj(create=self._create))
+
+    def _create(self, model: str, messages: List[Dict], **params):
+        prompt = _flatten_messages(messages)
+        json_mode = (params.get("response_format") or {}).get("type") == "json_object"
+        content = self._provider.complete(model, prompt, json_mode=json_mode)
+        return _Obj(
+            choices=[_Obj(message=_Obj(content=content))],
+            usage=_Obj(prompt_tokens=estimate_tokens(prompt), completion_tokens=estimate_tokens(content)),
+        )
+
+class MockAnthropicClient:
+    """Mimics anthropic.Anthropic(...).messages.create"""
+
+    def __init__(self, provider: MockProvider):
+        self._provider = provider
+        self.messages = _Obj(create=self._create)
+
+    def _create(self, model: str, messages: List[Dict], system: str = "", **params):
+        prompt = system + "\n" + _flatten_messages(messages)
+        content = self._provider.complete(model, prompt)
+        return _Obj(content=[_Obj(text=content)])
+
+class MockRequests:
+    """Mimics the slice of `requests` the pipelines use (GET to search APIs)"""
+
+    def __init__(self, provider: MockProvider):
+        self._provider = provider
+
+    def get(self, url: str, params: Dict = None, **kwargs):
+        params = params or {}
+        kind = "reddit" if "reddit.com" in url else "google"
+        payload = self._provider.search(kind, str(params.get("q", url)))
+        return _Obj(status_code=200, json=lambda: payload, text=json.dumps(payload))
+
+class MockAsyncProviderClient:
+    """Mimics async_provider.AsyncProviderClient; blocking mock calls run in the loop's executor"""
+
+    def __init__(self, provider: MockProvider, request_delay: float = 1.0):
+        self._provider = provider
+        self.request_delay = request_delay
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        pass
+
+    async def _run(self, fn, *args):
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self._provider.clock.sleep, self.request_delay)
+        return await loop.run_in_executor(None, fn, *args)
+
+    def _chat(self, params: Dict) -> Dict:
+        prompt = _flatten_messages(params["messages"])
+        json_mode = (params.get("response_format") or {}).get("type") == "json_object"
+        content = self._provider.complete(params["model"], prompt, json_mode=json_mode)
+        return {"choices": [{"message": {"content": content}}]}
+
+    def _messages(self, params: Dict) -> Dict:
+        prompt = params.get("system", "") + "\n" + _flatten_messages(params["messages"])
+        return {"content": [{"type": "text", "text": self._provider.complete(params["model"], prompt)}]}
+
+    async def openai_chat(self, params: Dict) -> Dict:
+        return await self._run(self._chat, params)
+
+    async def perplexity_chat(self, params: Dict) -> Dict:
+        return await self._run(self._chat, params)
+
+    async def anthropic_messages(self, params: Dict) -> Dict:
+        return await self._run(self._messages, params)
+
+    async def google_search(self, params: Dict) -> Dict:
+        return await self._run(self._provider.search, "google", str(params.get("q", "")))
+
+class QuotaExceeded(Exception):
+    """Shaped like gspread's APIError for a 429 (response.status_code)"""
+
+    def __init__(self):
+        super().__init__("APIError: [429]: Quota exceeded for quota metric 'Write requests'")
+        self.response = type("Response", (), {"status_code": 429})()
+
+class MockWorksheet:
+    """
+    In-memory worksheet for Sheets-based versions (v1.0 logs to Sheets).
+    Covers the gspread Worksheet calls the scripts and sheets_writer.py make,
+    counts API calls, and can fail the next `fail_next` writes with a 429.
+    """
+
+    def __init__(self, title: str, rows: Optional[List[List]] = None):
+        self.title = title
+        self.rows = [list(r) for r in (rows or [])]
+        self.calls: Dict[str, int] = {}
+        self.fail_next = 0
+
+    def _call(self, name: str, write: bool = True):
+        if write and self.fail_next > 0:
+            self.fail_next -= 1
+            raise QuotaExceeded()
+        self.calls[name] = self.calls.get(name, 0) + 1
+
+    @property
+    def api_calls(self) -> int:
+        return sum(self.calls.values())
+
+    def _set(self, row: int, col: int, value):
+        while len(self.rows) < row:
+            self.rows.append([])
+        cells = self.rows[row - 1]
+        while len(cells) < col:
+            cells.append("")
+        cells[col - 1] = str(value)
+
+    def append_row(self, row, **kwargs):
+        self._call("append_row")
+        self.rows.append([str(v) for v in row])
+
+    def append_rows(self, rows, **kwargs):
+        self._call("append_rows")
+        self.rows.extend([str(v) for v in row] for row in rows)
+
+    def update_cell(self, row: int, col: int, value):
+        self._call("update_cell")
+        self._set(row, col, value)
+
+    @staticmethod
+    def _cell(a1: str):
+        """A1 cell → (row, col), e.g. D12 → (12, 4)"""
+        letters = "".join(c for c in a1 if c.isalpha())
+        col = 0
+        for c in letters:
+            col = col * 26 + ord(c) - 64
+        return int(a1[len(letters):]), col
+
+    def batch_update(self, data: List[Dict], **kwargs):
+        self._call("batch_update")
+        for update in data:
+            first_row, col = self._cell(update["range"].partition(":")[0])
+            for r, values in enumerate(update["values"]):
+                for c, value in enumerate(values):
+                    self._set(first_row + r, col + c, value)
+
+    def batch_get(self, ranges: List[str], **kwargs):
+        """Like Sheets: trailing empty rows and cells are trimmed from each range"""
+        self._call("batch_get", write=False)
+        results = []
+        for a1 in ranges:
+            start, _, end = a1.partition(":")
+            (r1, c1), (r2, c2) = self._cell(start), self._cell(end or start)
+            block = [[v for v in row[c1 - 1:c2]] for row in self.rows[r1 - 1:r2]]
+            block = [row[:max([i + 1 for i, v in enumerate(row) if v != ""] or [0])] for row in block]
+            while block and not block[-1]:
+                block.pop()
+            results.append(block)
+        return results
+
+    def get_all_values(self):
+        self._call("get_all_values", write=False)
+        return [list(r) for r in self.rows]
+
+class MockSpreadsheet:
+    def __init__(self):
+        self._sheets = {}
+
+    def worksheet(self, title: str) -> MockWorksheet:
+        return self._sheets.setdefault(title, MockWorksheet(title))
+
+class MockSheetsClient:
+    def open(self, name: str) -> MockSpreadsheet:
+        return MockSpreadsheet()
+
+# ═══════════════════════════════════════════════════════════
+# INSTALLATION
+# ═══════════════════════════════════════════════════════════
+
+def install(module, provider: MockProvider):
+    """Swap a loaded pipeline module's clients, HTTP and clock for mocks"""
+    openai_mock = MockOpenAIClient(provider)
+    for attr in ("client", "openai_client", "perplexity_client"):
+        if hasattr(module, attr):
+            setattr(module, attr, openai_mock)
+    if hasattr(module, "anthropic_client"):
+        setattr(module, "anthropic_client", MockAnthropicClient(provider))
+    if hasattr(module, "requests"):
+        setattr(module, "requests", MockRequests(provider))
+    if hasattr(module, "time"):
+        setattr(module, "time", provider.clock)
+    if hasattr(module, "AsyncProviderClient"):
+        setattr(module, "AsyncProviderClient", lambda: MockAsyncProviderClient(provider))
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+JOB QUEUE SMOKE TEST - the task lifecycle against a live queue backend
+
+Runs one short run through job_queue.py and checks every step:
+- enqueue: two stages, re-enqueueing the same idea × stage is a no-op
+- lease: the later stage comes first, with a token and attempt count
+- heartbeat: extends the owner's lease, rejects a stale token
+- expiry: a lapsed lease is requeued and re-leased with a new token;
+  the old token can no longer complete it; after MAX_TASK_ATTEMPTS
+  lapses the task is failed instead
+- release: hands the task back without counting the attempt
+- complete → results → mark_applied → counts
+
+Against Redis (the default) the Lua lease/renew/complete scripts run on the
+server, so this needs a redis-server on localhost (`redis-server --port 6379`).
+Keys live under a throwaway prefix and are deleted afterwards. Exits 1 on
+any failed check.
+
+Usage:
+    python benchmarks/smoke_job_queue.py
+    python benchmarks/smoke_job_queue.py --url redis://localhost:6380/15
+    python benchmarks/smoke_job_queue.py --url sqlite:///smoke_queue.db
+"""
+
+import os
+import sys
+import time
+import uuid
+import argparse
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_DIR = os.path.dirname(BENCH_DIR)
+sys.path.insert(0, REPO_DIR)
+
+from job_queue import MAX_TASK_ATTEMPTS, RedisJobQueue, open_queue
+
+LEASE_SECONDS = 1.0
+
+# ═══════════════════════════════════════════════════════════
+# CHECKS
+# ═══════════════════════════════════════════════════════════
+
+failures = []
+
+def check(label: str, ok: bool, detail: str = ""):
+    print(f"  {'✅' if ok else '❌'} {label}" + (f" ({detail})" if detail and not ok else ""))
+    if not ok:
+        failures.append(label)
+
+def wait_for_expiry():
+    time.sleep(LEASE_SECONDS + 0.5)
+
+def run_lifecycle(queue, run_id: str):
+    print("\n📥 Enqueue")
+    tid_1 = queue.enqueue(run_id, 1, "Stage 1", "idea-a", {"idea": "a"})
+    tid_3 = queue.enqueue(run_id, 3, "Stage 3", "idea-b", {"idea": "b"})
+    again = queue.enqueue(run_id, 1, "Stage 1", "idea-a", {"idea": "a (again)"})
+    check("re-enqueue returns the same task id", again == tid_1)
+    counts = queue.counts(run_id)
+    check("two queued tasks", counts == {"Stage 1": {"queued": 1}, "Stage 3": {"queued": 1}}, str(counts))
+
+    print("\n🔒 Lease + heartbeat")
+    first = queue.lease("worker-1", visibility_timeout=60)
+    check("later stage is leased first", first is not None and first["id"] == tid_3,
+          first and first["id"])
+    check("lease carries token, attempt and worker",
+          bool(first and first["lease_token"]) and first["attempts"] == 1 and first["worker_id"] == "worker-1",
+          str(first))
+    check("payload round-trips", first is not None and first["payload"] == {"idea": "b"})
+    check("heartbeat with the lease token", queue.heartbeat(tid_3, first["lease_token"], 60))
+    check("heartbeat with a stale token is refused", not queue.heartbeat(tid_3, "stale-token", 60))
+
+    print("\n⏳ Lease expiry")
+    short = queue.lease("worker-2", visibility_timeout=LEASE_SECONDS)
+    check("next task is leased", short is not None and short["id"] == tid_1, short and short["id"])
+    check("payload of the first enqueue is kept", short is not None and short["payload"] == {"idea": "a"})
+    check("nothing else is queued", queue.lease("worker-2", LEASE_SECONDS) is None)
+    wait_for_expiry()
+    retry = queue.lease("worker-3", visibility_timeout=60)
+    check("expired lease is re-leased", retry is not None and retry["id"] == tid_1, retry and retry["id"])
+    check("re-lease counts a second attempt with a new token",
+          retry is not None and retry["attempts"] == 2 and retry["lease_token"] != short["lease_token"],
+          str(retry))
+    check("the lapsed worker cannot complete it", not queue.complete(tid_1, short["lease_token"], {"by": "worker-2"}))
+    check("the lapsed worker cannot heartbeat it", not queue.heartbeat(tid_1, short["lease_token"]))
+    check("the first lease survived (heartbeat kept it alive)", queue.heartbeat(tid_3, first["lease_token"], 60))
+
+    print("\n↩️  Release")
+    tid_r = queue.enqueue(run_id, 2, "Stage 2", "idea-r", {"idea": "r"})
+    leased = queue.lease("worker-4", visibility_timeout=60)
+    check("release with the lease token", leased is not None and queue.release(tid_r, leased["lease_token"]))
+    again = queue.lease("worker-4", visibility_timeout=60)
+    check("released task is leased again without counting the attempt",
+          again is not None and again["id"] == tid_r and again["attempts"] == 1, str(again))
+
+    print("\n✅ Complete")
+    check("complete the Stage 3 task", queue.complete(tid_3, first["lease_token"], {"verdict": "PASS"}))
+    check("complete the re-leased Stage 1 task", queue.complete(tid_1, retry["lease_token"], {"verdict": "KILL"}))
+    check("completing twice is refused", not queue.complete(tid_1, retry["lease_token"], {"verdict": "KILL"}))
+    check("complete the released task", queue.complete(tid_r, again["lease_token"], {"verdict": "PASS"}))
+
+    print("\n💀 Too many lapsed leases")
+    tid_f = queue.enqueue(run_id, 4, "Stage 4", "idea-f", {"idea": "f"})
+    for _ in range(MAX_TASK_ATTEMPTS):
+        queue.lease("worker-5", visibility_timeout=LEASE_SECONDS)
+        wait_for_expiry()
+    check("task is failed instead of leased again", queue.lease("worker-5", LEASE_SECONDS) is None)
+
+    print("\n📤 Results")
+    results = {task["id"]: task for task in queue.results(run_id)}
+    check("finished tasks are listed", set(results) == {tid_1, tid_3, tid_r, tid_f}, str(sorted(results)))
+    check("results round-trip",
+          results.get(tid_3, {}).get("result") == {"verdict": "PASS"}
+          and results.get(tid_1, {}).get("result") == {"verdict": "KILL"})
+    check("failed task records why", results.get(tid_f, {}).get("state") == "failed"
+          and results.get(tid_f, {}).get("error") == "lease expired", str(results.get(tid_f)))
+    queue.mark_applied(list(results))
+    check("applied tasks leave the results", queue.results(run_id) == [])
+    counts = queue.counts(run_id)
+    check("every task is applied", all(set(states) == {"applied"} for states in counts.values())
+          and len(counts) == 4, str(counts))
+
+# ═══════════════════════════════════════════════════════════
+# MAIN
+# ═══════════════════════════════════════════════════════════
+
+def main():
+    parser = argparse.ArgumentParser(description="Enqueue → lease → heartbeat → expiry → complete on a live queue")
+    parser.add_argument("--url", default="redis://localhost:6379/15", help="Queue URL (sqlite:/// or redis://)")
+    args = parser.parse_args()
+
+    run_id = f"smoke-{uuid.uuid4().hex[:8]}"
+    queue = open_queue(args.url)
+    if isinstance(queue, RedisJobQueue):
+        queue = RedisJobQueue(queue.client, prefix=f"smoke_job_queue:{run_id}")
+        try:
+            queue.client.execute("PING")
+        except OSError as e:
+            print(f"❌ No Redis server at {args.url}: {e}")
+            sys.exit(1)
+
+    print(f"\n{'='*60}")
+    print(f"🧪 JOB QUEUE SMOKE TEST ({args.url}, run {run_id})")
+    print(f"{'='*60}")
+    try:
+        run_lifecycle(queue, run_id)
+    finally:
+        if isinstance(queue, RedisJobQueue):
+            keys = queue.client.execute("KEYS", f"{queue.prefix}:*") or []
+            if keys:
+                queue.client.execute("DEL", *keys)
+
+    print(f"\n{'='*60}")
+    if failures:
+        print(f"❌ {len(failures)} check(s) failed")
+        sys.exit(1)
+    print("✅ Queue lifecycle works end to end")
+
+if __name__ == "__main__":
+    main()
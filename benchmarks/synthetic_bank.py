@@ -0,0 +1,278 @@
+#!/usr/bin/env python3
+"""
+Synthetic ideas bank generator for scale testing
+Writes schema-faithful ideas_bank.json files with 10k-1M ideas
+
+Mirrors what the real bank looks like after runs of different versions:
+- v4.0 ideas: killed_stageN / WINNER, stageN_analysis text blobs
+- v5.0 ideas: stage_N:_name_result stored as repr'd dicts, source_cluster, whitespace_evidence
+- v6.0 ideas: stage_N_name_analysis dicts, ROI fields, digital-only flags
+
+Usage:
+    python benchmarks/synthetic_bank.py --count 100000 --output /tmp/bank_100k.json
+    python benchmarks/synthetic_bank.py --count 1000000 --payload-scale 0.1 --dup-rate 0.02
+"""
+
+import os
+import sys
+import json
+import math
+import random
+import argparse
+from typing import Dict, List, Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from synthetic_ideas import make_idea, generate_idea_hash
+
+# Share of each key shape (today's bank is roughly 57% v4.0, 43% v5.0)
+DEFAULT_SHAPE_MIX = {"v4.0": 0.3, "v5.0": 0.3, "v6.0": 0.4}
+
+# Payload sizes in characters: (median, lognormal sigma) - fitted to ideas_bank.json
+PAYLOAD_SIZES = {
+    "kill_reason": (2_200, 1.1),
+    "analysis": (6_000, 0.5),
+    "result": (2_500, 0.5),
+}
+MAX_KILL_REASON = 30_000
+
+V4_STAGES = 6
+V5_STAGES = ["stage_1:_white_space", "stage_2:_evidence", "stage_3:_build",
+             "stage_4:_cost", "stage_5:_gtm", "stage_6:_founder_fit"]
+V6_STAGES = ["stage_1_white_space", "stage_2_evidence", "stage_3_build",
+             "stage_4_cost", "stage_5_gtm", "stage_6_founder"]
+
+# Funnel: probability an idea dies at each stage (rest become WINNER/FINALIST)
+KILL_CURVE = [0.35, 0.45, 0.25, 0.25, 0.15, 0.10]
+
+# ═══════════════════════════════════════════════════════════
+# PAYLOAD TEXT
+# ═══════════════════════════════════════════════════════════
+
+ANALYSIS_SENTENCES = [
+    "TASK 1: Dominant general-purpose platforms - none of the listed tools own this workflow. ",
+    "Procore and ServiceTitan cover adjacent scheduling but not the tracking step itself. ",
+    "PUBLIC_API_FEASIBILITY: YES (with caveats around vendor portal scraping). ",
+    "Operators report 6-10 hours per week reconciling spreadsheets across branches. ",
+    "Switching cost is LOW because the current workaround is Excel and email. ",
+    "Evidence: 14 forum threads, 9 job postings mention the task explicitly. ",
+    "MVP_BUILD_COMPLEXITY (3 months): YES assuming focused scope and no hardware. ",
+    "Estimated direct losses $38k/year; indirect costs from disputes and overtime. ",
+    "GTM: SEO on long-tail compliance terms, LinkedIn groups, trade association lists. ",
+    "- Answer: NO - no dominant player with more than 30% share in this niche.\n",
+]
+
+def _build_corpus(rng: random.Random, size: int = 96_000) -> str:
+    parts = []
+    length = 0
+    while length < size:
+        sentence = rng.choice(ANALYSIS_SENTENCES)
+        parts.append(sentence)
+        length += len(sentence)
+    return "".join(parts)
+
+class PayloadFactory:
+    """Cheap variable-length text: random slices of one shared corpus"""
+
+    def __init__(self, rng: random.Random, scale: float = 1.0):
+        self.rng = rng
+        self.scale = scale
+        self.corpus = _build_corpus(rng)
+
+    def size(self, kind: str, cap: int = None) -> int:
+        median, sigma = PAYLOAD_SIZES[kind]
+        n = int(median * self.scale * math.exp(self.rng.gauss(0, sigma)))
+        if cap:
+            n = min(n, int(cap * self.scale) or 1)
+        return max(1, min(n, len(self.corpus)))
+
+    def text(self, kind: str, cap: int = None) -> str:
+        n = self.size(kind, cap)
+        start = self.rng.randint(0, len(self.corpus) - n)
+        return self.corpus[start:start + n]
+
+# ═══════════════════════════════════════════════════════════
+# KEY SHAPES
+# ═══════════════════════════════════════════════════════════
+
+def _death_stage(rng: random.Random) -> int:
+    """1-based stage the idea was killed at, or 0 if it survived everything"""
+    for stage, kill_prob in enumerate(KILL_CURVE, 1):
+        if rng.random() < kill_prob:
+            return stage
+    return 0
+
+def shape_v4(idea: Dict, rng: random.Random, payloads: PayloadFactory) -> Dict:
+    died = _death_stage(rng)
+    last = died or V4_STAGES + 1
+    out = {k: idea[k] for k in ("business", "pain", "id", "hash", "generated_date")}
+    for stage in range(1, last):
+        out[f"stage{stage}_analysis"] = payloads.text("analysis")
+    if died:
+        out["status"] = f"killed_stage{died}"
+        out["kill_reason"] = payloads.text("kill_reason", cap=MAX_KILL_REASON) if died == 1 else \
+            rng.choice(["Problem cost too low", "Insufficient evidence", "Build complexity", "GTM requires phone sales"])
+    else:
+        out["status"] = "WINNER"
+    return out
+
+def shape_v5(idea: Dict, rng: random.Random, payloads: PayloadFactory) -> Dict:
+    died = _death_stage(rng)
+    last = died or len(V5_STAGES) + 1
+    out = {k: idea[k] for k in ("business", "pain", "id", "hash", "generated_date")}
+    out["current_solution"] = f"{idea['current_workaround']} and manual follow-ups"
+    out["whitespace_evidence"] = payloads.text("result")[:400]
+    out["estimated_cost"] = f"${idea['current_annual_cost']:,}+ per business"
+    out["source_cluster"] = idea["pain"].split(",")[0][:60]
+    for stage in range(1, last + (1 if died else 0)):
+        name = V5_STAGES[stage - 1]
+        verdict = "KILL" if stage == died else "PASS"
+        # v5.0 stored results with str(dict), so they land in JSON as repr strings
+        out[f"{name}_result"] = str({"verdict": verdict, "analysis": {"reasoning": payloads.text("result")}})
+        out["status"] = f"{'killed' if verdict == 'KILL' else 'passed'}_{name}"
+    if died:
+        out["kill_reason"] = payloads.text("kill_reason", cap=MAX_KILL_REASON) if rng.random() < 0.8 else "API Error"
+    else:
+        out["status"] = "FINALIST"
+        out["validation_playbook"] = payloads.text("analysis")
+    return out
+
+def shape_v6(idea: Dict, rng: random.Random, payloads: PayloadFactory) -> Dict:
+    died = _death_stage(rng)
+    last = died or len(V6_STAGES) + 1
+    out = {k: v for k, v in idea.items() if not k.startswith("_")}
+    for stage in range(1, last + (1 if died else 0)):
+        out[f"{V6_STAGES[stage - 1]}_analysis"] = {
+            "verdict": "KILL" if stage == died else "PASS",
+            "reasoning": payloads.text("result"),
+        }
+    if died:
+        out["status"] = f"killed_stage{died}"
+        out["kill_reason"] = payloads.text("kill_reason", cap=MAX_KILL_REASON)
+    else:
+        out["status"] = "FINALIST"
+        out["validation_playbook"] = {"playbook": payloads.text("analysis")}
+    return out
+
+SHAPERS = {"v4.0": shape_v4, "v5.0": shape_v5, "v6.0": shape_v6}
+
+# ═══════════════════════════════════════════════════════════
+# DUPLICATES
+# ═══════════════════════════════════════════════════════════
+
+def exact_duplicate(source: Dict, rng: random.Random) -> Tuple[str, str]:
+    """Same business+pain modulo case/whitespace - same hash, idea_exists() must catch it"""
+    business, pain = source["business"], source["pain"]
+    variant = rng.choice(["upper", "lower", "pad"])
+    if variant == "upper":
+        return business.upper(), pain
+    if variant == "lower":
+        return business.lower(), pain.lower()
+    return f"  {business} ", f"{pain}  "
+
+def near_duplicate(source: Dict, rng: random.Random) -> Tuple[str, str]:
+    """Reworded pain - different hash, a semantic dedupe would have to catch it"""
+    pain = source["pain"]
+    swaps = [(", leading to", ", causing"), (", causing", ", resulting in"), ("Manually", "Manually and repeatedly"),
+             ("across", "between"), ("every week", "each week"), ("by hand", "manually")]
+    rng.shuffle(swaps)
+    for old, new in swaps:
+        if old in pain:
+            return source["business"], pain.replace(old, new, 1)
+    return source["business"], pain.rstrip(".") + " for the team"
+
+# ═══════════════════════════════════════════════════════════
+# GENERATOR
+# ═══════════════════════════════════════════════════════════
+
+def iter_bank(count: int, seed: int = 42, shape_mix: Dict[str, float] = None,
+              dup_rate: float = 0.0, near_dup_rate: float = 0.0, payload_scale: float = 1.0):
+    """Yield `count` bank ideas; ids are sequential like the real bank"""
+    rng = random.Random(seed)
+    payloads = PayloadFactory(rng, payload_scale)
+    mix = shape_mix or DEFAULT_SHAPE_MIX
+    versions, weights = list(mix), list(mix.values())
+
+    # Sources for duplicates: a bounded reservoir keeps memory flat at 1M ideas
+    reservoir = []
+    reservoir_size = 10_000
+    # Hashes seen so far, so accidental vocabulary collisions don't inflate the dup rate
+    seen = set()
+
+    for idea_id in range(1, count + 1):
+        base = make_idea(rng, idea_id, run_id=f"synthetic_{idea_id // 100:05d}")
+        roll = rng.random()
+        if reservoir and roll < dup_rate:
+            base["business"], base["pain"] = exact_duplicate(rng.choice(reservoir), rng)
+        elif reservoir and roll < dup_rate + near_dup_rate:
+            base["business"], base["pain"] = near_duplicate(rng.choice(reservoir), rng)
+        elif generate_idea_hash(base["business"], base["pain"]) in seen:
+            base["business"] = f"{base['business']} - segment {idea_id}"
+        base["hash"] = generate_idea_hash(base["business"], base["pain"])
+        seen.add(base["hash"])
+
+        idea = SHAPERS[rng.choices(versions, weights)[0]](base, rng, payloads)
+
+        source = {"business": base["business"], "pain": base["pain"]}
+        if len(reservoir) < reservoir_size:
+            reservoir.append(source)
+        else:
+            reservoir[rng.randrange(reservoir_size)] = source
+        yield idea
+
+def generate_bank(count: int, **kwargs) -> List[Dict]:
+    return list(iter_bank(count, **kwargs))
+
+def write_bank(path: str, count: int, **kwargs) -> Dict:
+    """Stream a bank to disk in the {"ideas": [...]} format; returns summary stats"""
+    stats = {"count": 0, "shapes": {}, "unique_hashes": 0, "max_kill_reason": 0}
+    hashes = set()
+    with open(path, 'w') as f:
+        f.write('{"ideas": [\n')
+        for idea in iter_bank(count, **kwargs):
+            if stats["count"]:
+                f.write(",\n")
+            f.write(json.dumps(idea))
+            stats["count"] += 1
+            hashes.add(idea["hash"])
+            shape = "v6.0" if "roi_statement" in idea else "v5.0" if "source_cluster" in idea else "v4.0"
+            stats["shapes"][shape] = stats["shapes"].get(shape, 0) + 1
+            stats["max_kill_reason"] = max(stats["max_kill_reason"], len(idea.get("kill_reason", "")))
+        f.write("\n]}\n")
+    stats["unique_hashes"] = len(hashes)
+    stats["file_mb"] = round(os.path.getsize(path) / 1024 / 1024, 1)
+    return stats
+
+def parse_mix(text: str) -> Dict[str, float]:
+    """'v4.0=0.2,v6.0=0.8' → {'v4.0': 0.2, 'v6.0': 0.8}"""
+    mix = {}
+    for part in text.split(","):
+        version, weight = part.split("=")
+        if version.strip() not in SHAPERS:
+            raise ValueError(f"Unknown shape '{version}' (known: {', '.join(SHAPERS)})")
+        mix[version.strip()] = float(weight)
+    return mix
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate a synthetic ideas_bank.json")
+    parser.add_argument("--count", type=int, default=10_000, help="Number of ideas")
+    parser.add_argument("--output", type=str, default="ideas_bank_synthetic.json", help="Output path")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--mix", type=str, default=None, help="Shape mix, e.g. v4.0=0.3,v5.0=0.3,v6.0=0.4")
+    parser.add_argument("--dup-rate", type=float, default=0.01, help="Share of exact (same-hash) duplicates")
+    parser.add_argument("--near-dup-rate", type=float, default=0.03, help="Share of reworded near-duplicates")
+    parser.add_argument("--payload-scale", type=float, default=1.0, help="Multiplier on analysis/kill_reason sizes")
+    args = parser.parse_args()
+
+    print(f"🏭 Generating {args.count:,} ideas → {args.output}")
+    stats = write_bank(
+        args.output, args.count, seed=args.seed,
+        shape_mix=parse_mix(args.mix) if args.mix else None,
+        dup_rate=args.dup_rate, near_dup_rate=args.near_dup_rate, payload_scale=args.payload_scale,
+    )
+    print(f"✅ {stats['count']:,} ideas, {stats['unique_hashes']:,} unique hashes, {stats['file_mb']} MB")
+    print(f"   Shapes: {stats['shapes']}")
+    print(f"   Largest kill_reason: {stats['max_kill_reason']:,} chars")
+
+if __name__ == "__main__":
+    main()
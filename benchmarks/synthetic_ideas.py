@@ -0,0 +1,113 @@
+"""
+Synthetic idea generator for benchmarks
+Produces Stage 0D-shaped ideas (the v6.0 schema, which older versions also accept)
+"""
+
+import random
+import hashlib
+from datetime import datetime
+from typing import List, Dict
+
+BUSINESS_TYPES = [
+    "HVAC contractors", "Electrical contractors", "Commercial plumbing companies",
+    "Regional trucking fleets", "Freight brokerages", "Third-party logistics warehouses",
+    "Food distributors", "Industrial parts wholesalers", "Contract manufacturers",
+    "Machine shops", "Commercial landscaping companies", "Pest control operators",
+    "Commercial cleaning companies", "Event rental companies", "Equipment rental yards",
+    "Roofing contractors", "Fire protection contractors", "Elevator service companies",
+    "Sign and graphics shops", "Commercial print shops", "Courier services",
+    "Cold storage operators", "Auto body shops", "Fleet maintenance shops",
+]
+
+BUSINESS_SIZES = [
+    "($2-10M revenue, 15-40 employees)", "($5-20M revenue, 20-60 employees)",
+    "($10-50M revenue, 50-200 employees)", "($5-50M revenue)",
+]
+
+PAIN_TEMPLATES = [
+    "Manually tracking {asset} across {where}, leading to {outcome}",
+    "Reconciling {asset} between {where} by hand every week, causing {outcome}",
+    "No single view of {asset} across {where}, resulting in {outcome}",
+    "Chasing {asset} updates by phone and email across {where}, which causes {outcome}",
+    "Re-keying {asset} from {where} into spreadsheets, producing {outcome}",
+]
+
+ASSETS = [
+    "warranty expirations", "certificate of insurance renewals", "equipment calibration dates",
+    "subcontractor compliance documents", "driver hours and inspection reports",
+    "customer-supplied material counts", "change orders", "preventive maintenance schedules",
+    "rental return conditions", "lot and expiry dates", "permit inspection windows",
+    "vendor price changes", "proof-of-delivery photos", "service agreement renewals",
+]
+
+LOCATIONS = [
+    "multiple job sites", "three ERP exports", "dispatch and billing", "field techs and the office",
+    "several vendor portals", "email threads and paper forms", "branch locations",
+]
+
+OUTCOMES = [
+    "$40k+/year in missed reimbursements", "15-20% of invoices disputed",
+    "8-12 hours/week of admin time per coordinator", "late fees and failed audits",
+    "lost repeat business", "overtime for office staff every month-end",
+]
+
+WORKAROUNDS = ["Excel", "Google Sheets", "email", "paper forms", "phone calls", "whiteboard"]
+FREQUENCIES = ["daily", "weekly", "monthly"]
+
+def generate_idea_hash(business: str, pain: str) -> str:
+    """Same hash scheme as the v4.0-v6.0 ideas bank"""
+    combined = f"{business.lower().strip()}||{pain.lower().strip()}"
+    return hashlib.md5(combined.encode()).hexdigest()[:12]
+
+def make_idea(rng: random.Random, idea_id: int, run_id: str = "synthetic") -> Dict:
+    """One fresh Stage 0D idea, status 'generated'"""
+    business = f"{rng.choice(BUSINESS_TYPES)} {rng.choice(BUSINESS_SIZES)}"
+    pain = rng.choice(PAIN_TEMPLATES).format(
+        asset=rng.choice(ASSETS), where=rng.choice(LOCATIONS), outcome=rng.choice(OUTCOMES)
+    )
+    hours = rng.randint(3, 25)
+    annual_cost = hours * rng.choice([35, 45, 55, 65]) * 52
+    workaround = rng.choice(WORKAROUNDS)
+
+    return {
+        "business": business,
+        "pain": pain,
+        "roi_statement": f"You're wasting ${annual_cost:,}/year on {pain.split(',')[0].lower()}",
+        "current_annual_cost": annual_cost,
+        "time_waste_description": f"{hours} hours/week doing this in {workaround}",
+        "frequency": rng.choice(FREQUENCIES),
+        "current_workaround": workaround,
+        "why_persists": "Horizontal tools don't model this workflow and vertical suites are too expensive",
+        "digital_solution_overview": "Import, reminders, status dashboard, audit trail, email digests",
+        "buildable_3_months": True,
+        "no_hardware_required": True,
+        "no_certifications_required": True,
+        "solo_founder_feasible": True,
+        "public_apis_only": True,
+        "estimated_tam": rng.choice([8, 15, 25, 60, 120]) * 1_000_000,
+        "evidence_preview": {
+            "forum_mentions": rng.randint(0, 40),
+            "job_postings": rng.randint(0, 60),
+            "reddit_threads": rng.randint(0, 25),
+        },
+        "id": idea_id,
+        "hash": generate_idea_hash(business, pain),
+        "generated_date": datetime.now().strftime("%Y-%m-%d"),
+        "run_id": run_id,
+        "status": "generated",
+        # Hidden ground truth for the mock provider: probability each check passes
+        "_bench_quality": round(rng.betavariate(4, 2), 3),
+    }
+
+def generate_ideas(count: int, seed: int = 42, run_id: str = "synthetic") -> List[Dict]:
+    """Deterministic list of unique synthetic ideas"""
+    rng = random.Random(seed)
+    ideas = []
+    seen = set()
+    while len(ideas) < count:
+        idea = make_idea(rng, len(ideas) + 1, run_id)
+        if idea["hash"] in seen:
+            continue
+        seen.add(idea["hash"])
+        ideas.append(idea)
+    return ideas
@@ -0,0 +1,268 @@
+#!/usr/bin/env python3
+"""
+Content-addressed blob store for the big text fields of ideas
+
+Kill reasons (full LLM transcripts), stageN_analysis text, stage results and
+validation playbooks are most of ideas_bank.json - some ideas pass 30 KB.
+They now live in ideas_bank.blobs/, one zlib-compressed file per distinct
+value, named by the sha256 of its JSON:
+
+    ideas_bank.blobs/3f/3f2a9c...e1.json.z
+
+and the bank row keeps a reference in their place:
+
+    {"business": "...", "status": "killed_stage1", "kill_reason": {"$blob": "3f2a9c...e1", "bytes": 10136}}
+
+ideas_journal.py slims ideas as it writes events and snapshots: any field of
+IDEAS_BLOB_MIN_BYTES or more (except the identity fields) becomes a blob.
+Loaded ideas are LazyIdea dicts - a body is read and decompressed the first
+time its field is read (idea["kill_reason"], .get, .items(), json.dumps,
+{**idea}), so loading the bank or listing it in the dashboard doesn't touch
+the bodies. Identical bodies are stored once.
+
+    python blob_store.py          # blob count and sizes
+    python blob_store.py --gc     # delete blobs the bank no longer references
+"""
+
+import os
+import json
+import zlib
+import time
+import shutil
+import hashlib
+import argparse
+import threading
+from typing import Callable, Dict, Iterator, List, Optional, Set
+
+IDEAS_BLOB_MIN_BYTES = int(os.getenv("IDEAS_BLOB_MIN_BYTES", "1024"))
+BLOB_COMPRESSION_LEVEL = 6
+REF_KEY = "$blob"
+
+# Never moved out: dedupe, status checks and the dashboard lists read these for every idea
+INLINE_FIELDS = {"id", "hash", "business", "pain", "status", "generated_date"}
+
+# --gc leaves recent blobs alone: a running pipeline writes the blob before its journal event
+GC_GRACE_SECONDS = 3600
+
+def blobs_dir(bank_path: str) -> str:
+    return os.path.splitext(bank_path)[0] + ".blobs"
+
+def is_ref(value) -> bool:
+    return type(value) is dict and REF_KEY in value
+
+def value_size(value) -> int:
+    """Rough serialized size; only text and containers can be big"""
+    if isinstance(value, str):
+        return len(value)
+    if isinstance(value, (dict, list)):
+        return len(json.dumps(value))
+    return 0
+
+# ═══════════════════════════════════════════════════════════
+# STORE
+# ═══════════════════════════════════════════════════════════
+
+class BlobStore:
+    """
+    sha256-named, zlib-compressed JSON values under one directory. Writes go
+    to a temp file and are renamed into place, so a reader never sees half a
+    blob; an existing blob is never rewritten. fsync is left to sync(), which
+    the journal calls with its own batched fsync.
+    """
+
+    def __init__(self, root: str, min_bytes: Optional[int] = None):
+        self.root = root
+        self.min_bytes = IDEAS_BLOB_MIN_BYTES if min_bytes is None else min_bytes
+        self._unsynced: List[str] = []
+        self._lock = threading.Lock()
+        self.written = 0  # blobs this instance actually wrote (not already present)
+        self.written_bytes = 0
+
+    def path(self, digest: str) -> str:
+        return os.path.join(self.root, digest[:2], digest + ".json.z")
+
+    def put(self, value) -> Dict:
+        """Store `value`; returns its reference"""
+        data = json.dumps(value).encode("utf-8")  # key order kept, so a restored idea reads the same
+        digest = hashlib.sha256(data).hexdigest()
+        path = self.path(digest)
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            compressed = zlib.compress(data, BLOB_COMPRESSION_LEVEL)
+            with open(tmp_path, 'wb') as f:
+                f.write(compressed)
+            os.replace(tmp_path, path)
+            with self._lock:
+                self._unsynced.append(path)
+                self.written += 1
+                self.written_bytes += len(compressed)
+        return {REF_KEY: digest, "bytes": len(data)}
+
+    def has(self, digest: str) -> bool:
+        return os.path.exists(self.path(digest))
+
+    def copy_from(self, source: "BlobStore", digest: str):
+        """Take a blob from another store as-is (same name, same bytes - no decompress or rehash)"""
+        path = self.path(digest)
+        if os.path.exists(path):
+            return
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        shutil.copyfile(source.path(digest), tmp_path)
+        os.replace(tmp_path, path)
+        with self._lock:
+            self._unsynced.append(path)
+            self.written += 1
+            self.written_bytes += os.path.getsize(path)
+
+    def get(self, ref: Dict):
+        """The value behind a reference"""
+        digest = ref[REF_KEY]
+        try:
+            with open(self.path(digest), 'rb') as f:
+                return json.loads(zlib.decompress(f.read()))
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Blob {digest} is missing from {self.root}") from None
+
+    def sync(self):
+        """fsync the blobs written since the last sync"""
+        with self._lock:
+            paths, self._unsynced = self._unsynced, []
+        for path in paths:
+            fd = os.open(path, os.O_RDONLY)
+            try:
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+
+    def slim(self, idea: Dict) -> Dict:
+        """Copy of `idea` (or of a stage_result "set") with its big fields replaced by references"""
+        return {field: self.slim_field(field, value) for field, value in dict.items(idea)}
+
+    def slim_field(self, field: str, value):
+        if field in INLINE_FIELDS or is_ref(value) or value_size(value) < self.min_bytes:
+            return value
+        return self.put(value)
+
+    def digests(self) -> Iterator[str]:
+        if not os.path.isdir(self.root):
+            return
+        for prefix in sorted(os.listdir(self.root)):
+            folder = os.path.join(self.root, prefix)
+            if os.path.isdir(folder):
+                for name in sorted(os.listdir(folder)):
+                    if name.endswith(".json.z"):
+                        yield name[:-len(".json.z")]
+
+    def gc(self, live: Set[str], grace_seconds: float = GC_GRACE_SECONDS) -> int:
+        """Delete blobs not in `live` and older than `grace_seconds`; returns blobs deleted"""
+        cutoff = time.time() - grace_seconds
+        removed = 0
+        for digest in list(self.digests()):
+            path = self.path(digest)
+            if digest not in live and os.path.getmtime(path) < cutoff:
+                os.remove(path)
+                removed += 1
+        return removed
+
+    def __getstate__(self) -> Dict:
+        # Picklable (streamlit's cache pickles loaded ideas); pending fsyncs stay with this process
+        return {"root": self.root, "min_bytes": self.min_bytes}
+
+    def __setstate__(self, state: Dict):
+        self.__init__(state["root"], state["min_bytes"])
+
+# ═══════════════════════════════════════════════════════════
+# LAZY IDEAS
+# ═══════════════════════════════════════════════════════════
+
+class LazyIdea(dict):
+    """
+    An idea whose blob references are fetched on first read. A fetched body
+    replaces its reference, so it is read once. dict.items(idea) and
+    dict.__getitem__ still see the raw row (the journal diffs against that).
+    """
+
+    def __init__(self, raw: Dict, store: BlobStore,
+                 on_resolve: Optional[Callable[[str, Dict, object], None]] = None):
+        super().__init__(raw)
+        self._store = store
+        self._on_resolve = on_resolve
+
+    def _resolve(self, field: str, value):
+        if not is_ref(value):
+            return value
+        body = self._store.get(value)
+        dict.__setitem__(self, field, body)
+        if self._on_resolve is not None:
+            self._on_resolve(field, value, body)
+        return body
+
+    def __getitem__(self, field: str):
+        return self._resolve(field, dict.__getitem__(self, field))
+
+    def get(self, field: str, default=None):
+        return self[field] if field in self else default
+
+    def pop(self, field: str, *default):
+        if field in self:
+            value = self[field]
+            dict.__delitem__(self, field)
+            return value
+        return dict.pop(self, field, *default)
+
+    def setdefault(self, field: str, default=None):
+        if field not in self:
+            dict.__setitem__(self, field, default)
+        return self[field]
+
+    def __iter__(self):
+        # Overriding __iter__ makes dict(idea) and {**idea} copy through __getitem__, not the raw storage
+        return dict.__iter__(self)
+
+    def items(self):
+        return [(field, self[field]) for field in dict.keys(self)]
+
+    def values(self):
+        return [self[field] for field in dict.keys(self)]
+
+    def copy(self) -> Dict:
+        return dict(self.items())
+
+    def __reduce__(self):
+        # Pickling and deepcopy keep references unresolved (and drop the journal hook)
+        return (LazyIdea, (dict(dict.items(self)), self._store))
+
+# ═══════════════════════════════════════════════════════════
+# CLI
+# ═══════════════════════════════════════════════════════════
+
+def main():
+    from ideas_journal import IDEAS_BANK_FILE, referenced_blobs
+
+    parser = argparse.ArgumentParser(description="Ideas bank blob store: sizes, garbage collection")
+    parser.add_argument("--bank", default=IDEAS_BANK_FILE)
+    parser.add_argument("--gc", action="store_true", help="Delete blobs the snapshot and journal don't reference")
+    parser.add_argument("--grace", type=float, default=GC_GRACE_SECONDS,
+                        help="Keep unreferenced blobs younger than this many seconds")
+    args = parser.parse_args()
+
+    store = BlobStore(blobs_dir(args.bank))
+    if args.gc:
+        live = referenced_blobs(args.bank)
+        removed = store.gc(live, args.grace)
+        print(f"🧹 Removed {removed} unreferenced blobs ({len(live)} referenced)")
+        return
+
+    count, stored = 0, 0
+    for digest in store.digests():
+        count += 1
+        stored += os.path.getsize(store.path(digest))
+    if not count:
+        print(f"📦 No blobs in {store.root} yet (written as ideas are saved, or by python ideas_journal.py --compact)")
+        return
+    print(f"📦 {store.root}: {count} blobs, {stored / 1024 / 1024:.1f} MB compressed")
+
+if __name__ == "__main__":
+    main()
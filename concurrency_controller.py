@@ -0,0 +1,257 @@
+"""
+Adaptive concurrency controller
+One AIMD limiter per provider + model (openai/gpt-5-mini, openai/gpt-4o,
+perplexity/sonar, ...) caps how many API calls are in flight at once.
+
+    additive increase       +1 slot per `limit` healthy calls while the limiter is full,
+                            success rate and p95 latency look normal
+    multiplicative decrease × 0.5 on 429 / 5xx / timeouts, × 0.8 on a p95 latency spike
+
+provider_client.with_retries() / async_with_retries() take a slot for every
+attempt, so --workers only bounds how many ideas are in progress; the
+controller decides how many of their calls actually hit each provider.
+
+Learned limits are saved to concurrency_state.json, so the next run starts
+from the last level instead of re-probing from INITIAL_LIMIT.
+"""
+
+import os
+import json
+import time
+import asyncio
+import threading
+from collections import deque
+from datetime import datetime
+from typing import Dict, List, Optional
+
+# ═══════════════════════════════════════════════════════════
+# CONFIGURATION
+# ═══════════════════════════════════════════════════════════
+
+CONCURRENCY_STATE_FILE = "concurrency_state.json"
+
+INITIAL_LIMIT = 4
+MIN_LIMIT = 1
+DEFAULT_MAX_LIMIT = 16
+PROVIDER_MAX_LIMITS = {"openai": 32, "anthropic": 16, "perplexity": 16, "google": 8}
+
+CONGESTION_BACKOFF = 0.5        # 429 / 5xx / timeout
+LATENCY_BACKOFF = 0.8           # p95 spike
+DECREASE_COOLDOWN_SECONDS = 5.0 # a burst of 429s from one window only halves once
+
+LATENCY_WINDOW = 20             # successful calls kept for p95
+MIN_LATENCY_SAMPLES = 10
+LATENCY_SPIKE_FACTOR = 2.0      # p95 above 2x the learned baseline counts as a spike
+BASELINE_ALPHA = 0.05           # EWMA weight of a healthy window's p95
+
+OUTCOME_WINDOW = 20
+HEALTHY_SUCCESS_RATE = 0.95
+
+ASYNC_POLL_SECONDS = 0.05
+SAVE_INTERVAL_SECONDS = 30.0
+
+def p95(samples) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+
+# ═══════════════════════════════════════════════════════════
+# AIMD LIMITER
+# ═══════════════════════════════════════════════════════════
+
+class AIMDController:
+    """In-flight limit for one provider/model; thread-safe, usable from coroutines"""
+
+    def __init__(self, key: str, limit: float = INITIAL_LIMIT, max_limit: int = DEFAULT_MAX_LIMIT,
+                 baseline_p95: Optional[float] = None):
+        self.key = key
+        self.max_limit = max_limit
+        self.limit = min(max(float(limit), MIN_LIMIT), max_limit)
+        self.baseline_p95 = baseline_p95
+        self.in_flight = 0
+        self.latencies = deque(maxlen=LATENCY_WINDOW)
+        self.outcomes = deque(maxlen=OUTCOME_WINDOW)
+        self.last_decrease = 0.0
+        self.stats = {"calls": 0, "congested": 0, "waits": 0, "increases": 0, "decreases": 0,
+                      "peak_in_flight": 0, "start_limit": int(self.limit)}
+        self._cond = threading.Condition()
+
+    # ── slots ──────────────────────────────────────────────
+
+    def _try_acquire(self) -> Optional[tuple]:
+        with self._cond:
+            if self.in_flight >= int(self.limit):
+                return None
+            self.in_flight += 1
+            self.stats["calls"] += 1
+            self.stats["peak_in_flight"] = max(self.stats["peak_in_flight"], self.in_flight)
+            # Only a full limiter is evidence that more slots would be used
+            return time.monotonic(), self.in_flight >= int(self.limit)
+
+    def acquire(self) -> tuple:
+        """Block until a slot is free; returns the ticket release() needs"""
+        ticket = self._try_acquire()
+        if ticket is None:
+            with self._cond:
+                self.stats["waits"] += 1
+            while ticket is None:
+                with self._cond:
+                    self._cond.wait(1.0)
+                ticket = self._try_acquire()
+        return ticket
+
+    async def acquire_async(self) -> tuple:
+        """acquire() without blocking the event loop (slots are shared with threads)"""
+        ticket = self._try_acquire()
+        if ticket is None:
+            with self._cond:
+                self.stats["waits"] += 1
+            while ticket is None:
+                await asyncio.sleep(ASYNC_POLL_SECONDS)
+                ticket = self._try_acquire()
+        return ticket
+
+    def release(self, ticket: tuple, outcome: str = "ok"):
+        """outcome: ok | congested (429/5xx/timeout) | error (not a capacity signal) | cancelled"""
+        started, saturated = ticket
+        with self._cond:
+            self.in_flight -= 1
+            if outcome == "ok":
+                self.outcomes.append(True)
+                self.latencies.append(time.monotonic() - started)
+                self._on_success(saturated)
+            elif outcome == "congested":
+                self.outcomes.append(False)
+                self.stats["congested"] += 1
+                self._decrease(CONGESTION_BACKOFF, "rate limited / server error")
+            self._cond.notify_all()
+        _autosave()
+
+    # ── AIMD ───────────────────────────────────────────────
+
+    def _on_success(self, saturated: bool):
+        if len(self.latencies) >= MIN_LATENCY_SAMPLES:
+            current = p95(self.latencies)
+            if self.baseline_p95 is None:
+                self.baseline_p95 = current
+            elif current > self.baseline_p95 * LATENCY_SPIKE_FACTOR:
+                if self._decrease(LATENCY_BACKOFF, f"p95 {current:.1f}s vs {self.baseline_p95:.1f}s baseline"):
+                    self.latencies.clear()
+                return
+            else:
+                self.baseline_p95 += BASELINE_ALPHA * (current - self.baseline_p95)
+
+        success_rate = sum(self.outcomes) / len(self.outcomes)
+        if saturated and success_rate >= HEALTHY_SUCCESS_RATE and self.limit < self.max_limit:
+            before = int(self.limit)
+            self.limit = min(self.max_limit, self.limit + 1 / self.limit)
+            if int(self.limit) > before:
+                self.stats["increases"] += 1
+                print(f"      📈 {self.key} concurrency {before} → {int(self.limit)}")
+
+    def _decrease(self, factor: float, reason: str) -> bool:
+        now = time.monotonic()
+        if now - self.last_decrease < DECREASE_COOLDOWN_SECONDS:
+            return False
+        self.last_decrease = now
+        before = int(self.limit)
+        self.limit = max(float(MIN_LIMIT), self.limit * factor)
+        self.stats["decreases"] += 1
+        print(f"      📉 {self.key} concurrency {before} → {int(self.limit)} ({reason})")
+        return True
+
+    # ── telemetry / persistence ────────────────────────────
+
+    def snapshot(self) -> Dict:
+        with self._cond:
+            return {
+                "limit": int(self.limit),
+                "in_flight": self.in_flight,
+                "p95_seconds": round(p95(self.latencies), 2) if self.latencies else None,
+                "baseline_p95_seconds": round(self.baseline_p95, 2) if self.baseline_p95 else None,
+                **self.stats,
+            }
+
+    def state(self) -> Dict:
+        with self._cond:
+            return {"limit": round(self.limit, 3), "baseline_p95": self.baseline_p95,
+                    "updated_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
+
+# ═══════════════════════════════════════════════════════════
+# REGISTRY
+# ═══════════════════════════════════════════════════════════
+
+_controllers: Dict[str, AIMDController] = {}
+_registry_lock = threading.Lock()
+_saved_state: Optional[Dict] = None
+_last_save = 0.0
+
+def controller_key(provider: str, model: Optional[str] = None) -> str:
+    return f"{provider}/{model}" if model else provider
+
+def load_state() -> Dict[str, Dict]:
+    """{key: {"limit", "baseline_p95", "updated_at"}} from the last runs"""
+    if os.path.exists(CONCURRENCY_STATE_FILE):
+        try:
+            with open(CONCURRENCY_STATE_FILE, 'r') as f:
+                return json.load(f).get("controllers", {})
+        except (json.JSONDecodeError, OSError):
+            return {}
+    return {}
+
+def save_state():
+    """Merge this process's limits into the state file (other processes may share it)"""
+    global _last_save
+    with _registry_lock:
+        controllers = list(_controllers.values())
+        _last_save = time.monotonic()
+    if not controllers:
+        return
+
+    state = load_state()
+    for controller in controllers:
+        state[controller.key] = controller.state()
+
+    tmp_path = f"{CONCURRENCY_STATE_FILE}.{os.getpid()}.tmp"
+    with open(tmp_path, 'w') as f:
+        json.dump({"controllers": state}, f, indent=2)
+    os.replace(tmp_path, CONCURRENCY_STATE_FILE)
+
+def _autosave():
+    if time.monotonic() - _last_save > SAVE_INTERVAL_SECONDS:
+        try:
+            save_state()
+        except OSError as e:
+            print(f"      ⚠️  Could not save {CONCURRENCY_STATE_FILE}: {e}")
+
+def get_controller(provider: str, model: Optional[str] = None) -> AIMDController:
+    global _saved_state, _last_save
+    key = controller_key(provider, model)
+    with _registry_lock:
+        if key not in _controllers:
+            if _saved_state is None:
+                _saved_state = load_state()
+                _last_save = time.monotonic()
+            saved = _saved_state.get(key, {})
+            _controllers[key] = AIMDController(
+                key,
+                limit=saved.get("limit", INITIAL_LIMIT),
+                max_limit=PROVIDER_MAX_LIMITS.get(provider, DEFAULT_MAX_LIMIT),
+                baseline_p95=saved.get("baseline_p95"),
+            )
+        return _controllers[key]
+
+def concurrency_stats() -> Dict[str, Dict]:
+    """{key: snapshot} for every provider/model used in this process"""
+    with _registry_lock:
+        controllers = list(_controllers.values())
+    return {c.key: c.snapshot() for c in controllers}
+
+def concurrency_summary_lines() -> List[str]:
+    """Run summary lines: learned limit, peak in flight, congestion signals"""
+    lines = []
+    for key, s in concurrency_stats().items():
+        latency = f", p95 {s['p95_seconds']}s" if s["p95_seconds"] is not None else ""
+        lines.append(f"{key}: limit {s['start_limit']} → {s['limit']} (peak {s['peak_in_flight']} in flight), "
+                     f"{s['calls']} calls, {s['congested']} throttled/5xx, "
+                     f"{s['increases']}↑ {s['decreases']}↓{latency}")
+    return lines
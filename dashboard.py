@@ -5,10 +5,11 @@ View all tested ideas, stage-by-stage breakdown, and winners
 """
 
 import streamlit as st
-import json
 import pandas as pd
 from datetime import datetime
-import os
+
+from ideas_journal import load_bank
+from search_index import SearchIndex
 
 # Page config
 st.set_page_config(
@@ -20,11 +21,7 @@ st.set_page_config(
 # Load ideas bank
 @st.cache_data
 def load_ideas():
-    if os.path.exists("ideas_bank.json"):
-        with open("ideas_bank.json", 'r') as f:
-            data = json.load(f)
-            return data.get("ideas", [])
-    return []
+    return load_bank("ideas_bank.json")  # snapshot + journal; kill reasons / analyses are read when shown
 
 ideas = load_ideas()
 
@@ -52,7 +49,7 @@ with col4:
 st.markdown("---")
 
 # Tabs
-tab1, tab2, tab3, tab4, tab5 = st.tabs(["📊 Funnel", "💡 All Ideas", "🏆 Winners", "❌ Kill Reasons", "📈 Stats"])
+tab1, tab2, tab3, tab4, tab5, tab6 = st.tabs(["📊 Funnel", "💡 All Ideas", "🏆 Winners", "❌ Kill Reasons", "📈 Stats", "🔎 Search"])
 
 # TAB 1: Funnel
 with tab1:
@@ -287,6 +284,38 @@ with tab5:
     else:
         st.info("No statistics available yet.")
 
+# TAB 6: Search
+with tab6:
+    st.header("🔎 Have We Researched This Before?")
+    st.caption("Searches idea text, kill reasons, stage analyses and research/winner reports. "
+               "Supports \"phrases\", OR, NOT and prefix*.")
+
+    col1, col2 = st.columns([3, 1])
+    with col1:
+        query = st.text_input("Search", placeholder="e.g. paper intake forms")
+    with col2:
+        scope = st.selectbox("In", ["Everything", "Ideas", "Killed ideas", "Research reports", "Winner reports"])
+
+    if query:
+        index = SearchIndex()
+        index.update("ideas_bank.json")  # only new/changed ideas and reports are re-indexed
+        kind = {"Ideas": "idea", "Killed ideas": "idea", "Research reports": "report", "Winner reports": "winner"}.get(scope)
+        status = "killed" if scope == "Killed ideas" else None
+        results = index.search(query, limit=25, kind=kind, status=status, marks=("**", "**"))
+
+        st.markdown(f"**{len(results)} matches**")
+        for result in results:
+            label = (result["status"] or result["kind"]).replace("killed_stage", "Killed Stage ")
+            with st.expander(f"[{label}] {result['title'][:100]}"):
+                st.markdown(" ".join(result["snippet"].split()))
+                st.caption(result["source"])
+                if result["kind"] == "idea" and (result["status"] or "").startswith("killed_"):
+                    match = next((i for i in ideas if i.get("hash") == result["source"].split("#")[0]), None)
+                    if match is not None:
+                        reason = match.get("kill_reason", "No reason provided")
+                        st.markdown("**Kill reason:**")
+                        st.text(reason[:800] + "..." if len(reason) > 800 else reason)
+
 # Footer
 st.markdown("---")
 st.caption(f"Last updated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} | Total ideas in bank: {total_ideas}")
@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+"""
+DISTRIBUTED PIPELINE - the v6.0 funnel across N worker processes / hosts
+
+    python distributed_pipeline.py coordinator --count 50      # Stage 0, enqueue, track, playbooks
+    python distributed_pipeline.py worker                      # start as many as you like
+    python distributed_pipeline.py status --run-id 2025-10-09_14-02-11
+
+coordinator: runs Stage 0 (generate_new_ideas), enqueues a Stage 1 task per
+  idea, then applies finished tasks to ideas_bank.json (it is the only
+  writer), enqueues the next stage for survivors and writes FINALIST reports
+  once the funnel drains. Restart it with --run-id to re-attach to a run.
+worker: leases idea × stage tasks, runs the v6.0 stage function, heartbeats
+  while the stage runs and hands the updated idea back through the queue.
+
+Queue: --queue / JOB_QUEUE_URL (see job_queue.py). sqlite:///job_queue.db
+for one host; point every host at the same redis://host:6379/0 for several.
+Each worker host uses its own .env API keys.
+"""
+
+import os
+import sys
+import time
+import socket
+import argparse
+import threading
+from datetime import datetime
+from typing import Dict, List
+
+from job_queue import open_queue, DEFAULT_QUEUE_URL, VISIBILITY_TIMEOUT_SECONDS
+from pipeline_versions import load_pipeline
+from provider_client import ProviderError, TransientAPIError, PermanentAPIError
+from retry_queue import defer_idea, idea_key
+from concurrency_controller import save_state as save_concurrency_state
+from kill_predictor import screen_ideas, update_predictor
+
+PIPELINE = "v6.0"
+POLL_SECONDS = 2.0
+
+# ═══════════════════════════════════════════════════════════
+# WORKER
+# ═══════════════════════════════════════════════════════════
+
+def keep_lease(queue, task: Dict, visibility_timeout: float, stop: threading.Event):
+    """Heartbeat thread: extend the lease every third of the visibility timeout"""
+    while not stop.wait(visibility_timeout / 3):
+        if not queue.heartbeat(task["id"], task["lease_token"], visibility_timeout):
+            print(f"   ⚠️  Lost lease on {task['id']} - another worker will redo it")
+            return
+
+def run_task(pipeline, task: Dict) -> Dict:
+    """Run one idea × stage; returns the result the coordinator applies"""
+    payload = task["payload"]
+    idea = payload["idea"]
+    stage_name, stage_func, _ = pipeline.build_stages(payload.get("founder_profile", {}))[task["stage_index"]]
+
+    try:
+        passed, reason, analysis = stage_func(idea)
+    except ProviderError as e:
+        return {"outcome": "deferred", "idea": idea, "error": e.message, "provider": e.provider,
+                "transient": e.transient}
+    except Exception as e:
+        # A crashing stage shouldn't take the worker down; park the idea like an API error
+        return {"outcome": "deferred", "idea": idea, "error": f"{type(e).__name__}: {e}",
+                "provider": "worker", "transient": False}
+
+    pipeline.apply_stage_result(idea, stage_name, passed, reason, analysis)
+    return {"outcome": "passed" if passed else "killed", "idea": idea}
+
+def run_worker(queue, worker_id: str, visibility_timeout: float, idle_exit: float):
+    pipeline = load_pipeline(PIPELINE)
+    print(f"👷 Worker {worker_id} polling {queue.__class__.__name__}")
+
+    idle_since = time.time()
+    while True:
+        task = queue.lease(worker_id, visibility_timeout)
+        if task is None:
+            if idle_exit and time.time() - idle_since > idle_exit:
+                print(f"\n💤 Idle for {idle_exit:.0f}s - exiting")
+                return
+            time.sleep(POLL_SECONDS)
+            continue
+
+        print(f"\n📥 {task['stage_name']} - Idea #{task['payload']['idea'].get('id')} (attempt {task['attempts']})")
+        stop = threading.Event()
+        heartbeat = threading.Thread(target=keep_lease, args=(queue, task, visibility_timeout, stop), daemon=True)
+        heartbeat.start()
+        try:
+            result = run_task(pipeline, task)
+        except KeyboardInterrupt:
+            queue.release(task["id"], task["lease_token"])
+            print("\n⏹️  Released current task - exiting")
+            return
+        finally:
+            stop.set()
+
+        if queue.complete(task["id"], task["lease_token"], result):
+            print(f"📤 {result['outcome'].upper()}")
+        else:
+            print(f"⚠️  Lease expired before completion - result discarded")
+        idle_since = time.time()
+
+# ═══════════════════════════════════════════════════════════
+# COORDINATOR
+# ═══════════════════════════════════════════════════════════
+
+def enqueue_stage(queue, run_id: str, stages: List, stage_index: int, idea: Dict, founder_profile: Dict):
+    stage_name = stages[stage_index][0]
+    queue.enqueue(run_id, stage_index, stage_name, idea_key(idea),
+                  {"idea": idea, "founder_profile": founder_profile})
+
+def apply_result(pipeline, queue, task: Dict, run_id: str, stages: List, ideas_bank: List[Dict],
+                 positions: Dict[str, int], founder_profile: Dict) -> str:
+    """Write a finished task back into the bank and move the idea along the funnel"""
+    stage_index, stage_name = task["stage_index"], task["stage_name"]
+    result = task["result"] or {"outcome": "deferred", "idea": task["payload"]["idea"],
+                                "error": task.get("error") or "task failed", "provider": "worker",
+                                "transient": True}
+    idea = result["idea"]
+
+    # The worker's copy carries the new analysis; replace the bank's entry
+    key = idea_key(idea)
+    if key in positions:
+        ideas_bank[positions[key]] = idea
+    else:
+        positions[key] = len(ideas_bank)
+        ideas_bank.append(idea)
+
+    outcome = result["outcome"]
+    if outcome == "deferred":
+        error_class = TransientAPIError if result.get("transient") else PermanentAPIError
+        idea["status"] = f"deferred_{pipeline.stage_key(stage_name)}"
+        defer_idea(idea, stage_name, error_class(result.get("provider") or "worker", result["error"]),
+                   pipeline.PIPELINE_VERSION)
+    elif outcome == "passed":
+        if stage_index + 1 < len(stages):
+            enqueue_stage(queue, run_id, stages, stage_index + 1, idea, founder_profile)
+        else:
+            idea["status"] = f"passed_{pipeline.stage_key(stage_name)}"
+    return outcome
+
+def print_progress(counts: Dict[str, Dict[str, int]]):
+    line = " | ".join(
+        f"{name.split(':')[0]}: {c.get('queued', 0)}q {c.get('leased', 0)}⚙️ "
+        f"{c.get('done', 0) + c.get('applied', 0) + c.get('failed', 0)}✓"
+        for name, c in counts.items()
+    )
+    print(f"[{datetime.now().strftime('%H:%M:%S')}] {line}")
+
+def track_run(pipeline, queue, run_id: str, stages: List, ideas_bank: List[Dict], founder_profile: Dict):
+    """Apply results until nothing is queued, leased or waiting to be applied"""
+    tally = {"passed": 0, "killed": 0, "deferred": 0}
+    positions = {idea_key(idea): i for i, idea in enumerate(ideas_bank)}
+    last_counts = None
+
+    while True:
+        finished = queue.results(run_id)
+        for task in finished:
+            tally[apply_result(pipeline, queue, task, run_id, stages, ideas_bank, positions, founder_profile)] += 1
+        if finished:
+            pipeline.save_ideas_bank(ideas_bank)
+            queue.mark_applied([task["id"] for task in finished])
+
+        counts = queue.counts(run_id)
+        if counts != last_counts:
+            print_progress(counts)
+            last_counts = counts
+
+        in_flight = sum(c.get("queued", 0) + c.get("leased", 0) + c.get("done", 0) + c.get("failed", 0)
+                        for c in counts.values())
+        if not in_flight:
+            return tally
+        time.sleep(POLL_SECONDS)
+
+def run_coordinator(queue, count: int, run_id: str = None, min_yield: float = 0.0):
+    pipeline = load_pipeline(PIPELINE)
+    ideas_bank = pipeline.load_ideas_bank()
+    founder_profile = pipeline.load_founder_profile()
+    stages = pipeline.build_stages(founder_profile)
+
+    print("="*80)
+    print("🛰️  DISTRIBUTED WINNER MACHINE - COORDINATOR")
+    print("="*80)
+
+    if run_id:
+        print(f"Re-attaching to run {run_id}")
+    else:
+        run_id = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+        print(f"Run ID: {run_id}")
+        new_ideas = pipeline.generate_new_ideas(ideas_bank, count, run_id)
+        if not new_ideas:
+            pipeline.save_ideas_bank(ideas_bank)
+            print("\n⚠️  No new ideas to process. All were duplicates.")
+            return
+        new_ideas, _ = screen_ideas(new_ideas, min_yield)
+        pipeline.save_ideas_bank(ideas_bank)
+        if not new_ideas:
+            print("\n⚠️  Every new idea was below --min-yield.")
+            return
+        for idea in new_ideas:
+            enqueue_stage(queue, run_id, stages, 0, idea, founder_profile)
+        print(f"\n📬 Enqueued {len(new_ideas)} ideas for {stages[0][0]} - start workers with:")
+        print(f"   python distributed_pipeline.py worker --queue {queue_url_hint(queue)}")
+
+    tally = track_run(pipeline, queue, run_id, stages, ideas_bank, founder_profile)
+    update_predictor(ideas_bank)
+
+    final_status = f"passed_{pipeline.stage_key(stages[-1][0])}"
+    finalists = [i for i in ideas_bank if i.get("run_id") == run_id and i.get("status") == final_status]
+    written = pipeline.write_finalist_reports(finalists, ideas_bank) if finalists else []
+
+    print(f"\n{'='*80}")
+    print(f"RUN {run_id} COMPLETE")
+    print(f"✅ {tally['passed']} stage passes | ❌ {tally['killed']} killed | ⏸️  {tally['deferred']} deferred")
+    print(f"🏆 {len(written)} finalist(s)")
+    print(f"{'='*80}")
+
+def queue_url_hint(queue) -> str:
+    if hasattr(queue, "path"):
+        return f"sqlite:///{queue.path}"
+    client = queue.client
+    return f"redis://{client.host}:{client.port}/{client.db}"
+
+# ═══════════════════════════════════════════════════════════
+# MAIN
+# ═══════════════════════════════════════════════════════════
+
+def main():
+    parser = argparse.ArgumentParser(description="Distributed v6.0 pipeline (coordinator / worker)")
+    parser.add_argument("role", choices=["coordinator", "worker", "status"])
+    parser.add_argument("--queue", type=str, default=DEFAULT_QUEUE_URL, help="sqlite:///file.db or redis://host:port/db")
+    parser.add_argument("--count", type=int, default=10, help="coordinator: ideas to generate")
+    parser.add_argument("--run-id", type=str, help="coordinator: re-attach to a run; status: run to show")
+    parser.add_argument("--min-yield", type=float, default=0.0,
+                        help="coordinator: skip ideas below this predicted finalist yield (0 = rank only)")
+    parser.add_argument("--worker-id", type=str, default=f"{socket.gethostname()}-{os.getpid()}")
+    parser.add_argument("--visibility-timeout", type=float, default=VISIBILITY_TIMEOUT_SECONDS,
+                        help="worker: seconds a lease survives without a heartbeat")
+    parser.add_argument("--idle-exit", type=float, default=0, help="worker: exit after N idle seconds (0 = never)")
+    args = parser.parse_args()
+
+    queue = open_queue(args.queue)
+
+    if args.role == "worker":
+        run_worker(queue, args.worker_id, args.visibility_timeout, args.idle_exit)
+        save_concurrency_state()
+    elif args.role == "coordinator":
+        run_coordinator(queue, args.count, args.run_id, args.min_yield)
+        save_concurrency_state()
+    else:
+        if not args.run_id:
+            print("❌ status needs --run-id")
+            sys.exit(1)
+        counts = queue.counts(args.run_id)
+        if not counts:
+            print(f"No tasks for run {args.run_id}")
+            return
+        for stage_name, states in counts.items():
+            print(f"{stage_name:<24} " + "  ".join(f"{state}={n}" for state, n in sorted(states.items())))
+
+if __name__ == "__main__":
+    main()
@@ -12,6 +12,8 @@ from google.oauth2.service_account import Credentials
 from dotenv import load_dotenv
 from openai import OpenAI
 
+from sheets_client import SheetSnapshot
+
 load_dotenv()
 
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
@@ -96,8 +98,9 @@ except Exception as e:
 
 print("📝 Adding to Google Sheet...\n")
 
-queue = sheet.worksheet("Ideas Queue")
-current = len(queue.get_all_values())
+# Rows go into the local store and reach Sheets in one sync (sheets_sync.py)
+snapshot = SheetSnapshot(sheet)
+current = len(snapshot.values("Ideas Queue"))
 next_num = current
 added = 0
 
@@ -108,17 +111,20 @@ for line in ideas.strip().split('\n'):
     if ',' in line:
         parts = [p.strip() for p in line.split(',', 1)]
         if len(parts) >= 2 and len(parts[0]) > 0:
-            queue.append_row([
+            new_row = [
                 next_num,
                 parts[0],
                 parts[1],
                 "Pending",
                 datetime.now().strftime("%Y-%m-%d")
-            ])
+            ]
+            snapshot.append_row("Ideas Queue", new_row)
             print(f"  ✓ {parts[0][:50]}...")
             next_num += 1
             added += 1
 
+snapshot.flush()
+
 print(f"\n✅ Added {added} pain point ideas for REAL businesses!")
 print(f"   These target traditional/brick-and-mortar businesses.")
 print(f"   Solutions are digital/software (no physical products).")
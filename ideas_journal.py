@@ -0,0 +1,465 @@
+#!/usr/bin/env python3
+"""
+Append-only journal for the ideas bank
+
+save_ideas_bank() used to rewrite all of ideas_bank.json on every call. Now
+ideas_bank.json is a snapshot, and each save appends only what changed since
+the last save to ideas_bank.journal.jsonl, one event per line:
+
+    {"event": "created", "key": "3f2a...", "idea": {...}, "ts": "..."}
+    {"event": "status_change", "key": "3f2a...", "from": "generated", "to": "killed_stage1", "ts": "..."}
+    {"event": "stage_result", "key": "3f2a...", "set": {"stage_1_result": {...}}, "unset": [], "ts": "..."}
+    {"event": "removed", "key": "3f2a...", "ts": "..."}
+
+Ideas are keyed by their "hash" (then "id"). The bank is the snapshot plus
+every journal event replayed in order. Events are idempotent, so replaying one
+twice is harmless. Lines are flushed on every save. fsync is batched: every
+IDEAS_JOURNAL_FSYNC_EVENTS events, IDEAS_JOURNAL_FSYNC_SECONDS after the first
+unsynced one, and at exit.
+
+Once the journal holds IDEAS_JOURNAL_COMPACT_EVENTS events, a background thread
+folds it into a new snapshot. The journal is first renamed to
+ideas_bank.journal.compacting, so new events keep going to a fresh file. The
+new snapshot then replaces the old one atomically and the folded segment is
+deleted. A crash at any point leaves files that replay to the same bank.
+
+Big fields (kill reasons, analyses, stage results) are written to the blob
+store (blob_store.py) and events and snapshots carry references instead.
+Loaded ideas fetch those bodies on first read.
+
+    python ideas_journal.py              # snapshot / journal sizes, event counts
+    python ideas_journal.py --compact    # fold the journal into the snapshot now
+    python ideas_journal.py --tail 20    # last events
+"""
+
+import os
+import json
+import time
+import atexit
+import functools
+import argparse
+import threading
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+from blob_store import BlobStore, LazyIdea, blobs_dir, is_ref, REF_KEY
+
+try:
+    import fcntl  # POSIX: serializes appends and rotation across processes
+except ImportError:
+    fcntl = None
+
+IDEAS_BANK_FILE = "ideas_bank.json"
+IDEAS_JOURNAL_FSYNC_EVENTS = int(os.getenv("IDEAS_JOURNAL_FSYNC_EVENTS", "200"))
+IDEAS_JOURNAL_FSYNC_SECONDS = float(os.getenv("IDEAS_JOURNAL_FSYNC_SECONDS", "1.0"))
+IDEAS_JOURNAL_COMPACT_EVENTS = int(os.getenv("IDEAS_JOURNAL_COMPACT_EVENTS", "5000"))
+
+_journals: Dict[str, "IdeasJournal"] = {}
+_journals_lock = threading.Lock()
+
+def journal_path(bank_path: str) -> str:
+    return os.path.splitext(bank_path)[0] + ".journal.jsonl"
+
+def compacting_path(bank_path: str) -> str:
+    return os.path.splitext(bank_path)[0] + ".journal.compacting"
+
+def idea_key(idea: Dict, position: int) -> str:
+    """The idea's identity across saves: its hash, else its id, else its position"""
+    if idea.get("hash"):
+        return str(idea["hash"])
+    if idea.get("id") is not None:
+        return f"id:{idea['id']}"
+    return f"pos:{position}"
+
+def keyed(ideas: List[Dict]) -> Iterator[Tuple[str, Dict]]:
+    """(key, idea) in bank order; a repeated hash gets "#2", "#3"... so duplicates aren't merged"""
+    seen: Dict[str, int] = {}
+    for position, idea in enumerate(ideas):
+        key = idea_key(idea, position)
+        seen[key] = seen.get(key, 0) + 1
+        yield (key if seen[key] == 1 else f"{key}#{seen[key]}"), idea
+
+# ═══════════════════════════════════════════════════════════
+# REPLAY
+# ═══════════════════════════════════════════════════════════
+
+def read_snapshot(bank_path: str) -> List[Dict]:
+    if not os.path.exists(bank_path):
+        return []
+    with open(bank_path, 'r') as f:
+        data = json.load(f)
+    return data.get("ideas", []) if isinstance(data, dict) else data
+
+def read_events(path: str) -> Iterator[Dict]:
+    """Events in one journal file; a torn last line (crash mid-write) is skipped"""
+    if not os.path.exists(path):
+        return
+    with open(path, 'r') as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield json.loads(line)
+            except ValueError:
+                continue
+
+def apply_event(ideas: Dict[str, Dict], event: Dict):
+    kind, key = event.get("event"), event.get("key")
+    if kind == "created":
+        ideas[key] = event["idea"]
+    elif kind == "removed":
+        ideas.pop(key, None)
+    elif key in ideas:
+        if kind == "status_change":
+            ideas[key]["status"] = event["to"]
+        elif kind == "stage_result":
+            ideas[key].update(event.get("set", {}))
+            for field in event.get("unset", []):
+                ideas[key].pop(field, None)
+
+def materialize(bank_path: str = IDEAS_BANK_FILE) -> Tuple[Dict[str, Dict], int]:
+    """({key: idea} in bank order, journal events replayed) from snapshot + journal segments"""
+    # Held against a compaction swapping the snapshot between our reads
+    with file_lock(bank_path, suffix=".compact"):
+        ideas = dict(keyed(read_snapshot(bank_path)))
+        replayed = 0
+        for path in (compacting_path(bank_path), journal_path(bank_path)):
+            for event in read_events(path):
+                apply_event(ideas, event)
+                replayed += 1
+    return ideas, replayed
+
+def load_bank(bank_path: str = IDEAS_BANK_FILE) -> List[Dict]:
+    """The current bank, read-only (dashboard, rescore.py, kill_predictor.py); bodies load on first read"""
+    store = BlobStore(blobs_dir(bank_path))
+    return [LazyIdea(idea, store) for idea in materialize(bank_path)[0].values()]
+
+def referenced_blobs(bank_path: str = IDEAS_BANK_FILE) -> Set[str]:
+    """Every blob the snapshot or a journal event points to (blob_store.py --gc keeps these)"""
+    rows = list(read_snapshot(bank_path))
+    for path in (compacting_path(bank_path), journal_path(bank_path)):
+        for event in read_events(path):
+            rows.append(event.get("idea") or event.get("set") or {})
+    return {value[REF_KEY] for row in rows for value in row.values() if is_ref(value)}
+
+def bank_version(bank_path: str = IDEAS_BANK_FILE) -> Tuple:
+    """Changes whenever the snapshot or either journal segment does (cheap reload check)"""
+    stamps = []
+    for path in (bank_path, compacting_path(bank_path), journal_path(bank_path)):
+        try:
+            stat = os.stat(path)
+            stamps.append((stat.st_mtime, stat.st_size))
+        except OSError:
+            stamps.append(None)
+    return tuple(stamps)
+
+# ═══════════════════════════════════════════════════════════
+# JOURNAL
+# ═══════════════════════════════════════════════════════════
+
+def shape(value):
+    """Copy of the containers, sharing the leaves - what save() compares the next save against"""
+    if isinstance(value, dict):
+        return {k: shape(v) for k, v in dict.items(value)}  # raw: a LazyIdea's references stay unread
+    if isinstance(value, list):
+        return [shape(v) for v in value]
+    return value
+
+def same(old, value) -> bool:
+    """`value` still matches its shape: walks containers, compares leaves by identity first.
+    Cost is per node, not per byte, so unchanged ideas with big text fields are cheap."""
+    if isinstance(value, dict):
+        return type(old) is dict and len(old) == len(value) and \
+            all(k in old and same(old[k], v) for k, v in dict.items(value))
+    if isinstance(value, list):
+        return type(old) is list and len(old) == len(value) and all(same(o, v) for o, v in zip(old, value))
+    return old is value or (type(old) is type(value) and old == value)
+
+def diff_idea(key: str, old: Dict, new: Dict) -> List[Dict]:
+    """Events turning `old` (a shape) into `new`: a status_change and/or a stage_result with the changed fields"""
+    events = []
+    if "status" in new and not same(old.get("status"), new["status"]):
+        events.append({"event": "status_change", "key": key, "from": old.get("status"), "to": new["status"]})
+    changed = {field: value for field, value in dict.items(new)
+               if field != "status" and (field not in old or not same(old[field], value))}
+    unset = [field for field in old if field not in new]
+    if changed or unset:
+        events.append({"event": "stage_result", "key": key, "set": changed, "unset": unset})
+    return events
+
+class IdeasJournal:
+    """
+    One bank's journal in this process. save() diffs the caller's list
+    against what this process last loaded or saved, and appends only the
+    difference. Other processes' events aren't seen until the next load().
+    """
+
+    def __init__(self, bank_path: str = IDEAS_BANK_FILE, fsync_events: Optional[int] = None,
+                 fsync_seconds: Optional[float] = None, compact_events: Optional[int] = None):
+        self.bank_path = bank_path
+        self.path = journal_path(bank_path)
+        self.fsync_events = IDEAS_JOURNAL_FSYNC_EVENTS if fsync_events is None else fsync_events
+        self.fsync_seconds = IDEAS_JOURNAL_FSYNC_SECONDS if fsync_seconds is None else fsync_seconds
+        self.compact_events = IDEAS_JOURNAL_COMPACT_EVENTS if compact_events is None else compact_events
+        self.blobs = BlobStore(blobs_dir(bank_path))
+        self.lock = threading.RLock()
+        self._shapes: Optional[Dict[str, Dict]] = None  # key → shape() of the idea as last saved
+        self._file = None
+        self._unsynced = 0
+        self._timer: Optional[threading.Timer] = None
+        self._compactor: Optional[threading.Thread] = None
+        self.journal_events = 0
+        self.events_written = 0
+
+    # ── reads ──
+
+    def load(self) -> List[Dict]:
+        """Snapshot + journal, replayed; becomes the base the next save() diffs against"""
+        with self.lock:
+            ideas, replayed = materialize(self.bank_path)
+            self._shapes = {key: shape(idea) for key, idea in ideas.items()}
+            self.journal_events = replayed
+            return [LazyIdea(idea, self.blobs, functools.partial(self._resolved, key)) for key, idea in ideas.items()]
+
+    def _resolved(self, key: str, field: str, ref: Dict, body):
+        """A loaded idea fetched a body: diff against the body from now on, so it isn't saved again"""
+        with self.lock:
+            old = self._shapes.get(key) if self._shapes is not None else None
+            if old is not None and old.get(field) == ref:
+                old[field] = shape(body)
+
+    # ── writes ──
+
+    def save(self, ideas: List[Dict]) -> int:
+        """Append the events that turn the last saved bank into `ideas`; returns events written"""
+        with self.lock:
+            if self._shapes is None:
+                self.load()
+            events = []
+            seen = set()
+            for key, idea in keyed(ideas):
+                seen.add(key)
+                old = self._shapes.get(key)
+                if old is not None and same(old, idea):
+                    continue
+                if old is None:
+                    events.append({"event": "created", "key": key, "idea": idea})
+                else:
+                    events.extend(diff_idea(key, old, idea))
+                self._shapes[key] = shape(idea)
+            for key in [k for k in self._shapes if k not in seen]:
+                events.append({"event": "removed", "key": key})
+                del self._shapes[key]
+
+            if events:
+                self._append(events)
+            return len(events)
+
+    def _append(self, events: List[Dict]):
+        stamp = datetime.now().isoformat(timespec="seconds")
+        lines = "".join(json.dumps({**self._slim(event), "ts": stamp}) + "\n" for event in events)
+        with file_lock(self.bank_path):
+            self._open()
+            self._file.write(lines)
+            self._file.flush()
+        self._unsynced += len(events)
+        self.journal_events += len(events)
+        self.events_written += len(events)
+
+        if self._unsynced >= self.fsync_events:
+            self.sync()
+        elif self._timer is None and self.fsync_seconds > 0:
+            self._timer = threading.Timer(self.fsync_seconds, self.sync)
+            self._timer.daemon = True
+            self._timer.start()
+        if self.compact_events and self.journal_events >= self.compact_events:
+            self.compact_async()
+
+    def _slim(self, event: Dict) -> Dict:
+        """The event with big fields moved to the blob store"""
+        if event["event"] == "created":
+            return {**event, "idea": self.blobs.slim(event["idea"])}
+        if event["event"] == "stage_result":
+            return {**event, "set": self.blobs.slim(event["set"])}
+        return event
+
+    def _open(self):
+        """(Re)open the journal - another process may have rotated it for compaction"""
+        if self._file is not None:
+            try:
+                if os.stat(self.path).st_ino == os.fstat(self._file.fileno()).st_ino:
+                    return
+            except OSError:
+                pass
+            self._close_file()
+        self._file = open(self.path, 'a')
+        # End a torn last line (crash mid-write) so our first event doesn't get glued onto it
+        if self._file.tell() > 0:
+            with open(self.path, 'rb') as f:
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b"\n":
+                    self._file.write("\n")
+
+    def _close_file(self):
+        if self._file is not None:
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self._file.close()
+            self._file = None
+
+    def sync(self):
+        """fsync everything appended so far"""
+        with self.lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            self.blobs.sync()  # before the events that reference them
+            if self._file is not None and self._unsynced:
+                self._file.flush()
+                os.fsync(self._file.fileno())
+            self._unsynced = 0
+
+    def close(self):
+        with self.lock:
+            self.sync()
+            self._close_file()
+        compactor = self._compactor
+        if compactor is not None:
+            compactor.join()
+
+    # ── compaction ──
+
+    def compact_async(self):
+        """Fold the journal into a new snapshot on a background thread (one at a time)"""
+        with self.lock:
+            if self._compactor is not None and self._compactor.is_alive():
+                return
+            self._compactor = threading.Thread(target=self._compact_logged, name="ideas-journal-compact",
+                                               daemon=True)
+            self._compactor.start()
+
+    def _compact_logged(self):
+        try:
+            self.compact()
+        except Exception as e:
+            print(f"⚠️  Ideas journal compaction failed (journal kept): {e}", flush=True)
+
+    def compact(self) -> int:
+        """Rotate the journal, write snapshot + rotated events as the new snapshot; returns ideas written"""
+        with self.lock:
+            self.sync()
+            with file_lock(self.bank_path):
+                rotated = compacting_path(self.bank_path)
+                # A leftover segment from a crashed compaction is folded first; its journal waits for next time
+                if not os.path.exists(rotated) and os.path.exists(self.path):
+                    self._close_file()
+                    os.replace(self.path, rotated)
+                    self.journal_events = 0
+
+        # Only this thread touches the snapshot and the rotated segment from here on
+        with file_lock(self.bank_path, suffix=".compact"):
+            ideas = dict(keyed(read_snapshot(self.bank_path)))
+            for event in read_events(compacting_path(self.bank_path)):
+                apply_event(ideas, event)
+            write_snapshot(self.bank_path, list(ideas.values()))
+            if os.path.exists(compacting_path(self.bank_path)):
+                os.remove(compacting_path(self.bank_path))
+        return len(ideas)
+
+def write_snapshot(bank_path: str, ideas: List[Dict]):
+    """Atomically replace the snapshot (one idea per line, {"ideas": [...]} like before, big fields as blobs)"""
+    store = BlobStore(blobs_dir(bank_path))
+    tmp_path = bank_path + ".tmp"
+    with open(tmp_path, 'w') as f:
+        f.write('{"ideas": [\n')
+        for i, idea in enumerate(ideas):
+            f.write(("," if i else "") + json.dumps(store.slim(idea)) + "\n")
+        f.write("]}\n")
+        f.flush()
+        os.fsync(f.fileno())
+    store.sync()
+    os.replace(tmp_path, bank_path)
+
+def replace_bank(bank_path: str, ideas: List[Dict]):
+    """Make `ideas` the whole bank: a new snapshot and no journal (bank_snapshots.py restore)"""
+    with file_lock(bank_path):
+        with file_lock(bank_path, suffix=".compact"):
+            write_snapshot(bank_path, ideas)
+            for path in (compacting_path(bank_path), journal_path(bank_path)):
+                if os.path.exists(path):
+                    os.remove(path)
+
+class file_lock:
+    """flock on <path><suffix>.lock (no-op where fcntl is unavailable)"""
+
+    def __init__(self, bank_path: str, suffix: str = ""):
+        self.path = bank_path + suffix + ".lock"
+        self.handle = None
+
+    def __enter__(self):
+        if fcntl is not None:
+            self.handle = open(self.path, 'a')
+            fcntl.flock(self.handle, fcntl.LOCK_EX)
+        return self
+
+    def __exit__(self, *exc):
+        if self.handle is not None:
+            fcntl.flock(self.handle, fcntl.LOCK_UN)
+            self.handle.close()
+
+def open_journal(bank_path: str = IDEAS_BANK_FILE) -> IdeasJournal:
+    """The process-wide journal for a bank file"""
+    key = os.path.abspath(bank_path)
+    with _journals_lock:
+        if key not in _journals:
+            _journals[key] = IdeasJournal(bank_path)
+        return _journals[key]
+
+def _close_all():
+    for journal in list(_journals.values()):
+        try:
+            journal.close()
+        except Exception as e:
+            print(f"❌ Ideas journal close failed for {journal.path}: {e}", flush=True)
+
+atexit.register(_close_all)
+
+# ═══════════════════════════════════════════════════════════
+# CLI
+# ═══════════════════════════════════════════════════════════
+
+def main():
+    parser = argparse.ArgumentParser(description="Ideas bank journal: status, compaction, recent events")
+    parser.add_argument("--bank", default=IDEAS_BANK_FILE)
+    parser.add_argument("--compact", action="store_true", help="Fold the journal into the snapshot now")
+    parser.add_argument("--tail", type=int, metavar="N", help="Show the last N events")
+    args = parser.parse_args()
+
+    if args.compact:
+        started = time.time()
+        written = IdeasJournal(args.bank).compact()
+        print(f"🗜️  Compacted {args.bank}: {written} ideas in {time.time() - started:.1f}s")
+        return
+
+    segments = [compacting_path(args.bank), journal_path(args.bank)]
+    if args.tail:
+        events = [e for path in segments for e in read_events(path)][-args.tail:]
+        for e in events:
+            detail = f"{e.get('from')} → {e.get('to')}" if e["event"] == "status_change" else \
+                     ", ".join(e.get("set", {})) if e["event"] == "stage_result" else ""
+            print(f"{e.get('ts', '')}  {e['event']:<14} {e['key']}  {detail}")
+        return
+
+    counts: Dict[str, int] = {}
+    for path in segments:
+        for e in read_events(path):
+            counts[e.get("event")] = counts.get(e.get("event"), 0) + 1
+    size = lambda p: f"{os.path.getsize(p) / 1024:.0f} KB" if os.path.exists(p) else "none"
+    print(f"📚 Snapshot {args.bank}: {len(read_snapshot(args.bank))} ideas ({size(args.bank)})")
+    print(f"📝 Journal {journal_path(args.bank)}: {sum(counts.values())} events ({size(journal_path(args.bank))})")
+    for kind, n in sorted(counts.items(), key=lambda kv: -kv[1]):
+        print(f"   {kind}: {n}")
+
+if __name__ == "__main__":
+    main()
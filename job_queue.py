@@ -0,0 +1,410 @@
+"""
+Durable job queue for distributed runs
+Holds idea × stage tasks with leases, heartbeats and visibility timeouts.
+
+Backends (picked by URL, default JOB_QUEUE_URL or sqlite:///job_queue.db):
+    sqlite:///job_queue.db       single host, any number of worker processes
+    redis://[:password@]host:6379/0
+                                 multi-host; talks RESP directly, so any
+                                 Redis-protocol server works (no client library)
+
+Task lifecycle:
+    queued → leased → done → applied
+    - lease() hands a task to one worker with a lease token valid for
+      `visibility_timeout` seconds; heartbeat() extends it
+    - a lease that expires (worker died / hung) goes back to queued;
+      after MAX_TASK_ATTEMPTS leases the task is marked failed instead
+    - complete() stores the result; the coordinator reads results(),
+      applies them to the ideas bank and calls mark_applied()
+
+Lease expiry uses wall-clock time, so hosts sharing a Redis queue need
+roughly synced clocks (NTP) - skew eats into the visibility timeout.
+"""
+
+import os
+import json
+import time
+import uuid
+import socket
+import sqlite3
+import threading
+from urllib.parse import urlparse
+from typing import Dict, List, Optional
+
+DEFAULT_QUEUE_URL = os.getenv("JOB_QUEUE_URL", "sqlite:///job_queue.db")
+
+VISIBILITY_TIMEOUT_SECONDS = 300
+MAX_TASK_ATTEMPTS = 3
+
+# Later stages first: drains the funnel toward finalists before starting new ideas
+STAGE_PRIORITY_SPAN = 10 ** 13
+
+def task_id(run_id: str, stage_index: int, idea_key: str) -> str:
+    """Deterministic so re-enqueueing the same idea × stage is a no-op"""
+    return f"{run_id}:{stage_index}:{idea_key}"
+
+# ═══════════════════════════════════════════════════════════
+# SQLITE BACKEND
+# ═══════════════════════════════════════════════════════════
+
+SQLITE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS tasks (
+    id TEXT PRIMARY KEY,
+    run_id TEXT NOT NULL,
+    stage_index INTEGER NOT NULL,
+    stage_name TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    state TEXT NOT NULL DEFAULT 'queued',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    lease_token TEXT,
+    lease_expires REAL,
+    worker_id TEXT,
+    result TEXT,
+    error TEXT,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS tasks_queue ON tasks (state, stage_index, created_at);
+CREATE INDEX IF NOT EXISTS tasks_run ON tasks (run_id, state);
+"""
+
+class SQLiteJobQueue:
+    """One file, WAL mode; every call opens its own connection so threads/processes can share it"""
+
+    def __init__(self, path: str):
+        self.path = path
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(SQLITE_SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA busy_timeout=30000")
+        return conn
+
+    @staticmethod
+    def _task(row: sqlite3.Row) -> Dict:
+        task = dict(row)
+        task["payload"] = json.loads(task["payload"])
+        task["result"] = json.loads(task["result"]) if task["result"] else None
+        return task
+
+    def enqueue(self, run_id: str, stage_index: int, stage_name: str, idea_key: str, payload: Dict) -> str:
+        now = time.time()
+        tid = task_id(run_id, stage_index, idea_key)
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR IGNORE INTO tasks (id, run_id, stage_index, stage_name, payload, created_at, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (tid, run_id, stage_index, stage_name, json.dumps(payload), now, now))
+        return tid
+
+    def lease(self, worker_id: str, visibility_timeout: float = VISIBILITY_TIMEOUT_SECONDS) -> Optional[Dict]:
+        """Claim the next queued task (expired leases are requeued first)"""
+        now = time.time()
+        token = uuid.uuid4().hex
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            conn.execute(
+                "UPDATE tasks SET state = CASE WHEN attempts >= ? THEN 'failed' ELSE 'queued' END, "
+                "error = 'lease expired', lease_token = NULL, updated_at = ? "
+                "WHERE state = 'leased' AND lease_expires < ?",
+                (MAX_TASK_ATTEMPTS, now, now))
+            row = conn.execute(
+                "SELECT id FROM tasks WHERE state = 'queued' ORDER BY stage_index DESC, created_at LIMIT 1").fetchone()
+            if row is None:
+                conn.execute("COMMIT")
+                return None
+            conn.execute(
+                "UPDATE tasks SET state = 'leased', lease_token = ?, lease_expires = ?, worker_id = ?, "
+                "attempts = attempts + 1, updated_at = ? WHERE id = ?",
+                (token, now + visibility_timeout, worker_id, now, row["id"]))
+            task = self._task(conn.execute("SELECT * FROM tasks WHERE id = ?", (row["id"],)).fetchone())
+            conn.execute("COMMIT")
+            return task
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        finally:
+            conn.close()
+
+    def _update_leased(self, tid: str, token: str, sql: str, params: tuple) -> bool:
+        with self._connect() as conn:
+            cursor = conn.execute(f"{sql} WHERE id = ? AND lease_token = ? AND state = 'leased'",
+                                  params + (tid, token))
+            return cursor.rowcount == 1
+
+    def heartbeat(self, tid: str, token: str, visibility_timeout: float = VISIBILITY_TIMEOUT_SECONDS) -> bool:
+        """Extend a lease; False means it was lost (expired and re-leased)"""
+        now = time.time()
+        return self._update_leased(tid, token, "UPDATE tasks SET lease_expires = ?, updated_at = ?",
+                                   (now + visibility_timeout, now))
+
+    def complete(self, tid: str, token: str, result: Dict) -> bool:
+        return self._update_leased(tid, token,
+                                   "UPDATE tasks SET state = 'done', result = ?, lease_token = NULL, updated_at = ?",
+                                   (json.dumps(result), time.time()))
+
+    def release(self, tid: str, token: str) -> bool:
+        """Give a task back without counting the attempt (worker shutting down)"""
+        return self._update_leased(tid, token,
+                                   "UPDATE tasks SET state = 'queued', lease_token = NULL, attempts = attempts - 1, "
+                                   "updated_at = ?", (time.time(),))
+
+    def results(self, run_id: str, limit: int = 500) -> List[Dict]:
+        """Finished (done or failed) tasks the coordinator hasn't applied yet"""
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT * FROM tasks WHERE run_id = ? AND state IN ('done', 'failed') ORDER BY updated_at LIMIT ?",
+                (run_id, limit)).fetchall()
+        return [self._task(row) for row in rows]
+
+    def mark_applied(self, task_ids: List[str]):
+        with self._connect() as conn:
+            conn.executemany("UPDATE tasks SET state = 'applied', updated_at = ? WHERE id = ?",
+                             [(time.time(), tid) for tid in task_ids])
+
+    def counts(self, run_id: str) -> Dict[str, Dict[str, int]]:
+        """{stage_name: {state: n}}"""
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT stage_index, stage_name, state, COUNT(*) AS n FROM tasks WHERE run_id = ? "
+                "GROUP BY stage_index, stage_name, state ORDER BY stage_index", (run_id,)).fetchall()
+        counts = {}
+        for row in rows:
+            counts.setdefault(row["stage_name"], {})[row["state"]] = row["n"]
+        return counts
+
+# ═══════════════════════════════════════════════════════════
+# REDIS-PROTOCOL BACKEND
+# ═══════════════════════════════════════════════════════════
+
+class RespError(Exception):
+    """Error reply from the server"""
+
+class RespClient:
+    """Minimal RESP2 client: one socket, one command at a time"""
+
+    def __init__(self, host: str = "localhost", port: int = 6379, db: int = 0,
+                 password: Optional[str] = None, timeout: float = 30.0):
+        self.host, self.port, self.db, self.password, self.timeout = host, port, db, password, timeout
+        self._lock = threading.Lock()
+        self._sock = None
+        self._file = None
+
+    def _connect(self):
+        self._sock = socket.create_connection((self.host, self.port), timeout=self.timeout)
+        self._file = self._sock.makefile("rb")
+        if self.password:
+            self._call("AUTH", self.password)
+        if self.db:
+            self._call("SELECT", self.db)
+
+    def _close(self):
+        if self._sock:
+            self._sock.close()
+        self._sock = self._file = None
+
+    @staticmethod
+    def _encode(args) -> bytes:
+        parts = [f"*{len(args)}\r\n".encode()]
+        for arg in args:
+            data = arg if isinstance(arg, bytes) else str(arg).encode()
+            parts.append(f"${len(data)}\r\n".encode() + data + b"\r\n")
+        return b"".join(parts)
+
+    def _read(self):
+        line = self._file.readline()
+        if not line:
+            raise ConnectionError("Redis connection closed")
+        kind, rest = line[:1], line[1:-2]
+        if kind == b"+":
+            return rest.decode()
+        if kind == b"-":
+            raise RespError(rest.decode())
+        if kind == b":":
+            return int(rest)
+        if kind == b"$":
+            length = int(rest)
+            if length == -1:
+                return None
+            data = self._file.read(length + 2)[:-2]
+            return data.decode()
+        if kind == b"*":
+            length = int(rest)
+            return None if length == -1 else [self._read() for _ in range(length)]
+        raise RespError(f"Unexpected reply: {line!r}")
+
+    def _call(self, *args):
+        self._sock.sendall(self._encode(args))
+        return self._read()
+
+    def execute(self, *args):
+        with self._lock:
+            for attempt in (1, 2):
+                try:
+                    if self._sock is None:
+                        self._connect()
+                    return self._call(*args)
+                except (ConnectionError, OSError):
+                    # One reconnect for dropped idle connections
+                    self._close()
+                    if attempt == 2:
+                        raise
+
+REDIS_ENQUEUE = """
+local key = ARGV[1] .. ':task:' .. ARGV[2]
+if redis.call('EXISTS', key) == 1 then return 0 end
+redis.call('HSET', key, 'id', ARGV[2], 'run_id', ARGV[3], 'stage_index', ARGV[4], 'stage_name', ARGV[5],
+           'payload', ARGV[6], 'state', 'queued', 'attempts', 0, 'priority', ARGV[7],
+           'created_at', ARGV[8], 'updated_at', ARGV[8])
+redis.call('ZADD', ARGV[1] .. ':queue', ARGV[7], ARGV[2])
+redis.call('SADD', ARGV[1] .. ':run:' .. ARGV[3], ARGV[2])
+return 1
+"""
+
+# ARGV: prefix, now, expires, token, worker_id, max_attempts
+REDIS_LEASE = """
+local prefix = ARGV[1]
+local expired = redis.call('ZRANGEBYSCORE', prefix .. ':leased', '-inf', ARGV[2])
+for _, id in ipairs(expired) do
+  redis.call('ZREM', prefix .. ':leased', id)
+  local key = prefix .. ':task:' .. id
+  local run = redis.call('HGET', key, 'run_id')
+  redis.call('HSET', key, 'lease_token', '', 'error', 'lease expired', 'updated_at', ARGV[2])
+  if tonumber(redis.call('HGET', key, 'attempts')) >= tonumber(ARGV[6]) then
+    redis.call('HSET', key, 'state', 'failed')
+    redis.call('SADD', prefix .. ':results:' .. run, id)
+  else
+    redis.call('HSET', key, 'state', 'queued')
+    redis.call('ZADD', prefix .. ':queue', redis.call('HGET', key, 'priority'), id)
+  end
+end
+local next = redis.call('ZRANGE', prefix .. ':queue', 0, 0)
+if #next == 0 then return false end
+local id = next[1]
+local key = prefix .. ':task:' .. id
+redis.call('ZREM', prefix .. ':queue', id)
+redis.call('HSET', key, 'state', 'leased', 'lease_token', ARGV[4], 'lease_expires', ARGV[3],
+           'worker_id', ARGV[5], 'updated_at', ARGV[2])
+redis.call('HINCRBY', key, 'attempts', 1)
+redis.call('ZADD', prefix .. ':leased', ARGV[3], id)
+return id
+"""
+
+# ARGV: prefix, id, token, action, now, value
+REDIS_UPDATE_LEASED = """
+local key = ARGV[1] .. ':task:' .. ARGV[2]
+if redis.call('HGET', key, 'state') ~= 'leased' or redis.call('HGET', key, 'lease_token') ~= ARGV[3] then
+  return 0
+end
+if ARGV[4] == 'heartbeat' then
+  redis.call('HSET', key, 'lease_expires', ARGV[6], 'updated_at', ARGV[5])
+  redis.call('ZADD', ARGV[1] .. ':leased', ARGV[6], ARGV[2])
+  return 1
+end
+redis.call('ZREM', ARGV[1] .. ':leased', ARGV[2])
+redis.call('HSET', key, 'lease_token', '', 'updated_at', ARGV[5])
+if ARGV[4] == 'complete' then
+  redis.call('HSET', key, 'state', 'done', 'result', ARGV[6])
+  redis.call('SADD', ARGV[1] .. ':results:' .. redis.call('HGET', key, 'run_id'), ARGV[2])
+else
+  redis.call('HSET', key, 'state', 'queued')
+  redis.call('HINCRBY', key, 'attempts', -1)
+  redis.call('ZADD', ARGV[1] .. ':queue', redis.call('HGET', key, 'priority'), ARGV[2])
+end
+return 1
+"""
+
+class RedisJobQueue:
+    """
+    Same interface as SQLiteJobQueue on a Redis-protocol server
+    Keys: {prefix}:task:{id} (hash), {prefix}:queue (zset by priority),
+    {prefix}:leased (zset by lease expiry), {prefix}:run:{run_id} (set),
+    {prefix}:results:{run_id} (set of finished, unapplied task ids)
+    """
+
+    def __init__(self, client: RespClient, prefix: str = "winner_machine"):
+        self.client = client
+        self.prefix = prefix
+
+    def _eval(self, script: str, *args):
+        return self.client.execute("EVAL", script, 0, self.prefix, *args)
+
+    def _task(self, tid: str) -> Optional[Dict]:
+        flat = self.client.execute("HGETALL", f"{self.prefix}:task:{tid}")
+        if not flat:
+            return None
+        task = dict(zip(flat[::2], flat[1::2]))
+        task["stage_index"] = int(task["stage_index"])
+        task["attempts"] = int(task["attempts"])
+        task["payload"] = json.loads(task["payload"])
+        task["result"] = json.loads(task["result"]) if task.get("result") else None
+        return task
+
+    def enqueue(self, run_id: str, stage_index: int, stage_name: str, idea_key: str, payload: Dict) -> str:
+        now = time.time()
+        tid = task_id(run_id, stage_index, idea_key)
+        priority = -stage_index * STAGE_PRIORITY_SPAN + int(now * 1000)
+        self._eval(REDIS_ENQUEUE, tid, run_id, stage_index, stage_name, json.dumps(payload), priority, now)
+        return tid
+
+    def lease(self, worker_id: str, visibility_timeout: float = VISIBILITY_TIMEOUT_SECONDS) -> Optional[Dict]:
+        now = time.time()
+        token = uuid.uuid4().hex
+        tid = self._eval(REDIS_LEASE, now, now + visibility_timeout, token, worker_id, MAX_TASK_ATTEMPTS)
+        return self._task(tid) if tid else None
+
+    def heartbeat(self, tid: str, token: str, visibility_timeout: float = VISIBILITY_TIMEOUT_SECONDS) -> bool:
+        now = time.time()
+        return self._eval(REDIS_UPDATE_LEASED, tid, token, "heartbeat", now, now + visibility_timeout) == 1
+
+    def complete(self, tid: str, token: str, result: Dict) -> bool:
+        return self._eval(REDIS_UPDATE_LEASED, tid, token, "complete", time.time(), json.dumps(result)) == 1
+
+    def release(self, tid: str, token: str) -> bool:
+        return self._eval(REDIS_UPDATE_LEASED, tid, token, "release", time.time(), "") == 1
+
+    def results(self, run_id: str, limit: int = 500) -> List[Dict]:
+        ids = self.client.execute("SMEMBERS", f"{self.prefix}:results:{run_id}") or []
+        tasks = [task for task in (self._task(tid) for tid in ids[:limit]) if task]
+        return sorted(tasks, key=lambda t: float(t["updated_at"]))
+
+    def mark_applied(self, task_ids: List[str]):
+        for tid in task_ids:
+            key = f"{self.prefix}:task:{tid}"
+            run_id = self.client.execute("HGET", key, "run_id")
+            self.client.execute("HSET", key, "state", "applied", "updated_at", time.time())
+            self.client.execute("SREM", f"{self.prefix}:results:{run_id}", tid)
+
+    def counts(self, run_id: str) -> Dict[str, Dict[str, int]]:
+        ids = self.client.execute("SMEMBERS", f"{self.prefix}:run:{run_id}") or []
+        rows = []
+        for tid in ids:
+            stage_index, stage_name, state = self.client.execute(
+                "HMGET", f"{self.prefix}:task:{tid}", "stage_index", "stage_name", "state")
+            rows.append((int(stage_index), stage_name, state))
+        counts = {}
+        for _, stage_name, state in sorted(rows):
+            stage = counts.setdefault(stage_name, {})
+            stage[state] = stage.get(state, 0) + 1
+        return counts
+
+# ═══════════════════════════════════════════════════════════
+# FACTORY
+# ═══════════════════════════════════════════════════════════
+
+def open_queue(url: str = DEFAULT_QUEUE_URL):
+    """sqlite:///path.db or redis://[:password@]host:port/db"""
+    if url.startswith("sqlite:///"):
+        return SQLiteJobQueue(url[len("sqlite:///"):])
+
+    parsed = urlparse(url)
+    if parsed.scheme == "redis":
+        db = int(parsed.path.lstrip("/") or 0)
+        client = RespClient(parsed.hostname or "localhost", parsed.port or 6379, db, parsed.password)
+        return RedisJobQueue(client)
+
+    raise ValueError(f"Unsupported job queue URL: {url} (use sqlite:///file.db or redis://host:port/db)")
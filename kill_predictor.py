@@ -0,0 +1,313 @@
+#!/usr/bin/env python3
+"""
+KILL PREDICTOR - learned pre-screen before the paid stages
+
+Hashed word n-grams of business + pain → one logistic regression per stage,
+predicting P(survive stage N | reached stage N). Trained by SGD on the verdicts
+already in ideas_bank.json (killed_stage1, killed_stage_2:_evidence, FINALIST, ...):
+an idea killed at stage 3 is a positive example for stages 1-2 and a negative
+for stage 3. Pure Python, CPU only, saved as JSON.
+
+    expected yield = P(s1) × P(s2) × ... × P(s6)     (chance of becoming a finalist)
+
+The pipelines rank fresh ideas by expected yield before Stage 1 and, with
+--min-yield, skip ideas below it (status "skipped_predictor"). After each run
+the model trains on the newly labelled ideas only.
+
+    python kill_predictor.py --retrain        # full retrain from ideas_bank.json
+    python kill_predictor.py --evaluate       # holdout accuracy vs base rate
+"""
+
+import os
+import re
+import json
+import math
+import zlib
+import random
+import argparse
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from ideas_journal import load_bank
+
+# ═══════════════════════════════════════════════════════════
+# CONFIGURATION
+# ═══════════════════════════════════════════════════════════
+
+MODEL_FILE = "kill_predictor_model.json"
+IDEAS_BANK_FILE = "ideas_bank.json"
+
+STAGES = [1, 2, 3, 4, 5, 6]
+HASH_BUCKETS = 2 ** 18
+
+# Tuned on synthetic banks: at higher rates the model overfits hashed n-grams
+# and scores worse than the base rate when text carries no signal
+LEARNING_RATE = 0.01
+L2 = 1e-3
+FULL_EPOCHS = 5
+INCREMENTAL_EPOCHS = 3
+
+# Below this many examples a stage predicts its (smoothed) base rate
+MIN_STAGE_EXAMPLES = 20
+
+# Share of below-threshold ideas still run, so the model keeps seeing
+# verdicts for the kind of idea it would otherwise always skip
+EXPLORE_FRACTION = 0.1
+
+SKIPPED_STATUS = "skipped_predictor"
+
+# ═══════════════════════════════════════════════════════════
+# FEATURES + LABELS
+# ═══════════════════════════════════════════════════════════
+
+TOKEN_RE = re.compile(r"[a-z0-9$%]+")
+
+def tokens(text: str) -> List[str]:
+    return TOKEN_RE.findall((text or "").lower())
+
+def features(idea: Dict) -> List[int]:
+    """Hashed unigrams + bigrams, prefixed by field so 'b:clinics' ≠ 'p:clinics'"""
+    grams = []
+    for prefix, field in (("b", "business"), ("p", "pain")):
+        words = tokens(idea.get(field, ""))
+        grams += [f"{prefix}:{w}" for w in words]
+        grams += [f"{prefix}:{a}_{b}" for a, b in zip(words, words[1:])]
+    return sorted({zlib.crc32(g.encode()) % HASH_BUCKETS for g in grams})
+
+STATUS_RE = re.compile(r"^(killed|passed|deferred)_stage_?(\d)")
+
+def stage_labels(idea: Dict) -> Dict[int, int]:
+    """{stage: 1 survived / 0 killed} for every stage the idea has a verdict on"""
+    status = idea.get("status", "")
+    if status in ("FINALIST", "WINNER"):
+        return {stage: 1 for stage in STAGES}
+
+    match = STATUS_RE.match(status)
+    if not match:
+        return {}
+    outcome, stage = match.group(1), int(match.group(2))
+    labels = {s: 1 for s in STAGES if s < stage}
+    if outcome == "killed":
+        labels[stage] = 0
+    elif outcome == "passed":
+        labels[stage] = 1
+    return labels
+
+# ═══════════════════════════════════════════════════════════
+# MODEL
+# ═══════════════════════════════════════════════════════════
+
+def _sigmoid(z: float) -> float:
+    if z < -30:
+        return 0.0
+    if z > 30:
+        return 1.0
+    return 1 / (1 + math.exp(-z))
+
+class KillPredictor:
+    """Per-stage logistic regressions over hashed n-grams"""
+
+    def __init__(self, model: Optional[Dict] = None):
+        model = model or {}
+        self.stages = {
+            stage: model.get("stages", {}).get(str(stage)) or {"bias": 0.0, "weights": {}, "examples": 0, "survived": 0}
+            for stage in STAGES
+        }
+        self.trained = model.get("trained", {})   # idea hash → status it was trained at
+        self.updated_at = model.get("updated_at")
+
+    # ── prediction ─────────────────────────────────────────
+
+    def base_rate(self, stage: int) -> float:
+        s = self.stages[stage]
+        return (s["survived"] + 1) / (s["examples"] + 2)
+
+    def stage_probability(self, stage: int, feats: List[int]) -> float:
+        s = self.stages[stage]
+        if s["examples"] < MIN_STAGE_EXAMPLES:
+            return self.base_rate(stage)
+        weights = s["weights"]
+        return _sigmoid(s["bias"] + sum(weights.get(str(f), 0.0) for f in feats))
+
+    def survival(self, idea: Dict) -> Dict[int, float]:
+        feats = features(idea)
+        return {stage: self.stage_probability(stage, feats) for stage in STAGES}
+
+    def expected_yield(self, idea: Dict) -> float:
+        return math.prod(self.survival(idea).values())
+
+    # ── training ───────────────────────────────────────────
+
+    def _sgd(self, examples: List[Tuple[int, List[int], int]], epochs: int, seed: int = 42):
+        rng = random.Random(seed)
+        examples = list(examples)
+        for epoch in range(epochs):
+            rng.shuffle(examples)
+            rate = LEARNING_RATE / (1 + epoch)
+            for stage, feats, label in examples:
+                s = self.stages[stage]
+                weights = s["weights"]
+                p = _sigmoid(s["bias"] + sum(weights.get(str(f), 0.0) for f in feats))
+                gradient = p - label
+                s["bias"] -= rate * gradient
+                for f in feats:
+                    key = str(f)
+                    w = weights.get(key, 0.0)
+                    weights[key] = w - rate * (gradient + L2 * w)
+
+    def train(self, ideas: List[Dict], epochs: int = INCREMENTAL_EPOCHS) -> int:
+        """Fit on ideas whose verdict is new since the last training; returns examples used"""
+        examples = []
+        for idea in ideas:
+            labels = stage_labels(idea)
+            key = idea.get("hash")
+            if not labels or not key or self.trained.get(key) == idea.get("status"):
+                continue
+            # An idea resumed past its old verdict only adds the stages it newly reached
+            already = stage_labels({"status": self.trained[key]}) if key in self.trained else {}
+            feats = features(idea)
+            for stage, label in labels.items():
+                if already.get(stage) == label:
+                    continue
+                examples.append((stage, feats, label))
+                self.stages[stage]["examples"] += 1
+                self.stages[stage]["survived"] += label
+            self.trained[key] = idea["status"]
+
+        if examples:
+            self._sgd(examples, epochs)
+            self.updated_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        return len(examples)
+
+    def to_dict(self) -> Dict:
+        return {
+            "hash_buckets": HASH_BUCKETS,
+            "updated_at": self.updated_at,
+            "stages": {str(stage): s for stage, s in self.stages.items()},
+            "trained": self.trained,
+        }
+
+def load_predictor() -> KillPredictor:
+    if os.path.exists(MODEL_FILE):
+        with open(MODEL_FILE, 'r') as f:
+            return KillPredictor(json.load(f))
+    return KillPredictor()
+
+def save_predictor(predictor: KillPredictor):
+    with open(MODEL_FILE, 'w') as f:
+        json.dump(predictor.to_dict(), f)
+
+# ═══════════════════════════════════════════════════════════
+# PIPELINE HOOKS
+# ═══════════════════════════════════════════════════════════
+
+def screen_ideas(ideas: List[Dict], min_yield: float = 0.0) -> Tuple[List[Dict], List[Dict]]:
+    """
+    Rank ideas by expected finalist yield (highest first) and split off those below
+    min_yield; returns (to_run, skipped). Skipped ideas get status skipped_predictor.
+    """
+    predictor = load_predictor()
+    for idea in ideas:
+        survival = predictor.survival(idea)
+        idea["predicted_survival"] = {f"stage{s}": round(p, 3) for s, p in survival.items()}
+        idea["predicted_yield"] = round(math.prod(survival.values()), 4)
+
+    ranked = sorted(ideas, key=lambda i: i["predicted_yield"], reverse=True)
+    print(f"\n🔮 Kill predictor ranked {len(ranked)} ideas by expected finalist yield "
+          f"(model updated {predictor.updated_at or 'never - using base rates'})")
+    for idea in ranked[:5]:
+        print(f"   {idea['predicted_yield']:.1%}  {idea['business'][:50]} - {idea['pain'][:50]}")
+
+    if min_yield <= 0:
+        return ranked, []
+
+    to_run, skipped = [], []
+    for idea in ranked:
+        # Deterministic per idea: the same idea isn't explored on one run and skipped on the next
+        explore = zlib.crc32(str(idea.get("hash", idea.get("id"))).encode()) % 100 < EXPLORE_FRACTION * 100
+        if idea["predicted_yield"] >= min_yield or explore:
+            to_run.append(idea)
+        else:
+            idea["status"] = SKIPPED_STATUS
+            skipped.append(idea)
+
+    if skipped:
+        print(f"   ⏭️  Skipping {len(skipped)} idea(s) below {min_yield:.1%} expected yield "
+              f"(~{EXPLORE_FRACTION:.0%} of low scorers still run to keep the model honest)")
+    return to_run, skipped
+
+def update_predictor(ideas_bank: List[Dict]):
+    """Incremental retrain after a run on ideas that got a verdict since the last update"""
+    predictor = load_predictor()
+    used = predictor.train(ideas_bank)
+    if used:
+        save_predictor(predictor)
+        print(f"\n🔮 Kill predictor updated with {used} new stage verdict(s)")
+
+# ═══════════════════════════════════════════════════════════
+# CLI
+# ═══════════════════════════════════════════════════════════
+
+def load_bank_ideas() -> List[Dict]:
+    return load_bank(IDEAS_BANK_FILE)
+
+def auc(scores: List[Tuple[float, int]]) -> Optional[float]:
+    """Probability a random survivor outscores a random kill (ties count half)"""
+    positives = [s for s, label in scores if label == 1]
+    negatives = [s for s, label in scores if label == 0]
+    if not positives or not negatives:
+        return None
+    wins = sum(1.0 if p > n else 0.5 if p == n else 0.0 for p in positives for n in negatives)
+    return wins / (len(positives) * len(negatives))
+
+def evaluate(ideas: List[Dict], holdout: float = 0.2):
+    """Train on the oldest ideas, score the newest (bank order ≈ time order)"""
+    labelled = [i for i in ideas if stage_labels(i) and i.get("hash")]
+    split = int(len(labelled) * (1 - holdout))
+    train, test = labelled[:split], labelled[split:]
+    if not train or not test:
+        print("❌ Not enough labelled ideas to evaluate")
+        return
+
+    predictor = KillPredictor()
+    predictor.train(train, epochs=FULL_EPOCHS)
+    print(f"Trained on {len(train)} ideas, testing on {len(test)}\n")
+    print(f"{'Stage':<8}{'test n':>8}{'survived':>10}{'AUC':>8}{'log loss':>10}{'base rate ll':>14}")
+    for stage in STAGES:
+        scored = [(predictor.stage_probability(stage, features(i)), stage_labels(i)[stage])
+                  for i in test if stage in stage_labels(i)]
+        if not scored:
+            continue
+        base = predictor.base_rate(stage)
+
+        def log_loss(pairs):
+            eps = 1e-6
+            return -sum(math.log(max(eps, p if y else 1 - p)) for p, y in pairs) / len(pairs)
+
+        score_auc = auc(scored)
+        print(f"{stage:<8}{len(scored):>8}{sum(y for _, y in scored):>10}"
+              f"{score_auc if score_auc is not None else float('nan'):>8.2f}"
+              f"{log_loss(scored):>10.3f}{log_loss([(base, y) for _, y in scored]):>14.3f}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Learned kill predictor (per-stage survival)")
+    parser.add_argument("--retrain", action="store_true", help="Full retrain from ideas_bank.json")
+    parser.add_argument("--evaluate", action="store_true", help="Holdout evaluation on the newest 20%% of ideas")
+    args = parser.parse_args()
+
+    ideas = load_bank_ideas()
+
+    if args.evaluate:
+        evaluate(ideas)
+        return
+
+    predictor = KillPredictor() if args.retrain else load_predictor()
+    used = predictor.train(ideas, epochs=FULL_EPOCHS if args.retrain else INCREMENTAL_EPOCHS)
+    save_predictor(predictor)
+    print(f"🔮 Trained on {used} stage verdict(s) → {MODEL_FILE}")
+    for stage in STAGES:
+        s = predictor.stages[stage]
+        print(f"   Stage {stage}: {s['examples']} examples, base survival {predictor.base_rate(stage):.0%}")
+
+if __name__ == "__main__":
+    main()
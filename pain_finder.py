@@ -14,6 +14,8 @@ from google.oauth2.service_account import Credentials
 from dotenv import load_dotenv
 import google.generativeai as genai
 
+from sheets_mirror import WorksheetMirror
+
 load_dotenv()
 
 print("\n" + "="*80)
@@ -235,19 +237,32 @@ ID: #{idea_num}
 }
 
 # Helper functions
+_queue_mirror = None
+
+def queue_mirror():
+    """Local mirror of the Ideas Queue (sheets_mirror.py), synced past its cursor once per run"""
+    global _queue_mirror
+    if _queue_mirror is None:
+        _queue_mirror = WorksheetMirror(sheet.worksheet("Ideas Queue"))
+        _queue_mirror.sync()
+    return _queue_mirror
+
 def get_next():
     try:
-        q = sheet.worksheet("Ideas Queue")
-        rows = q.get_all_records()
-        for idx, row in enumerate(rows, start=2):
-            if str(row.get('Status', '')).strip() == 'Pending':
-                return {
-                    'row': idx,
-                    'num': row.get('Idea #', idx-1),
-                    'niche': str(row.get('Micro-Niche', '')).strip(),
-                    'pain': str(row.get('Specific Task/Pain', '')).strip()
-                }
-        return None
+        mirror = queue_mirror()
+        pending = mirror.rows_with_status('Pending', 1)
+        if not pending and mirror.sync():  # only rows appended since the cursor
+            pending = mirror.rows_with_status('Pending', 1)
+        if not pending:
+            return None
+        idx = pending[0]
+        row = mirror.record(idx)
+        return {
+            'row': idx,
+            'num': row.get('Idea #') or idx-1,
+            'niche': str(row.get('Micro-Niche', '')).strip(),
+            'pain': str(row.get('Specific Task/Pain', '')).strip()
+        }
     except Exception as e:
         print(f"❌ Queue error: {e}")
         return None
@@ -255,6 +270,8 @@ def get_next():
 def update_status(row, status):
     try:
         sheet.worksheet("Ideas Queue").update_cell(row, 4, status)
+        queue_mirror().set_cell(row, 4, status)
+        queue_mirror().save()
     except:
         pass
 
@@ -4,33 +4,19 @@ Pain Point Finder v4.0 - OpenAI Edition
 Rigorous 5-stage validation with better research
 """
 
-import os
-import sys
 import time
-import gspread
 from datetime import datetime
-from google.oauth2.service_account import Credentials
 from dotenv import load_dotenv
-from openai import OpenAI
 
-load_dotenv()
-
-OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
-GOOGLE_SHEET_NAME = os.getenv("GOOGLE_SHEET_NAME", "Pain Point Research")
+from providers import lazy_client
+from sheet_leases import SheetLeaser
+from sheets_client import SheetSnapshot
 
-if not OPENAI_API_KEY:
-    print("❌ No OPENAI_API_KEY in .env")
-    sys.exit(1)
+load_dotenv()
 
-client = OpenAI(api_key=OPENAI_API_KEY)
+client = lazy_client("openai")  # built on first call (providers.py); exits there without OPENAI_API_KEY
 
-SCOPES = [
-    'https://www.googleapis.com/auth/spreadsheets',
-    'https://www.googleapis.com/auth/drive'
-]
-creds = Credentials.from_service_account_file('google-credentials.json', scopes=SCOPES)
-gc = gspread.authorize(creds)
-sheet = gc.open(GOOGLE_SHEET_NAME)
+sheet = lazy_client("google_sheet")  # service-account login + open on first use
 
 # Rate limiting: 1 second between API calls
 RATE_LIMIT_DELAY = 1.0
@@ -380,13 +366,12 @@ def main():
     print("💀 Expected kill rate: 95%+", flush=True)
     print("="*60, flush=True)
 
-    queue = sheet.worksheet("Ideas Queue")
-    verified = sheet.worksheet("Verified Pains")
-    winners = sheet.worksheet("Winners")
-
-    all_rows = queue.get_all_values()
+    # The queue and result tabs live in a local store; sheets_sync.py pushes
+    # and pulls the differences to Sheets in bulk (on a timer and at exit)
+    snapshot = SheetSnapshot(sheet)
+    mirror = snapshot.mirror("Ideas Queue")
 
-    if len(all_rows) <= 1:
+    if mirror.cursor <= 1:
         print("\n❌ No ideas in queue. Run: python generate_ideas_v4.py", flush=True)
         return
 
@@ -395,24 +380,27 @@ def main():
     verified_count = 0
     winners_count = 0
 
-    for i, row in enumerate(all_rows[1:], start=2):
-        if len(row) < 4:
-            continue
+    # Each row is leased before it's researched, so several copies of this
+    # script can share the queue (sheet_leases.py)
+    leaser = SheetLeaser(snapshot.worksheet("Ideas Queue"), mirror, lock=snapshot.lock)
+    print(f"🔒 Worker {leaser.worker_id}", flush=True)
 
-        status = row[3] if len(row) > 3 else ""
-        if status != "Pending":
-            continue
+    for lease in leaser.claim_each("Pending"):
+        i = lease["row"]
+        row = mirror.row(i)
 
         row_num = row[0]
         niche = row[1]
         pain = row[2]
 
-        result_status, research_data = research_pain_point(row_num, niche, pain)
+        with leaser.hold(lease):
+            result_status, research_data = research_pain_point(row_num, niche, pain)
 
-        processed += 1
+            # Update Ideas Queue status (under the lease lock, so a heartbeat can't lease over it)
+            with leaser.lock:
+                snapshot.update_cell("Ideas Queue", i, 4, result_status)
 
-        # Update Ideas Queue status
-        queue.update_cell(i, 4, result_status)
+        processed += 1
 
         if "KILLED" in result_status:
             killed += 1
@@ -420,7 +408,7 @@ def main():
 
         elif "VERIFIED" in result_status:
             # Add to Verified Pains
-            verified.append_row([
+            snapshot.append_row("Verified Pains", [
                 row_num,
                 niche,
                 pain,
@@ -432,7 +420,7 @@ def main():
 
             # Check if it's a winner (passed all 5 stages)
             if "Stage 5" in research_data and "PROCEED" in research_data:
-                winners.append_row([
+                snapshot.append_row("Winners", [
                     row_num,
                     niche,
                     pain,
@@ -445,6 +433,8 @@ def main():
         print(f"\n📊 Progress: {processed} processed | {killed} killed | {verified_count} verified | {winners_count} winners", flush=True)
         print(f"   Kill rate: {(killed/processed*100):.1f}%", flush=True)
 
+    snapshot.flush()
+
     print(f"\n{'='*60}", flush=True)
     print(f"✅ Research complete!", flush=True)
     print(f"   Processed: {processed}", flush=True)
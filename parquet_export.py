@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+"""
+Parquet export of the ideas history for analytics
+
+Flattens the bank, the Stage 2 signals store and the cost ledger into typed
+Parquet tables under analytics/, one file per run_id (hive partitions):
+
+    analytics/ideas/run_id=2025-10-07_10-27-39/part.parquet           one row per idea
+    analytics/stage_verdicts/run_id=.../part.parquet                  one row per idea × stage it reached
+    analytics/signals/run_id=.../part.parquet                         one row per idea × Stage 2 signal
+    analytics/costs/run_id=.../part.parquet                           one row per run × stage (cost_ledger.jsonl)
+
+Status, business, stage, signal and verdict columns are dictionary-encoded.
+Stage verdicts come from each idea's status (killed_stage3 → passed 1-2,
+killed 3), so no analysis bodies are read from the blob store. Ideas from
+before run ids existed go to run_id=none.
+
+Re-running only rewrites the runs whose rows changed since the last export
+(export_state.json keeps a fingerprint per table and run):
+
+    python parquet_export.py            # incremental
+    python parquet_export.py --full     # rewrite every partition
+
+    import duckdb
+    duckdb.sql("SELECT stage_name, count(*) FILTER (WHERE passed) AS passed, count(*) AS reached "
+               "FROM read_parquet('analytics/stage_verdicts/*/*.parquet', hive_partitioning=1) "
+               "GROUP BY ALL ORDER BY 1")
+    pandas.read_parquet("analytics/ideas").groupby("status", observed=True).size()
+"""
+
+import os
+import json
+import time
+import shutil
+import hashlib
+import argparse
+from datetime import date, datetime
+from typing import Dict, List, Optional
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from ideas_journal import IDEAS_BANK_FILE, load_bank
+from kill_predictor import STAGES, stage_labels
+from priority_scheduler import COST_LEDGER_FILE
+from signals_store import load_signal_rows
+
+EXPORT_DIR = os.getenv("PARQUET_EXPORT_DIR", "analytics")
+STATE_FILE = "export_state.json"
+NO_RUN_ID = "none"
+COMPRESSION = "zstd"
+
+STAGE_NAMES = {1: "Stage 1: White Space", 2: "Stage 2: Evidence", 3: "Stage 3: Build",
+               4: "Stage 4: Cost", 5: "Stage 5: GTM", 6: "Stage 6: Founder"}
+
+CATEGORY = pa.dictionary(pa.int32(), pa.string())
+
+SCHEMAS = {
+    "ideas": pa.schema([
+        ("hash", pa.string()),
+        ("idea_id", pa.int64()),
+        ("business", CATEGORY),
+        ("pain", pa.string()),
+        ("status", CATEGORY),
+        ("outcome", CATEGORY),         # finalist / killed / passed / other statuses as-is
+        ("last_stage", pa.int8()),     # highest stage with a verdict (0: none yet)
+        ("killed_stage", pa.int8()),   # null unless killed
+        ("source_cluster", CATEGORY),
+        ("generated_date", pa.date32()),
+    ]),
+    "stage_verdicts": pa.schema([
+        ("hash", pa.string()),
+        ("stage", pa.int8()),
+        ("stage_name", CATEGORY),
+        ("passed", pa.bool_()),
+        ("status", CATEGORY),
+        ("business", CATEGORY),
+    ]),
+    "signals": pa.schema([
+        ("hash", pa.string()),
+        ("version", CATEGORY),
+        ("signal", CATEGORY),
+        ("score", pa.float32()),
+        ("max_score", pa.int8()),
+        ("counted", pa.bool_()),
+        ("metric", pa.float64()),
+        ("verdict", CATEGORY),
+        ("status", CATEGORY),
+    ]),
+    "costs": pa.schema([
+        ("date", pa.timestamp("s")),
+        ("stage", CATEGORY),
+        ("ideas", pa.int32()),
+        ("spend_usd", pa.float64()),
+    ]),
+}
+
+# ═══════════════════════════════════════════════════════════
+# FLATTEN
+# ═══════════════════════════════════════════════════════════
+
+def _int(value) -> Optional[int]:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+def _date(value) -> Optional[date]:
+    try:
+        return date.fromisoformat(str(value)[:10])
+    except ValueError:
+        return None
+
+def _timestamp(value) -> Optional[datetime]:
+    try:
+        return datetime.strptime(str(value), "%Y-%m-%d %H:%M:%S")
+    except ValueError:
+        return None
+
+def _category(value) -> Optional[str]:
+    return value if isinstance(value, str) else None
+
+def idea_row(idea: Dict) -> Dict:
+    status = idea.get("status", "")
+    labels = stage_labels(idea)
+    killed = [stage for stage, survived in labels.items() if not survived]
+    if status in ("FINALIST", "WINNER"):
+        outcome = "finalist"
+    elif status.startswith(("killed_", "passed_")):
+        outcome = status.split("_")[0]
+    else:
+        outcome = status or None
+    return {
+        "hash": idea.get("hash"),
+        "idea_id": _int(idea.get("id")),
+        "business": _category(idea.get("business")),
+        "pain": _category(idea.get("pain")),
+        "status": status or None,
+        "outcome": outcome,
+        "last_stage": max(labels, default=0),
+        "killed_stage": killed[0] if killed else None,
+        "source_cluster": _category(idea.get("source_cluster")),
+        "generated_date": _date(idea.get("generated_date")),
+    }
+
+def verdict_rows(idea: Dict) -> List[Dict]:
+    return [{
+        "hash": idea.get("hash"),
+        "stage": stage,
+        "stage_name": STAGE_NAMES[stage],
+        "passed": bool(survived),
+        "status": idea.get("status"),
+        "business": _category(idea.get("business")),
+    } for stage, survived in sorted(stage_labels(idea).items()) if stage in STAGES]
+
+def read_ledger(path: str = COST_LEDGER_FILE) -> List[Dict]:
+    rows = []
+    if os.path.exists(path):
+        with open(path, 'r') as f:
+            for line in f:
+                try:
+                    rows.append(json.loads(line))
+                except json.JSONDecodeError:
+                    continue
+    return rows
+
+def collect(ideas: List[Dict], signal_rows: List[Dict], ledger: List[Dict]) -> Dict[str, Dict[str, List[Dict]]]:
+    """{table: {run_id: rows}} for every table"""
+    tables: Dict[str, Dict[str, List[Dict]]] = {name: {} for name in SCHEMAS}
+    run_of_hash = {}
+    for idea in ideas:
+        run_id = idea.get("run_id") or NO_RUN_ID
+        run_of_hash[idea.get("hash")] = run_id
+        tables["ideas"].setdefault(run_id, []).append(idea_row(idea))
+        tables["stage_verdicts"].setdefault(run_id, []).extend(verdict_rows(idea))
+    for row in signal_rows:
+        tables["signals"].setdefault(run_of_hash.get(row.get("hash"), NO_RUN_ID), []).append(
+            {field: row.get(field) for field in SCHEMAS["signals"].names})
+    for entry in ledger:
+        tables["costs"].setdefault(entry.get("run_id") or NO_RUN_ID, []).append({
+            "date": _timestamp(entry.get("date")),
+            "stage": entry.get("stage"),
+            "ideas": _int(entry.get("ideas")),
+            "spend_usd": entry.get("spend_usd"),
+        })
+    return tables
+
+def fingerprint(rows: List[Dict]) -> str:
+    return hashlib.sha1(json.dumps(rows, default=str, sort_keys=True).encode()).hexdigest()
+
+# ═══════════════════════════════════════════════════════════
+# WRITE
+# ═══════════════════════════════════════════════════════════
+
+def partition_path(export_dir: str, table: str, run_id: str) -> str:
+    return os.path.join(export_dir, table, f"run_id={run_id}", "part.parquet")
+
+def write_partition(path: str, schema: pa.Schema, rows: List[Dict]):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = path + ".tmp"
+    pq.write_table(pa.Table.from_pylist(rows, schema=schema), tmp_path, compression=COMPRESSION)
+    os.replace(tmp_path, path)
+
+def load_state(export_dir: str) -> Dict[str, Dict[str, str]]:
+    path = os.path.join(export_dir, STATE_FILE)
+    if not os.path.exists(path):
+        return {}
+    with open(path, 'r') as f:
+        return json.load(f)
+
+def save_state(export_dir: str, state: Dict[str, Dict[str, str]]):
+    path = os.path.join(export_dir, STATE_FILE)
+    with open(path + ".tmp", 'w') as f:
+        json.dump(state, f, indent=2, sort_keys=True)
+    os.replace(path + ".tmp", path)
+
+def export(bank_path: str = IDEAS_BANK_FILE, export_dir: str = EXPORT_DIR,
+           full: bool = False) -> Dict[str, Dict[str, int]]:
+    """Write the partitions whose rows changed; returns {table: {"written", "removed", "partitions", "rows"}}"""
+    tables = collect(load_bank(bank_path), load_signal_rows(), read_ledger())
+    state = {} if full else load_state(export_dir)
+    summary = {}
+    for table, partitions in tables.items():
+        previous = state.get(table, {})
+        current, written = {}, 0
+        for run_id, rows in partitions.items():
+            current[run_id] = fingerprint(rows)
+            path = partition_path(export_dir, table, run_id)
+            if previous.get(run_id) != current[run_id] or not os.path.exists(path):
+                write_partition(path, SCHEMAS[table], rows)
+                written += 1
+        removed = [run_id for run_id in previous if run_id not in current]
+        for run_id in removed:
+            shutil.rmtree(os.path.dirname(partition_path(export_dir, table, run_id)), ignore_errors=True)
+        state[table] = current
+        summary[table] = {"written": written, "removed": len(removed), "partitions": len(current),
+                          "rows": sum(len(rows) for rows in partitions.values())}
+    os.makedirs(export_dir, exist_ok=True)
+    save_state(export_dir, state)
+    return summary
+
+# ═══════════════════════════════════════════════════════════
+# CLI
+# ═══════════════════════════════════════════════════════════
+
+def main():
+    parser = argparse.ArgumentParser(description="Export the ideas history to Parquet (incremental by run_id)")
+    parser.add_argument("--bank", default=IDEAS_BANK_FILE)
+    parser.add_argument("--output", default=EXPORT_DIR, help="Export directory")
+    parser.add_argument("--full", action="store_true", help="Rewrite every partition")
+    args = parser.parse_args()
+
+    started = time.time()
+    summary = export(args.bank, args.output, args.full)
+    print(f"📦 Parquet export → {args.output}/ in {time.time() - started:.1f}s")
+    for table, s in summary.items():
+        print(f"   {table:<15} {s['rows']:>8,} rows  {s['written']:>4}/{s['partitions']} runs written"
+              + (f", {s['removed']} removed" if s["removed"] else ""))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,397 @@
+#!/usr/bin/env python3
+"""
+PIPELINE DAEMON - a warm v6.0 pipeline behind a local HTTP/JSON API
+
+One long-running process keeps the provider clients and their connection
+pools, the ideas bank, the founder profile, the Stage 0A source list and the
+adaptive concurrency limits warm between jobs. Jobs run one at a time (they
+share the bank); per-idea progress is streamed back as NDJSON.
+
+    python pipeline_daemon.py serve                          # 127.0.0.1:8765
+    python pipeline_daemon.py submit --count 20 --workers 4  # mine 20 new ideas, stream progress
+    python pipeline_daemon.py submit --ideas my_ideas.json   # [{"business": "...", "pain": "..."}, ...]
+    python pipeline_daemon.py submit --type resume           # or: recompute
+    python pipeline_daemon.py status [JOB_ID]
+
+    python ultimate_winner_machine_v6.0.py --count 20 --daemon http://127.0.0.1:8765
+
+API:
+    POST /jobs               {"type": "mine", "count": 20, "workers": 4, "batch_size": 0, "min_yield": 0,
+                              "budget_usd": 0, "deadline_min": 0, "profiles": ["a.json", "b.json"]}
+                             {"type": "ideas", "ideas": [...]} | {"type": "resume"} | {"type": "recompute"}
+                             → {"job_id": "...", "queued_ahead": n}
+    GET  /jobs               every job (without events)
+    GET  /jobs/<id>          one job
+    GET  /jobs/<id>/events   NDJSON: queued, started, passed/killed/deferred per idea × stage, finalist, done/failed
+    GET  /health
+
+The client side (submit/status) only uses the standard library, so it starts
+instantly; only `serve` imports the pipeline.
+"""
+
+import os
+import sys
+import json
+import time
+import queue
+import argparse
+import threading
+import traceback
+import urllib.request
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from ideas_journal import bank_version
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+DEFAULT_URL = f"http://{DEFAULT_HOST}:{DEFAULT_PORT}"
+
+# Stage 0A results are reused for this long before sources are rediscovered
+SOURCES_TTL_HOURS = 6
+
+JOB_TYPES = ("mine", "ideas", "resume", "recompute")
+
+EVENT_ICONS = {"queued": "🕒", "started": "▶️ ", "passed": "✅", "killed": "❌", "deferred": "⏸️ ",
+               "finalist": "🏆", "done": "🎉", "failed": "💥"}
+
+# ═══════════════════════════════════════════════════════════
+# DAEMON
+# ═══════════════════════════════════════════════════════════
+
+class PipelineDaemon:
+    """Warm pipeline state + a single job runner thread"""
+
+    def __init__(self, version: str = "v6.0", sources_ttl_hours: float = SOURCES_TTL_HOURS):
+        from pipeline_versions import load_pipeline
+
+        started = time.time()
+        self.pipeline = load_pipeline(version)
+        self.version = version
+        self.sources_ttl = sources_ttl_hours * 3600
+        self.sources: Optional[List] = None
+        self.sources_at = 0.0
+        self.ideas_bank = self.pipeline.load_ideas_bank()
+        self.bank_mtime = self._bank_mtime()
+
+        self.jobs: Dict[str, Dict] = {}
+        self.changed = threading.Condition()
+        self.pending: "queue.Queue[str]" = queue.Queue()
+        self.counter = 0
+        threading.Thread(target=self._run_jobs, name="pipeline-jobs", daemon=True).start()
+        print(f"🔥 {version} pipeline warm in {time.time() - started:.1f}s | {len(self.ideas_bank)} ideas in bank")
+
+    # ─── bank / caches ───
+
+    def _bank_mtime(self) -> Tuple:
+        """Snapshot + journal stamps (ideas_journal.py); changes on any write"""
+        return bank_version(self.pipeline.IDEAS_BANK_FILE)
+
+    def _refresh_bank(self):
+        """Another tool (rescore.py, the dashboard, ...) wrote the bank since our last job - reload it"""
+        if self._bank_mtime() != self.bank_mtime:
+            self.ideas_bank = self.pipeline.load_ideas_bank()
+            print(f"🔄 Ideas bank changed on disk - reloaded ({len(self.ideas_bank)} ideas)")
+
+    def _cached_sources(self) -> List:
+        if self.sources is None or time.time() - self.sources_at > self.sources_ttl:
+            self.sources = self.pipeline.stage0a_meta_source_discovery()
+            self.sources_at = time.time()
+        else:
+            age_min = (time.time() - self.sources_at) / 60
+            print(f"\n♨️  Reusing {len(self.sources)} discovered sources ({age_min:.0f} min old)")
+        return self.sources
+
+    # ─── jobs ───
+
+    def submit(self, spec: Dict) -> Dict:
+        job_type = spec.get("type", "mine")
+        if job_type not in JOB_TYPES:
+            raise ValueError(f"Unknown job type '{job_type}' (known: {', '.join(JOB_TYPES)})")
+        if job_type == "ideas":
+            ideas = spec.get("ideas")
+            if not isinstance(ideas, list) or not all(isinstance(i, dict) and i.get("business") and i.get("pain")
+                                                      for i in ideas):
+                raise ValueError('"ideas" must be a list of {"business": ..., "pain": ...}')
+
+        with self.changed:
+            self.counter += 1
+            job_id = f"{datetime.now().strftime('%Y-%m-%d_%H-%M-%S')}_{self.counter}"
+            self.jobs[job_id] = {
+                "id": job_id,
+                "type": job_type,
+                "spec": spec,
+                "status": "queued",
+                "submitted": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                "finalists": [],
+                "events": [],
+            }
+            queued_ahead = self.pending.qsize()
+        self._event(job_id, {"event": "queued", "queued_ahead": queued_ahead})
+        self.pending.put(job_id)
+        return {"job_id": job_id, "queued_ahead": queued_ahead}
+
+    def _event(self, job_id: str, event: Dict):
+        with self.changed:
+            event = {"time": datetime.now().strftime("%H:%M:%S"), **event}
+            self.jobs[job_id]["events"].append(event)
+            self.changed.notify_all()
+
+    def _finish(self, job_id: str, status: str, **fields):
+        # Status and final event change together, so a streaming client never stops short of "done"
+        with self.changed:
+            job = self.jobs[job_id]
+            job.update(status=status, finished=datetime.now().strftime("%Y-%m-%d %H:%M:%S"), **fields)
+            self._event(job_id, {"event": status, **fields})
+
+    def _run_jobs(self):
+        while True:
+            job_id = self.pending.get()
+            with self.changed:
+                job = self.jobs[job_id]
+                job.update(status="running", started=datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
+            self._event(job_id, {"event": "started"})
+            self.pipeline.set_progress_listener(lambda event: self._event(job_id, event))
+            try:
+                finalists = self._run(job_id, job["type"], job["spec"])
+                self._finish(job_id, "done", finalists=[
+                    {"id": idea["id"], "business": idea["business"]} for idea in finalists
+                ])
+            except Exception as e:
+                traceback.print_exc()
+                self._finish(job_id, "failed", error=f"{type(e).__name__}: {e}")
+            finally:
+                self.pipeline.set_progress_listener(None)
+                self.bank_mtime = self._bank_mtime()
+
+    def _run(self, job_id: str, job_type: str, spec: Dict) -> List[Dict]:
+        """One job = one v6.0 run over the warm bank"""
+        pipeline = self.pipeline
+        self._refresh_bank()
+        profiles = pipeline.load_profiles(",".join(spec["profiles"])) if spec.get("profiles") else {}
+        founder_profile = next(iter(profiles.values())) if profiles else pipeline.load_founder_profile()
+        resumed = []
+
+        print(f"\n{'='*80}")
+        print(f"📨 JOB {job_id}: {job_type} {json.dumps({k: v for k, v in spec.items() if k not in ('type', 'ideas')})}")
+        print(f"{'='*80}")
+
+        if job_type == "resume":
+            entries = pipeline.load_resume_entries(self.ideas_bank, founder_profile)
+            resumed = [idea for batch in entries.values() for idea in batch]
+        elif job_type == "recompute":
+            entries = pipeline.load_recompute_entries(self.ideas_bank, founder_profile)
+        else:
+            if job_type == "mine":
+                new_ideas = pipeline.generate_new_ideas(self.ideas_bank, int(spec.get("count", 10)), job_id,
+                                                        self._cached_sources())
+            else:
+                new_ideas = pipeline.add_new_ideas(self.ideas_bank, [dict(idea) for idea in spec["ideas"]], job_id)
+                print(f"\n✅ Accepted {len(new_ideas)} submitted ideas (filtered duplicates)")
+            new_ideas, _ = pipeline.screen_ideas(new_ideas, float(spec.get("min_yield", 0.0)))
+            entries = {0: new_ideas} if new_ideas else {}
+
+        if not entries:
+            print("\n✅ Nothing to run")
+            return []
+        pipeline.save_ideas_bank(self.ideas_bank)
+        return pipeline.run_entries(self.ideas_bank, entries, founder_profile, job_id,
+                                    int(spec.get("batch_size", 0)), int(spec.get("workers", 1)),
+                                    float(spec.get("budget_usd", 0.0)), float(spec.get("deadline_min", 0.0)),
+                                    profiles, resumed)
+
+    # ─── queries ───
+
+    def job_view(self, job_id: str, events: bool = False) -> Optional[Dict]:
+        with self.changed:
+            job = self.jobs.get(job_id)
+            if job is None:
+                return None
+            view = {k: v for k, v in job.items() if k != "events" and k != "spec"}
+            view["params"] = {k: v for k, v in job["spec"].items() if k != "ideas"}
+            view["event_count"] = len(job["events"])
+            if events:
+                view["events"] = list(job["events"])
+            return view
+
+    def stream_events(self, job_id: str) -> Iterator[Dict]:
+        """Every event of the job so far, then new ones until it finishes"""
+        sent = 0
+        while True:
+            with self.changed:
+                job = self.jobs[job_id]
+                if sent >= len(job["events"]) and job["status"] in ("queued", "running"):
+                    self.changed.wait(timeout=15)
+                batch = job["events"][sent:]
+                finished = job["status"] not in ("queued", "running")
+            if batch:
+                yield from batch
+                sent += len(batch)
+            elif finished:
+                return
+            else:
+                yield {"event": "heartbeat"}
+
+# ═══════════════════════════════════════════════════════════
+# HTTP API
+# ═══════════════════════════════════════════════════════════
+
+class DaemonHandler(BaseHTTPRequestHandler):
+    daemon: PipelineDaemon = None
+
+    def log_message(self, format, *args):
+        pass  # the pipeline's own output is the log
+
+    def _json(self, status: int, body):
+        data = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):
+        parts = [p for p in self.path.split("?")[0].split("/") if p]
+        if parts == ["health"]:
+            return self._json(200, {"ok": True, "version": self.daemon.version,
+                                    "ideas": len(self.daemon.ideas_bank), "queued": self.daemon.pending.qsize()})
+        if parts == ["jobs"]:
+            return self._json(200, [self.daemon.job_view(job_id) for job_id in list(self.daemon.jobs)])
+        if len(parts) in (2, 3) and parts[0] == "jobs":
+            if parts[1] not in self.daemon.jobs:
+                return self._json(404, {"error": f"Unknown job {parts[1]}"})
+            if len(parts) == 2:
+                return self._json(200, self.daemon.job_view(parts[1]))
+            if parts[2] == "events":
+                return self._stream(parts[1])
+        self._json(404, {"error": "Not found"})
+
+    def do_POST(self):
+        if self.path.rstrip("/") != "/jobs":
+            return self._json(404, {"error": "Not found"})
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            spec = json.loads(self.rfile.read(length) or b"{}")
+            self._json(202, self.daemon.submit(spec))
+        except (ValueError, TypeError) as e:
+            self._json(400, {"error": str(e)})
+
+    def _stream(self, job_id: str):
+        """NDJSON, one event per line; the connection closes when the job ends"""
+        self.send_response(200)
+        self.send_header("Content-Type", "application/x-ndjson")
+        self.end_headers()
+        try:
+            for event in self.daemon.stream_events(job_id):
+                self.wfile.write((json.dumps(event) + "\n").encode())
+                self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            pass  # client went away; the job keeps running
+
+def serve(host: str, port: int, sources_ttl_hours: float):
+    DaemonHandler.daemon = PipelineDaemon(sources_ttl_hours=sources_ttl_hours)
+    server = ThreadingHTTPServer((host, port), DaemonHandler)
+    server.daemon_threads = True
+    print(f"🛰️  Pipeline daemon listening on http://{host}:{port} (Ctrl+C to stop)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n👋 Stopping daemon")
+    finally:
+        server.server_close()
+
+# ═══════════════════════════════════════════════════════════
+# CLIENT
+# ═══════════════════════════════════════════════════════════
+
+def _request(url: str, method: str = "GET", body: Optional[Dict] = None, timeout: Optional[float] = 30):
+    data = json.dumps(body).encode() if body is not None else None
+    request = urllib.request.Request(url, data=data, method=method, headers={"Content-Type": "application/json"})
+    return urllib.request.urlopen(request, timeout=timeout)
+
+def format_event(event: Dict) -> str:
+    icon = EVENT_ICONS.get(event["event"], "•")
+    if event["event"] in ("passed", "killed", "deferred", "finalist"):
+        profile = f" [{event['profile']}]" if event.get("profile") else ""
+        line = f"{icon} #{event.get('idea_id')} {str(event.get('business', ''))[:40]} - {event['stage']}{profile}"
+        if event.get("reason") and event["event"] != "passed":
+            line += f": {str(event['reason'])[:80]}"
+        if event.get("report"):
+            line += f" → {event['report']}"
+        return line
+    if event["event"] == "done":
+        return f"{icon} Done - {len(event.get('finalists', []))} finalist(s)"
+    if event["event"] == "failed":
+        return f"{icon} Failed - {event.get('error')}"
+    if event["event"] == "queued":
+        return f"{icon} Queued ({event.get('queued_ahead', 0)} job(s) ahead)"
+    return f"{icon} {event['event'].capitalize()}"
+
+def submit_and_stream(url: str, spec: Dict) -> Dict:
+    """Submit a job and print its progress until it ends; returns the final job record"""
+    url = url.rstrip("/")
+    with _request(f"{url}/jobs", "POST", spec) as response:
+        job_id = json.loads(response.read())["job_id"]
+    print(f"📨 Job {job_id} submitted to {url}")
+
+    with _request(f"{url}/jobs/{job_id}/events", timeout=None) as response:
+        for line in response:
+            event = json.loads(line)
+            if event["event"] != "heartbeat":
+                print(f"[{event.get('time', '')}] {format_event(event)}", flush=True)
+
+    with _request(f"{url}/jobs/{job_id}") as response:
+        return json.loads(response.read())
+
+def main():
+    parser = argparse.ArgumentParser(description="Warm v6.0 pipeline daemon + client")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p_serve = sub.add_parser("serve", help="Run the daemon")
+    p_serve.add_argument("--host", default=DEFAULT_HOST)
+    p_serve.add_argument("--port", type=int, default=DEFAULT_PORT)
+    p_serve.add_argument("--sources-ttl-h", type=float, default=SOURCES_TTL_HOURS,
+                         help="Reuse Stage 0A sources for this many hours")
+
+    p_submit = sub.add_parser("submit", help="Submit a job and stream its progress")
+    p_submit.add_argument("--url", default=os.getenv("PIPELINE_DAEMON_URL", DEFAULT_URL))
+    p_submit.add_argument("--type", choices=JOB_TYPES, default=None)
+    p_submit.add_argument("--count", type=int, default=10)
+    p_submit.add_argument("--ideas", type=str, help="JSON file with a list of {business, pain} ideas")
+    p_submit.add_argument("--batch-size", type=int, default=0)
+    p_submit.add_argument("--workers", type=int, default=1)
+    p_submit.add_argument("--min-yield", type=float, default=0.0)
+    p_submit.add_argument("--budget-usd", type=float, default=0.0)
+    p_submit.add_argument("--deadline-min", type=float, default=0.0)
+    p_submit.add_argument("--profiles", type=str, help="Comma-separated founder profile files (daemon-side paths)")
+
+    p_status = sub.add_parser("status", help="List jobs or show one")
+    p_status.add_argument("job_id", nargs="?")
+    p_status.add_argument("--url", default=os.getenv("PIPELINE_DAEMON_URL", DEFAULT_URL))
+
+    args = parser.parse_args()
+
+    if args.command == "serve":
+        serve(args.host, args.port, args.sources_ttl_h)
+        return
+
+    if args.command == "status":
+        path = f"/jobs/{args.job_id}" if args.job_id else "/jobs"
+        with _request(args.url.rstrip("/") + path) as response:
+            print(json.dumps(json.loads(response.read()), indent=2))
+        return
+
+    spec = {"type": args.type or ("ideas" if args.ideas else "mine"), "count": args.count,
+            "batch_size": args.batch_size, "workers": args.workers, "min_yield": args.min_yield,
+            "budget_usd": args.budget_usd, "deadline_min": args.deadline_min}
+    if args.ideas:
+        with open(args.ideas, 'r') as f:
+            spec["ideas"] = json.load(f)
+    if args.profiles:
+        spec["profiles"] = [p.strip() for p in args.profiles.split(",") if p.strip()]
+    job = submit_and_stream(args.url, spec)
+    sys.exit(0 if job.get("status") == "done" else 1)
+
+if __name__ == "__main__":
+    main()
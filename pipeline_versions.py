@@ -0,0 +1,52 @@
+"""
+Pipeline version registry
+Maps each winner machine generation to its script and loads it as a module
+
+The scripts have dots in their file names (ultimate_winner_machine_v6.0.py),
+so they can't be imported with a plain `import` statement.
+"""
+
+import os
+import sys
+import threading
+import importlib.util
+
+REPO_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Oldest → newest
+PIPELINE_VERSIONS = {
+    "v1.0": "winner_machine.py",
+    "v2.0": "ultimate_winner_machine_v2.py",
+    "v3.1": "ultimate_winner_machine_v3.1.py",
+    "v4.0": "ultimate_winner_machine_v4.0.py",
+    "v5.0": "ultimate_winner_machine_v5.0.py",
+    "v6.0": "ultimate_winner_machine_v6.0.py",
+}
+
+# Versions that write to Google Sheets (the "google_sheet" provider) during a run
+SHEETS_VERSIONS = {"v1.0"}
+
+# A module is registered before it finishes executing; other threads must wait for it
+_load_lock = threading.RLock()
+
+def pipeline_path(version: str) -> str:
+    """Absolute path of the script for a pipeline version"""
+    if version not in PIPELINE_VERSIONS:
+        raise KeyError(f"Unknown pipeline version '{version}' (known: {', '.join(PIPELINE_VERSIONS)})")
+    return os.path.join(REPO_DIR, PIPELINE_VERSIONS[version])
+
+def load_pipeline(version: str):
+    """Import a pipeline script as a module (executes its module-level setup)"""
+    if REPO_DIR not in sys.path:
+        sys.path.insert(0, REPO_DIR)
+
+    module_name = "winner_machine_" + version.replace(".", "_")
+    with _load_lock:
+        if module_name in sys.modules:
+            return sys.modules[module_name]
+
+        spec = importlib.util.spec_from_file_location(module_name, pipeline_path(version))
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[module_name] = module
+        spec.loader.exec_module(module)
+        return module
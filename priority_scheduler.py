@@ -0,0 +1,172 @@
+"""
+Priority scheduler - expected finalist value per dollar
+
+    priority = value × P(finalist | next stage) / expected remaining cost
+
+value           log-scaled payoff from Stage 0D/0C: current_annual_cost,
+                estimated_tam and the source cluster's rank_score
+P(finalist)     product of the kill predictor's per-stage survival from the
+                idea's next stage through Stage 6
+remaining cost  per-idea stage costs (learned from cost_ledger.jsonl), each
+                weighted by the chance the idea gets that far
+
+An idea two stages from finalist costs less to finish and is more likely to
+make it, so it outranks a fresh idea of the same value - a run stopped by
+--budget-usd / --deadline-min has spent its money on the best candidates.
+
+cost_ledger.jsonl gets one line per stage per run:
+    {"run_id": "...", "stage": "Stage 2: Evidence", "ideas": 14, "spend_usd": 0.91}
+"""
+
+import os
+import json
+import math
+import heapq
+import threading
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from kill_predictor import load_predictor, STAGES
+
+# ═══════════════════════════════════════════════════════════
+# CONFIGURATION
+# ═══════════════════════════════════════════════════════════
+
+COST_LEDGER_FILE = "cost_ledger.jsonl"
+
+# Per idea, Stages 1-6, from the README estimates (~$10 of the $16 per 100 ideas)
+DEFAULT_STAGE_COST_USD = [0.015, 0.07, 0.01, 0.02, 0.03, 0.01]
+
+# The defaults count as this many observed ideas when blended with the ledger
+PRIOR_IDEAS = 5
+
+# ═══════════════════════════════════════════════════════════
+# STAGE COSTS
+# ═══════════════════════════════════════════════════════════
+
+_stage_ideas: Dict[str, int] = {}
+_stage_ideas_lock = threading.Lock()
+
+def count_stage_ideas(stage_name: str, count: int = 1):
+    """Ideas a stage processed this run (for the ledger's per-idea cost)"""
+    with _stage_ideas_lock:
+        _stage_ideas[stage_name] = _stage_ideas.get(stage_name, 0) + count
+
+def reset_stage_counts():
+    """Start a new run's counts (a daemon runs many jobs in one process)"""
+    with _stage_ideas_lock:
+        _stage_ideas.clear()
+
+def stage_cost_estimates(stage_names: List[str]) -> List[float]:
+    """USD per idea for each stage: ledger history blended with the defaults"""
+    totals = {name: [0, 0.0] for name in stage_names}
+    if os.path.exists(COST_LEDGER_FILE):
+        with open(COST_LEDGER_FILE, 'r') as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                if entry.get("stage") in totals and entry.get("ideas"):
+                    totals[entry["stage"]][0] += entry["ideas"]
+                    totals[entry["stage"]][1] += entry["spend_usd"]
+
+    estimates = []
+    for index, name in enumerate(stage_names):
+        default = DEFAULT_STAGE_COST_USD[min(index, len(DEFAULT_STAGE_COST_USD) - 1)]
+        ideas, spend = totals[name]
+        estimates.append((spend + default * PRIOR_IDEAS) / (ideas + PRIOR_IDEAS))
+    return estimates
+
+def append_cost_ledger(run_id: str, spend_by_stage: Dict[str, float]):
+    """One line per stage that processed ideas this run"""
+    with _stage_ideas_lock:
+        counts = dict(_stage_ideas)
+    if not counts:
+        return
+    with open(COST_LEDGER_FILE, 'a') as f:
+        for stage_name, ideas in counts.items():
+            f.write(json.dumps({
+                "run_id": run_id,
+                "date": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                "stage": stage_name,
+                "ideas": ideas,
+                "spend_usd": round(spend_by_stage.get(stage_name, 0.0), 4),
+            }) + "\n")
+
+# ═══════════════════════════════════════════════════════════
+# SCORING
+# ═══════════════════════════════════════════════════════════
+
+_predictor = None
+
+def _number(value) -> float:
+    """20000, "20000", "$20,000/year" → 20000.0"""
+    if isinstance(value, (int, float)):
+        return max(0.0, float(value))
+    digits = "".join(c for c in str(value or "").split("/")[0] if c.isdigit() or c == ".")
+    try:
+        return float(digits) if digits else 0.0
+    except ValueError:
+        return 0.0
+
+def idea_value(idea: Dict) -> float:
+    """Relative payoff of the idea as a finalist (≥ 1 so missing data never zeroes it)"""
+    return (1 + math.log10(1 + _number(idea.get("current_annual_cost")))
+            + math.log10(1 + _number(idea.get("estimated_tam")))
+            + 0.5 * math.log10(1 + _number(idea.get("cluster_rank_score"))))
+
+def stage_survival(idea: Dict) -> List[float]:
+    """P(survive) per stage - from screen_ideas() if it ran, else the kill predictor"""
+    predicted = idea.get("predicted_survival")
+    if predicted:
+        return [predicted.get(f"stage{s}", 0.5) for s in STAGES]
+    global _predictor
+    if _predictor is None:
+        _predictor = load_predictor()
+    survival = _predictor.survival(idea)
+    return [survival[s] for s in STAGES]
+
+def priority(idea: Dict, stage_index: int, stage_costs: List[float]) -> Tuple[float, float, float]:
+    """(score, P(finalist), expected remaining USD) for an idea about to run stage_index"""
+    survival = stage_survival(idea)
+    reach, remaining_cost = 1.0, 0.0
+    for index in range(stage_index, len(stage_costs)):
+        remaining_cost += reach * stage_costs[index]
+        reach *= survival[min(index, len(survival) - 1)]
+    return idea_value(idea) * reach / max(remaining_cost, 1e-6), reach, remaining_cost
+
+def order_by_priority(ideas: List[Dict], stage_index: int, stage_costs: List[float]) -> List[Dict]:
+    """A stage's batch, best expected value per dollar first"""
+    return sorted(ideas, key=lambda idea: priority(idea, stage_index, stage_costs)[0], reverse=True)
+
+class StageScheduler:
+    """Max-heap of (idea, next stage index) by priority()"""
+
+    def __init__(self, stage_costs: List[float]):
+        self.stage_costs = stage_costs
+        self._heap = []
+        self._counter = 0
+
+    def push(self, idea: Dict, stage_index: int):
+        score, _, _ = priority(idea, stage_index, self.stage_costs)
+        self._counter += 1
+        heapq.heappush(self._heap, (-score, self._counter, stage_index, idea))
+
+    def peek(self) -> Optional[Tuple[Dict, int]]:
+        if not self._heap:
+            return None
+        _, _, stage_index, idea = self._heap[0]
+        return idea, stage_index
+
+    def pop(self) -> Tuple[Dict, int]:
+        _, _, stage_index, idea = heapq.heappop(self._heap)
+        return idea, stage_index
+
+    def drain(self) -> List[Tuple[Dict, int]]:
+        items = [(idea, stage_index) for _, _, stage_index, idea in sorted(self._heap)]
+        self._heap = []
+        return items
+
+    def __len__(self):
+        return len(self._heap)
@@ -0,0 +1,485 @@
+"""
+Provider client helpers
+Typed API errors, retries with exponential backoff + jitter, and a circuit
+breaker per provider (openai, anthropic, perplexity, google)
+
+The call_* wrappers in each pipeline run their SDK call through
+with_retries(). Errors that survive the retries are raised as
+TransientAPIError / PermanentAPIError so the stage runner can defer the idea
+(see retry_queue.py) instead of recording a KILL verdict.
+
+coalesce() adds singleflight on top: concurrent byte-identical requests
+(same provider + params) share one outstanding call and its result.
+
+Every attempt holds a slot from the provider/model's adaptive concurrency
+limiter (concurrency_controller.py); 429s, 5xx and timeouts shrink it.
+
+record_usage() prices each response's token usage (MODEL_PRICING) and adds
+it to the current stage's spend, for budgets and the run summary.
+"""
+
+import json
+import time
+import random
+import asyncio
+import hashlib
+import threading
+import contextvars
+from contextlib import contextmanager, asynccontextmanager
+from typing import Callable, Dict, List, Optional
+
+from concurrency_controller import AIMDController, get_controller
+
+# ═══════════════════════════════════════════════════════════
+# CONFIGURATION
+# ═══════════════════════════════════════════════════════════
+
+RETRY_ATTEMPTS = 4
+BACKOFF_BASE_SECONDS = 2.0
+BACKOFF_MAX_SECONDS = 60.0
+
+BREAKER_FAILURE_THRESHOLD = 5
+BREAKER_RESET_SECONDS = 120.0
+
+# HTTP statuses worth retrying (timeouts, conflicts, rate limits, server side)
+TRANSIENT_STATUS_CODES = {408, 409, 425, 429, 500, 502, 503, 504, 529}
+
+# SDK / transport exception class names that mean "try again later"
+TRANSIENT_ERROR_NAMES = {
+    "RateLimitError", "APITimeoutError", "APIConnectionError", "InternalServerError",
+    "OverloadedError", "ServiceUnavailableError", "Timeout", "ReadTimeout",
+    "ConnectTimeout", "ConnectionError", "ChunkedEncodingError",
+    # aiohttp (async_provider.py)
+    "ClientConnectorError", "ServerDisconnectedError", "ClientOSError", "ClientPayloadError",
+    "ServerTimeoutError",
+}
+
+# USD per 1M tokens (input, output); unknown models use the provider default
+MODEL_PRICING = {
+    "gpt-5-mini": (0.25, 2.00),
+    "gpt-4o": (2.50, 10.00),
+    "gpt-4o-mini": (0.15, 0.60),
+    "claude-3-5-sonnet-20241022": (3.00, 15.00),
+    "sonar": (1.00, 1.00),
+}
+PROVIDER_DEFAULT_PRICING = {"openai": (2.50, 10.00), "anthropic": (3.00, 15.00), "perplexity": (1.00, 1.00)}
+
+# Flat per-request fees (Perplexity request fee, Google CSE $5 / 1000 queries)
+REQUEST_FEES_USD = {"perplexity": 0.005, "google": 0.005}
+
+# Errors that mean "too many requests in flight" to the concurrency controller
+CONGESTION_STATUS_CODES = {429, 500, 502, 503, 504, 529}
+CONGESTION_ERROR_NAMES = {
+    "RateLimitError", "APITimeoutError", "InternalServerError", "OverloadedError",
+    "ServiceUnavailableError", "Timeout", "ReadTimeout", "ServerTimeoutError",
+}
+
+# ═══════════════════════════════════════════════════════════
+# ERRORS
+# ═══════════════════════════════════════════════════════════
+
+class ProviderError(Exception):
+    """An API call that failed after retries"""
+    transient = False
+
+    def __init__(self, provider: str, message: str, status_code: Optional[int] = None):
+        super().__init__(f"{provider}: {message}")
+        self.provider = provider
+        self.message = message
+        self.status_code = status_code
+
+class TransientAPIError(ProviderError):
+    """Rate limits, timeouts, 5xx - the same call may succeed later"""
+    transient = True
+
+class PermanentAPIError(ProviderError):
+    """Auth, bad request, missing config - retrying won't help until something changes"""
+    transient = False
+
+class CircuitOpenError(TransientAPIError):
+    """Provider breaker is open, call not attempted"""
+
+def _status_code(error: Exception) -> Optional[int]:
+    status = getattr(error, "status_code", None)
+    if status is None:
+        status = getattr(getattr(error, "response", None), "status_code", None)
+    return status if isinstance(status, int) else None
+
+def classify_error(provider: str, error: Exception) -> ProviderError:
+    """Map an SDK/transport exception onto TransientAPIError or PermanentAPIError"""
+    if isinstance(error, ProviderError):
+        return error
+
+    status = _status_code(error)
+    message = str(error) or type(error).__name__
+
+    if status in TRANSIENT_STATUS_CODES or type(error).__name__ in TRANSIENT_ERROR_NAMES \
+            or isinstance(error, (TimeoutError, ConnectionError)):
+        return TransientAPIError(provider, message, status)
+    if status is not None and 400 <= status < 500:
+        return PermanentAPIError(provider, message, status)
+
+    # Unknown failure: assume transient - a later retry is cheaper than losing the idea
+    return TransientAPIError(provider, message, status)
+
+def _retry_after(error: Exception) -> Optional[float]:
+    """Retry-After header in seconds, if the provider sent one"""
+    headers = getattr(getattr(error, "response", None), "headers", None) or {}
+    try:
+        value = headers.get("retry-after") or headers.get("Retry-After")
+        return float(value) if value is not None else None
+    except (TypeError, ValueError, AttributeError):
+        return None
+
+def is_congestion(error: BaseException) -> bool:
+    """Rate limit, overloaded/5xx or timeout - a signal to lower concurrency"""
+    return _status_code(error) in CONGESTION_STATUS_CODES or type(error).__name__ in CONGESTION_ERROR_NAMES \
+        or isinstance(error, TimeoutError)
+
+def _outcome(error: BaseException) -> str:
+    if isinstance(error, Exception):
+        return "congested" if is_congestion(error) else "error"
+    return "cancelled"
+
+# ═══════════════════════════════════════════════════════════
+# CIRCUIT BREAKER
+# ═══════════════════════════════════════════════════════════
+
+class CircuitBreaker:
+    """
+    closed → open after `failure_threshold` consecutive transient failures
+    open → half_open after `reset_timeout` seconds (one probe call allowed;
+        other callers fail fast until the probe resolves)
+    half_open → closed on success, back to open on failure
+    """
+
+    def __init__(self, provider: str, failure_threshold: int = BREAKER_FAILURE_THRESHOLD,
+                 reset_timeout: float = BREAKER_RESET_SECONDS):
+        self.provider = provider
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = "closed"
+        self.failures = 0
+        self.opened_at = 0.0
+        self.probing = False
+        self._lock = threading.Lock()
+
+    def before_call(self) -> bool:
+        """Raises CircuitOpenError if the call may not go out; True if the caller is the half-open probe"""
+        with self._lock:
+            if self.state == "closed":
+                return False
+            if self.state == "open":
+                remaining = self.reset_timeout - (time.monotonic() - self.opened_at)
+                if remaining > 0:
+                    raise CircuitOpenError(self.provider, f"circuit open, retry in {remaining:.0f}s")
+                self.state = "half_open"
+            if self.probing:
+                raise CircuitOpenError(self.provider, "circuit half-open, probe call in flight")
+            self.probing = True
+            return True
+
+    def release_probe(self):
+        """The probe ended without a verdict on the provider (permanent error, cancelled) - let another through"""
+        with self._lock:
+            self.probing = False
+
+    def record_success(self):
+        with self._lock:
+            self.state = "closed"
+            self.failures = 0
+            self.probing = False
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            self.probing = False
+            if self.state == "half_open" or self.failures >= self.failure_threshold:
+                if self.state != "open":
+                    print(f"      🔌 {self.provider} circuit OPEN after {self.failures} failures "
+                          f"(cooling down {self.reset_timeout:.0f}s)")
+                self.state = "open"
+                self.opened_at = time.monotonic()
+
+_breakers: Dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+def get_breaker(provider: str) -> CircuitBreaker:
+    with _breakers_lock:
+        if provider not in _breakers:
+            _breakers[provider] = CircuitBreaker(provider)
+        return _breakers[provider]
+
+# ═══════════════════════════════════════════════════════════
+# RETRIES
+# ═══════════════════════════════════════════════════════════
+
+def backoff_delay(attempt: int, base: float = BACKOFF_BASE_SECONDS, cap: float = BACKOFF_MAX_SECONDS) -> float:
+    """Exponential backoff with full jitter: uniform(0, min(cap, base * 2^(attempt-1)))"""
+    return random.uniform(0, min(cap, base * (2 ** (attempt - 1))))
+
+@contextmanager
+def _slot(limiter: AIMDController):
+    ticket = limiter.acquire()
+    try:
+        yield
+    except BaseException as e:
+        limiter.release(ticket, _outcome(e))
+        raise
+    limiter.release(ticket)
+
+@asynccontextmanager
+async def _async_slot(limiter: AIMDController):
+    ticket = await limiter.acquire_async()
+    try:
+        yield
+    except BaseException as e:
+        limiter.release(ticket, _outcome(e))
+        raise
+    limiter.release(ticket)
+
+def with_retries(provider: str, fn: Callable, max_attempts: int = RETRY_ATTEMPTS, model: Optional[str] = None):
+    """
+    Call fn() with retries on transient errors
+    Each attempt waits for a slot from the provider/model concurrency limiter
+    Raises TransientAPIError / PermanentAPIError / CircuitOpenError when it gives up
+    """
+    breaker = get_breaker(provider)
+    limiter = get_controller(provider, model)
+
+    for attempt in range(1, max_attempts + 1):
+        probe = breaker.before_call()
+        try:
+            with _slot(limiter):
+                result = fn()
+        except Exception as e:
+            error = classify_error(provider, e)
+            if not error.transient:
+                if probe:
+                    breaker.release_probe()
+                raise error from e
+            breaker.record_failure()
+            if attempt == max_attempts or breaker.state == "open":
+                raise error from e
+
+            delay = _retry_after(e) or backoff_delay(attempt)
+            print(f"      ⏳ {provider} error ({error.message[:80]}) - retry {attempt}/{max_attempts - 1} in {delay:.1f}s")
+            time.sleep(delay)
+            continue
+
+        breaker.record_success()
+        return result
+
+async def async_with_retries(provider: str, coro_fn: Callable, max_attempts: int = RETRY_ATTEMPTS,
+                             model: Optional[str] = None):
+    """with_retries() for coroutines: await coro_fn() with the same backoff, breaker and limiter"""
+    breaker = get_breaker(provider)
+    limiter = get_controller(provider, model)
+
+    for attempt in range(1, max_attempts + 1):
+        probe = breaker.before_call()
+        try:
+            async with _async_slot(limiter):
+                result = await coro_fn()
+        except asyncio.CancelledError:
+            if probe:
+                breaker.release_probe()
+            raise
+        except Exception as e:
+            error = classify_error(provider, e)
+            if not error.transient:
+                if probe:
+                    breaker.release_probe()
+                raise error from e
+            breaker.record_failure()
+            if attempt == max_attempts or breaker.state == "open":
+                raise error from e
+
+            delay = _retry_after(e) or backoff_delay(attempt)
+            print(f"      ⏳ {provider} error ({error.message[:80]}) - retry {attempt}/{max_attempts - 1} in {delay:.1f}s")
+            await asyncio.sleep(delay)
+            continue
+
+        breaker.record_success()
+        return result
+
+def call_or_none(fn: Callable, *args, **kwargs):
+    """For call sites that already handle a None response (Stage 0 mining/generation)"""
+    try:
+        return fn(*args, **kwargs)
+    except ProviderError as e:
+        print(f"      ⚠️  {e}")
+        return None
+
+# ═══════════════════════════════════════════════════════════
+# SINGLEFLIGHT (IN-FLIGHT REQUEST COALESCING)
+# ═══════════════════════════════════════════════════════════
+
+class _Flight:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+class SingleFlight:
+    """
+    Concurrent calls with the same key share one execution of fn().
+    Nothing is cached: the key is forgotten as soon as the leader's call finishes,
+    so a later identical request makes a fresh call.
+
+    Counts are kept per scope: the stage name set_dedup_scope() gave the
+    calling thread / task.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._flights: Dict[str, _Flight] = {}
+        self._async_flights: Dict[str, asyncio.Future] = {}
+        self._stats: Dict[str, Dict[str, int]] = {}
+
+    def do(self, key: str, fn: Callable):
+        with self._lock:
+            stats = self._stats.setdefault(_dedup_scope.get(), {"calls": 0, "coalesced": 0})
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+                stats["calls"] += 1
+            else:
+                stats["coalesced"] += 1
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result
+
+        try:
+            flight.result = fn()
+            return flight.result
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._flights[key]
+            flight.done.set()
+
+    async def do_async(self, key: str, coro_fn: Callable):
+        """do() for coroutines sharing one event loop: followers await the leader's future"""
+        with self._lock:
+            stats = self._stats.setdefault(_dedup_scope.get(), {"calls": 0, "coalesced": 0})
+            future = self._async_flights.get(key)
+            leader = future is None
+            if leader:
+                future = self._async_flights[key] = asyncio.get_running_loop().create_future()
+                stats["calls"] += 1
+            else:
+                stats["coalesced"] += 1
+
+        if not leader:
+            # shield: a cancelled follower must not cancel the shared call
+            return await asyncio.shield(future)
+
+        try:
+            result = await coro_fn()
+            future.set_result(result)
+            return result
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()  # mark retrieved - no "never retrieved" warning without followers
+            raise
+        finally:
+            with self._lock:
+                del self._async_flights[key]
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        with self._lock:
+            return {scope: dict(counts) for scope, counts in self._stats.items()}
+
+_singleflight = SingleFlight()
+
+# Per thread / asyncio task, so stages running side by side don't count against each other
+_dedup_scope: contextvars.ContextVar = contextvars.ContextVar("dedup_scope", default="Other")
+
+def request_key(provider: str, request: Dict) -> str:
+    """Stable key for a request: provider + hash of its JSON-serialised params"""
+    payload = json.dumps(request, sort_keys=True, default=str)
+    return f"{provider}:{hashlib.sha256(payload.encode()).hexdigest()}"
+
+def coalesce(provider: str, request: Dict, fn: Callable):
+    """Run fn() once for all concurrent callers sending an identical request"""
+    return _singleflight.do(request_key(provider, request), fn)
+
+async def async_coalesce(provider: str, request: Dict, coro_fn: Callable):
+    """coalesce() for coroutines on one event loop"""
+    return await _singleflight.do_async(request_key(provider, request), coro_fn)
+
+def set_dedup_scope(scope: str):
+    """Attribute this thread's / task's subsequent calls to `scope` (a stage name) in dedup_stats()"""
+    _dedup_scope.set(scope)
+
+def carry_scope(fn: Callable) -> Callable:
+    """fn, run with the caller's dedup scope - pool threads don't inherit it (pool.map(carry_scope(run_one), ...))"""
+    context = contextvars.copy_context()
+    return lambda *args, **kwargs: context.copy().run(fn, *args, **kwargs)
+
+def dedup_stats() -> Dict[str, Dict[str, int]]:
+    """{scope: {"calls": n, "coalesced": m}} for this process"""
+    return _singleflight.stats()
+
+def dedup_summary_lines() -> List[str]:
+    """Run summary lines: provider calls made vs identical in-flight requests shared"""
+    lines = []
+    for scope, counts in dedup_stats().items():
+        total = counts["calls"] + counts["coalesced"]
+        pct = counts["coalesced"] / total * 100 if total else 0
+        lines.append(f"{scope}: {counts['calls']} calls, {counts['coalesced']} coalesced ({pct:.0f}%)")
+    return lines
+
+# ═══════════════════════════════════════════════════════════
+# SPEND TRACKING
+# ═══════════════════════════════════════════════════════════
+
+_spend: Dict[str, float] = {}
+_spend_lock = threading.Lock()
+_cost_scope = threading.local()
+
+def _usage_tokens(usage) -> tuple:
+    """(input, output) from an SDK usage object or a raw JSON usage dict"""
+    if usage is None:
+        return 0, 0
+    get = usage.get if isinstance(usage, dict) else lambda name: getattr(usage, name, None)
+    input_tokens = get("prompt_tokens") or get("input_tokens") or 0
+    output_tokens = get("completion_tokens") or get("output_tokens") or 0
+    return input_tokens, output_tokens
+
+def usage_cost(provider: str, model: Optional[str], usage=None) -> float:
+    """USD for one request: token usage at MODEL_PRICING + any per-request fee"""
+    input_price, output_price = MODEL_PRICING.get(model) or PROVIDER_DEFAULT_PRICING.get(provider, (0.0, 0.0))
+    input_tokens, output_tokens = _usage_tokens(usage)
+    return (input_tokens * input_price + output_tokens * output_price) / 1_000_000 + REQUEST_FEES_USD.get(provider, 0.0)
+
+def set_cost_scope(scope: Optional[str]):
+    """Attribute this thread's spend to `scope` (None = follow the dedup scope)"""
+    _cost_scope.name = scope
+
+def record_usage(provider: str, model: Optional[str], usage=None) -> float:
+    """Add one request's cost to the current scope's spend; call once per real request (not per coalesced caller)"""
+    cost = usage_cost(provider, model, usage)
+    scope = getattr(_cost_scope, "name", None) or _dedup_scope.get()
+    with _spend_lock:
+        _spend[scope] = _spend.get(scope, 0.0) + cost
+    return cost
+
+def spend_stats() -> Dict[str, float]:
+    """{scope: USD} for this process"""
+    with _spend_lock:
+        return dict(_spend)
+
+def total_spend() -> float:
+    with _spend_lock:
+        return sum(_spend.values())
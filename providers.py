@@ -0,0 +1,143 @@
+"""
+Lazy provider registry: API clients are built on first use, not at import
+
+    from providers import lazy_client, lazy_module
+    openai_client = lazy_client("openai")        # nothing imported or authenticated yet
+    openai_client.chat.completions.create(...)   # OpenAI() is built here, once per process
+    requests = lazy_module("requests")           # imported on the first requests.get
+
+A LazyClient is truthy when its provider is configured (its key is set), so
+the scripts' `if not perplexity_client:` checks keep working without building
+the client. Factories import their SDK (openai, anthropic, gspread +
+google-auth) inside the factory, so importing a script costs nothing until it
+calls a provider - `--help`, the dashboard and the benchmarks run without
+live credentials. benchmarks/bench_startup.py holds the import-time budget.
+
+    register("my_provider", factory, configured=lambda: bool(os.getenv("MY_KEY")))
+"""
+
+import os
+import sys
+import threading
+import importlib
+from typing import Callable, Dict, Optional
+
+GOOGLE_CREDENTIALS_FILE = "google-credentials.json"
+SHEETS_SCOPES = [
+    'https://www.googleapis.com/auth/spreadsheets',
+    'https://www.googleapis.com/auth/drive'
+]
+PERPLEXITY_BASE_URL = "https://api.perplexity.ai"
+
+_lock = threading.RLock()
+_factories: Dict[str, Callable[[], object]] = {}
+_configured: Dict[str, Callable[[], bool]] = {}
+_instances: Dict[str, object] = {}
+
+# ═══════════════════════════════════════════════════════════
+# REGISTRY
+# ═══════════════════════════════════════════════════════════
+
+def register(name: str, factory: Callable[[], object], configured: Optional[Callable[[], bool]] = None):
+    """Add (or replace) a provider; an already-built instance is dropped"""
+    with _lock:
+        _factories[name] = factory
+        _configured[name] = configured or (lambda: True)
+        _instances.pop(name, None)
+
+def get(name: str):
+    """The process-wide client for `name`, built by its factory on first call"""
+    with _lock:
+        if name not in _instances:
+            if name not in _factories:
+                raise KeyError(f"Unknown provider '{name}' (registered: {', '.join(sorted(_factories))})")
+            _instances[name] = _factories[name]()
+        return _instances[name]
+
+def is_configured(name: str) -> bool:
+    """Whether the provider has what it needs (API key / credentials file) - never builds it"""
+    return name in _factories and bool(_configured[name]())
+
+def built(name: str) -> bool:
+    return name in _instances
+
+def reset(name: Optional[str] = None):
+    """Forget built clients (one, or all) so the next use rebuilds them"""
+    with _lock:
+        if name is None:
+            _instances.clear()
+        else:
+            _instances.pop(name, None)
+
+class LazyClient:
+    """Stands in for a provider's client until an attribute is first used"""
+
+    def __init__(self, name: str):
+        object.__setattr__(self, "_name", name)
+
+    def __getattr__(self, attr: str):
+        return getattr(get(self._name), attr)
+
+    def __bool__(self) -> bool:
+        return is_configured(self._name)
+
+    def __repr__(self) -> str:
+        state = "built" if built(self._name) else "not built"
+        return f"<LazyClient {self._name} ({state})>"
+
+def lazy_client(name: str) -> LazyClient:
+    return LazyClient(name)
+
+class LazyModule:
+    """A module imported on first attribute access (`requests = lazy_module("requests")`)"""
+
+    def __init__(self, name: str):
+        object.__setattr__(self, "_name", name)
+        object.__setattr__(self, "_module", None)
+
+    def __getattr__(self, attr: str):
+        if self._module is None:
+            object.__setattr__(self, "_module", importlib.import_module(self._name))
+        return getattr(self._module, attr)
+
+    def __repr__(self) -> str:
+        state = "imported" if self._module is not None else "not imported"
+        return f"<LazyModule {self._name} ({state})>"
+
+def lazy_module(name: str) -> LazyModule:
+    return LazyModule(name)
+
+# ═══════════════════════════════════════════════════════════
+# BUILT-IN PROVIDERS
+# ═══════════════════════════════════════════════════════════
+
+def _env_set(key: str) -> Callable[[], bool]:
+    return lambda: bool(os.getenv(key))
+
+def _openai():
+    api_key = os.getenv("OPENAI_API_KEY")
+    if not api_key:
+        print("❌ Missing OPENAI_API_KEY in .env")
+        sys.exit(1)
+    from openai import OpenAI
+    return OpenAI(api_key=api_key)
+
+def _anthropic():
+    from anthropic import Anthropic
+    return Anthropic(api_key=os.getenv("ANTHROPIC_API_KEY"))
+
+def _perplexity():
+    # Perplexity speaks the OpenAI chat API
+    from openai import OpenAI
+    return OpenAI(api_key=os.getenv("PERPLEXITY_API_KEY"), base_url=PERPLEXITY_BASE_URL)
+
+def _google_sheet():
+    import gspread
+    from google.oauth2.service_account import Credentials
+    creds = Credentials.from_service_account_file(GOOGLE_CREDENTIALS_FILE, scopes=SHEETS_SCOPES)
+    return gspread.authorize(creds).open(os.getenv("GOOGLE_SHEET_NAME", "Pain Point Research"))
+
+register("openai", _openai, _env_set("OPENAI_API_KEY"))
+register("anthropic", _anthropic, _env_set("ANTHROPIC_API_KEY"))
+register("perplexity", _perplexity, _env_set("PERPLEXITY_API_KEY"))
+register("google_sheet", _google_sheet, lambda: os.path.exists(GOOGLE_CREDENTIALS_FILE))
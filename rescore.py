@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+RESCORE - re-apply Stage 2 pass thresholds to the whole history offline
+
+Reads the normalized signals in stage2_signals.jsonl (synced from
+ideas_bank.json first), re-applies a threshold configuration to every idea at
+once with pandas/NumPy, and shows which verdicts would flip. No API calls.
+
+    python rescore.py                                         # current thresholds (sanity check)
+    python rescore.py --min-total 22 --min-signals 5          # v6.0 what-if
+    python rescore.py --version v5.0 --min-total 10
+    python rescore.py --config stage2_thresholds.json         # {"min_total": 22, "weights": {"frequency": 2}}
+    python rescore.py --min-total 22 --apply --workers 4      # run KILL → PASS flips through Stages 3-6
+
+--apply only pushes ideas that were killed at Stage 2 and now pass; they
+continue through the v6.0 Stages 3-6 (the v5.0 stages, shared) and get
+FINALIST reports like a normal run. PASS → KILL flips are reported only.
+"""
+
+import sys
+import json
+import argparse
+from datetime import datetime
+from typing import Dict, List
+
+import numpy as np
+import pandas as pd
+
+from ideas_journal import load_bank as read_bank
+from signals_store import (
+    STAGE2_THRESHOLDS, SIGNALS, SIGNALS_STORE_FILE, load_signal_rows, sync_signals
+)
+
+IDEAS_BANK_FILE = "ideas_bank.json"
+
+# Statuses that mean "killed by Stage 2" (v6.0 / v5.0)
+STAGE2_KILLED = {"killed_stage2", "killed_stage_2:_evidence"}
+
+# Stage 3 is index 2 in the v6.0 funnel
+STAGE3_INDEX = 2
+
+# ═══════════════════════════════════════════════════════════
+# BULK RESCORE
+# ═══════════════════════════════════════════════════════════
+
+def signals_frame(version: str) -> pd.DataFrame:
+    """Store rows for one pipeline version (raw payloads dropped)"""
+    rows = [{k: v for k, v in row.items() if k != "raw"} for row in load_signal_rows() if row["version"] == version]
+    return pd.DataFrame(rows, columns=["hash", "version", "idea_id", "signal", "score", "max_score",
+                                       "counted", "metric", "verdict", "status"])
+
+def rescore(df: pd.DataFrame, version: str, thresholds: Dict) -> pd.DataFrame:
+    """One row per idea: total, triggered, tam, recorded verdict and the verdict under `thresholds`"""
+    if df.empty:
+        return pd.DataFrame(columns=["idea_id", "verdict", "status", "total", "triggered", "tam", "new_verdict"])
+
+    counted = [name for name, (_, _, is_counted) in SIGNALS[version].items() if is_counted]
+    scores = (df.pivot_table(index="hash", columns="signal", values="score", aggfunc="last")
+                .reindex(columns=list(SIGNALS[version]), fill_value=0).fillna(0))
+    weights = np.array([thresholds.get("weights", {}).get(name, 1) for name in counted], dtype=float)
+
+    counted_scores = scores[counted].to_numpy(dtype=float)
+    total = counted_scores @ weights
+    triggered = (counted_scores >= thresholds["trigger_score"]).sum(axis=1)
+    market_score = scores["market_size"].to_numpy(dtype=float)
+    tam = (df[df["signal"] == "market_size"].groupby("hash")["metric"].last()
+             .reindex(scores.index).fillna(0).to_numpy(dtype=float))
+
+    passed = ((total >= thresholds["min_total"]) & (triggered >= thresholds["min_signals"])
+              & (tam >= thresholds["min_tam"]) & (market_score >= thresholds["min_market_score"]))
+
+    result = df.groupby("hash")[["idea_id", "verdict", "status"]].last().reindex(scores.index)
+    result["total"] = total
+    result["triggered"] = triggered
+    result["tam"] = tam
+    result["new_verdict"] = np.where(passed, "PASS", "KILL")
+    return result
+
+def report(result: pd.DataFrame, version: str, thresholds: Dict, bank_by_hash: Dict[str, Dict]):
+    flips = result[result["verdict"] != result["new_verdict"]]
+    to_pass = flips[flips["new_verdict"] == "PASS"]
+    to_kill = flips[flips["new_verdict"] == "KILL"]
+
+    print("="*80)
+    print(f"🧮 STAGE 2 RESCORE - {version}")
+    print("="*80)
+    print(f"Thresholds: {json.dumps(thresholds)}")
+    print(f"Ideas with stored signals: {len(result)}")
+    print(f"PASS recorded: {(result['verdict'] == 'PASS').sum()} → under these thresholds: "
+          f"{(result['new_verdict'] == 'PASS').sum()}")
+    print(f"Flips: {len(to_pass)} KILL → PASS | {len(to_kill)} PASS → KILL")
+
+    for label, frame in (("KILL → PASS", to_pass), ("PASS → KILL", to_kill)):
+        if frame.empty:
+            continue
+        print(f"\n{label}:")
+        for key, row in frame.sort_values("total", ascending=False).iterrows():
+            idea = bank_by_hash.get(key, {})
+            print(f"   #{row['idea_id']:<5} score {row['total']:>5.1f} | {int(row['triggered'])} signals | "
+                  f"TAM ${row['tam']:,.0f} | {idea.get('business', '?')[:40]} ({row['status']})")
+
+# ═══════════════════════════════════════════════════════════
+# APPLY
+# ═══════════════════════════════════════════════════════════
+
+def push_downstream(ideas: List[Dict], ideas_bank: List[Dict], thresholds: Dict, batch_size: int, workers: int):
+    """Run newly passing Stage 2 kills through the v6.0 Stages 3-6 + Stage 7"""
+    from pipeline_versions import load_pipeline
+
+    pipeline = load_pipeline("v6.0")
+    for idea in ideas:
+        idea["stage2_rescore"] = {
+            "previous": "KILL",
+            "previous_status": idea.get("status"),
+            "previous_kill_reason": idea.pop("kill_reason", None),
+            "thresholds": thresholds,
+            "rescored_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        }
+        idea["status"] = "rescored_stage2"
+    pipeline.save_ideas_bank(ideas_bank)
+
+    finalists = pipeline.run_funnel(ideas_bank, {STAGE3_INDEX: ideas}, pipeline.load_founder_profile(),
+                                    batch_size, workers)
+    written = pipeline.write_finalist_reports(finalists, ideas_bank) if finalists else []
+    pipeline.save_ideas_bank(ideas_bank)
+    sync_signals(ideas_bank)
+    print(f"\n🏆 {len(written)} new finalist(s) from {len(ideas)} rescored idea(s)")
+
+# ═══════════════════════════════════════════════════════════
+# MAIN
+# ═══════════════════════════════════════════════════════════
+
+def load_bank() -> List[Dict]:
+    return read_bank(IDEAS_BANK_FILE)
+
+def main():
+    parser = argparse.ArgumentParser(description="Re-apply Stage 2 thresholds to stored signals")
+    parser.add_argument("--version", choices=sorted(STAGE2_THRESHOLDS), default="v6.0")
+    parser.add_argument("--config", type=str, help="JSON file with threshold overrides")
+    parser.add_argument("--min-total", type=float)
+    parser.add_argument("--min-signals", type=int)
+    parser.add_argument("--trigger-score", type=float, help="A signal counts as triggered at this score")
+    parser.add_argument("--min-tam", type=float, help="USD")
+    parser.add_argument("--min-market-score", type=float)
+    parser.add_argument("--rebuild", action="store_true", help=f"Rewrite {SIGNALS_STORE_FILE} from the bank first")
+    parser.add_argument("--apply", action="store_true", help="Run KILL → PASS flips through Stages 3-6")
+    parser.add_argument("--batch-size", type=int, default=0, help="--apply: batch Stages 3 and 6")
+    parser.add_argument("--workers", type=int, default=1, help="--apply: ideas per stage in parallel")
+    args = parser.parse_args()
+
+    thresholds = dict(STAGE2_THRESHOLDS[args.version])
+    if args.config:
+        with open(args.config, 'r') as f:
+            thresholds.update(json.load(f))
+    for name in ("min_total", "min_signals", "trigger_score", "min_tam", "min_market_score"):
+        value = getattr(args, name)
+        if value is not None:
+            thresholds[name] = value
+
+    ideas_bank = load_bank()
+    sync_signals(ideas_bank, rebuild=args.rebuild)
+    bank_by_hash = {idea["hash"]: idea for idea in ideas_bank if idea.get("hash")}
+
+    result = rescore(signals_frame(args.version), args.version, thresholds)
+    if result.empty:
+        print(f"❌ No {args.version} Stage 2 signals stored yet")
+        sys.exit(1)
+    report(result, args.version, thresholds, bank_by_hash)
+
+    if args.apply:
+        flipped = result[(result["verdict"] == "KILL") & (result["new_verdict"] == "PASS")].index
+        ideas = [bank_by_hash[key] for key in flipped
+                 if key in bank_by_hash and bank_by_hash[key].get("status") in STAGE2_KILLED]
+        if not ideas:
+            print("\n✅ Nothing to push downstream")
+            return
+        print(f"\n⏩ Pushing {len(ideas)} idea(s) into Stage 3")
+        push_downstream(ideas, ideas_bank, thresholds, args.batch_size, args.workers)
+
+if __name__ == "__main__":
+    main()
@@ -5,33 +5,19 @@ Implements the full "Researcher" role from your startup framework
 Outputs COMPLETE research reports ready for "The Strategist" (Stage 2)
 """
 
-import os
-import sys
 import time
-import gspread
 from datetime import datetime
-from google.oauth2.service_account import Credentials
 from dotenv import load_dotenv
-from openai import OpenAI
 
-load_dotenv()
-
-OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
-GOOGLE_SHEET_NAME = os.getenv("GOOGLE_SHEET_NAME", "Pain Point Research")
+from providers import lazy_client
+from sheets_mirror import WorksheetMirror
+from sheets_writer import buffered
 
-if not OPENAI_API_KEY:
-    print("❌ No OPENAI_API_KEY in .env")
-    sys.exit(1)
+load_dotenv()
 
-client = OpenAI(api_key=OPENAI_API_KEY)
+client = lazy_client("openai")  # built on first call (providers.py); exits there without OPENAI_API_KEY
 
-SCOPES = [
-    'https://www.googleapis.com/auth/spreadsheets',
-    'https://www.googleapis.com/auth/drive'
-]
-creds = Credentials.from_service_account_file('google-credentials.json', scopes=SCOPES)
-gc = gspread.authorize(creds)
-sheet = gc.open(GOOGLE_SHEET_NAME)
+sheet = lazy_client("google_sheet")  # service-account login + open on first use
 
 RATE_LIMIT_DELAY = 1.0
 
@@ -591,13 +577,15 @@ def main():
     print("💀 Expected kill rate: 95%+ (only the best pass)", flush=True)
     print("="*70, flush=True)
 
-    queue = sheet.worksheet("Ideas Queue")
-    verified = sheet.worksheet("Verified Pains")
-    winners = sheet.worksheet("Winners")
+    # Only rows appended since the last run are read; status updates and
+    # result rows are batched (flushed on size/time/exit)
+    mirror = WorksheetMirror(sheet.worksheet("Ideas Queue"))
+    mirror.sync()
+    queue = buffered(mirror.worksheet, on_flush=mirror.save)
+    verified = buffered(sheet.worksheet("Verified Pains"))
+    winners = buffered(sheet.worksheet("Winners"))
 
-    all_rows = queue.get_all_values()
-
-    if len(all_rows) <= 1:
+    if mirror.cursor <= 1:
         print("\n❌ No ideas in queue. Run: python generate_ideas_v4.py", flush=True)
         return
 
@@ -605,13 +593,8 @@ def main():
     killed = 0
     winners_count = 0
 
-    for i, row in enumerate(all_rows[1:], start=2):
-        if len(row) < 4:
-            continue
-
-        status = row[3] if len(row) > 3 else ""
-        if status != "Pending":
-            continue
+    for i in mirror.rows_with_status("Pending"):
+        row = mirror.row(i)
 
         row_num = row[0]
         niche = row[1]
@@ -623,6 +606,7 @@ def main():
 
         # Update Ideas Queue
         queue.update_cell(i, 4, result_status)
+        mirror.set_cell(i, 4, result_status)
 
         if "KILLED" in result_status:
             killed += 1
@@ -661,6 +645,10 @@ def main():
         print(f"\n📊 Progress: {processed} processed | {killed} killed | {winners_count} winners", flush=True)
         print(f"   Kill rate: {(killed/processed*100):.1f}%", flush=True)
 
+    for worksheet in (queue, verified, winners):
+        worksheet.flush()
+    mirror.save()
+
     print(f"\n{'='*70}", flush=True)
     print(f"✅ Research complete!", flush=True)
     print(f"   Processed: {processed}", flush=True)
@@ -0,0 +1,109 @@
+"""
+Deferred retry queue
+Ideas whose stage failed on an API error (after retries) are parked here with
+their completed-stage state intact, instead of being recorded as kills.
+
+Queue file format (deferred_ideas.json):
+{
+  "deferred": [
+    {"hash": "...", "version": "v6.0", "stage": "Stage 2: Evidence", "error": "...",
+     "error_type": "TransientAPIError", "provider": "perplexity", "attempts": 1,
+     "deferred_at": "2025-10-08 14:02:11", "run_id": "...", "idea": {...}}
+  ]
+}
+
+One entry per (hash, version). Deferring an idea again bumps `attempts`;
+resolve_deferred() removes the entry once the idea reached a verdict, and
+retire_exhausted() removes it after MAX_DEFER_ATTEMPTS (the pipeline then
+marks the idea failed_<stage>).
+Pipelines and the daemon can share the file: updates hold a flock on
+deferred_ideas.json.lock and replace the file in one rename.
+"""
+
+import os
+import json
+import copy
+import hashlib
+import threading
+from datetime import datetime
+from typing import Dict, List
+
+from ideas_journal import file_lock
+
+DEFERRED_QUEUE_FILE = "deferred_ideas.json"
+
+# Give up resuming an idea after this many deferrals
+MAX_DEFER_ATTEMPTS = 5
+
+_lock = threading.Lock()
+
+def idea_key(idea: Dict) -> str:
+    """Bank hash; older versions (v2.0) don't store one, so derive it the same way"""
+    if idea.get("hash"):
+        return idea["hash"]
+    combined = f"{idea.get('business', '').lower().strip()}||{idea.get('pain', '').lower().strip()}"
+    return hashlib.md5(combined.encode()).hexdigest()[:12]
+
+def load_deferred() -> List[Dict]:
+    """Load all deferred entries"""
+    if os.path.exists(DEFERRED_QUEUE_FILE):
+        with open(DEFERRED_QUEUE_FILE, 'r') as f:
+            return json.load(f).get("deferred", [])
+    return []
+
+def save_deferred(entries: List[Dict]):
+    """Save deferred entries (temp file + rename: a crash mid-write leaves the old queue)"""
+    tmp_path = f"{DEFERRED_QUEUE_FILE}.{os.getpid()}.tmp"
+    with open(tmp_path, 'w') as f:
+        json.dump({"deferred": entries}, f, indent=2)
+    os.replace(tmp_path, DEFERRED_QUEUE_FILE)
+
+def defer_idea(idea: Dict, stage_name: str, error: Exception, version: str) -> Dict:
+    """Park an idea at `stage_name`; returns the queue entry"""
+    with _lock, file_lock(DEFERRED_QUEUE_FILE):
+        key = idea_key(idea)
+        entries = load_deferred()
+        entry = next((e for e in entries if e["hash"] == key and e["version"] == version), None)
+        if entry is None:
+            entry = {"hash": key, "version": version, "attempts": 0}
+            entries.append(entry)
+
+        entry.update({
+            "stage": stage_name,
+            "error": str(error)[:500],
+            "error_type": type(error).__name__,
+            "provider": getattr(error, "provider", None),
+            "attempts": entry["attempts"] + 1,
+            "deferred_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "run_id": idea.get("run_id"),
+            "idea": copy.deepcopy(idea),
+        })
+        save_deferred(entries)
+        return entry
+
+def pending_deferred(version: str, max_attempts: int = MAX_DEFER_ATTEMPTS) -> List[Dict]:
+    """Entries for a pipeline version that are still worth resuming"""
+    return [e for e in load_deferred() if e["version"] == version and e["attempts"] < max_attempts]
+
+def retire_exhausted(version: str, max_attempts: int = MAX_DEFER_ATTEMPTS) -> List[Dict]:
+    """Drop entries deferred `max_attempts` times from the queue; returns them so the pipeline can mark them failed"""
+    with _lock, file_lock(DEFERRED_QUEUE_FILE):
+        entries = load_deferred()
+        exhausted = [e for e in entries if e["version"] == version and e["attempts"] >= max_attempts]
+        if exhausted:
+            save_deferred([e for e in entries if not (e["version"] == version and e["attempts"] >= max_attempts)])
+    for entry in exhausted:
+        print(f"   ⛔ {entry['idea'].get('business', entry['hash'])[:50]} gave up at {entry['stage']} "
+              f"(deferred {entry['attempts']}x: {entry['error'][:60]})")
+    if exhausted:
+        print(f"   ⛔ {len(exhausted)} idea(s) reached {max_attempts} deferrals - dropped from {DEFERRED_QUEUE_FILE}")
+    return exhausted
+
+def resolve_deferred(idea_hashes: List[str], version: str):
+    """Drop entries for ideas that reached a verdict"""
+    hashes = set(idea_hashes)
+    with _lock, file_lock(DEFERRED_QUEUE_FILE):
+        entries = load_deferred()
+        remaining = [e for e in entries if not (e["version"] == version and e["hash"] in hashes)]
+        if len(remaining) != len(entries):
+            save_deferred(remaining)
@@ -1,33 +1,56 @@
 #!/usr/bin/env python3
 """
 Master Orchestrator - Complete 3-Stage Winner Pipeline
-Runs all stages automatically to find TRUE WINNERS
+Runs all stages in one process to find TRUE WINNERS
+
+Each idea flows Stage 1 → 2 → 3 on its own, `--workers` ideas at a time.
+Survivors are handed forward in memory, and the three stages share one
+OpenAI client, one Sheets login and one worksheet snapshot (sheets_client.py).
+No stage waits for the previous one to finish the whole sheet.
+
+    python run_winner_pipeline.py
+    python run_winner_pipeline.py --workers 4
 """
 
-import subprocess
-import sys
+import argparse
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict
 
-def run_command(cmd, description):
-    """Run a command and handle errors"""
-    print(f"\n{'='*70}")
-    print(f"🚀 {description}")
-    print(f"{'='*70}\n")
+from sheets_client import sheet_snapshot
+from stage1_growth_filter import growth_filter, pending_ideas, record_growth_result
+from stage2_budget_validator import budget_validator, growth_pass_ideas, record_budget_result
+from stage3_deep_research import deep_research, budget_pass_ideas, record_research_result
 
-    result = subprocess.run(
-        cmd,
-        shell=True,
-        capture_output=False,
-        text=True
-    )
+# Rows left waiting by an earlier run re-enter at their stage
+READY_FOR_STAGE2 = "Ready for Budget Filter"
+READY_FOR_STAGE3 = "Ready for Deep Research"
 
-    if result.returncode != 0:
-        print(f"\n❌ Error in {description}")
-        sys.exit(1)
+STAGES = [
+    ("STAGE 1: Growth Filter", growth_filter, record_growth_result),
+    ("STAGE 2: Budget Validator", budget_validator, record_budget_result),
+    ("STAGE 3: Deep Research", deep_research, record_research_result),
+]
 
-    print(f"\n✅ {description} - Complete!")
-    return True
+def run_idea(snapshot, idea: Dict, first_stage: int, counts: Dict, lock: threading.Lock):
+    """One idea through the remaining stages; stops at the first kill"""
+    for index in range(first_stage, len(STAGES)):
+        stage_name, evaluate, record = STAGES[index]
+        result_status, analysis = evaluate(idea["row_num"], idea["niche"], idea["pain"])
+        passed = record(snapshot, idea, result_status, analysis)
+        with lock:
+            counts[stage_name]["processed"] += 1
+            counts[stage_name]["passed" if passed else "killed"] += 1
+        print(f"\n{'✅' if passed else '💀'} #{idea['row_num']} {idea['niche']} - {stage_name}: {result_status}", flush=True)
+        if not passed:
+            return
+    print(f"   📄 Report saved: {idea['report_file']}", flush=True)
 
 def main():
+    parser = argparse.ArgumentParser(description="3-stage Sheets winner pipeline (in one process)")
+    parser.add_argument("--workers", type=int, default=1, help="Ideas flowing through the stages concurrently")
+    args = parser.parse_args()
+
     print("""
 ╔══════════════════════════════════════════════════════════════════╗
 ║                                                                  ║
@@ -44,28 +67,36 @@ def main():
 ╚══════════════════════════════════════════════════════════════════╝
     """)
 
-    # Stage 1: Growth Filter
-    run_command(
-        "python stage1_growth_filter.py",
-        "STAGE 1: Growth Filter (High-growth industries + API feasibility)"
-    )
+    snapshot = sheet_snapshot()
+    entries = [(idea, 0) for idea in pending_ideas(snapshot)]
+    entries += [(idea, 1) for idea in growth_pass_ideas(snapshot, READY_FOR_STAGE2)]
+    entries += [(idea, 2) for idea in budget_pass_ideas(snapshot, READY_FOR_STAGE3)]
 
-    # Stage 2: Budget Validator
-    run_command(
-        "python stage2_budget_validator.py",
-        "STAGE 2: Budget Validator (Proven spending + Decision makers)"
-    )
+    if not entries:
+        print("\n❌ No ideas waiting. Run: python generate_ideas_v4.py", flush=True)
+        return
 
-    # Stage 3: Deep Research
-    run_command(
-        "python stage3_deep_research.py",
-        "STAGE 3: Deep Research (Complete analysis + Final winners)"
-    )
+    resumed = sum(1 for _, first_stage in entries if first_stage > 0)
+    print(f"🚀 {len(entries)} ideas ({resumed} resuming at Stage 2/3) | {args.workers} worker(s)\n", flush=True)
 
+    counts = {name: {"processed": 0, "passed": 0, "killed": 0} for name, _, _ in STAGES}
+    lock = threading.Lock()
+    with ThreadPoolExecutor(max_workers=max(1, args.workers)) as pool:
+        futures = [pool.submit(run_idea, snapshot, idea, first_stage, counts, lock) for idea, first_stage in entries]
+        for future in futures:
+            future.result()
+    snapshot.flush()
+
+    winners = counts[STAGES[-1][0]]["passed"]
     print(f"""
 {'='*70}
 🎉 PIPELINE COMPLETE! 🎉
 {'='*70}
+""")
+    for name, stage_counts in counts.items():
+        print(f"   {name}: {stage_counts['processed']} processed | {stage_counts['passed']} passed | {stage_counts['killed']} killed")
+    print(f"""
+🏆 TRUE WINNERS: {winners}
 
 📊 Check Results:
    - Google Sheet tabs for stage-by-stage filtering
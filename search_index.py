@@ -0,0 +1,302 @@
+#!/usr/bin/env python3
+"""
+Full-text search over past research: "have we looked at this before, and why did it die?"
+
+One SQLite FTS5 index (search_index.db) over:
+    - every idea in the bank: business + pain, kill reason, and the rest of its
+      text (stage analyses, stage results, evidence)
+    - research_report_*.txt and WINNER_*.txt
+
+Updates are incremental. Ideas are fingerprinted on their raw rows, where big
+fields are still blob references (blob_store.py), so an unchanged idea costs
+no blob reads. Only new or changed ideas are re-indexed. Report files are
+re-read when their mtime or size changes. If the bank version (ideas_journal
+.bank_version) hasn't moved since the last update, the bank isn't read at all.
+
+    python search_index.py update
+    python search_index.py query "paper intake forms"
+    python search_index.py query "dispatch NEAR/5 spreadsheet" --kind idea --status killed
+    python search_index.py rebuild
+
+Queries use FTS5 syntax (AND/OR/NOT, "phrases", prefix*, NEAR). Text that
+isn't valid syntax is searched word by word. Results are ranked by bm25, with
+a match in the title (business + pain) or the kill reason weighted above one
+in the body. The dashboard's 🔎 Search tab runs the same query.
+"""
+
+import os
+import glob
+import json
+import time
+import hashlib
+import sqlite3
+import argparse
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from blob_store import BlobStore, LazyIdea, blobs_dir
+from ideas_journal import IDEAS_BANK_FILE, bank_version, materialize
+
+SEARCH_INDEX_DB = os.getenv("SEARCH_INDEX_DB", "search_index.db")
+REPORT_GLOBS = ["research_report_*.txt", "WINNER_*.txt"]
+
+# bm25 column weights: title, kill_reason, body
+RANK_WEIGHTS = (5.0, 3.0, 1.0)
+SNIPPET_TOKENS = 24
+
+# Not searchable text: identity, dates, bookkeeping
+SKIP_FIELDS = {"id", "hash", "status", "generated_date", "run_id", "business", "pain", "kill_reason"}
+
+SQLITE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS docs (
+    id INTEGER PRIMARY KEY,
+    doc_key TEXT NOT NULL UNIQUE,
+    kind TEXT NOT NULL,
+    fingerprint TEXT NOT NULL,
+    business TEXT,
+    status TEXT,
+    source TEXT
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS docs_fts USING fts5(
+    title, kill_reason, body, tokenize = 'porter unicode61'
+);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+# ═══════════════════════════════════════════════════════════
+# DOCUMENTS
+# ═══════════════════════════════════════════════════════════
+
+def text_of(value) -> Iterator[str]:
+    """Every string inside a field value (stage results are nested dicts/lists)"""
+    if isinstance(value, str):
+        if value.strip():
+            yield value
+    elif isinstance(value, dict):
+        for item in value.values():
+            yield from text_of(item)
+    elif isinstance(value, list):
+        for item in value:
+            yield from text_of(item)
+
+def idea_fingerprint(raw: Dict) -> str:
+    # raw row: blob references, not bodies - the digest changes whenever a body does
+    return hashlib.sha1(json.dumps(raw, sort_keys=True, default=str).encode()).hexdigest()
+
+def idea_doc(idea: Dict) -> Dict:
+    body = []
+    for field, value in idea.items():
+        if field not in SKIP_FIELDS:
+            body.extend(text_of(value))
+    kill_reason = idea.get("kill_reason")
+    return {
+        "title": f"{idea.get('business', '')} - {idea.get('pain', '')}",
+        "kill_reason": "\n".join(text_of(kill_reason)),
+        "body": "\n".join(body),
+        "business": idea.get("business"),
+        "status": idea.get("status"),
+    }
+
+def file_fingerprint(path: str) -> str:
+    stat = os.stat(path)
+    return f"{stat.st_mtime_ns}:{stat.st_size}"
+
+def report_doc(path: str) -> Dict:
+    with open(path, 'r', errors='replace') as f:
+        text = f.read()
+    header = {}
+    for line in text.splitlines()[:10]:
+        label, _, value = line.partition(":")
+        if label in ("TARGET", "PROBLEM"):
+            header[label] = value.strip()
+    title = f"{header.get('TARGET', '')} - {header.get('PROBLEM', '')}" if header else os.path.basename(path)
+    return {
+        "title": title,
+        "kill_reason": "",
+        "body": text,
+        "business": header.get("TARGET"),
+        "status": "WINNER" if os.path.basename(path).startswith("WINNER_") else None,
+    }
+
+def report_paths(root: str = ".") -> List[str]:
+    paths = set()
+    for pattern in REPORT_GLOBS:
+        paths.update(glob.glob(os.path.join(root, pattern)))
+    return sorted(paths)
+
+# ═══════════════════════════════════════════════════════════
+# INDEX
+# ═══════════════════════════════════════════════════════════
+
+class SearchIndex:
+    """One SQLite file; docs holds what was indexed and its fingerprint, docs_fts the text"""
+
+    def __init__(self, path: str = SEARCH_INDEX_DB):
+        self.path = path
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(SQLITE_SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA busy_timeout=30000")
+        return conn
+
+    def _put(self, conn: sqlite3.Connection, doc_key: str, kind: str, fingerprint: str,
+             source: str, doc: Dict):
+        row = conn.execute("SELECT id FROM docs WHERE doc_key = ?", (doc_key,)).fetchone()
+        if row is not None:
+            conn.execute("DELETE FROM docs_fts WHERE rowid = ?", (row["id"],))
+            conn.execute("UPDATE docs SET kind = ?, fingerprint = ?, business = ?, status = ?, source = ? "
+                         "WHERE id = ?",
+                         (kind, fingerprint, doc["business"], doc["status"], source, row["id"]))
+            rowid = row["id"]
+        else:
+            rowid = conn.execute(
+                "INSERT INTO docs (doc_key, kind, fingerprint, business, status, source) VALUES (?, ?, ?, ?, ?, ?)",
+                (doc_key, kind, fingerprint, doc["business"], doc["status"], source)).lastrowid
+        conn.execute("INSERT INTO docs_fts (rowid, title, kill_reason, body) VALUES (?, ?, ?, ?)",
+                     (rowid, doc["title"], doc["kill_reason"], doc["body"]))
+
+    def _sync_kind(self, conn: sqlite3.Connection, kind_prefix: str,
+                   current: Dict[str, str], build) -> Tuple[int, int]:
+        """Re-index docs whose fingerprint changed, drop ones that are gone; returns (indexed, removed)"""
+        known = {row["doc_key"]: (row["id"], row["fingerprint"]) for row in conn.execute(
+            "SELECT id, doc_key, fingerprint FROM docs WHERE doc_key LIKE ?", (kind_prefix + "%",))}
+        indexed = 0
+        for doc_key, fingerprint in current.items():
+            if known.get(doc_key, (None, None))[1] != fingerprint:
+                kind, source, doc = build(doc_key)
+                self._put(conn, doc_key, kind, fingerprint, source, doc)
+                indexed += 1
+        removed = [rowid for doc_key, (rowid, _) in known.items() if doc_key not in current]
+        for rowid in removed:
+            conn.execute("DELETE FROM docs_fts WHERE rowid = ?", (rowid,))
+            conn.execute("DELETE FROM docs WHERE id = ?", (rowid,))
+        return indexed, len(removed)
+
+    def update(self, bank_path: str = IDEAS_BANK_FILE, reports_root: str = ".") -> Dict[str, int]:
+        """Bring the index up to date with the bank and report files"""
+        summary = {"ideas_indexed": 0, "ideas_removed": 0, "reports_indexed": 0, "reports_removed": 0}
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            version = json.dumps(bank_version(bank_path))
+            row = conn.execute("SELECT value FROM meta WHERE key = 'bank_version'").fetchone()
+            if row is None or row["value"] != version:
+                raw_ideas, _ = materialize(bank_path)
+                store = BlobStore(blobs_dir(bank_path))
+                current = {f"idea:{key}": idea_fingerprint(raw) for key, raw in raw_ideas.items()}
+
+                def build_idea(doc_key: str):
+                    key = doc_key[len("idea:"):]
+                    return "idea", key, idea_doc(LazyIdea(raw_ideas[key], store))
+
+                summary["ideas_indexed"], summary["ideas_removed"] = self._sync_kind(
+                    conn, "idea:", current, build_idea)
+                conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('bank_version', ?)", (version,))
+
+            paths = {f"file:{os.path.basename(path)}": path for path in report_paths(reports_root)}
+            current = {doc_key: file_fingerprint(path) for doc_key, path in paths.items()}
+
+            def build_report(doc_key: str):
+                path = paths[doc_key]
+                kind = "winner" if os.path.basename(path).startswith("WINNER_") else "report"
+                return kind, os.path.basename(path), report_doc(path)
+
+            summary["reports_indexed"], summary["reports_removed"] = self._sync_kind(
+                conn, "file:", current, build_report)
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        finally:
+            conn.close()
+        return summary
+
+    def rebuild(self, bank_path: str = IDEAS_BANK_FILE, reports_root: str = ".") -> Dict[str, int]:
+        with self._connect() as conn:
+            conn.execute("DELETE FROM docs_fts")
+            conn.execute("DELETE FROM docs")
+            conn.execute("DELETE FROM meta")
+        return self.update(bank_path, reports_root)
+
+    def search(self, query: str, limit: int = 20, kind: Optional[str] = None,
+               status: Optional[str] = None, marks: Tuple[str, str] = ("[", "]")) -> List[Dict]:
+        """Ranked matches with a snippet of the best-matching column"""
+        sql = ("SELECT docs.doc_key, docs.kind, docs.business, docs.status, docs.source, "
+               "docs_fts.title, bm25(docs_fts, ?, ?, ?) AS score, "
+               "snippet(docs_fts, -1, ?, ?, ' … ', ?) AS snippet "
+               "FROM docs_fts JOIN docs ON docs.id = docs_fts.rowid WHERE docs_fts MATCH ?")
+        params: List = [*RANK_WEIGHTS, marks[0], marks[1], SNIPPET_TOKENS]
+        filters, filter_params = "", []
+        if kind:
+            filters += " AND docs.kind = ?"
+            filter_params.append(kind)
+        if status:
+            filters += " AND docs.status LIKE ?"
+            filter_params.append(status + "%")
+        sql += filters + " ORDER BY score LIMIT ?"
+        with self._connect() as conn:
+            try:
+                rows = conn.execute(sql, params + [query] + filter_params + [limit]).fetchall()
+            except sqlite3.OperationalError:
+                # Not FTS5 syntax ("e-commerce", a stray quote): search the words instead
+                rows = conn.execute(sql, params + [plain_query(query)] + filter_params + [limit]).fetchall()
+        return [dict(row) for row in rows]
+
+    def stats(self) -> Dict[str, int]:
+        with self._connect() as conn:
+            return {row["kind"]: row["n"] for row in conn.execute(
+                "SELECT kind, count(*) AS n FROM docs GROUP BY kind ORDER BY kind")}
+
+def plain_query(text: str) -> str:
+    """Every word as a quoted term (implicit AND)"""
+    return " ".join('"' + word.replace('"', '""') + '"' for word in text.split()) or '""'
+
+# ═══════════════════════════════════════════════════════════
+# CLI
+# ═══════════════════════════════════════════════════════════
+
+def main():
+    parser = argparse.ArgumentParser(description="Full-text search over ideas, kill reasons and research reports")
+    parser.add_argument("--db", default=SEARCH_INDEX_DB)
+    parser.add_argument("--bank", default=IDEAS_BANK_FILE)
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    subparsers.add_parser("update", help="Index new/changed ideas and reports")
+    subparsers.add_parser("rebuild", help="Drop the index and build it again")
+    query_parser = subparsers.add_parser("query", help="Search (updates the index first)")
+    query_parser.add_argument("text")
+    query_parser.add_argument("--limit", type=int, default=10)
+    query_parser.add_argument("--kind", choices=["idea", "report", "winner"])
+    query_parser.add_argument("--status", help="Status prefix, e.g. killed or killed_stage2")
+    args = parser.parse_args()
+
+    index = SearchIndex(args.db)
+    if args.command in ("update", "rebuild"):
+        started = time.time()
+        summary = (index.rebuild if args.command == "rebuild" else index.update)(args.bank)
+        print(f"🔎 Search index {args.db} updated in {time.time() - started:.1f}s")
+        print(f"   ideas:   {summary['ideas_indexed']} indexed, {summary['ideas_removed']} removed")
+        print(f"   reports: {summary['reports_indexed']} indexed, {summary['reports_removed']} removed")
+        print("   " + ", ".join(f"{n} {kind}s" for kind, n in index.stats().items()))
+        return
+
+    index.update(args.bank)
+    results = index.search(args.text, args.limit, args.kind, args.status)
+    if not results:
+        print(f"🔎 No matches for: {args.text}")
+        return
+    print(f"🔎 {len(results)} matches for: {args.text}\n")
+    for n, result in enumerate(results, 1):
+        label = result["status"] or result["kind"]
+        print(f"{n:>2}. [{label}] {result['title'][:100]}")
+        print(f"    {result['source']}")
+        print(f"    {' '.join(result['snippet'].split())}\n")
+
+if __name__ == "__main__":
+    main()
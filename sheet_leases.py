@@ -0,0 +1,311 @@
+#!/usr/bin/env python3
+"""
+Row leases for running several Sheets workers against one queue
+
+Sheets has no compare-and-set, so a worker claims a row by writing
+"In Progress <worker-id> <expiry>" to its Status cell and reading it back
+after VERIFY_DELAY_SECONDS: if a competing worker wrote over it in the
+meantime, the read shows their lease and we back off. Workers on the same
+host also take the row in a local sqlite lock table (sheet_leases.db) first,
+so they never race on the sheet at all.
+
+While a row is processed a heartbeat thread pushes the expiry forward. A
+worker that crashes stops heartbeating; once its expiry passes, any worker
+may claim the row again. Expiry is wall-clock UTC, so hosts need roughly
+synced clocks (NTP).
+
+    leaser = SheetLeaser(worksheet, mirror)
+    for lease in leaser.claim_each("Pending"):
+        with leaser.hold(lease):
+            ...research...
+            with leaser.lock:
+                ...write the final status...
+
+    python sheet_leases.py          # leases in the local lock table
+"""
+
+import os
+import time
+import zlib
+import socket
+import sqlite3
+import argparse
+import threading
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from sheets_mirror import mirror_key, STATUS_COL
+from sheets_writer import column_letter, with_backoff
+
+LEASE_PREFIX = "In Progress"
+SHEETS_LEASE_SECONDS = int(os.getenv("SHEETS_LEASE_SECONDS", "600"))
+VERIFY_DELAY_SECONDS = 2.0
+SHEET_LEASES_DB = "sheet_leases.db"
+
+EXPIRY_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
+
+def default_worker_id() -> str:
+    return os.getenv("SHEETS_WORKER_ID") or f"{socket.gethostname()}-{os.getpid()}"
+
+# ═══════════════════════════════════════════════════════════
+# LEASE STATUS
+# ═══════════════════════════════════════════════════════════
+
+def lease_status(worker_id: str, expires: float) -> str:
+    """The Status cell text for a lease: "In Progress <worker-id> <expiry UTC>" """
+    stamp = datetime.fromtimestamp(expires, tz=timezone.utc).strftime(EXPIRY_FORMAT)
+    return f"{LEASE_PREFIX} {worker_id.replace(' ', '_')} {stamp}"
+
+def parse_lease(status: str) -> Optional[Tuple[str, float]]:
+    """(worker id, expiry epoch) for a lease status; None for anything else (incl. a bare "In Progress")"""
+    parts = (status or "").strip().split()
+    if len(parts) != 4 or " ".join(parts[:2]) != LEASE_PREFIX:
+        return None
+    try:
+        expires = datetime.strptime(parts[3], EXPIRY_FORMAT).replace(tzinfo=timezone.utc).timestamp()
+    except ValueError:
+        return None
+    return parts[2], expires
+
+def claimable(status: str, from_status: str, now: Optional[float] = None) -> bool:
+    """Still at `from_status`, or leased by a worker whose lease has run out"""
+    if (status or "").strip() == from_status:
+        return True
+    lease = parse_lease(status)
+    return lease is not None and lease[1] < (time.time() if now is None else now)
+
+# ═══════════════════════════════════════════════════════════
+# LOCAL LOCK TABLE
+# ═══════════════════════════════════════════════════════════
+
+SQLITE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS leases (
+    key TEXT PRIMARY KEY,
+    worker_id TEXT NOT NULL,
+    expires REAL NOT NULL
+);
+"""
+
+class LocalLockTable:
+    """Same-host stand-in for a lock service: one sqlite row per leased sheet row"""
+
+    def __init__(self, path: str = SHEET_LEASES_DB):
+        self.path = path
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(SQLITE_SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA busy_timeout=30000")
+        return conn
+
+    def acquire(self, key: str, worker_id: str, seconds: float) -> bool:
+        """Take `key` unless another worker holds an unexpired lock on it"""
+        now = time.time()
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            row = conn.execute("SELECT worker_id, expires FROM leases WHERE key = ?", (key,)).fetchone()
+            if row and row["worker_id"] != worker_id and row["expires"] >= now:
+                conn.execute("COMMIT")
+                return False
+            conn.execute("INSERT OR REPLACE INTO leases (key, worker_id, expires) VALUES (?, ?, ?)",
+                         (key, worker_id, now + seconds))
+            conn.execute("COMMIT")
+            return True
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        finally:
+            conn.close()
+
+    def release(self, key: str, worker_id: str):
+        with self._connect() as conn:
+            conn.execute("DELETE FROM leases WHERE key = ? AND worker_id = ?", (key, worker_id))
+
+    def held(self) -> List[Dict]:
+        with self._connect() as conn:
+            return [dict(row) for row in conn.execute("SELECT * FROM leases ORDER BY key")]
+
+# ═══════════════════════════════════════════════════════════
+# SHEET LEASER
+# ═══════════════════════════════════════════════════════════
+
+class SheetLeaser:
+    """
+    Claims Status cells on one worksheet. Reads and lease writes go straight
+    to the worksheet (never through a buffer); the optional mirror
+    (sheets_mirror.WorksheetMirror) supplies candidate rows and is kept in
+    step with every status we observe.
+    """
+
+    def __init__(self, worksheet, mirror=None, worker_id: Optional[str] = None,
+                 lease_seconds: float = SHEETS_LEASE_SECONDS, status_col: int = STATUS_COL,
+                 locks: Optional[LocalLockTable] = None, verify_delay: float = VERIFY_DELAY_SECONDS,
+                 lock: Optional[threading.RLock] = None, sleep=time.sleep):
+        self.worksheet = worksheet
+        self.mirror = mirror
+        self.worker_id = (worker_id or default_worker_id()).replace(" ", "_")
+        self.lease_seconds = lease_seconds
+        self.status_col = status_col
+        self.locks = locks if locks is not None else LocalLockTable()
+        self.verify_delay = verify_delay
+        self.lock = lock or threading.RLock()  # share the caller's (reentrant) lock if gspread is used from several threads
+        self.sleep = sleep
+        self.claimed = 0
+        self.lost = 0
+
+    def _key(self, row: int) -> str:
+        return f"{mirror_key(self.worksheet)}!{row}"
+
+    def _read(self, row: int) -> str:
+        with self.lock:
+            values = with_backoff(self.worksheet.batch_get, [f"{column_letter(self.status_col)}{row}"])
+        cells = values[0] if values else []
+        return str(cells[0][0]) if cells and cells[0] else ""
+
+    def _write(self, row: int, status: str):
+        with self.lock:
+            with_backoff(self.worksheet.update_cell, row, self.status_col, status)
+
+    def _local_status(self, row: int) -> Optional[str]:
+        """The row's status in the mirror (None without one)"""
+        if self.mirror is None:
+            return None
+        cells = self.mirror.row(row)
+        return cells[self.status_col - 1] if len(cells) >= self.status_col else ""
+
+    def _observed(self, row: int, status: str):
+        if self.mirror is not None:
+            self.mirror.observe(row, self.status_col, status)
+
+    def candidates(self, from_status: str) -> List[int]:
+        """Rows at `from_status` plus rows under expired leases, rotated so workers start apart"""
+        if self.mirror is None:
+            return []
+        rows = self.mirror.rows_with_status(from_status)
+        now = time.time()
+        for status in self.mirror.status_counts():
+            lease = parse_lease(status)
+            if lease and lease[1] < now:
+                rows += self.mirror.rows_with_status(status)
+        rows = sorted(set(rows))
+        if rows:
+            offset = zlib.crc32(self.worker_id.encode()) % len(rows)
+            rows = rows[offset:] + rows[:offset]
+        return rows
+
+    def claim(self, row: int, from_status: str) -> Optional[Dict]:
+        """Lease `row` if it is still claimable; None if another worker has it"""
+        key = self._key(row)
+        if not self.locks.acquire(key, self.worker_id, self.lease_seconds):
+            return None
+
+        current = self._read(row)
+        if not claimable(current, from_status):
+            self._observed(row, current)
+            self.locks.release(key, self.worker_id)
+            return None
+
+        expires = time.time() + self.lease_seconds
+        status = lease_status(self.worker_id, expires)
+        self._write(row, status)
+        self.sleep(self.verify_delay)
+        seen = self._read(row)
+        self._observed(row, seen)
+        if seen != status:
+            self.lost += 1
+            self.locks.release(key, self.worker_id)
+            return None
+
+        self.claimed += 1
+        return {"row": row, "key": key, "status": status, "expires": expires, "from_status": from_status}
+
+    def claim_each(self, from_status: str) -> Iterator[Dict]:
+        """Lease candidate rows one at a time (the next claim happens when the caller asks)"""
+        for row in self.candidates(from_status):
+            lease = self.claim(row, from_status)
+            if lease:
+                yield lease
+
+    def renew(self, lease: Dict) -> bool:
+        """Push the expiry forward; False if the row is no longer ours"""
+        # One lock section from check to write, so a final status written meanwhile is never leased over
+        with self.lock:
+            row = lease["row"]
+            local = self._local_status(row)
+            if local is not None and local != lease["status"]:
+                return False  # final status written locally, not pushed yet
+            if self._read(row) != lease["status"]:
+                return False
+            expires = time.time() + self.lease_seconds
+            status = lease_status(self.worker_id, expires)
+            self._write(row, status)
+            self._observed(row, status)
+            self.locks.acquire(lease["key"], self.worker_id, self.lease_seconds)
+            lease.update(status=status, expires=expires)
+            return True
+
+    def release(self, lease: Dict, give_back: bool = False):
+        """Drop the local lock; give_back also restores the row's original status for other workers"""
+        if give_back and self._read(lease["row"]) == lease["status"]:
+            self._write(lease["row"], lease["from_status"])
+            self._observed(lease["row"], lease["from_status"])
+        self.locks.release(lease["key"], self.worker_id)
+
+    def _keep_lease(self, lease: Dict, stop: threading.Event):
+        """Heartbeat thread: renew every third of the lease"""
+        while not stop.wait(self.lease_seconds / 3):
+            try:
+                if not self.renew(lease):
+                    print(f"   ⚠️  Lost lease on row {lease['row']} - another worker may redo it", flush=True)
+                    return
+            except Exception as e:
+                print(f"   ⚠️  Lease heartbeat failed for row {lease['row']}: {e}", flush=True)
+
+    @contextmanager
+    def hold(self, lease: Dict):
+        """
+        Heartbeat while the body runs; the row is given back if the body raises.
+        Write the final status under `self.lock` (the heartbeat renews under it too).
+        """
+        stop = threading.Event()
+        heartbeat = threading.Thread(target=self._keep_lease, args=(lease, stop), daemon=True)
+        heartbeat.start()
+        try:
+            yield lease
+        except BaseException:
+            stop.set()
+            heartbeat.join()
+            self.release(lease, give_back=True)
+            raise
+        stop.set()
+        heartbeat.join()
+        self.release(lease)
+
+# ═══════════════════════════════════════════════════════════
+# CLI
+# ═══════════════════════════════════════════════════════════
+
+def main():
+    parser = argparse.ArgumentParser(description="Sheets row leases held on this host")
+    parser.add_argument("--db", default=SHEET_LEASES_DB)
+    args = parser.parse_args()
+
+    if not os.path.exists(args.db):
+        print(f"No lock table at {args.db}")
+        return
+    now = time.time()
+    held = LocalLockTable(args.db).held()
+    if not held:
+        print("No rows leased")
+    for lease in held:
+        left = lease["expires"] - now
+        state = f"{left:.0f}s left" if left >= 0 else f"expired {-left:.0f}s ago"
+        print(f"🔒 {lease['key']} - {lease['worker_id']} ({state})")
+
+if __name__ == "__main__":
+    main()
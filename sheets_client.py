@@ -0,0 +1,130 @@
+"""
+Shared clients for the Sheets pipeline (stage1_growth_filter → stage2_budget_validator → stage3_deep_research)
+
+One OpenAI client, one authorized gspread client and one opened spreadsheet
+per process, created on first use by the provider registry (providers.py). SheetSnapshot is the pipeline's local
+store: every read and write is in memory, and sheets_sync.py pushes / pulls
+the differences to Sheets in bulk on a schedule, so Sheets is a view of the
+store rather than the database each status change waits on.
+"""
+
+import atexit
+import threading
+import weakref
+from typing import Dict, List, Optional, Tuple
+
+from dotenv import load_dotenv
+
+import providers
+from sheets_sync import SyncedWorksheet, SyncScheduler, SHEETS_STORE_FILE
+
+load_dotenv()
+
+_lock = threading.Lock()
+_snapshot = None
+_snapshots = weakref.WeakSet()  # every SheetSnapshot is synced at exit
+
+# ═══════════════════════════════════════════════════════════
+# CLIENTS
+# ═══════════════════════════════════════════════════════════
+
+def openai_client():
+    """The process-wide OpenAI client (exits like the stage scripts always did if no key)"""
+    return providers.get("openai")
+
+def google_sheet():
+    """The process-wide spreadsheet (one service-account auth + open per process)"""
+    return providers.get("google_sheet")
+
+def sheet_snapshot() -> "SheetSnapshot":
+    """The process-wide worksheet cache, shared by every stage run in this process"""
+    global _snapshot
+    sheet = google_sheet()
+    with _lock:
+        if _snapshot is None:
+            _snapshot = SheetSnapshot(sheet)
+        return _snapshot
+
+# ═══════════════════════════════════════════════════════════
+# WORKSHEET SNAPSHOT
+# ═══════════════════════════════════════════════════════════
+
+class SheetSnapshot:
+    """
+    The local store for the Sheets pipeline: one SyncedWorksheet per tab
+    (sheets_sync.py). Reads and writes hit local memory; a background thread
+    syncs every tab with Sheets in bulk every SHEETS_SYNC_SECONDS, and
+    flush() (also run at exit) syncs right away. Rows we append get their
+    sheet position at sync time, so update them by row id (update_status).
+    """
+
+    def __init__(self, sheet):
+        self.sheet = sheet
+        self.lock = threading.RLock()
+        self._worksheets: Dict[str, object] = {}
+        self._mirrors: Dict[str, SyncedWorksheet] = {}
+        self._scheduler = SyncScheduler(self.flush)
+        _snapshots.add(self)
+
+    def worksheet(self, name: str):
+        with self.lock:
+            if name not in self._worksheets:
+                self._worksheets[name] = self.sheet.worksheet(name)
+            return self._worksheets[name]
+
+    def mirror(self, name: str) -> SyncedWorksheet:
+        """The tab's local store, synced with the sheet on first use"""
+        with self.lock:
+            if name not in self._mirrors:
+                mirror = SyncedWorksheet(self.worksheet(name))
+                mirror.sync()
+                self._mirrors[name] = mirror
+                self._scheduler.start()
+            return self._mirrors[name]
+
+    def values(self, name: str) -> List[List[str]]:
+        """All rows of the worksheet (header included, unsynced appends last)"""
+        return self.mirror(name).values()
+
+    def rows_with_status(self, name: str, status: str, n: Optional[int] = None) -> List[Tuple[int, List[str]]]:
+        """(row number, row) for the first n rows whose Status column is `status`"""
+        with self.lock:
+            mirror = self.mirror(name)
+            return [(row_num, mirror.row(row_num)) for row_num in mirror.rows_with_status(status, n)]
+
+    def update_cell(self, name: str, row: int, col: int, value):
+        """Local write to a row already on the sheet; pushed at the next sync"""
+        with self.lock:
+            self.mirror(name).set_cell(row, col, value)
+
+    def update_status(self, name: str, row_id, status: str) -> bool:
+        """Local Status write by row id (first column) - safe for rows appended this run"""
+        with self.lock:
+            return self.mirror(name).set_status(row_id, status)
+
+    def append_row(self, name: str, values: List) -> int:
+        """Queue an append; returns the row number it should get (see update_status)"""
+        with self.lock:
+            return self.mirror(name).add_row(values)
+
+    def flush(self):
+        """Sync every tab now (pull, push, save)"""
+        with self.lock:
+            for mirror in self._mirrors.values():
+                mirror.sync()
+
+    def refresh(self, name: Optional[str] = None):
+        """Sync one tab (or all) now"""
+        with self.lock:
+            for mirror_name, mirror in self._mirrors.items():
+                if not name or mirror_name == name:
+                    mirror.sync()
+
+def _flush_at_exit():
+    for snapshot in list(_snapshots):
+        try:
+            snapshot.flush()
+        except Exception as e:
+            print(f"❌ Sheets sync at exit failed (local store kept in {SHEETS_STORE_FILE}): {e}", flush=True)
+
+atexit.register(_flush_at_exit)
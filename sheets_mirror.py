@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+"""
+Incremental local mirror of the Sheets queue worksheets
+
+Each mirrored worksheet keeps its rows plus a cursor (the last sheet row seen)
+in sheets_mirror.json. sync() only asks Sheets for the rows after the cursor,
+several row ranges per batch_get call, so a run reads what was appended since
+the last run instead of the whole tab. A status index (status → row numbers,
+in arrival order) makes "next N Pending rows" cheap: no scan over the queue.
+
+Our own writes are mirrored as they happen (set_cell / add_row). Edits made
+by hand in the Sheets UI to rows behind the cursor aren't seen until
+`python sheets_mirror.py --reset` (or WorksheetMirror.resync()).
+
+    python sheets_mirror.py                 # mirrored tabs, cursors, status counts
+    python sheets_mirror.py --reset         # forget every mirror (next run re-reads)
+    python sheets_mirror.py --reset "Ideas Queue"
+"""
+
+import os
+import sys
+import json
+import argparse
+import threading
+from collections import deque
+from itertools import islice
+from typing import Dict, List, Optional
+
+from ideas_journal import file_lock
+from sheets_writer import column_letter, with_backoff
+
+SHEETS_MIRROR_FILE = "sheets_mirror.json"
+
+# Rows per range and ranges per batch_get when reading past the cursor
+SYNC_CHUNK_ROWS = 200
+SYNC_CHUNKS_PER_CALL = 5
+MIRROR_LAST_COLUMN = 26  # A:Z covers every queue/stage tab
+
+STATUS_COL = 4
+HEADER_ROWS = 1
+
+# Threads of one process; file_lock (flock on <file>.lock) serializes worker processes on the host
+_store_lock = threading.Lock()
+
+# ═══════════════════════════════════════════════════════════
+# PERSISTENCE
+# ═══════════════════════════════════════════════════════════
+
+def load_mirrors(path: str = SHEETS_MIRROR_FILE) -> Dict[str, Dict]:
+    """{mirror key: {"sheet_id", "cursor", "rows"}}"""
+    if not os.path.exists(path):
+        return {}
+    try:
+        with open(path, "r") as f:
+            return json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"⚠️  Ignoring unreadable {path}: {e}", flush=True)
+        return {}
+
+def save_mirror(mirror: "WorksheetMirror", path: str = SHEETS_MIRROR_FILE):
+    """Write one mirror back into the shared file (other tabs' entries are kept)"""
+    with _store_lock, file_lock(path):
+        mirrors = load_mirrors(path)
+        mirrors[mirror.key] = mirror.to_dict()
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(mirrors, f)
+        os.replace(tmp_path, path)
+
+def mirror_key(worksheet) -> str:
+    spreadsheet = getattr(worksheet, "spreadsheet", None)
+    sheet_title = getattr(spreadsheet, "title", "") or os.getenv("GOOGLE_SHEET_NAME", "Pain Point Research")
+    return f"{sheet_title}/{worksheet.title}"
+
+# ═══════════════════════════════════════════════════════════
+# MIRROR
+# ═══════════════════════════════════════════════════════════
+
+class WorksheetMirror:
+    """
+    Local copy of one worksheet. rows[0] is sheet row 1 (the header); row
+    numbers in the API are the sheet's own 1-based numbers.
+    """
+
+    def __init__(self, worksheet, path: str = SHEETS_MIRROR_FILE, status_col: int = STATUS_COL):
+        self.worksheet = worksheet
+        self.path = path
+        self.status_col = status_col
+        self.key = mirror_key(worksheet)
+        self.sheet_id = getattr(worksheet, "id", None)
+        self.lock = threading.RLock()
+        self.rows: List[List[str]] = []
+        self._status: Dict[int, str] = {}
+        self._index: Dict[str, deque] = {}
+        self.reads = 0
+
+        saved = load_mirrors(path).get(self.key)
+        if saved and saved.get("sheet_id") == self.sheet_id:
+            for row in saved.get("rows", []):
+                self._append(row)
+            self._restore(saved)
+
+    def _restore(self, saved: Dict):
+        """Hook for subclasses that persist more than rows"""
+
+    @property
+    def cursor(self) -> int:
+        return len(self.rows)
+
+    # ── index ──
+
+    def _index_row(self, row_num: int):
+        if row_num <= HEADER_ROWS:
+            return
+        row = self.rows[row_num - 1]
+        status = row[self.status_col - 1].strip() if len(row) >= self.status_col else ""
+        if self._status.get(row_num) == status:
+            return
+        self._status[row_num] = status
+        self._index.setdefault(status, deque()).append(row_num)
+
+    def _append(self, row: List) -> int:
+        self.rows.append([str(v) for v in row])
+        self._index_row(len(self.rows))
+        return len(self.rows)
+
+    def rows_with_status(self, status: str, n: Optional[int] = None) -> List[int]:
+        """Row numbers currently at `status` (first n), oldest first"""
+        with self.lock:
+            queue = self._index.get(status)
+            if not queue:
+                return []
+            # Rows whose status moved on are dropped lazily from the front
+            while queue and self._status.get(queue[0]) != status:
+                queue.popleft()
+            seen = set()
+            matches = (r for r in queue
+                       if self._status.get(r) == status and not (r in seen or seen.add(r)))
+            return list(matches if n is None else islice(matches, n))
+
+    def status_counts(self) -> Dict[str, int]:
+        with self.lock:
+            counts: Dict[str, int] = {}
+            for status in self._status.values():
+                counts[status] = counts.get(status, 0) + 1
+            return counts
+
+    # ── reads ──
+
+    def row(self, row_num: int) -> List[str]:
+        with self.lock:
+            return list(self.rows[row_num - 1]) if 0 < row_num <= len(self.rows) else []
+
+    def values(self) -> List[List[str]]:
+        with self.lock:
+            return [list(row) for row in self.rows]
+
+    def record(self, row_num: int) -> Dict[str, str]:
+        """One row keyed by the header (the get_all_records() shape)"""
+        with self.lock:
+            header = self.rows[0] if self.rows else []
+            row = self.row(row_num)
+            return {name: row[i] if i < len(row) else "" for i, name in enumerate(header)}
+
+    def sync(self) -> int:
+        """Pull rows appended after the cursor (batch_get over new ranges only); returns rows added"""
+        with self.lock:
+            added = 0
+            last_col = column_letter(MIRROR_LAST_COLUMN)
+            while True:
+                start = self.cursor + 1
+                ranges = []
+                for k in range(SYNC_CHUNKS_PER_CALL):
+                    first = start + k * SYNC_CHUNK_ROWS
+                    ranges.append(f"A{first}:{last_col}{first + SYNC_CHUNK_ROWS - 1}")
+                chunks = with_backoff(self.worksheet.batch_get, ranges)
+                self.reads += 1
+
+                full = True
+                for chunk in chunks:
+                    chunk = list(chunk)
+                    for row in chunk:
+                        self._append(row)
+                    added += len(chunk)
+                    # Sheets trims trailing empty rows, so a short chunk is the end of the data
+                    if len(chunk) < SYNC_CHUNK_ROWS:
+                        full = False
+                        break
+                if not full:
+                    return added
+
+    def resync(self) -> int:
+        """Forget everything and re-read the worksheet from row 1"""
+        with self.lock:
+            self.rows = []
+            self._status = {}
+            self._index = {}
+            return self.sync()
+
+    # ── our own writes ──
+
+    def set_cell(self, row_num: int, col: int, value):
+        with self.lock:
+            while len(self.rows) < row_num:
+                self._append([])
+            cells = self.rows[row_num - 1]
+            while len(cells) < col:
+                cells.append("")
+            cells[col - 1] = str(value)
+            if col == self.status_col:
+                self._index_row(row_num)
+
+    def observe(self, row_num: int, col: int, value):
+        """A value just read from / written to the sheet by someone else (e.g. a lease)"""
+        self.set_cell(row_num, col, value)
+
+    def add_row(self, values: List) -> int:
+        """Mirror an appended row; returns its 1-based row number"""
+        with self.lock:
+            return self._append(values)
+
+    def save(self):
+        with self.lock:
+            save_mirror(self, self.path)
+
+    def to_dict(self) -> Dict:
+        return {"sheet_id": self.sheet_id, "cursor": self.cursor, "rows": self.rows}
+
+# ═══════════════════════════════════════════════════════════
+# CLI
+# ═══════════════════════════════════════════════════════════
+
+def main():
+    parser = argparse.ArgumentParser(description="Local mirror of the Sheets queue tabs")
+    parser.add_argument("--reset", nargs="?", const="*", metavar="TAB",
+                        help="Forget the mirror of TAB (or every tab) so the next run re-reads it")
+    parser.add_argument("--file", default=SHEETS_MIRROR_FILE)
+    args = parser.parse_args()
+
+    if args.reset:
+        with file_lock(args.file):
+            mirrors = load_mirrors(args.file)
+            kept = {k: v for k, v in mirrors.items() if args.reset != "*" and not k.endswith("/" + args.reset)}
+            with open(args.file, "w") as f:
+                json.dump(kept, f)
+        print(f"🧹 Reset {len(mirrors) - len(kept)} mirror(s)")
+        return
+
+    mirrors = load_mirrors(args.file)
+
+    if not mirrors:
+        print(f"No mirrors in {args.file}")
+        sys.exit(0)
+    for key, saved in mirrors.items():
+        counts: Dict[str, int] = {}
+        for row in saved["rows"][HEADER_ROWS:]:
+            status = row[STATUS_COL - 1].strip() if len(row) >= STATUS_COL else ""
+            counts[status] = counts.get(status, 0) + 1
+        top = ", ".join(f"{s or '(blank)'}: {n}" for s, n in sorted(counts.items(), key=lambda kv: -kv[1])[:5])
+        print(f"📋 {key}: cursor row {saved['cursor']} | {top}")
+
+if __name__ == "__main__":
+    main()
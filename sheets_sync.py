@@ -0,0 +1,337 @@
+#!/usr/bin/env python3
+"""
+Two-way sync between the local Sheets store and Google Sheets
+
+The Sheets pipeline (stage1 → stage2 → stage3, run_winner_pipeline) reads and
+writes a local copy of each tab (SyncedWorksheet, kept in sheets_store.json).
+Status changes and appended rows cost nothing at write time; every
+SHEETS_SYNC_SECONDS, on flush() and at exit the store is synced in bulk:
+
+    pull  one batch_get: the row-id and Status columns of every known row,
+          plus whatever was appended past the cursor
+    push  one batch_update for every changed cell, one append_rows for new
+          rows (which are then pulled back to learn where they landed)
+
+Conflicts are detected against the last synced value ("base") of each row:
+- row id: the first column at a known row no longer matches (rows were
+  sorted, inserted or deleted in the sheet) → the tab is re-read and local
+  changes are re-applied by row id
+- status: the sheet and the local store both changed a row's Status since
+  the last sync, to different values → the sheet wins (it's what other
+  workers and people see) and the local value is logged. Our own lease
+  being renewed (sheet_leases.py heartbeat) isn't a conflict: the local
+  result is still pushed
+
+Every conflict goes to sheets_conflicts.jsonl.
+
+    python sheets_sync.py                  # sync every tab in the store now
+    python sheets_sync.py --conflicts 20   # last 20 conflicts
+"""
+
+import os
+import json
+import argparse
+import threading
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from sheet_leases import parse_lease
+from sheets_mirror import WorksheetMirror, load_mirrors, HEADER_ROWS, STATUS_COL
+from sheets_writer import column_letter, coalesce_cells, with_backoff, UPDATE_INPUT_OPTION, APPEND_INPUT_OPTION
+
+SHEETS_STORE_FILE = "sheets_store.json"
+SHEETS_CONFLICTS_FILE = "sheets_conflicts.jsonl"
+SHEETS_SYNC_SECONDS = float(os.getenv("SHEETS_SYNC_SECONDS", "30"))
+
+ID_COL = 1
+
+def log_conflict(conflict: Dict, path: str = SHEETS_CONFLICTS_FILE):
+    conflict = {"at": datetime.now().isoformat(timespec="seconds"), **conflict}
+    with open(path, "a") as f:
+        f.write(json.dumps(conflict) + "\n")
+    print(f"   ⚠️  Sheets conflict ({conflict['type']}) on {conflict['tab']} "
+          f"#{conflict.get('row_id', '?')}: {conflict.get('detail', '')}", flush=True)
+
+def renewed_lease(base: str, remote: str) -> bool:
+    """Both are leases by the same worker (a heartbeat moved the expiry)"""
+    base_lease, remote_lease = parse_lease(base), parse_lease(remote)
+    return bool(base_lease and remote_lease and base_lease[0] == remote_lease[0])
+
+def _cell(values: List[List[str]], i: int) -> str:
+    row = values[i] if i < len(values) else []
+    return str(row[0]) if row else ""
+
+def _col(row: List[str], col: int) -> str:
+    return row[col - 1] if len(row) >= col else ""
+
+# ═══════════════════════════════════════════════════════════
+# SYNCED WORKSHEET
+# ═══════════════════════════════════════════════════════════
+
+class SyncedWorksheet(WorksheetMirror):
+    """
+    A WorksheetMirror whose writes stay local until sync(). rows are the
+    sheet's rows as of the last sync (plus local edits); `base` holds what the
+    sheet had at that sync; `pending` holds appended rows not pushed yet.
+
+    Rows we append only get a sheet row number once pushed (another worker may
+    append first), so address them by row id (first column): set_status().
+    """
+
+    def __init__(self, worksheet, path: str = SHEETS_STORE_FILE, status_col: int = STATUS_COL,
+                 conflicts_path: str = SHEETS_CONFLICTS_FILE):
+        self.base: List[List[str]] = []
+        self.pending: List[List[str]] = []
+        self._ids: Dict[str, int] = {}
+        self.conflicts_path = conflicts_path
+        self.conflicts = 0
+        super().__init__(worksheet, path=path, status_col=status_col)
+        if len(self.base) != len(self.rows):
+            self.base = [list(row) for row in self.rows]
+
+    # ── local store ──
+
+    def _append(self, row: List) -> int:
+        row_num = super()._append(row)
+        self._ids[_col(self.rows[-1], ID_COL)] = row_num
+        return row_num
+
+    def _restore(self, saved: Dict):
+        self.base = [list(row) for row in saved.get("base", [])]
+        self.pending = [list(row) for row in saved.get("pending", [])]
+
+    def to_dict(self) -> Dict:
+        data = super().to_dict()
+        data.update(base=self.base, pending=self.pending)
+        return data
+
+    def values(self) -> List[List[str]]:
+        """Synced rows then rows still waiting to be appended"""
+        with self.lock:
+            return [list(row) for row in self.rows + self.pending]
+
+    def add_row(self, values: List) -> int:
+        """Queue an append; returns the row number it will have if nobody else appends first"""
+        with self.lock:
+            self.pending.append([str(v) for v in values])
+            return len(self.rows) + len(self.pending)
+
+    def set_cell(self, row_num: int, col: int, value):
+        with self.lock:
+            if row_num > len(self.rows) and row_num - len(self.rows) <= len(self.pending):
+                cells = self.pending[row_num - len(self.rows) - 1]
+                while len(cells) < col:
+                    cells.append("")
+                cells[col - 1] = str(value)
+                return
+            super().set_cell(row_num, col, value)
+            while len(self.base) < len(self.rows):
+                self.base.append([])
+
+    def set_status(self, row_id, status: str) -> bool:
+        """Set Status on the newest row with this row id (pending rows included)"""
+        row_id = str(row_id)
+        with self.lock:
+            for i in range(len(self.pending) - 1, -1, -1):
+                if _col(self.pending[i], ID_COL) == row_id:
+                    self.set_cell(len(self.rows) + i + 1, self.status_col, status)
+                    return True
+            row_num = self._ids.get(row_id)
+            if row_num is None:
+                return False
+            self.set_cell(row_num, self.status_col, status)
+            return True
+
+    def observe(self, row_num: int, col: int, value):
+        """Someone wrote this to the sheet directly (e.g. a lease): local and base both take it"""
+        with self.lock:
+            super().set_cell(row_num, col, value)
+            self._set_base(row_num, col, value)
+
+    def _set_base(self, row_num: int, col: int, value):
+        while len(self.base) < row_num:
+            self.base.append([])
+        cells = self.base[row_num - 1]
+        while len(cells) < col:
+            cells.append("")
+        cells[col - 1] = str(value)
+
+    def dirty_cells(self) -> Dict:
+        """{(row, col): value} for every synced cell changed locally since the last sync"""
+        with self.lock:
+            cells = {}
+            for i, (row, base) in enumerate(zip(self.rows, self.base)):
+                if row == base:
+                    continue
+                for c in range(max(len(row), len(base))):
+                    value = row[c] if c < len(row) else ""
+                    if value != (base[c] if c < len(base) else ""):
+                        cells[(i + 1, c + 1)] = value
+            return cells
+
+    # ── sync ──
+
+    def _pull_new_rows(self) -> int:
+        start = len(self.rows)
+        added = WorksheetMirror.sync(self)
+        self.base.extend(list(row) for row in self.rows[start:])
+        return added
+
+    def pull(self) -> Dict:
+        """Merge the sheet's row ids / statuses into the store and pull new rows"""
+        with self.lock:
+            stats = {"pulled": 0, "remote_changes": 0, "conflicts": 0}
+            n = len(self.rows)
+            if n > HEADER_ROWS:
+                first = HEADER_ROWS + 1
+                id_col, status_col = column_letter(ID_COL), column_letter(self.status_col)
+                ids, statuses = with_backoff(self.worksheet.batch_get,
+                                             [f"{id_col}{first}:{id_col}{n}", f"{status_col}{first}:{status_col}{n}"])
+                self.reads += 1
+
+                moved = [r for r in range(first, n + 1)
+                         if _cell(ids, r - first) != _col(self.base[r - 1], ID_COL)]
+                if moved:
+                    self._log({"type": "row_id", "row_id": _col(self.base[moved[0] - 1], ID_COL),
+                               "detail": f"{len(moved)} row(s) moved/edited in the sheet (first at row {moved[0]}) - re-reading tab"})
+                    stats["conflicts"] += 1
+                    stats.update(self._reread())
+                    return stats
+
+                for r in range(first, n + 1):
+                    remote = _cell(statuses, r - first).strip()
+                    base = _col(self.base[r - 1], self.status_col).strip()
+                    local = _col(self.rows[r - 1], self.status_col).strip()
+                    if remote == base:
+                        continue
+                    stats["remote_changes"] += 1
+                    if local != base and renewed_lease(base, remote):
+                        # Our own lease heartbeat moved the sheet on; the local result still goes out
+                        self._set_base(r, self.status_col, remote)
+                        continue
+                    if local != base and local != remote:
+                        self._log({"type": "status", "row_id": _col(self.rows[r - 1], ID_COL), "row": r,
+                                   "base": base, "local": local, "remote": remote, "kept": "remote",
+                                   "detail": f"local '{local}' vs sheet '{remote}' - kept sheet"})
+                        stats["conflicts"] += 1
+                    self.observe(r, self.status_col, remote)
+
+            stats["pulled"] = self._pull_new_rows()
+            return stats
+
+    def _reread(self) -> Dict:
+        """Rebuild from the sheet, then re-apply local edits (by row id) the sheet hasn't contradicted"""
+        edits = {}
+        for row, base in zip(self.rows, self.base):
+            if row != base:
+                edits[_col(base, ID_COL)] = (base, row)
+        self.rows, self.base, self._status, self._index, self._ids = [], [], {}, {}, {}
+        pulled = self._pull_new_rows()
+        for row_id, (base, local) in edits.items():
+            row_num = self._ids.get(row_id)
+            if row_num is None:
+                self._log({"type": "row_id", "row_id": row_id, "detail": "row gone from the sheet - local edit dropped"})
+                continue
+            remote_status = _col(self.rows[row_num - 1], self.status_col)
+            if remote_status.strip() != _col(base, self.status_col).strip():
+                if remote_status.strip() != _col(local, self.status_col).strip():
+                    self._log({"type": "status", "row_id": row_id, "row": row_num, "base": _col(base, self.status_col),
+                               "local": _col(local, self.status_col), "remote": remote_status, "kept": "remote",
+                               "detail": f"local '{_col(local, self.status_col)}' vs sheet '{remote_status}' - kept sheet"})
+                continue
+            for c, value in enumerate(local):
+                if value != _col(base, c + 1):
+                    super().set_cell(row_num, c + 1, value)
+        return {"pulled": pulled}
+
+    def push(self) -> Dict:
+        """Send local cell changes (one batch_update) and queued rows (one append_rows)"""
+        with self.lock:
+            stats = {"cells": 0, "appended": 0}
+            cells = self.dirty_cells()
+            if cells:
+                with_backoff(self.worksheet.batch_update, coalesce_cells(cells), value_input_option=UPDATE_INPUT_OPTION)
+                for (r, c), value in cells.items():
+                    self._set_base(r, c, value)
+                stats["cells"] = len(cells)
+            if self.pending:
+                # Cleared only once the append went through, so a failed push keeps the rows queued
+                with_backoff(self.worksheet.append_rows, self.pending, value_input_option=APPEND_INPUT_OPTION)
+                stats["appended"] = len(self.pending)
+                self.pending = []
+                # Read them back: another worker may have appended in between
+                self._pull_new_rows()
+            return stats
+
+    def sync(self) -> Dict:
+        """pull, then push, then save the store"""
+        with self.lock:
+            stats = self.pull()
+            stats.update(self.push())
+            self.save()
+            return stats
+
+    def _log(self, conflict: Dict):
+        self.conflicts += 1
+        log_conflict({"tab": self.worksheet.title, **conflict}, self.conflicts_path)
+
+# ═══════════════════════════════════════════════════════════
+# SCHEDULE
+# ═══════════════════════════════════════════════════════════
+
+class SyncScheduler:
+    """Daemon thread calling sync_fn every `seconds`; errors are printed and retried next round"""
+
+    def __init__(self, sync_fn, seconds: float = SHEETS_SYNC_SECONDS):
+        self.sync_fn = sync_fn
+        self.seconds = seconds
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        if self._thread is None and self.seconds > 0:
+            self._thread = threading.Thread(target=self._run, daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        while not self._stop.wait(self.seconds):
+            try:
+                self.sync_fn()
+            except Exception as e:
+                print(f"   ⚠️  Sheets sync failed (retrying in {self.seconds:.0f}s): {e}", flush=True)
+
+    def stop(self):
+        self._stop.set()
+
+# ═══════════════════════════════════════════════════════════
+# CLI
+# ═══════════════════════════════════════════════════════════
+
+def main():
+    parser = argparse.ArgumentParser(description="Sync the local Sheets store with Google Sheets")
+    parser.add_argument("--conflicts", type=int, metavar="N", help="Show the last N conflicts instead")
+    args = parser.parse_args()
+
+    if args.conflicts:
+        if not os.path.exists(SHEETS_CONFLICTS_FILE):
+            print("No conflicts logged")
+            return
+        with open(SHEETS_CONFLICTS_FILE) as f:
+            lines = f.readlines()[-args.conflicts:]
+        for line in lines:
+            c = json.loads(line)
+            print(f"{c['at']}  {c['type']:<7} {c['tab']} #{c.get('row_id', '?')}: {c.get('detail', '')}")
+        return
+
+    from sheets_client import sheet_snapshot
+    snapshot = sheet_snapshot()
+    tabs = sorted({key.split("/", 1)[1] for key in load_mirrors(SHEETS_STORE_FILE)})
+    if not tabs:
+        print(f"Nothing in {SHEETS_STORE_FILE} yet - run a stage first")
+        return
+    for tab in tabs:
+        stats = snapshot.mirror(tab).sync()
+        print(f"🔄 {tab}: {stats}")
+
+if __name__ == "__main__":
+    main()
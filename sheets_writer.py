@@ -0,0 +1,188 @@
+"""
+Buffered Google Sheets writes for the Sheets-based scripts
+
+    queue = buffered(sheet.worksheet("Ideas Queue"))
+    queue.update_cell(i, 4, "KILLED")     # buffered
+    queue.append_row([...])               # buffered
+    queue.flush()                         # one append_rows + one batch_update
+
+Cell updates are coalesced into A1 ranges (runs of adjacent rows in one
+column, e.g. D2:D41) and sent with a single batch_update; appended rows go
+out with a single append_rows. A buffer flushes when it holds
+SHEETS_FLUSH_ROWS writes, SHEETS_FLUSH_SECONDS after its first pending write,
+on flush()/flush_all() and at interpreter exit. Quota errors (HTTP 429 /
+RESOURCE_EXHAUSTED) are retried with exponential backoff.
+
+Only the gspread Worksheet methods get_all_values / append_rows /
+batch_update (and batch_get, for sheets_mirror.py) are used, so any in-memory fake with those methods works
+(benchmarks/mock_provider.py MockWorksheet).
+"""
+
+import os
+import time
+import atexit
+import random
+import threading
+import weakref
+from typing import Dict, List, Optional, Tuple
+
+SHEETS_FLUSH_ROWS = int(os.getenv("SHEETS_FLUSH_ROWS", "50"))
+SHEETS_FLUSH_SECONDS = float(os.getenv("SHEETS_FLUSH_SECONDS", "30"))
+SHEETS_MAX_RETRIES = 6
+SHEETS_BACKOFF_BASE = 2.0
+SHEETS_BACKOFF_CAP = 64.0
+
+# gspread sends update_cell as USER_ENTERED and append_row as RAW
+UPDATE_INPUT_OPTION = "USER_ENTERED"
+APPEND_INPUT_OPTION = "RAW"
+
+_writers = weakref.WeakSet()
+
+# ═══════════════════════════════════════════════════════════
+# A1 RANGES
+# ═══════════════════════════════════════════════════════════
+
+def column_letter(col: int) -> str:
+    """1 → A, 27 → AA"""
+    letters = ""
+    while col > 0:
+        col, rem = divmod(col - 1, 26)
+        letters = chr(65 + rem) + letters
+    return letters
+
+def coalesce_cells(cells: Dict[Tuple[int, int], object]) -> List[Dict]:
+    """{(row, col): value} → batch_update data, one range per run of adjacent rows in a column"""
+    data = []
+    run: List[Tuple[int, int, object]] = []
+
+    def close_run():
+        if not run:
+            return
+        col = column_letter(run[0][1])
+        a1 = f"{col}{run[0][0]}" if len(run) == 1 else f"{col}{run[0][0]}:{col}{run[-1][0]}"
+        data.append({"range": a1, "values": [[value] for _, _, value in run]})
+
+    for (row, col), value in sorted(cells.items(), key=lambda item: (item[0][1], item[0][0])):
+        if run and (col != run[-1][1] or row != run[-1][0] + 1):
+            close_run()
+            run = []
+        run.append((row, col, value))
+    close_run()
+    return data
+
+# ═══════════════════════════════════════════════════════════
+# RETRIES
+# ═══════════════════════════════════════════════════════════
+
+def is_quota_error(e: Exception) -> bool:
+    """gspread APIError for 429 / RESOURCE_EXHAUSTED (matched by status, not by type)"""
+    response = getattr(e, "response", None)
+    if getattr(response, "status_code", None) == 429:
+        return True
+    text = str(e)
+    return "429" in text or "RESOURCE_EXHAUSTED" in text or "Quota exceeded" in text
+
+def with_backoff(fn, *args, sleep=time.sleep, **kwargs):
+    """Call fn, retrying quota errors with exponential backoff + jitter"""
+    for attempt in range(SHEETS_MAX_RETRIES + 1):
+        try:
+            return fn(*args, **kwargs)
+        except Exception as e:
+            if attempt == SHEETS_MAX_RETRIES or not is_quota_error(e):
+                raise
+            delay = min(SHEETS_BACKOFF_CAP, SHEETS_BACKOFF_BASE * (2 ** attempt)) + random.uniform(0, 1)
+            print(f"   ⏳ Sheets quota hit, retrying in {delay:.1f}s ({attempt + 1}/{SHEETS_MAX_RETRIES})", flush=True)
+            sleep(delay)
+
+# ═══════════════════════════════════════════════════════════
+# BUFFERED WORKSHEET
+# ═══════════════════════════════════════════════════════════
+
+class BufferedWorksheet:
+    """
+    Drop-in for the update_cell / append_row calls the scripts make. Pending
+    appends are sent before pending cell updates, so an update to a row we
+    appended earlier lands on that row. Reads go straight to the worksheet
+    after a flush.
+    """
+
+    def __init__(self, worksheet, max_pending: Optional[int] = None,
+                 max_age_s: Optional[float] = None, sleep=time.sleep, on_flush=None):
+        self.worksheet = worksheet
+        self.on_flush = on_flush  # called after each flush that sent something
+        self.title = getattr(worksheet, "title", "")
+        self.max_pending = SHEETS_FLUSH_ROWS if max_pending is None else max_pending
+        self.max_age_s = SHEETS_FLUSH_SECONDS if max_age_s is None else max_age_s
+        self.sleep = sleep
+        self.lock = threading.RLock()
+        self._cells: Dict[Tuple[int, int], object] = {}
+        self._appends: List[List] = []
+        self._timer: Optional[threading.Timer] = None
+        self.api_calls = 0
+        _writers.add(self)
+
+    @property
+    def pending(self) -> int:
+        with self.lock:
+            return len(self._cells) + len(self._appends)
+
+    def update_cell(self, row: int, col: int, value):
+        with self.lock:
+            self._cells[(row, col)] = value  # last write to a cell wins
+            self._buffered()
+
+    def append_row(self, values: List):
+        with self.lock:
+            self._appends.append(list(values))
+            self._buffered()
+
+    def append_rows(self, rows: List[List]):
+        with self.lock:
+            self._appends.extend(list(values) for values in rows)
+            self._buffered()
+
+    def get_all_values(self) -> List[List[str]]:
+        self.flush()
+        return self.worksheet.get_all_values()
+
+    def _buffered(self):
+        if self.pending >= self.max_pending:
+            self.flush()
+        elif self._timer is None and self.max_age_s > 0:
+            self._timer = threading.Timer(self.max_age_s, self.flush)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def flush(self):
+        """Send everything pending: one append_rows, then one batch_update"""
+        with self.lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            sent = bool(self._appends or self._cells)
+            if self._appends:
+                with_backoff(self.worksheet.append_rows, self._appends,
+                             value_input_option=APPEND_INPUT_OPTION, sleep=self.sleep)
+                self.api_calls += 1
+                self._appends = []
+            if self._cells:
+                with_backoff(self.worksheet.batch_update, coalesce_cells(self._cells),
+                             value_input_option=UPDATE_INPUT_OPTION, sleep=self.sleep)
+                self.api_calls += 1
+                self._cells = {}
+            if sent and self.on_flush:
+                self.on_flush()
+
+def buffered(worksheet, **kwargs) -> BufferedWorksheet:
+    """Wrap a gspread Worksheet (or a fake) in a BufferedWorksheet"""
+    return BufferedWorksheet(worksheet, **kwargs)
+
+def flush_all():
+    """Flush every live buffer; errors are reported so one bad sheet doesn't strand the rest"""
+    for writer in list(_writers):
+        try:
+            writer.flush()
+        except Exception as e:
+            print(f"❌ Sheets flush failed for '{writer.title}': {e}", flush=True)
+
+atexit.register(flush_all)
@@ -0,0 +1,206 @@
+"""
+Stage 2 signals store
+Every Stage 2 evidence signal as one normalized row, so pass thresholds can be
+re-applied to the whole history offline (rescore.py) instead of re-running the
+paid stage.
+
+stage2_signals.jsonl - one row per idea × signal:
+    {"hash": "...", "version": "v6.0", "idea_id": 17, "signal": "job_demand",
+     "score": 3, "max_score": 5, "counted": true, "metric": 12.0,
+     "verdict": "KILL", "status": "killed_stage2", "raw": {...}}
+
+`metric` is the signal's main raw number (mentions, job postings, TAM in USD, ...);
+`counted` is false for v5.0's market size, which gates but isn't summed.
+
+STAGE2_THRESHOLDS is the single source of the pass criteria: the pipelines
+read it, and stage2_decision() is the scalar twin of rescore.py's bulk version.
+An optional "weights": {signal: w} multiplies scores before they are summed.
+"""
+
+import os
+import ast
+import json
+import re
+from typing import Dict, List, Optional, Tuple
+
+SIGNALS_STORE_FILE = "stage2_signals.jsonl"
+
+# ═══════════════════════════════════════════════════════════
+# THRESHOLDS
+# ═══════════════════════════════════════════════════════════
+
+STAGE2_THRESHOLDS = {
+    # ≥25/39 AND ≥6/8 signals AND TAM ≥ $10M
+    "v6.0": {"min_total": 25, "min_signals": 6, "trigger_score": 1, "min_tam": 10_000_000, "min_market_score": 0},
+    # ≥12/33 AND ≥3/7 signals AND market size score ≥ 3 ($10M+ TAM)
+    "v5.0": {"min_total": 12, "min_signals": 3, "trigger_score": 1, "min_tam": 0, "min_market_score": 3},
+}
+
+# signal → (max score, metric field, counted toward total/signals)
+SIGNALS = {
+    "v6.0": {
+        "time_waste_evidence": (5, "mentions", True),
+        "willingness_to_pay": (5, "mentions", True),
+        "cost_validation": (5, "calculated_annual_cost", True),
+        "job_demand": (5, "job_postings_found", True),
+        "diy_solutions": (5, "diy_solutions_found", True),
+        "competitor_gaps": (5, "competitor_gaps_found", True),
+        "market_size": (5, "tam", True),
+        "frequency": (4, None, True),
+    },
+    "v5.0": {
+        "search_volume": (5, "total_monthly_searches", True),
+        "diy_demand": (5, "monthly_diy_searches", True),
+        "job_postings": (5, "pain_mentions", True),
+        "competitor_gaps": (5, "reviews_mentioning_gap", True),
+        "forums": (4, "threads_found", True),
+        "web_evidence": (4, "sources_found", True),
+        "cost_research": (5, None, True),
+        "market_size": (5, "tam_estimate", False),
+    },
+}
+
+# Where each version keeps its Stage 2 output on the idea
+V6_EVIDENCE_KEY = "stage_2_evidence_analysis"
+V5_RESULT_KEY = "stage_2:_evidence_result"
+
+def stage2_decision(version: str, scores: Dict[str, float], tam: float = 0,
+                    thresholds: Optional[Dict] = None) -> Tuple[bool, str]:
+    """(passed, kill reason) for one idea's signal scores under `thresholds`"""
+    t = thresholds or STAGE2_THRESHOLDS[version]
+    weights = t.get("weights", {})
+    counted = [name for name, (_, _, is_counted) in SIGNALS[version].items() if is_counted]
+    total = sum(scores.get(name, 0) * weights.get(name, 1) for name in counted)
+    triggered = sum(1 for name in counted if scores.get(name, 0) >= t["trigger_score"])
+    max_total = sum(SIGNALS[version][name][0] for name in counted)
+
+    if total < t["min_total"]:
+        return False, f"Economic proof too weak ({total:g}/{max_total})"
+    if triggered < t["min_signals"]:
+        return False, f"Too few signals triggered ({triggered}/{len(counted)})"
+    if tam < t["min_tam"]:
+        return False, f"Market too small (${tam:,.0f} TAM)"
+    if scores.get("market_size", 0) < t["min_market_score"]:
+        return False, "Market too small"
+    return True, ""
+
+# ═══════════════════════════════════════════════════════════
+# NORMALIZATION
+# ═══════════════════════════════════════════════════════════
+
+def _number(value) -> float:
+    """12, "12", "$45.2M", "$1.2 billion", [..3 items..] → float"""
+    if isinstance(value, bool):
+        return float(value)
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, list):
+        return float(len(value))
+    text = str(value or "").lower().replace(",", "")
+    match = re.search(r"(\d+(?:\.\d+)?)\s*(billion|bn|b\b|million|m\b|mm|thousand|k\b)?", text)
+    if not match:
+        return 0.0
+    number = float(match.group(1))
+    unit = match.group(2) or ""
+    if unit.startswith("b"):
+        number *= 1e9
+    elif unit.startswith("m"):
+        number *= 1e6
+    elif unit.startswith(("k", "t")):
+        number *= 1e3
+    return number
+
+def _as_dict(value) -> Dict:
+    """Stage results are dicts, or repr'd dicts in older banks"""
+    if isinstance(value, dict):
+        return value
+    if isinstance(value, str) and value.startswith("{"):
+        try:
+            parsed = ast.literal_eval(value)
+            return parsed if isinstance(parsed, dict) else {}
+        except (ValueError, SyntaxError):
+            return {}
+    return {}
+
+def stage2_evidence(idea: Dict) -> Tuple[Optional[str], Dict, Optional[str]]:
+    """(version, evidence dict, recorded verdict) or (None, {}, None) if the idea never finished Stage 2"""
+    if idea.get(V6_EVIDENCE_KEY):
+        evidence = _as_dict(idea[V6_EVIDENCE_KEY])
+        verdict = "KILL" if idea.get("status") == "killed_stage2" else "PASS"
+        return "v6.0", evidence, verdict
+    result = _as_dict(idea.get(V5_RESULT_KEY))
+    if result.get("evidence"):
+        return "v5.0", _as_dict(result["evidence"]), result.get("verdict")
+    return None, {}, None
+
+def normalize_idea(idea: Dict) -> List[Dict]:
+    """One row per Stage 2 signal (empty if the idea has no Stage 2 evidence)"""
+    version, evidence, verdict = stage2_evidence(idea)
+    if not version or not idea.get("hash"):
+        return []
+
+    rows = []
+    for signal, (max_score, metric_field, counted) in SIGNALS[version].items():
+        data = _as_dict(evidence.get(signal))
+        rows.append({
+            "hash": idea["hash"],
+            "version": version,
+            "idea_id": idea.get("id"),
+            "signal": signal,
+            "score": _number(data.get("score", 0)),
+            "max_score": max_score,
+            "counted": counted,
+            "metric": _number(data.get(metric_field)) if metric_field else None,
+            "verdict": verdict,
+            "status": idea.get("status"),
+            "raw": data,
+        })
+    return rows
+
+# ═══════════════════════════════════════════════════════════
+# STORE
+# ═══════════════════════════════════════════════════════════
+
+def load_signal_rows() -> List[Dict]:
+    rows = []
+    if os.path.exists(SIGNALS_STORE_FILE):
+        with open(SIGNALS_STORE_FILE, 'r') as f:
+            for line in f:
+                if line.strip():
+                    rows.append(json.loads(line))
+    return rows
+
+def sync_signals(ideas: List[Dict], rebuild: bool = False) -> int:
+    """
+    Add Stage 2 rows for ideas not yet in the store (or whose status moved on);
+    rebuild=True rewrites the store from `ideas`. Returns ideas written.
+    """
+    existing = {} if rebuild else {(row["hash"], row["version"]): row.get("status") for row in load_signal_rows()}
+
+    new_rows, stale = {}, set()
+    for idea in ideas:
+        rows = normalize_idea(idea)
+        if not rows:
+            continue
+        key = (rows[0]["hash"], rows[0]["version"])
+        if existing.get(key, "missing") == rows[0]["status"]:
+            continue
+        if key in existing and key not in new_rows:
+            stale.add(key)
+        existing[key] = rows[0]["status"]
+        new_rows[key] = rows
+
+    written_rows = [row for rows in new_rows.values() for row in rows]
+    if rebuild or stale:
+        kept = [] if rebuild else [row for row in load_signal_rows() if (row["hash"], row["version"]) not in stale]
+        with open(SIGNALS_STORE_FILE, 'w') as f:
+            for row in kept + written_rows:
+                f.write(json.dumps(row) + "\n")
+    elif written_rows:
+        with open(SIGNALS_STORE_FILE, 'a') as f:
+            for row in written_rows:
+                f.write(json.dumps(row) + "\n")
+
+    if new_rows:
+        print(f"\n🗃️  Stage 2 signals stored for {len(new_rows)} idea(s) → {SIGNALS_STORE_FILE}")
+    return len(new_rows)
@@ -5,33 +5,15 @@ Identifies HIGH-GROWTH industries with NO licensing/API restrictions
 Filters out 80% of ideas immediately
 """
 
-import os
-import sys
 import time
-import gspread
 from datetime import datetime
-from google.oauth2.service_account import Credentials
-from dotenv import load_dotenv
-from openai import OpenAI
+from typing import Dict, List
 
-load_dotenv()
+from sheet_leases import SheetLeaser
+from sheets_client import openai_client, sheet_snapshot, SheetSnapshot
 
-OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
-GOOGLE_SHEET_NAME = os.getenv("GOOGLE_SHEET_NAME", "Pain Point Research")
-
-if not OPENAI_API_KEY:
-    print("❌ No OPENAI_API_KEY in .env")
-    sys.exit(1)
-
-client = OpenAI(api_key=OPENAI_API_KEY)
-
-SCOPES = [
-    'https://www.googleapis.com/auth/spreadsheets',
-    'https://www.googleapis.com/auth/drive'
-]
-creds = Credentials.from_service_account_file('google-credentials.json', scopes=SCOPES)
-gc = gspread.authorize(creds)
-sheet = gc.open(GOOGLE_SHEET_NAME)
+QUEUE_TAB = "Ideas Queue"
+GROWTH_PASS_TAB = "Stage 1: Growth Pass"
 
 # Industries EXCLUDED due to licensing/regulatory barriers
 EXCLUDED_INDUSTRIES = [
@@ -58,7 +40,7 @@ def call_openai(prompt, max_tokens=3000):
     """Call OpenAI API"""
     time.sleep(1)
     try:
-        response = client.chat.completions.create(
+        response = openai_client().chat.completions.create(
             model="gpt-4o",
             messages=[
                 {"role": "system", "content": "You are a business analyst specializing in high-growth industries. You find data-driven evidence of growth, funding, and market dynamics."},
@@ -211,6 +193,27 @@ Only PASS if technically feasible without gatekeepers."""
     # All checks passed
     return "PASS: Growth Filter", result + "\n\n" + api_result
 
+def pending_ideas(snapshot: SheetSnapshot) -> List[Dict]:
+    """Ideas Queue rows with Status "Pending" ({row_num, niche, pain, queue_row})"""
+    return [{"row_num": row[0], "niche": row[1], "pain": row[2], "queue_row": i}
+            for i, row in snapshot.rows_with_status(QUEUE_TAB, "Pending")]
+
+def record_growth_result(snapshot: SheetSnapshot, idea: Dict, result_status: str, analysis: str) -> bool:
+    """Write the verdict to the Ideas Queue; a pass is appended to Growth Pass (idea["growth_row"])"""
+    snapshot.update_cell(QUEUE_TAB, idea["queue_row"], 4, result_status)
+    if "KILL" in result_status:
+        return False
+
+    idea["growth_row"] = snapshot.append_row(GROWTH_PASS_TAB, [
+        idea["row_num"],
+        idea["niche"],
+        idea["pain"],
+        "Ready for Budget Filter",
+        (analysis or "")[:500],
+        datetime.now().strftime("%Y-%m-%d")
+    ])
+    return True
+
 def main():
     """Process ideas through Growth Filter"""
     print("\n🚀 STAGE 1: GROWTH FILTER", flush=True)
@@ -220,12 +223,8 @@ def main():
     print("💀 Expected pass rate: ~20%", flush=True)
     print("="*70, flush=True)
 
-    queue = sheet.worksheet("Ideas Queue")
-    growth_pass = sheet.worksheet("Stage 1: Growth Pass")
-
-    all_rows = queue.get_all_values()
-
-    if len(all_rows) <= 1:
+    snapshot = sheet_snapshot()
+    if len(snapshot.values(QUEUE_TAB)) <= 1:
         print("\n❌ No ideas in queue. Run: python generate_ideas_v4.py", flush=True)
         return
 
@@ -233,44 +232,35 @@ def main():
     killed = 0
     passed = 0
 
-    for i, row in enumerate(all_rows[1:], start=2):
-        if len(row) < 4:
-            continue
-
-        status = row[3] if len(row) > 3 else ""
-        if status != "Pending":
-            continue
-
-        row_num = row[0]
-        niche = row[1]
-        pain = row[2]
+    # Each row is leased before it's researched, so several copies of this
+    # script can share the queue (sheet_leases.py)
+    leaser = SheetLeaser(snapshot.worksheet(QUEUE_TAB), snapshot.mirror(QUEUE_TAB), lock=snapshot.lock)
+    print(f"🔒 Worker {leaser.worker_id}", flush=True)
 
-        result_status, analysis = growth_filter(row_num, niche, pain)
+    for lease in leaser.claim_each("Pending"):
+        row = snapshot.mirror(QUEUE_TAB).row(lease["row"])
+        idea = {"row_num": row[0], "niche": row[1], "pain": row[2], "queue_row": lease["row"]}
+        with leaser.hold(lease):
+            result_status, analysis = growth_filter(idea["row_num"], idea["niche"], idea["pain"])
+            # Under the lease lock, so a heartbeat can't lease over the verdict
+            with leaser.lock:
+                is_pass = record_growth_result(snapshot, idea, result_status, analysis)
 
         processed += 1
 
-        # Update Ideas Queue
-        queue.update_cell(i, 4, result_status)
-
-        if "KILL" in result_status:
+        if not is_pass:
             killed += 1
             print(f"\n💀 {result_status}", flush=True)
         else:
-            # PASSED - Move to Stage 2
-            growth_pass.append_row([
-                row_num,
-                niche,
-                pain,
-                "Ready for Budget Filter",
-                analysis[:500],
-                datetime.now().strftime("%Y-%m-%d")
-            ])
+            # PASSED - Moved to Stage 2
             passed += 1
             print(f"\n✅ PASSED Growth Filter!", flush=True)
 
         print(f"\n📊 Progress: {processed} processed | {killed} killed | {passed} passed", flush=True)
         print(f"   Kill rate: {(killed/processed*100):.1f}% | Pass rate: {(passed/processed*100):.1f}%", flush=True)
 
+    snapshot.flush()
+
     print(f"\n{'='*70}", flush=True)
     print(f"✅ Stage 1 Complete!", flush=True)
     print(f"   Processed: {processed}", flush=True)
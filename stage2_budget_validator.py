@@ -5,39 +5,20 @@ Proves businesses WILL PAY and identifies buying authority
 Only processes ideas that passed Stage 1
 """
 
-import os
-import sys
 import time
-import gspread
 from datetime import datetime
-from google.oauth2.service_account import Credentials
-from dotenv import load_dotenv
-from openai import OpenAI
+from typing import Dict, List, Optional
 
-load_dotenv()
+from sheets_client import openai_client, sheet_snapshot, SheetSnapshot
 
-OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
-GOOGLE_SHEET_NAME = os.getenv("GOOGLE_SHEET_NAME", "Pain Point Research")
-
-if not OPENAI_API_KEY:
-    print("❌ No OPENAI_API_KEY in .env")
-    sys.exit(1)
-
-client = OpenAI(api_key=OPENAI_API_KEY)
-
-SCOPES = [
-    'https://www.googleapis.com/auth/spreadsheets',
-    'https://www.googleapis.com/auth/drive'
-]
-creds = Credentials.from_service_account_file('google-credentials.json', scopes=SCOPES)
-gc = gspread.authorize(creds)
-sheet = gc.open(GOOGLE_SHEET_NAME)
+GROWTH_PASS_TAB = "Stage 1: Growth Pass"
+BUDGET_PASS_TAB = "Stage 2: Budget Pass"
 
 def call_openai(prompt, max_tokens=4000):
     """Call OpenAI API"""
     time.sleep(1)
     try:
-        response = client.chat.completions.create(
+        response = openai_client().chat.completions.create(
             model="gpt-4o",
             messages=[
                 {"role": "system", "content": "You are a budget analyst. You find PROOF that businesses spend money on solutions. You identify decision makers and validate willingness to pay."},
@@ -263,6 +244,37 @@ Require viable business model."""
     # All checks passed
     return "PASS: Budget Validated", full_analysis
 
+def growth_pass_ideas(snapshot: SheetSnapshot, status: Optional[str] = None) -> List[Dict]:
+    """Stage 1: Growth Pass rows, all or just those at `status` ({row_num, niche, pain, growth_row, status})"""
+    if status is not None:
+        rows = snapshot.rows_with_status(GROWTH_PASS_TAB, status)
+    else:
+        rows = list(enumerate(snapshot.values(GROWTH_PASS_TAB), start=1))[1:]
+    ideas = []
+    for i, row in rows:
+        if len(row) < 3:
+            continue
+        ideas.append({"row_num": row[0], "niche": row[1], "pain": row[2], "growth_row": i,
+                      "status": row[3] if len(row) > 3 else ""})
+    return ideas
+
+def record_budget_result(snapshot: SheetSnapshot, idea: Dict, result_status: str, analysis: str) -> bool:
+    """Write the verdict to Growth Pass; a pass is appended to Budget Pass (idea["budget_row"])"""
+    if "KILL" in result_status:
+        snapshot.update_status(GROWTH_PASS_TAB, idea["row_num"], result_status)
+        return False
+
+    idea["budget_row"] = snapshot.append_row(BUDGET_PASS_TAB, [
+        idea["row_num"],
+        idea["niche"],
+        idea["pain"],
+        "Ready for Deep Research",
+        (analysis or "")[:500],
+        datetime.now().strftime("%Y-%m-%d")
+    ])
+    snapshot.update_status(GROWTH_PASS_TAB, idea["row_num"], "PASSED to Stage 3")
+    return True
+
 def main():
     """Process ideas through Budget Validator"""
     print("\n🚀 STAGE 2: BUDGET VALIDATOR", flush=True)
@@ -272,12 +284,8 @@ def main():
     print("💀 Expected pass rate: ~50% of Stage 1 survivors", flush=True)
     print("="*70, flush=True)
 
-    growth_pass = sheet.worksheet("Stage 1: Growth Pass")
-    budget_pass = sheet.worksheet("Stage 2: Budget Pass")
-
-    all_rows = growth_pass.get_all_values()
-
-    if len(all_rows) <= 1:
+    snapshot = sheet_snapshot()
+    if len(snapshot.values(GROWTH_PASS_TAB)) <= 1:
         print("\n❌ No ideas from Stage 1. Run: python stage1_growth_filter.py", flush=True)
         return
 
@@ -285,42 +293,24 @@ def main():
     killed = 0
     passed = 0
 
-    for i, row in enumerate(all_rows[1:], start=2):
-        if len(row) < 3:
-            continue
-
-        row_num = row[0]
-        niche = row[1]
-        pain = row[2]
-
-        result_status, analysis = budget_validator(row_num, niche, pain)
+    for idea in growth_pass_ideas(snapshot):
+        result_status, analysis = budget_validator(idea["row_num"], idea["niche"], idea["pain"])
 
         processed += 1
 
-        if "KILL" in result_status:
+        if not record_budget_result(snapshot, idea, result_status, analysis):
             killed += 1
             print(f"\n💀 {result_status}", flush=True)
-            # Update status in growth_pass sheet
-            growth_pass.update_cell(i, 4, result_status)
         else:
-            # PASSED - Move to Stage 3
-            budget_pass.append_row([
-                row_num,
-                niche,
-                pain,
-                "Ready for Deep Research",
-                analysis[:500],
-                datetime.now().strftime("%Y-%m-%d")
-            ])
+            # PASSED - Moved to Stage 3
             passed += 1
             print(f"\n✅ PASSED Budget Validation!", flush=True)
 
-            # Update status in growth_pass sheet
-            growth_pass.update_cell(i, 4, "PASSED to Stage 3")
-
         print(f"\n📊 Progress: {processed} processed | {killed} killed | {passed} passed", flush=True)
         print(f"   Kill rate: {(killed/processed*100):.1f}% | Pass rate: {(passed/processed*100):.1f}%", flush=True)
 
+    snapshot.flush()
+
     print(f"\n{'='*70}", flush=True)
     print(f"✅ Stage 2 Complete!", flush=True)
     print(f"   Processed: {processed}", flush=True)
@@ -5,39 +5,20 @@ Only runs on ideas that passed BOTH Growth & Budget filters
 Comprehensive analysis ready for "The Strategist"
 """
 
-import os
-import sys
 import time
-import gspread
 from datetime import datetime
-from google.oauth2.service_account import Credentials
-from dotenv import load_dotenv
-from openai import OpenAI
+from typing import Dict, List, Optional
 
-load_dotenv()
+from sheets_client import openai_client, sheet_snapshot, SheetSnapshot
 
-OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
-GOOGLE_SHEET_NAME = os.getenv("GOOGLE_SHEET_NAME", "Pain Point Research")
-
-if not OPENAI_API_KEY:
-    print("❌ No OPENAI_API_KEY in .env")
-    sys.exit(1)
-
-client = OpenAI(api_key=OPENAI_API_KEY)
-
-SCOPES = [
-    'https://www.googleapis.com/auth/spreadsheets',
-    'https://www.googleapis.com/auth/drive'
-]
-creds = Credentials.from_service_account_file('google-credentials.json', scopes=SCOPES)
-gc = gspread.authorize(creds)
-sheet = gc.open(GOOGLE_SHEET_NAME)
+BUDGET_PASS_TAB = "Stage 2: Budget Pass"
+WINNERS_TAB = "TRUE WINNERS"
 
 def call_openai(prompt, max_tokens=5000):
     """Call OpenAI API"""
     time.sleep(1)
     try:
-        response = client.chat.completions.create(
+        response = openai_client().chat.completions.create(
             model="gpt-4o",
             messages=[
                 {"role": "system", "content": "You are a world-class business researcher. You create comprehensive opportunity reports with real evidence, actionable insights, and clear next steps."},
@@ -287,6 +268,44 @@ If NO: [What's missing or what pivot to consider]"""
     else:
         return "⚠️ MARGINAL - Needs refinement", full_report
 
+def budget_pass_ideas(snapshot: SheetSnapshot, status: Optional[str] = None) -> List[Dict]:
+    """Stage 2: Budget Pass rows, all or just those at `status` ({row_num, niche, pain, budget_row, status})"""
+    if status is not None:
+        rows = snapshot.rows_with_status(BUDGET_PASS_TAB, status)
+    else:
+        rows = list(enumerate(snapshot.values(BUDGET_PASS_TAB), start=1))[1:]
+    ideas = []
+    for i, row in rows:
+        if len(row) < 3:
+            continue
+        ideas.append({"row_num": row[0], "niche": row[1], "pain": row[2], "budget_row": i,
+                      "status": row[3] if len(row) > 3 else ""})
+    return ideas
+
+def record_research_result(snapshot: SheetSnapshot, idea: Dict, result_status: str, full_report: str) -> bool:
+    """TRUE WINNER → WINNER_*.txt + TRUE WINNERS row (idea["report_file"]); else marked for review"""
+    if "TRUE WINNER" not in result_status:
+        snapshot.update_status(BUDGET_PASS_TAB, idea["row_num"], "Marginal - Review")
+        return False
+
+    # Save complete report
+    safe_niche = idea["niche"].replace(' ', '_').replace('/', '-')[:30]
+    filename = f"WINNER_{idea['row_num']}_{safe_niche}.txt"
+    with open(filename, 'w') as f:
+        f.write(full_report)
+    idea["report_file"] = filename
+
+    snapshot.append_row(WINNERS_TAB, [
+        idea["row_num"],
+        idea["niche"],
+        idea["pain"],
+        result_status,
+        full_report[:1500],
+        datetime.now().strftime("%Y-%m-%d")
+    ])
+    snapshot.update_status(BUDGET_PASS_TAB, idea["row_num"], "TRUE WINNER ✅")
+    return True
+
 def main():
     """Process ideas through Deep Research"""
     print("\n🚀 STAGE 3: DEEP RESEARCH (Final Analysis)", flush=True)
@@ -295,12 +314,8 @@ def main():
     print("🎯 Output: Complete reports for TRUE WINNERS", flush=True)
     print("="*70, flush=True)
 
-    budget_pass = sheet.worksheet("Stage 2: Budget Pass")
-    winners = sheet.worksheet("TRUE WINNERS")
-
-    all_rows = budget_pass.get_all_values()
-
-    if len(all_rows) <= 1:
+    snapshot = sheet_snapshot()
+    if len(snapshot.values(BUDGET_PASS_TAB)) <= 1:
         print("\n❌ No ideas from Stage 2. Run: python stage2_budget_validator.py", flush=True)
         return
 
@@ -308,48 +323,23 @@ def main():
     true_winners = 0
     marginal = 0
 
-    for i, row in enumerate(all_rows[1:], start=2):
-        if len(row) < 3:
-            continue
-
-        row_num = row[0]
-        niche = row[1]
-        pain = row[2]
-
-        result_status, full_report = deep_research(row_num, niche, pain)
+    for idea in budget_pass_ideas(snapshot):
+        result_status, full_report = deep_research(idea["row_num"], idea["niche"], idea["pain"])
 
         processed += 1
 
-        if "TRUE WINNER" in result_status:
-            # Save complete report
-            safe_niche = niche.replace(' ', '_').replace('/', '-')[:30]
-            filename = f"WINNER_{row_num}_{safe_niche}.txt"
-            with open(filename, 'w') as f:
-                f.write(full_report)
-
-            # Add to Winners sheet
-            winners.append_row([
-                row_num,
-                niche,
-                pain,
-                result_status,
-                full_report[:1500],
-                datetime.now().strftime("%Y-%m-%d")
-            ])
+        if record_research_result(snapshot, idea, result_status, full_report):
             true_winners += 1
             print(f"\n🏆 TRUE WINNER!", flush=True)
-            print(f"   📄 Report saved: {filename}", flush=True)
-
-            # Update budget_pass sheet
-            budget_pass.update_cell(i, 4, "TRUE WINNER ✅")
-
+            print(f"   📄 Report saved: {idea['report_file']}", flush=True)
         else:
             marginal += 1
             print(f"\n⚠️  Marginal opportunity (may need pivot)", flush=True)
-            budget_pass.update_cell(i, 4, "Marginal - Review")
 
         print(f"\n📊 Progress: {processed} processed | {true_winners} TRUE WINNERS | {marginal} marginal", flush=True)
 
+    snapshot.flush()
+
     print(f"\n{'='*70}", flush=True)
     print(f"✅ RESEARCH COMPLETE!", flush=True)
     print(f"   Processed: {processed}", flush=True)
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Stage fingerprints - which prompt/model/threshold version produced each stored result
+
+Every stage result is stamped with a hash of what went into it:
+
+    idea["stage_fingerprints"] = {"Stage 1: White Space": "3f9c...", "Stage 2: Evidence": "a01b...", ...}
+
+A stage's fingerprint covers the source of its stage functions (prompt
+templates, model names and call parameters are all literals in there), its
+config (thresholds, founder profile) and the fingerprint of the stage before
+it. Editing a Stage 2 prompt therefore changes the fingerprints of Stages 2-7
+and nothing upstream.
+
+    python stage_fingerprint.py            # stale results per stage in the v6.0 bank
+    python stage_fingerprint.py --adopt    # trust unstamped (pre-fingerprint) results as current
+    python ultimate_winner_machine_v6.0.py --recompute   # re-run only stale stages + their dependents
+"""
+
+import json
+import hashlib
+import inspect
+import argparse
+from typing import Dict, List, Optional, Tuple
+
+FINGERPRINT_KEY = "stage_fingerprints"
+
+# ═══════════════════════════════════════════════════════════
+# HASHING
+# ═══════════════════════════════════════════════════════════
+
+def _canonical(obj):
+    """JSON-safe, address-free form: functions become their source"""
+    if callable(obj):
+        try:
+            return inspect.getsource(obj)
+        except (OSError, TypeError):
+            return getattr(obj, "__qualname__", repr(obj))
+    if isinstance(obj, dict):
+        return {str(k): _canonical(v) for k, v in sorted(obj.items(), key=lambda item: str(item[0]))}
+    if isinstance(obj, (list, tuple, set)):
+        return [_canonical(v) for v in obj]
+    return obj
+
+def fingerprint(parts: List, config: Optional[Dict] = None, upstream: str = "") -> str:
+    """Hash of stage functions/prompt constants, config and the upstream fingerprint"""
+    payload = json.dumps({"parts": _canonical(parts), "config": _canonical(config or {}), "upstream": upstream},
+                         sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()[:16]
+
+def chain_fingerprints(stage_inputs: List[Tuple[str, List, Dict]]) -> Dict[str, str]:
+    """(stage name, parts, config) in funnel order → {stage name: fingerprint}, each chained to the previous"""
+    fingerprints, upstream = {}, ""
+    for stage_name, parts, config in stage_inputs:
+        upstream = fingerprint(parts, config, upstream)
+        fingerprints[stage_name] = upstream
+    return fingerprints
+
+def stamp(idea: Dict, stage_name: str, stage_fingerprint: Optional[str]):
+    if stage_fingerprint:
+        idea.setdefault(FINGERPRINT_KEY, {})[stage_name] = stage_fingerprint
+
+# ═══════════════════════════════════════════════════════════
+# INVALIDATION
+# ═══════════════════════════════════════════════════════════
+
+def first_stale_stage(idea: Dict, stages: List[Tuple[str, str]], fingerprints: Dict[str, str],
+                      include_unstamped: bool = True) -> Optional[int]:
+    """
+    Index of the first stage whose stored result is stale, or None.
+    `stages` is (stage name, result key on the idea) in funnel order; only
+    stages the idea has a result for are checked.
+    """
+    stamps = idea.get(FINGERPRINT_KEY, {})
+    for index, (stage_name, result_key) in enumerate(stages):
+        if result_key not in idea:
+            return None
+        stored = stamps.get(stage_name)
+        if stored is None and not include_unstamped:
+            continue
+        if stored != fingerprints.get(stage_name):
+            return index
+    return None
+
+def invalidate_from(idea: Dict, stages: List[Tuple[str, str]], index: int):
+    """Drop the results and stamps of stages[index:] so they are re-run from scratch"""
+    stamps = idea.get(FINGERPRINT_KEY, {})
+    for stage_name, result_key in stages[index:]:
+        idea.pop(result_key, None)
+        stamps.pop(stage_name, None)
+    idea.pop("kill_reason", None)
+
+def stale_counts(ideas: List[Dict], stages: List[Tuple[str, str]], fingerprints: Dict[str, str]) -> Dict[str, Dict[str, int]]:
+    """Per stage: results that are current, stale (fingerprint changed) or unstamped"""
+    counts = {name: {"current": 0, "stale": 0, "unstamped": 0} for name, _ in stages}
+    for idea in ideas:
+        stamps = idea.get(FINGERPRINT_KEY, {})
+        for stage_name, result_key in stages:
+            if result_key not in idea:
+                break
+            stored = stamps.get(stage_name)
+            state = "unstamped" if stored is None else "current" if stored == fingerprints[stage_name] else "stale"
+            counts[stage_name][state] += 1
+    return counts
+
+def adopt_unstamped(ideas: List[Dict], stages: List[Tuple[str, str]], fingerprints: Dict[str, str]) -> int:
+    """Stamp pre-fingerprint results with the current fingerprints; returns results stamped"""
+    adopted = 0
+    for idea in ideas:
+        stamps = idea.get(FINGERPRINT_KEY, {})
+        for stage_name, result_key in stages:
+            if result_key not in idea:
+                break
+            if stage_name not in stamps:
+                stamp(idea, stage_name, fingerprints[stage_name])
+                stamps = idea[FINGERPRINT_KEY]
+                adopted += 1
+    return adopted
+
+# ═══════════════════════════════════════════════════════════
+# MAIN
+# ═══════════════════════════════════════════════════════════
+
+def main():
+    parser = argparse.ArgumentParser(description="Stale stage results in the v6.0 ideas bank")
+    parser.add_argument("--adopt", action="store_true",
+                        help="Stamp unstamped results with the current fingerprints instead of recomputing them")
+    args = parser.parse_args()
+
+    from pipeline_versions import load_pipeline
+
+    pipeline = load_pipeline("v6.0")
+    ideas_bank = pipeline.load_ideas_bank()
+    fingerprints = pipeline.stage_fingerprints(pipeline.load_founder_profile())
+    stages = pipeline.fingerprinted_stages()
+
+    print("="*80)
+    print("🧬 STAGE FINGERPRINTS - v6.0")
+    print("="*80)
+    for stage_name, counts in stale_counts(ideas_bank, stages, fingerprints).items():
+        print(f"   {stage_name:<22} {fingerprints[stage_name]} | ✅ {counts['current']:>4} current | "
+              f"♻️  {counts['stale']:>4} stale | ❔ {counts['unstamped']:>4} unstamped")
+
+    if args.adopt:
+        adopted = adopt_unstamped(ideas_bank, stages, fingerprints)
+        pipeline.save_ideas_bank(ideas_bank)
+        print(f"\n✅ Stamped {adopted} unstamped result(s) as current")
+    else:
+        print("\nRe-run stale and unstamped results: python ultimate_winner_machine_v6.0.py --recompute")
+
+if __name__ == "__main__":
+    main()
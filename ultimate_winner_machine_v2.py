@@ -15,22 +15,29 @@ One unified system to find TRUE business opportunities with PROVEN gaps
 Expected: 100 ideas → 0-1 TRUE WINNER (or honest ZERO)
 """
 
-import os
-import sys
 import time
 import argparse
 from datetime import datetime
-from openai import OpenAI
 from dotenv import load_dotenv
 
+from providers import lazy_client
+from provider_client import ProviderError, with_retries, call_or_none
+from retry_queue import defer_idea, idea_key, pending_deferred, resolve_deferred, retire_exhausted
+
 load_dotenv()
 
-OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
-if not OPENAI_API_KEY:
-    print("❌ No OPENAI_API_KEY in .env")
-    sys.exit(1)
+client = lazy_client("openai")  # built on first call (providers.py); exits there without OPENAI_API_KEY
+
+PIPELINE_VERSION = "v2.0"
 
-client = OpenAI(api_key=OPENAI_API_KEY)
+# Filter stages that can defer an idea, by the stage number it resumes at (--resume-deferred)
+RESUME_STAGES = {
+    "Stage 1: Growth & Feasibility": 1,
+    "Stage 2: Budget": 2,
+    "Stage 3: Urgency": 3,
+    "Stage 4: Gap Proof": 4,
+    "Stage 6: Founder Check": 6,
+}
 
 # Excluded industries (licensing/regulatory hell)
 EXCLUDED_INDUSTRIES = [
@@ -48,21 +55,26 @@ EXCLUDED_INDUSTRIES = [
 ]
 
 def call_openai(prompt, system_message="You are a business research expert.", model="gpt-4o", temperature=0.7):
-    """Call OpenAI API with rate limiting"""
+    """Call OpenAI API with rate limiting (raises ProviderError after retries)"""
     time.sleep(1)  # Rate limiting
+    response = with_retries("openai", lambda: client.chat.completions.create(
+        model=model,
+        messages=[
+            {"role": "system", "content": system_message},
+            {"role": "user", "content": prompt}
+        ],
+        temperature=temperature,
+        max_tokens=4000
+    ))
+    return response.choices[0].message.content
+
+def defer_on_api_error(idea, stage_name, prompt, **kwargs):
+    """call_openai for a filter stage; on API failure the idea is queued, not killed (returns None)"""
     try:
-        response = client.chat.completions.create(
-            model=model,
-            messages=[
-                {"role": "system", "content": system_message},
-                {"role": "user", "content": prompt}
-            ],
-            temperature=temperature,
-            max_tokens=4000
-        )
-        return response.choices[0].message.content
-    except Exception as e:
-        print(f"   ⚠️  API Error: {str(e)}")
+        return call_openai(prompt, **kwargs)
+    except ProviderError as e:
+        entry = defer_idea(idea, stage_name, e, PIPELINE_VERSION)
+        print(f"   ⏸️  DEFERRED: {e} (attempt {entry['attempts']}, see deferred_ideas.json)")
         return None
 
 # ============================================================================
@@ -143,7 +155,7 @@ Business Type (specific industry), Specific Operational Problem
 
     print(f"Generating {count} pre-filtered ideas...", flush=True)
 
-    result = call_openai(prompt, temperature=0.9)
+    result = call_or_none(call_openai, prompt, temperature=0.9)
 
     if not result:
         print("❌ Failed to generate ideas")
@@ -232,10 +244,9 @@ PUBLIC_API: [YES/NO] - [brief reason]
 VERDICT: [PASS/KILL] - [reason if KILL]
 """
 
-        result = call_openai(prompt, temperature=0.3)
+        result = defer_on_api_error(idea, "Stage 1: Growth & Feasibility", prompt, temperature=0.3)
 
         if not result:
-            killed.append({**idea, "kill_reason": "API error (Stage 1)"})
             continue
 
         # Parse result
@@ -323,10 +334,9 @@ PROOF_OF_USE: [YES/NO] - [evidence with source]
 VERDICT: [PASS/KILL] - [reason]
 """
 
-        result = call_openai(prompt, temperature=0.3)
+        result = defer_on_api_error(idea, "Stage 2: Budget", prompt, temperature=0.3)
 
         if not result:
-            killed.append({**idea, "kill_reason": "API error (Stage 2)"})
             continue
 
         result_lower = result.lower()
@@ -417,10 +427,9 @@ VERDICT: [PASS/KILL] - [reason]
 PASS only if: 10+ complaints (2024-2025), pain score 8+/10, urgency drivers present
 """
 
-        result = call_openai(prompt, temperature=0.3)
+        result = defer_on_api_error(idea, "Stage 3: Urgency", prompt, temperature=0.3)
 
         if not result:
-            killed.append({**idea, "kill_reason": "API error (Stage 3)"})
             continue
 
         result_lower = result.lower()
@@ -565,10 +574,9 @@ VERDICT: [PASS/KILL] - [Reason]
 PASS only if ALL 4 proven: 10+ weaknesses, 5+ demand signals, moat possible, "why now" exists
 """
 
-        result = call_openai(prompt, temperature=0.3, model="gpt-4o")
+        result = defer_on_api_error(idea, "Stage 4: Gap Proof", prompt, temperature=0.3, model="gpt-4o")
 
         if not result:
-            killed.append({**idea, "kill_reason": "API error (Stage 4)"})
             continue
 
         result_lower = result.lower()
@@ -675,7 +683,7 @@ List 3 experiments with:
 Use this format exactly. Include sources/citations.
 """
 
-        researcher_result = call_openai(researcher_prompt, temperature=0.5, model="gpt-4o")
+        researcher_result = call_or_none(call_openai, researcher_prompt, temperature=0.5, model="gpt-4o")
 
         # Part 2: The Strategist
         strategist_prompt = f"""Complete STRATEGIST analysis for this opportunity:
@@ -726,7 +734,7 @@ Content → Lead Magnet → Offer
 [Map out the flow solving the same pain throughout]
 """
 
-        strategist_result = call_openai(strategist_prompt, temperature=0.6, model="gpt-4o")
+        strategist_result = call_or_none(call_openai, strategist_prompt, temperature=0.6, model="gpt-4o")
 
         # Part 3: The Attack Plan
         attack_prompt = f"""Create THE ATTACK PLAN for stealing customers from competitors:
@@ -770,7 +778,7 @@ Week 1-2 action plan:
 - Expected response rate: [X%]
 """
 
-        attack_result = call_openai(attack_prompt, temperature=0.6, model="gpt-4o")
+        attack_result = call_or_none(call_openai, attack_prompt, temperature=0.6, model="gpt-4o")
 
         # Final Assessment
         assessment_prompt = f"""Final assessment of this opportunity:
@@ -800,7 +808,7 @@ VERDICT: BUILD / PIVOT / KILL
 - Next immediate action: [What to do first]
 """
 
-        assessment_result = call_openai(assessment_prompt, temperature=0.5, model="gpt-4o")
+        assessment_result = call_or_none(call_openai, assessment_prompt, temperature=0.5, model="gpt-4o")
 
         # Compile full report
         full_report = f"""# ULTIMATE WINNER REPORT
@@ -966,10 +974,9 @@ FINAL VERDICT: [PASS/KILL] - [reason]
 PASS only if ALL 4 are YES.
 """
 
-        result = call_openai(prompt, temperature=0.3, model="gpt-4o")
+        result = defer_on_api_error(winner, "Stage 6: Founder Check", prompt, temperature=0.3, model="gpt-4o")
 
         if not result:
-            final_kills.append({**winner, "final_kill_reason": "API error"})
             continue
 
         result_lower = result.lower()
@@ -1007,6 +1014,29 @@ PASS only if ALL 4 are YES.
 
     return true_winners, final_kills
 
+# ============================================================================
+# DEFERRED IDEAS
+# ============================================================================
+
+def load_resume_entries():
+    """Deferred v2.0 ideas grouped by the stage number they resume at"""
+    retire_exhausted(PIPELINE_VERSION)  # v2.0 keeps no bank, so giving up is only reported
+    entries = {}
+    for entry in pending_deferred(PIPELINE_VERSION):
+        stage = RESUME_STAGES.get(entry["stage"], 1)
+        entries.setdefault(stage, []).append(entry["idea"])
+        print(f"   ↩️  {entry['idea'].get('business', '')[:50]} resumes at {entry['stage']} "
+              f"(deferred {entry['attempts']}x: {entry['error'][:60]})")
+    return entries
+
+def resolve_verdicts(*groups):
+    """Ideas that reached a verdict leave the deferred queue"""
+    resolve_deferred([idea_key(idea) for group in groups for idea in group], PIPELINE_VERSION)
+
+def waiting_after(resumed, stage):
+    """Deferred ideas still to rejoin after `stage` (a stage with no survivors doesn't end the run)"""
+    return any(ideas for number, ideas in resumed.items() if number > stage)
+
 # ============================================================================
 # MAIN ORCHESTRATOR
 # ============================================================================
@@ -1017,6 +1047,8 @@ def main():
     parser.add_argument('--mode', type=str, default='full',
                        choices=['full', 'stage0', 'stage1', 'stage2', 'stage3', 'stage4', 'stage5', 'stage6'],
                        help='Which stage to run')
+    parser.add_argument('--resume-deferred', action='store_true',
+                       help='Skip Stage 0 and re-run ideas parked in deferred_ideas.json from the stage that failed')
 
     args = parser.parse_args()
 
@@ -1042,21 +1074,31 @@ def main():
 ╚══════════════════════════════════════════════════════════════════╝
     """)
 
-    # Stage 0: Generate ideas
-    ideas = stage0_generate_ideas(args.count)
+    resumed = {}
+    if args.resume_deferred:
+        print(f"\n⏩ Resuming deferred ideas (skipping Stage 0)")
+        resumed = load_resume_entries()
+        if not resumed:
+            print("\n✅ No deferred ideas to resume.")
+            return
+        ideas = []
+    else:
+        # Stage 0: Generate ideas
+        ideas = stage0_generate_ideas(args.count)
 
-    if not ideas:
-        print("\n❌ No ideas generated. Exiting.")
-        return
+        if not ideas:
+            print("\n❌ No ideas generated. Exiting.")
+            return
 
-    if args.mode == 'stage0':
-        print(f"\n✅ Generated {len(ideas)} ideas. Stopping at Stage 0.")
-        return
+        if args.mode == 'stage0':
+            print(f"\n✅ Generated {len(ideas)} ideas. Stopping at Stage 0.")
+            return
 
     # Stage 1: Growth & Feasibility
-    survivors, _ = stage1_growth_feasibility(ideas)
+    survivors, killed = stage1_growth_feasibility(ideas + resumed.get(1, []))
+    resolve_verdicts(survivors, killed)
 
-    if not survivors:
+    if not survivors and not waiting_after(resumed, 1):
         print(f"\n⚠️  ALL {len(ideas)} IDEAS KILLED IN STAGE 1")
         print(f"\nThis is honest - no opportunities met the growth/feasibility criteria.")
         print(f"\nTry: Different industries or broader pain points")
@@ -1067,9 +1109,10 @@ def main():
         return
 
     # Stage 2: Budget Check
-    survivors, _ = stage2_budget_check(survivors)
+    survivors, killed = stage2_budget_check(survivors + resumed.get(2, []))
+    resolve_verdicts(survivors, killed)
 
-    if not survivors:
+    if not survivors and not waiting_after(resumed, 2):
         print(f"\n⚠️  ALL IDEAS KILLED BY STAGE 2")
         print(f"\nCould not prove businesses spend $10k+/year on solutions.")
         return
@@ -1079,9 +1122,10 @@ def main():
         return
 
     # Stage 3: Urgency Validation
-    survivors, _ = stage3_urgency_validation(survivors)
+    survivors, killed = stage3_urgency_validation(survivors + resumed.get(3, []))
+    resolve_verdicts(survivors, killed)
 
-    if not survivors:
+    if not survivors and not waiting_after(resumed, 3):
         print(f"\n⚠️  ALL IDEAS KILLED BY STAGE 3")
         print(f"\nCould not find 10+ complaints showing urgent pain.")
         return
@@ -1091,9 +1135,10 @@ def main():
         return
 
     # Stage 4: Gap Proof (THE CRITICAL FILTER)
-    survivors, _ = stage4_gap_proof(survivors)
+    survivors, killed = stage4_gap_proof(survivors + resumed.get(4, []))
+    resolve_verdicts(survivors, killed)
 
-    if not survivors:
+    if not survivors and not waiting_after(resumed, 4):
         print(f"\n⚠️  ALL IDEAS KILLED BY STAGE 4 (GAP PROOF)")
         print(f"\nCould not prove attackable gaps exist in the market.")
         print(f"\nThis is GOOD - you avoided building in saturated markets.")
@@ -1111,7 +1156,8 @@ def main():
         return
 
     # Stage 6: Founder Reality Check
-    true_winners, _ = stage6_founder_check(winners)
+    true_winners, final_kills = stage6_founder_check(winners + resumed.get(6, []))
+    resolve_verdicts(true_winners, final_kills)
 
     # Final output
     print(f"\n{'='*70}")
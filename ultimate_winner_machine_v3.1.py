@@ -19,24 +19,19 @@ Cost: ~$6 for 100 ideas (75% cheaper than v3.0)
 """
 
 import os
-import sys
 import time
-import json
 import hashlib
 import argparse
-import requests
 from datetime import datetime
-from openai import OpenAI
 from dotenv import load_dotenv
 
-load_dotenv()
+from providers import lazy_client, lazy_module
+from ideas_journal import open_journal
 
-OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
-if not OPENAI_API_KEY:
-    print("❌ No OPENAI_API_KEY in .env")
-    sys.exit(1)
+load_dotenv()
 
-client = OpenAI(api_key=OPENAI_API_KEY)
+client = lazy_client("openai")  # built on first call (providers.py); exits there without OPENAI_API_KEY
+requests = lazy_module("requests")  # imported on the first search call
 
 # Excluded industries (licensing/regulatory hell)
 EXCLUDED_INDUSTRIES = [
@@ -147,20 +142,12 @@ def idea_hash(business, pain):
     return hashlib.md5(text.encode()).hexdigest()[:12]
 
 def load_ideas_bank():
-    """Load or create ideas bank"""
-    if os.path.exists(IDEAS_BANK_FILE):
-        with open(IDEAS_BANK_FILE, 'r') as f:
-            return json.load(f)
-    else:
-        return {
-            "run_history": [],
-            "ideas": []
-        }
+    """Load ideas bank (snapshot + journal, see ideas_journal.py) in the v3.1 {"ideas": [...]} shape"""
+    return {"ideas": open_journal(IDEAS_BANK_FILE).load()}
 
 def save_ideas_bank(bank):
-    """Save ideas bank"""
-    with open(IDEAS_BANK_FILE, 'w') as f:
-        json.dump(bank, f, indent=2)
+    """Append what changed since the last save to the ideas journal"""
+    open_journal(IDEAS_BANK_FILE).save(bank["ideas"])
 
 def get_existing_hashes(bank):
     """Get all existing idea hashes"""
@@ -24,24 +24,19 @@ Time: ~2-3 hours
 """
 
 import os
-import sys
 import time
-import json
 import hashlib
 import argparse
-import requests
 from datetime import datetime
-from openai import OpenAI
 from dotenv import load_dotenv
 
-load_dotenv()
+from ideas_journal import open_journal
+from providers import lazy_client, lazy_module
 
-OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
-if not OPENAI_API_KEY:
-    print("❌ No OPENAI_API_KEY in .env")
-    sys.exit(1)
+load_dotenv()
 
-client = OpenAI(api_key=OPENAI_API_KEY)
+client = lazy_client("openai")  # built on first call (providers.py); exits there without OPENAI_API_KEY
+requests = lazy_module("requests")  # imported on the first search call
 
 # Excluded industries (licensing/regulatory hell OR saturated enterprise markets)
 EXCLUDED_INDUSTRIES = [
@@ -211,17 +206,12 @@ def generate_idea_hash(business, pain):
     return hashlib.md5(combined.encode()).hexdigest()[:12]
 
 def load_ideas_bank():
-    """Load existing ideas bank or create new one"""
-    if os.path.exists(IDEAS_BANK_FILE):
-        with open(IDEAS_BANK_FILE, 'r') as f:
-            data = json.load(f)
-            return data if isinstance(data, list) else data.get("ideas", [])
-    return []
+    """Load existing ideas bank (snapshot + journal, see ideas_journal.py)"""
+    return open_journal(IDEAS_BANK_FILE).load()
 
 def save_ideas_bank(ideas):
-    """Save ideas bank to file"""
-    with open(IDEAS_BANK_FILE, 'w') as f:
-        json.dump({"ideas": ideas}, f, indent=2)
+    """Append what changed since the last save to the ideas journal"""
+    open_journal(IDEAS_BANK_FILE).save(ideas)
 
 def idea_exists(ideas_bank, business, pain):
     """Check if idea already exists in bank"""
@@ -91,21 +91,27 @@ THIS IS A RESEARCH ASSISTANT THAT FINDS CANDIDATES, NOT A MAGIC ORACLE.
 """
 
 import os
-import sys
 import time
 import json
 import hashlib
 import argparse
-import requests
 import asyncio
-import aiohttp
 from datetime import datetime
-from openai import OpenAI
-from anthropic import Anthropic
 from dotenv import load_dotenv
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 import re
-from bs4 import BeautifulSoup
+
+from provider_client import (
+    ProviderError, PermanentAPIError, TransientAPIError, with_retries, call_or_none,
+    coalesce, set_dedup_scope, dedup_summary_lines, async_with_retries, async_coalesce
+)
+from async_provider import AsyncProviderClient
+from ideas_journal import open_journal
+from providers import lazy_client, lazy_module
+from retry_queue import defer_idea, pending_deferred, resolve_deferred, retire_exhausted
+from concurrency_controller import concurrency_summary_lines, save_state as save_concurrency_state
+from kill_predictor import screen_ideas, update_predictor
+from signals_store import sync_signals
 
 load_dotenv()
 
@@ -120,16 +126,20 @@ SERPAPI_KEY = os.getenv("SERPAPI_KEY")
 GOOGLE_API_KEY = os.getenv("GOOGLE_API_KEY")
 GOOGLE_CSE_ID = os.getenv("GOOGLE_CSE_ID")
 
-if not OPENAI_API_KEY:
-    print("❌ Missing OPENAI_API_KEY in .env")
-    sys.exit(1)
-
-openai_client = OpenAI(api_key=OPENAI_API_KEY)
-anthropic_client = Anthropic(api_key=ANTHROPIC_API_KEY) if ANTHROPIC_API_KEY else None
-perplexity_client = OpenAI(api_key=PERPLEXITY_API_KEY, base_url="https://api.perplexity.ai") if PERPLEXITY_API_KEY else None
+# Built on first use (providers.py); a missing OPENAI_API_KEY exits at the first OpenAI call.
+# anthropic_client / perplexity_client are falsy when their key isn't set.
+openai_client = lazy_client("openai")
+anthropic_client = lazy_client("anthropic")
+perplexity_client = lazy_client("perplexity")
+requests = lazy_module("requests")
 
 IDEAS_BANK_FILE = "ideas_bank.json"
 FOUNDER_PROFILE_FILE = "founder_profile.json"
+PIPELINE_VERSION = "v5.0"
+
+# Stage names as run_stage_batch records them (deferred_ideas.json "stage")
+V5_STAGES = ["Stage 1: White Space", "Stage 2: Evidence", "Stage 3: Build",
+             "Stage 4: Cost", "Stage 5: GTM", "Stage 6: Founder Fit"]
 
 # Excluded industries (same as v4.0)
 EXCLUDED_INDUSTRIES = [
@@ -165,51 +175,52 @@ DOMINANT_PLAYERS = [
 
 def call_openai(prompt: str, system_message: str = "You are a business research expert.",
                 model: str = "gpt-5-mini", response_format: str = None) -> str:
-    """Call OpenAI API with rate limiting"""
-    time.sleep(1)
-    try:
-        params = {
-            "model": model,
-            "messages": [
-                {"role": "system", "content": system_message},
-                {"role": "user", "content": prompt}
-            ]
-        }
+    """Call OpenAI API with rate limiting (raises ProviderError on failure)"""
+    params = {
+        "model": model,
+        "messages": [
+            {"role": "system", "content": system_message},
+            {"role": "user", "content": prompt}
+        ]
+    }
+
+    if "gpt-5" in model.lower() or "o1" in model.lower():
+        params["max_completion_tokens"] = 4000
+    else:
+        params["max_tokens"] = 4000
+        params["temperature"] = 0.7
 
-        if "gpt-5" in model.lower() or "o1" in model.lower():
-            params["max_completion_tokens"] = 4000
-        else:
-            params["max_tokens"] = 4000
-            params["temperature"] = 0.7
+    if response_format == "json":
+        params["response_format"] = {"type": "json_object"}
 
-        if response_format == "json":
-            params["response_format"] = {"type": "json_object"}
+    def request():
+        time.sleep(1)
+        return with_retries("openai", lambda: openai_client.chat.completions.create(**params),
+                            model=params["model"])
 
-        response = openai_client.chat.completions.create(**params)
-        return response.choices[0].message.content
-    except Exception as e:
-        print(f"      ⚠️  OpenAI API error: {str(e)}")
-        return None
+    response = coalesce("openai", params, request)
+    return response.choices[0].message.content
 
 def call_claude(prompt: str, system_message: str = "You are a business research expert.",
                 model: str = "claude-3-5-sonnet-20241022") -> str:
-    """Call Claude API"""
+    """Call Claude API (raises ProviderError on failure)"""
     if not anthropic_client:
-        print("      ⚠️  Claude API not configured")
-        return None
+        raise PermanentAPIError("anthropic", "Claude API not configured (set ANTHROPIC_API_KEY)")
 
-    time.sleep(1)
-    try:
-        response = anthropic_client.messages.create(
-            model=model,
-            max_tokens=4000,
-            system=system_message,
-            messages=[{"role": "user", "content": prompt}]
-        )
-        return response.content[0].text
-    except Exception as e:
-        print(f"      ⚠️  Claude API error: {str(e)}")
-        return None
+    params = {
+        "model": model,
+        "max_tokens": 4000,
+        "system": system_message,
+        "messages": [{"role": "user", "content": prompt}]
+    }
+
+    def request():
+        time.sleep(1)
+        return with_retries("anthropic", lambda: anthropic_client.messages.create(**params),
+                            model=params["model"])
+
+    response = coalesce("anthropic", params, request)
+    return response.content[0].text
 
 def call_perplexity(prompt: str) -> str:
     """Call Perplexity API for web research"""
@@ -217,15 +228,21 @@ def call_perplexity(prompt: str) -> str:
         print("      ⚠️  Perplexity API not configured - using Google instead")
         return web_search(prompt)
 
-    time.sleep(1)
+    params = {
+        "model": "sonar",  # Updated to current model name (Feb 2025)
+        "messages": [{"role": "user", "content": prompt}]
+    }
+
+    def request():
+        time.sleep(1)
+        return with_retries("perplexity", lambda: perplexity_client.chat.completions.create(**params),
+                            model=params["model"])
+
     try:
-        response = perplexity_client.chat.completions.create(
-            model="sonar",  # Updated to current model name (Feb 2025)
-            messages=[{"role": "user", "content": prompt}]
-        )
+        response = coalesce("perplexity", params, request)
         return response.choices[0].message.content
-    except Exception as e:
-        print(f"      ⚠️  Perplexity API error: {str(e)}")
+    except ProviderError as e:
+        print(f"      ⚠️  Perplexity API error: {str(e)} - using Google instead")
         return web_search(prompt)
 
 def web_search(query: str, num_results: int = 10) -> str:
@@ -233,6 +250,9 @@ def web_search(query: str, num_results: int = 10) -> str:
     if not GOOGLE_API_KEY or not GOOGLE_CSE_ID:
         return "[Google Search not configured]"
 
+    return coalesce("google", {"q": query, "num": num_results}, lambda: _google_search(query, num_results))
+
+def _google_search(query: str, num_results: int) -> str:
     time.sleep(1)
     try:
         url = "https://www.googleapis.com/customsearch/v1"
@@ -245,25 +265,92 @@ def web_search(query: str, num_results: int = 10) -> str:
         response = requests.get(url, params=params, timeout=30)
 
         if response.status_code == 200:
-            data = response.json()
-            items = data.get("items", [])
-
-            if not items:
-                return f"[No results found for: {query}]"
-
-            results = []
-            for i, item in enumerate(items[:num_results], 1):
-                title = item.get("title", "No title")
-                snippet = item.get("snippet", "No description")
-                link = item.get("link", "")
-                results.append(f"{i}. {title}\n   {snippet}\n   {link}\n")
-
-            return "\n".join(results)
+            return format_search_results(response.json(), query, num_results)
         else:
             return f"[ERROR: Google Search returned {response.status_code}]"
     except Exception as e:
         return f"[ERROR: {str(e)}]"
 
+def format_search_results(data: Dict, query: str, num_results: int) -> str:
+    items = data.get("items", [])
+
+    if not items:
+        return f"[No results found for: {query}]"
+
+    results = []
+    for i, item in enumerate(items[:num_results], 1):
+        title = item.get("title", "No title")
+        snippet = item.get("snippet", "No description")
+        link = item.get("link", "")
+        results.append(f"{i}. {title}\n   {snippet}\n   {link}\n")
+
+    return "\n".join(results)
+
+# ═══════════════════════════════════════════════════════════
+# ASYNC API CALL FUNCTIONS (Stages 1-6)
+# ═══════════════════════════════════════════════════════════
+
+# Opened by run_funnel() for the lifetime of the event loop
+async_client: AsyncProviderClient = None
+
+async def acall_openai(prompt: str, system_message: str = "You are a business research expert.",
+                       model: str = "gpt-5-mini", response_format: str = None) -> str:
+    """Async call_openai over the shared aiohttp session (raises ProviderError on failure)"""
+    params = {
+        "model": model,
+        "messages": [
+            {"role": "system", "content": system_message},
+            {"role": "user", "content": prompt}
+        ]
+    }
+
+    if "gpt-5" in model.lower() or "o1" in model.lower():
+        params["max_completion_tokens"] = 4000
+    else:
+        params["max_tokens"] = 4000
+        params["temperature"] = 0.7
+
+    if response_format == "json":
+        params["response_format"] = {"type": "json_object"}
+
+    data = await async_coalesce("openai", params, lambda: async_with_retries(
+        "openai", lambda: async_client.openai_chat(params), model=model))
+    return data["choices"][0]["message"]["content"]
+
+async def acall_perplexity(prompt: str) -> str:
+    """Async call_perplexity, same Google fallback"""
+    if not PERPLEXITY_API_KEY:
+        print("      ⚠️  Perplexity API not configured - using Google instead")
+        return await aweb_search(prompt)
+
+    params = {
+        "model": "sonar",
+        "messages": [{"role": "user", "content": prompt}]
+    }
+
+    try:
+        data = await async_coalesce("perplexity", params, lambda: async_with_retries(
+            "perplexity", lambda: async_client.perplexity_chat(params), model=params["model"]))
+        return data["choices"][0]["message"]["content"]
+    except ProviderError as e:
+        print(f"      ⚠️  Perplexity API error: {str(e)} - using Google instead")
+        return await aweb_search(prompt)
+
+async def aweb_search(query: str, num_results: int = 10) -> str:
+    """Async Google Custom Search fallback"""
+    if not GOOGLE_API_KEY or not GOOGLE_CSE_ID:
+        return "[Google Search not configured]"
+
+    params = {"key": GOOGLE_API_KEY, "cx": GOOGLE_CSE_ID, "q": query, "num": num_results}
+
+    async def search():
+        try:
+            return format_search_results(await async_client.google_search(params), query, num_results)
+        except Exception as e:
+            return f"[ERROR: {str(e)}]"
+
+    return await async_coalesce("google", {"q": query, "num": num_results}, search)
+
 def serpapi_search_volume(keyword: str) -> int:
     """Get search volume from SerpAPI (requires API key)"""
     if not SERPAPI_KEY:
@@ -291,17 +378,12 @@ def generate_idea_hash(business: str, pain: str) -> str:
     return hashlib.md5(combined.encode()).hexdigest()[:12]
 
 def load_ideas_bank() -> List[Dict]:
-    """Load existing ideas bank"""
-    if os.path.exists(IDEAS_BANK_FILE):
-        with open(IDEAS_BANK_FILE, 'r') as f:
-            data = json.load(f)
-            return data.get("ideas", []) if isinstance(data, dict) else data
-    return []
+    """Load existing ideas bank (snapshot + journal, see ideas_journal.py)"""
+    return open_journal(IDEAS_BANK_FILE).load()
 
 def save_ideas_bank(ideas: List[Dict]):
-    """Save ideas bank"""
-    with open(IDEAS_BANK_FILE, 'w') as f:
-        json.dump({"ideas": ideas}, f, indent=2)
+    """Append what changed since the last save to the ideas journal"""
+    open_journal(IDEAS_BANK_FILE).save(ideas)
 
 def idea_exists(ideas_bank: List[Dict], business: str, pain: str) -> bool:
     """Check if idea already exists"""
@@ -451,7 +533,7 @@ Format:
 """
 
     print("\n🤖 Analyzing patterns with gpt-4o (this takes ~1-2 minutes)...")
-    response = call_openai(prompt, model="gpt-4o", response_format="json")
+    response = call_or_none(call_openai, prompt, model="gpt-4o", response_format="json")
 
     if not response:
         print("❌ Pattern analysis failed")
@@ -514,7 +596,7 @@ Return as JSON:
 }}
 """
 
-        response = call_claude(prompt, model="claude-3-5-sonnet-20241022")
+        response = call_or_none(call_claude, prompt, model="claude-3-5-sonnet-20241022")
         if not response:
             continue
 
@@ -623,7 +705,7 @@ Current Solution: [What they use now]
 
 Generate {count} ideas:"""
 
-    response = call_claude(prompt)
+    response = call_or_none(call_claude, prompt)
     if not response:
         return []
 
@@ -674,20 +756,8 @@ Generate {count} ideas:"""
 # STAGE 1: WHITE SPACE + SWITCHING COST CHECK
 # ═══════════════════════════════════════════════════════════
 
-async def stage1_whitespace_check(idea: Dict) -> Dict:
-    """Enhanced white space check with switching cost analysis"""
-    print(f"\n{'─'*60}")
-    print(f"STAGE 1: WHITE SPACE + SWITCHING COST - Idea #{idea['id']}")
-    print(f"Business: {idea['business']}")
-    print(f"Pain: {idea['pain'][:80]}...")
-    print(f"{'─'*60}")
-
-    prompt = f"""White space and switching cost analysis:
-
-Business: {idea['business']}
-Pain: {idea['pain']}
-
-TASK 1: Dominant Player Check
+# Shared between the single-idea prompt and batched_stages.py
+STAGE1_TASKS = f"""TASK 1: Dominant Player Check
 Is this pain solved by: {', '.join(DOMINANT_PLAYERS[:10])}?
 If YES → KILL (can't compete with Salesforce/HubSpot)
 
@@ -704,11 +774,9 @@ If adjacent platform exists:
 TASK 4: Data Migration Burden
 If they need to switch:
 - <1 day migration → LOW switching cost → PASS
-- >1 week migration → HIGH switching cost → KILL
+- >1 week migration → HIGH switching cost → KILL"""
 
-Return JSON:
-{{
-  "dominant_player": "ServiceTitan" or null,
+STAGE1_FIELDS = """  "dominant_player": "ServiceTitan" or null,
   "adjacent_platform": "ServiceTitan" or null,
   "adjacent_market_share": "60%" or null,
   "standalone_viable": true/false,
@@ -716,23 +784,45 @@ Return JSON:
   "market_type": "WHITE_SPACE"/"FRAGMENTED"/"SATURATED"/"MONOPOLY",
   "decision": "PASS"/"KILL",
   "reasoning": "..."
-}}
 """
 
-    response = call_openai(prompt, model="gpt-5-mini", response_format="json")
+def evaluate_stage1(data: Dict) -> Dict:
+    """Stage 1 verdict from the model's JSON"""
+    decision = data.get("decision", "KILL")
+
+    if decision == "PASS":
+        print(f"\n✅ PASS - {data.get('market_type')} market, {data.get('switching_cost')} switching cost")
+        return {"verdict": "PASS", "analysis": data}
+    else:
+        print(f"\n❌ KILL - {data.get('reasoning', 'Failed checks')}")
+        return {"verdict": "KILL", "analysis": data}
+
+async def stage1_whitespace_check(idea: Dict) -> Dict:
+    """Enhanced white space check with switching cost analysis"""
+    print(f"\n{'─'*60}")
+    print(f"STAGE 1: WHITE SPACE + SWITCHING COST - Idea #{idea['id']}")
+    print(f"Business: {idea['business']}")
+    print(f"Pain: {idea['pain'][:80]}...")
+    print(f"{'─'*60}")
+
+    prompt = f"""White space and switching cost analysis:
+
+Business: {idea['business']}
+Pain: {idea['pain']}
+
+{STAGE1_TASKS}
+
+Return JSON:
+{{
+{STAGE1_FIELDS}}}
+"""
+
+    response = await acall_openai(prompt, model="gpt-5-mini", response_format="json")
     if not response:
-        return {"verdict": "KILL", "reason": "API Error"}
+        raise TransientAPIError("openai", "Empty response")
 
     try:
-        data = json.loads(response)
-        decision = data.get("decision", "KILL")
-
-        if decision == "PASS":
-            print(f"\n✅ PASS - {data.get('market_type')} market, {data.get('switching_cost')} switching cost")
-            return {"verdict": "PASS", "analysis": data}
-        else:
-            print(f"\n❌ KILL - {data.get('reasoning', 'Failed checks')}")
-            return {"verdict": "KILL", "analysis": data}
+        return evaluate_stage1(json.loads(response))
     except json.JSONDecodeError:
         return {"verdict": "KILL", "reason": "Parse error"}
 
@@ -749,6 +839,7 @@ try:
         stage6_founder_fit,
         stage7_validation_playbook
     )
+    from batched_stages import AsyncBatchedStage, stage_spec, STAGE3_BATCH_SPEC, stage6_batch_spec
 except ImportError:
     print("⚠️  Warning: v5_stages_2_through_7.py not found. Some stages will be skipped.")
     stage2_evidence_engine = None
@@ -757,8 +848,8 @@ except ImportError:
 # BATCH PROCESSING ORCHESTRATOR
 # ═══════════════════════════════════════════════════════════
 
-def run_stage_batch(ideas: List[Dict], stage_func, stage_name: str) -> tuple:
-    """Run a stage on all ideas, return (survivors, killed)"""
+async def run_stage_batch(ideas: List[Dict], stage_func, stage_name: str, workers: int = 5) -> tuple:
+    """Run a coroutine stage on all ideas (`workers` in flight), return (survivors, killed)"""
     print(f"\n{'='*80}")
     print(f"BATCH PROCESSING: {stage_name}")
     print(f"Processing {len(ideas)} ideas...")
@@ -767,9 +858,30 @@ def run_stage_batch(ideas: List[Dict], stage_func, stage_name: str) -> tuple:
     survivors = []
     killed = []
 
-    for i, idea in enumerate(ideas, 1):
-        print(f"\n[{i}/{len(ideas)}] Processing Idea #{idea['id']}")
-        result = stage_func(idea)
+    deferred = []
+    set_dedup_scope(stage_name)
+
+    semaphore = asyncio.Semaphore(max(1, workers))
+
+    async def run_one(i, idea):
+        async with semaphore:
+            print(f"\n[{i}/{len(ideas)}] Processing Idea #{idea['id']}")
+            try:
+                return idea, await stage_func(idea), None
+            except ProviderError as e:
+                return idea, None, e
+
+    # gather keeps input order, so verdicts are applied in the same order as before
+    outcomes = await asyncio.gather(*(run_one(i, idea) for i, idea in enumerate(ideas, 1)))
+
+    for idea, result, error in outcomes:
+        if error is not None:
+            # API failure is not a verdict - park the idea with its completed stages
+            idea["status"] = f"deferred_{stage_name.lower().replace(' ', '_')}"
+            entry = defer_idea(idea, stage_name, error, PIPELINE_VERSION)
+            print(f"   ⏸️  DEFERRED - {error} (attempt {entry['attempts']})")
+            deferred.append(idea)
+            continue
 
         if result.get("verdict") == "PASS":
             idea[f"{stage_name.lower().replace(' ', '_')}_result"] = result
@@ -785,10 +897,95 @@ def run_stage_batch(ideas: List[Dict], stage_func, stage_name: str) -> tuple:
     print(f"{stage_name} COMPLETE:")
     print(f"✅ {len(survivors)} passed")
     print(f"❌ {len(killed)} killed")
+    if deferred:
+        print(f"⏸️  {len(deferred)} deferred (API errors) - queued in deferred_ideas.json")
     print(f"{'='*80}")
 
     return survivors, killed
 
+async def run_funnel(entries: Dict[int, List[Dict]], founder_profile: Dict,
+                     batch_size: int = 0, workers: int = 5) -> Optional[List[Dict]]:
+    """
+    Stages 1-6 on one event loop with one aiohttp session. `entries` maps a
+    stage index (0 = Stage 1) to the ideas that start there: new ideas at 0,
+    resumed deferred ideas at the stage they were parked at. Returns the
+    finalists, or None when a stage leaves no survivors.
+    """
+    global async_client
+
+    # Binary filter stages: batched calls, single-idea fallback for anything missing/malformed
+    stage1 = stage1_whitespace_check
+    stage3 = lambda idea: stage3_build_feasibility(idea, acall_openai)
+    stage6 = lambda idea: stage6_founder_fit(idea, founder_profile, acall_openai)
+    if batch_size > 0:
+        stage1_spec = stage_spec("Stage 1: White Space", "White space and switching cost analysis for each idea below.",
+                                 STAGE1_TASKS, STAGE1_FIELDS, evaluate_stage1, output_tokens_per_idea=180)
+        stage1 = AsyncBatchedStage(stage1_spec, stage1, acall_openai, batch_size)
+        stage3 = AsyncBatchedStage(STAGE3_BATCH_SPEC, stage3, acall_openai, batch_size)
+        stage6 = AsyncBatchedStage(stage6_batch_spec(founder_profile), stage6, acall_openai, batch_size)
+
+    stage2 = None
+    if stage2_evidence_engine:
+        stage2 = lambda idea: stage2_evidence_engine(idea, acall_perplexity, aweb_search, acall_openai)
+
+    # (name, coroutine stage, message when nothing survives it)
+    stages = [
+        (V5_STAGES[0], stage1, "No ideas passed Stage 1. Try generating more ideas."),
+        (V5_STAGES[1], stage2, "No ideas passed Stage 2. Evidence too weak."),
+        (V5_STAGES[2], stage3, "No ideas passed Stage 3. All require hardware/certs."),
+        (V5_STAGES[3], lambda idea: stage4_cost_calculator(idea, acall_perplexity, acall_openai),
+         "No ideas passed Stage 4. Problem costs too low."),
+        (V5_STAGES[4], lambda idea: stage5_gtm_fit(idea, acall_openai),
+         "No ideas passed Stage 5. Can't acquire customers digitally."),
+        (V5_STAGES[5], stage6, None),
+    ]
+
+    survivors = []
+    async with AsyncProviderClient() as async_client:
+        for index, (stage_name, stage, empty_message) in enumerate(stages):
+            batch = survivors + entries.get(index, [])
+            if not batch:
+                continue  # resuming: nothing parked this early
+            if stage is None:
+                survivors = batch
+                continue
+            if batch_size > 0 and hasattr(stage, "prefetch"):
+                await stage.prefetch(batch)
+            survivors, _ = await run_stage_batch(batch, stage, stage_name, workers)
+
+            waiting = any(entries.get(later) for later in range(index + 1, len(stages)))
+            if not survivors and empty_message and not waiting:
+                print(f"\n⚠️  {empty_message}")
+                return None
+
+    return survivors
+
+def load_resume_entries(ideas_bank: List[Dict]) -> Dict[int, List[Dict]]:
+    """Deferred v5.0 ideas grouped by the stage index they resume at"""
+    bank_by_hash = {idea.get("hash"): idea for idea in ideas_bank}
+
+    # Deferred too often: deferred_<stage> becomes failed_<stage>
+    retired = retire_exhausted(PIPELINE_VERSION)
+    for entry in retired:
+        idea = bank_by_hash.get(entry["hash"])
+        if idea is not None and idea.get("status", "").startswith("deferred_"):
+            idea["status"] = "failed_" + idea["status"][len("deferred_"):]
+            idea["fail_reason"] = entry["error"]
+    if retired:
+        save_ideas_bank(ideas_bank)
+
+    entries = {}
+    for entry in pending_deferred(PIPELINE_VERSION):
+        # Prefer the bank's copy so results land in the bank; fall back to the queued snapshot
+        idea = bank_by_hash.get(entry["hash"])
+        if idea is None:
+            idea = entry["idea"]
+            ideas_bank.append(idea)
+        index = V5_STAGES.index(entry["stage"]) if entry["stage"] in V5_STAGES else 0
+        entries.setdefault(index, []).append(idea)
+        print(f"   ↩️  Idea #{idea['id']} resumes at {entry['stage']} (deferred {entry['attempts']}x: {entry['error'][:60]})")
+    return entries
+
 # ═══════════════════════════════════════════════════════════
 # MAIN EXECUTION
 # ═══════════════════════════════════════════════════════════
@@ -797,6 +994,14 @@ def main():
     parser = argparse.ArgumentParser(description="Ultimate Winner Machine v5.0")
     parser.add_argument("--count", type=int, default=10, help="Number of ideas to generate")
     parser.add_argument("--skip-stage0", action="store_true", help="Skip idea generation (test existing ideas)")
+    parser.add_argument("--batch-size", type=int, default=0,
+                        help="Evaluate Stages 1, 3 and 6 this many ideas per LLM call (0 = one call per idea)")
+    parser.add_argument("--workers", type=int, default=5,
+                        help="Ideas in flight per stage (identical in-flight API calls are shared)")
+    parser.add_argument("--min-yield", type=float, default=0.0,
+                        help="Skip ideas whose predicted finalist yield is below this (e.g. 0.02; 0 = rank only)")
+    parser.add_argument("--resume-deferred", action="store_true",
+                        help="Skip Stage 0 and re-run ideas parked in deferred_ideas.json from the stage that failed")
     args = parser.parse_args()
 
     run_id = datetime.now().strftime('%Y-%m-%d_%H-%M-%S')
@@ -816,8 +1021,17 @@ def main():
     # Load founder profile
     founder_profile = load_founder_profile()
 
+    resumed = []
+    if args.resume_deferred:
+        print(f"\n⏩ Resuming deferred ideas (skipping Stage 0)")
+        entries = load_resume_entries(ideas_bank)
+        if not entries:
+            print("\n✅ No deferred ideas to resume.")
+            return
+        resumed = [idea for batch in entries.values() for idea in batch]
+        ideas = resumed
     # Stage 0: Generate evidence-backed ideas
-    if not args.skip_stage0:
+    elif not args.skip_stage0:
         ideas = stage0_generate_ideas(args.count, ideas_bank)
 
         if not ideas:
@@ -830,83 +1044,26 @@ def main():
         ideas = [i for i in ideas_bank if i.get("status") == "generated"][:args.count]
         print(f"\n⏩ Skipping Stage 0, using {len(ideas)} existing ideas for testing")
 
-    # Track all ideas (survivors + killed)
+    # Track all ideas (survivors + killed + skipped by the kill predictor)
     all_ideas = list(ideas)
-
-    # Stage 1: White Space Check
-    survivors, killed = run_stage_batch(
-        ideas,
-        lambda idea: asyncio.run(stage1_whitespace_check(idea)),
-        "Stage 1: White Space"
-    )
-    all_ideas.extend(killed)
-
-    if not survivors:
-        print("\n⚠️  No ideas passed Stage 1. Try generating more ideas.")
-        save_ideas_bank(ideas_bank + all_ideas)
+    if not args.resume_deferred:
+        ideas, _ = screen_ideas(ideas, args.min_yield)
+        entries = {0: ideas}
+
+    # Stages 1-6 run as coroutines on one event loop
+    survivors = asyncio.run(run_funnel(entries, founder_profile, args.batch_size, args.workers))
+    save_concurrency_state()
+    # Resumed ideas that reached a verdict this time leave the queue
+    resolve_deferred([i["hash"] for i in resumed if not i.get("status", "").startswith("deferred")],
+                     PIPELINE_VERSION)
+    if not args.resume_deferred:
+        ideas_bank.extend(all_ideas)  # resumed ideas are in the bank already
+    if survivors is None:
+        save_ideas_bank(ideas_bank)
+        update_predictor(ideas_bank)
+        sync_signals(ideas_bank)
         return
 
-    # Stage 2: Multi-Signal Evidence
-    if stage2_evidence_engine:
-        survivors, killed = run_stage_batch(
-            survivors,
-            lambda idea: stage2_evidence_engine(idea, call_perplexity, web_search, call_openai),
-            "Stage 2: Evidence"
-        )
-        all_ideas.extend(killed)
-
-    if not survivors:
-        print("\n⚠️  No ideas passed Stage 2. Evidence too weak.")
-        save_ideas_bank(ideas_bank + all_ideas)
-        return
-
-    # Stage 3: Build Feasibility
-    survivors, killed = run_stage_batch(
-        survivors,
-        lambda idea: stage3_build_feasibility(idea, call_openai),
-        "Stage 3: Build"
-    )
-    all_ideas.extend(killed)
-
-    if not survivors:
-        print("\n⚠️  No ideas passed Stage 3. All require hardware/certs.")
-        save_ideas_bank(ideas_bank + all_ideas)
-        return
-
-    # Stage 4: Cost Calculator
-    survivors, killed = run_stage_batch(
-        survivors,
-        lambda idea: stage4_cost_calculator(idea, call_perplexity, call_openai),
-        "Stage 4: Cost"
-    )
-    all_ideas.extend(killed)
-
-    if not survivors:
-        print("\n⚠️  No ideas passed Stage 4. Problem costs too low.")
-        save_ideas_bank(ideas_bank + all_ideas)
-        return
-
-    # Stage 5: GTM Fit
-    survivors, killed = run_stage_batch(
-        survivors,
-        lambda idea: stage5_gtm_fit(idea, call_openai),
-        "Stage 5: GTM"
-    )
-    all_ideas.extend(killed)
-
-    if not survivors:
-        print("\n⚠️  No ideas passed Stage 5. Can't acquire customers digitally.")
-        save_ideas_bank(ideas_bank + all_ideas)
-        return
-
-    # Stage 6: Founder Fit
-    survivors, killed = run_stage_batch(
-        survivors,
-        lambda idea: stage6_founder_fit(idea, founder_profile, call_openai),
-        "Stage 6: Founder Fit"
-    )
-    all_ideas.extend(killed)
-
     # Stage 7: Validation Playbooks for Finalists
     print("\n" + "="*80)
     print(f"🎉 FINALISTS: {len(survivors)} IDEAS")
@@ -929,8 +1086,9 @@ def main():
         print("Recommendation: Run with 100 ideas to increase chances.")
 
     # Save all ideas to bank
-    ideas_bank.extend(all_ideas)
     save_ideas_bank(ideas_bank)
+    update_predictor(ideas_bank)
+    sync_signals(ideas_bank)
 
     # Generate summary report
     print("\n" + "="*80)
@@ -952,6 +1110,13 @@ Stage 5: {len([i for i in all_ideas if 'passed_stage_5' in i.get('status', '')])
 Stage 6: {len([i for i in all_ideas if 'passed_stage_6' in i.get('status', '')])} passed
 
 FINALISTS: {len(survivors)}
+DEFERRED (API errors): {len([i for i in ideas if i.get('status', '').startswith('deferred')])}
+
+API CALLS (identical in-flight requests coalesced):
+{chr(10).join(dedup_summary_lines()) or 'No API calls'}
+
+ADAPTIVE CONCURRENCY (per provider/model, saved to concurrency_state.json):
+{chr(10).join(concurrency_summary_lines()) or 'No API calls'}
 
 {'='*80}
 NEXT STEPS:
@@ -24,9 +24,25 @@ import time
 import hashlib
 import argparse
 from datetime import datetime
-from typing import List, Dict, Optional, Tuple
-from openai import OpenAI
-from anthropic import Anthropic
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from typing import Callable, List, Dict, Optional, Tuple
+
+from provider_client import (
+    ProviderError, PermanentAPIError, TransientAPIError, with_retries, call_or_none,
+    coalesce, set_dedup_scope, carry_scope, dedup_summary_lines,
+    record_usage, set_cost_scope, spend_stats, total_spend
+)
+from ideas_journal import open_journal
+from providers import lazy_client
+from retry_queue import defer_idea, pending_deferred, resolve_deferred, retire_exhausted
+from concurrency_controller import concurrency_summary_lines, save_state as save_concurrency_state
+from kill_predictor import screen_ideas, update_predictor
+from signals_store import STAGE2_THRESHOLDS, stage2_decision, sync_signals
+from stage_fingerprint import chain_fingerprints, stamp, first_stale_stage, invalidate_from
+from priority_scheduler import (
+    StageScheduler, order_by_priority, stage_cost_estimates, count_stage_ideas, reset_stage_counts,
+    append_cost_ledger
+)
 
 # ═══════════════════════════════════════════════════════════
 # CONFIGURATION
@@ -36,17 +52,12 @@ from anthropic import Anthropic
 from dotenv import load_dotenv
 load_dotenv()
 
-# API clients
-openai_client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
-anthropic_client = Anthropic(api_key=os.getenv("ANTHROPIC_API_KEY"))
+# API clients, built on first use (providers.py)
+openai_client = lazy_client("openai")
+anthropic_client = lazy_client("anthropic")
 
-# Perplexity client (uses OpenAI-compatible interface)
-perplexity_client = None
-if os.getenv("PERPLEXITY_API_KEY"):
-    perplexity_client = OpenAI(
-        api_key=os.getenv("PERPLEXITY_API_KEY"),
-        base_url="https://api.perplexity.ai"
-    )
+# Perplexity client (uses OpenAI-compatible interface); falsy without PERPLEXITY_API_KEY
+perplexity_client = lazy_client("perplexity")
 
 # File paths
 IDEAS_BANK_FILE = "ideas_bank.json"
@@ -58,38 +69,47 @@ from v5_stages_2_through_7 import (
     stage4_cost_calculator as v5_cost,
     stage5_gtm_fit as v5_gtm,
     stage6_founder_fit as v5_founder,
-    stage7_validation_playbook as v5_playbook
+    stage7_validation_playbook as v5_playbook,
+    as_async, run_sync
+)
+from batched_stages import (
+    BatchedStage, STAGE3_BATCH_SPEC, stage6_batch_spec, build_batch_prompt, parse_batch_response
 )
 
 # Wrapper functions to match v5.0 signatures
-def stage3_build_feasibility(idea: Dict) -> Tuple[bool, str, Dict]:
-    result = v5_build(idea, call_openai)
+def run_v5_stage(stage, idea: Dict, *args) -> Dict:
+    """v5.0 stages 3-6 are coroutines; v6.0 steps them on the calling thread with the blocking clients (no event loop)"""
+    return run_sync(stage(idea, *args))
+
+def stage3_build_feasibility(idea: Dict, v5_stage=None) -> Tuple[bool, str, Dict]:
+    # v5_stage: a BatchedStage standing in for v5_build (--batch-size)
+    result = v5_stage(idea) if v5_stage else run_v5_stage(v5_build, idea, call_openai_async)
     # v5 returns {"verdict": "PASS/KILL", "analysis": {...}}
     passed = result.get("verdict") == "PASS"
     reason = "" if passed else result.get("analysis", {}).get("reasoning", "Failed build checks")
     return passed, reason, result
 
 def stage4_cost_analysis(idea: Dict) -> Tuple[bool, str, Dict]:
-    result = v5_cost(idea, call_perplexity, call_openai)
+    result = run_v5_stage(v5_cost, idea, call_perplexity_async, call_openai_async)
     passed = result.get("verdict") == "PASS"
     reason = "" if passed else result.get("reason", "") or result.get("analysis", {}).get("reasoning", "Failed cost checks")
     return passed, reason, result
 
 def stage5_gtm_validation(idea: Dict) -> Tuple[bool, str, Dict]:
-    result = v5_gtm(idea, call_openai)
+    result = run_v5_stage(v5_gtm, idea, call_openai_async)
     passed = result.get("verdict") == "PASS"
     reason = "" if passed else result.get("reason", "") or result.get("analysis", {}).get("reasoning", "Failed GTM checks")
     return passed, reason, result
 
-def stage6_founder_fit(idea: Dict, founder_profile: Dict) -> Tuple[bool, str, Dict]:
-    result = v5_founder(idea, founder_profile, call_openai)
+def stage6_founder_fit(idea: Dict, founder_profile: Dict, v5_stage=None) -> Tuple[bool, str, Dict]:
+    result = v5_stage(idea) if v5_stage else run_v5_stage(v5_founder, idea, founder_profile, call_openai_async)
     passed = result.get("verdict") == "PASS"
     reason = "" if passed else result.get("reason", "") or result.get("analysis", {}).get("reasoning", "Failed founder fit")
     return passed, reason, result
 
-def stage7_validation_playbook(idea: Dict) -> str:
-    # v5 expects stage2_evidence dict, but we have it in idea already
-    evidence = idea.get("stage2_evidence_analysis", {})
+def stage7_validation_playbook(idea: Dict) -> Dict:
+    # v5 expects stage2_evidence dict, but we have it in idea already (run_stage_batch key)
+    evidence = idea.get("stage_2_evidence_analysis", {})
     return v5_playbook(idea, evidence)
 
 # ═══════════════════════════════════════════════════════════
@@ -97,64 +117,81 @@ def stage7_validation_playbook(idea: Dict) -> str:
 # ═══════════════════════════════════════════════════════════
 
 def call_perplexity(prompt: str) -> str:
-    """Call Perplexity API for real-time web research"""
+    """Call Perplexity API for real-time web research (raises ProviderError on failure)"""
     if not perplexity_client:
-        print("      ⚠️  Perplexity API not configured")
-        return None
+        raise PermanentAPIError("perplexity", "Perplexity API not configured (set PERPLEXITY_API_KEY)")
 
-    time.sleep(1)
-    try:
-        response = perplexity_client.chat.completions.create(
-            model="sonar",
-            messages=[{"role": "user", "content": prompt}]
-        )
-        return response.choices[0].message.content
-    except Exception as e:
-        print(f"      ⚠️  Perplexity API error: {str(e)}")
-        return None
+    params = {
+        "model": "sonar",
+        "messages": [{"role": "user", "content": prompt}]
+    }
+
+    def request():
+        time.sleep(1)
+        response = with_retries("perplexity", lambda: perplexity_client.chat.completions.create(**params),
+                                model=params["model"])
+        record_usage("perplexity", params["model"], getattr(response, "usage", None))
+        return response
+
+    response = coalesce("perplexity", params, request)
+    return response.choices[0].message.content
 
 def call_openai(prompt: str, system_message: str = "You are a business research expert.",
                 model: str = "gpt-5-mini", response_format: str = None) -> str:
-    """Call OpenAI API with rate limiting"""
-    time.sleep(1)
-    try:
-        params = {
-            "model": model,
-            "messages": [
-                {"role": "system", "content": system_message},
-                {"role": "user", "content": prompt}
-            ]
-        }
-
-        if "gpt-5" in model.lower() or "o1" in model.lower():
-            params["max_completion_tokens"] = 8000
-        else:
-            params["max_tokens"] = 8000
-            params["temperature"] = 0.7
+    """Call OpenAI API with rate limiting (raises ProviderError on failure)"""
+    params = {
+        "model": model,
+        "messages": [
+            {"role": "system", "content": system_message},
+            {"role": "user", "content": prompt}
+        ]
+    }
+
+    if "gpt-5" in model.lower() or "o1" in model.lower():
+        params["max_completion_tokens"] = 8000
+    else:
+        params["max_tokens"] = 8000
+        params["temperature"] = 0.7
+
+    if response_format == "json":
+        params["response_format"] = {"type": "json_object"}
 
-        if response_format == "json":
-            params["response_format"] = {"type": "json_object"}
+    def request():
+        time.sleep(1)
+        response = with_retries("openai", lambda: openai_client.chat.completions.create(**params),
+                                model=params["model"])
+        record_usage("openai", params["model"], getattr(response, "usage", None))
+        return response
 
-        response = openai_client.chat.completions.create(**params)
-        return response.choices[0].message.content
-    except Exception as e:
-        print(f"      ⚠️  OpenAI API error: {str(e)}")
-        return None
+    response = coalesce("openai", params, request)
+    return response.choices[0].message.content
 
 def call_claude(prompt: str, system_message: str = "You are a business idea specification expert.") -> str:
-    """Call Claude API for idea specification"""
-    time.sleep(1)
-    try:
-        response = anthropic_client.messages.create(
-            model="claude-3-5-sonnet-20241022",
-            max_tokens=4000,
-            system=system_message,
-            messages=[{"role": "user", "content": prompt}]
-        )
-        return response.content[0].text
-    except Exception as e:
-        print(f"      ⚠️  Claude API error: {str(e)}")
-        return None
+    """Call Claude API for idea specification (raises ProviderError on failure)"""
+    params = {
+        "model": "claude-3-5-sonnet-20241022",
+        "max_tokens": 4000,
+        "system": system_message,
+        "messages": [{"role": "user", "content": prompt}]
+    }
+
+    def request():
+        time.sleep(1)
+        response = with_retries("anthropic", lambda: anthropic_client.messages.create(**params),
+                                model=params["model"])
+        record_usage("anthropic", params["model"], getattr(response, "usage", None))
+        return response
+
+    response = coalesce("anthropic", params, request)
+    return response.content[0].text
+
+def call_openai_or_none(*args, **kwargs) -> Optional[str]:
+    """call_openai for Stage 0, where a failed call just means less mined data"""
+    return call_or_none(call_openai, *args, **kwargs)
+
+# For the (async) v5.0 stages 3-6
+call_openai_async = as_async(call_openai)
+call_perplexity_async = as_async(call_perplexity)
 
 def perplexity_to_json(perplexity_response: str, expected_schema: Dict, call_openai_fn) -> Dict:
     """Convert Perplexity's conversational response into structured JSON"""
@@ -196,17 +233,12 @@ def generate_idea_hash(business: str, pain: str) -> str:
     return hashlib.md5(combined.encode()).hexdigest()[:12]
 
 def load_ideas_bank() -> List[Dict]:
-    """Load existing ideas bank"""
-    if os.path.exists(IDEAS_BANK_FILE):
-        with open(IDEAS_BANK_FILE, 'r') as f:
-            data = json.load(f)
-            return data.get("ideas", []) if isinstance(data, dict) else data
-    return []
+    """Load existing ideas bank (snapshot + journal, see ideas_journal.py)"""
+    return open_journal(IDEAS_BANK_FILE).load()
 
 def save_ideas_bank(ideas: List[Dict]):
-    """Save ideas bank"""
-    with open(IDEAS_BANK_FILE, 'w') as f:
-        json.dump({"ideas": ideas}, f, indent=2)
+    """Append what changed since the last save to the ideas journal"""
+    open_journal(IDEAS_BANK_FILE).save(ideas)
 
 def idea_exists(ideas_bank: List[Dict], business: str, pain: str) -> bool:
     """Check if idea already exists"""
@@ -251,9 +283,9 @@ For each, provide:
 
 Return as JSON array: [{name, url, industry, activity}]"""
 
-    forums_response = call_perplexity(forums_prompt)
+    forums_response = call_or_none(call_perplexity, forums_prompt)
     if forums_response:
-        forums_data = perplexity_to_json(forums_response, {"forums": []}, call_openai)
+        forums_data = perplexity_to_json(forums_response, {"forums": []}, call_openai_or_none)
         for forum in forums_data.get("forums", [])[:30]:
             sources.append({
                 "type": "forum",
@@ -275,9 +307,9 @@ Look for subreddits about:
 
 Return as JSON array: [{subreddit, description, subscriber_count}]"""
 
-    reddit_response = call_perplexity(reddit_prompt)
+    reddit_response = call_or_none(call_perplexity, reddit_prompt)
     if reddit_response:
-        reddit_data = perplexity_to_json(reddit_response, {"subreddits": []}, call_openai)
+        reddit_data = perplexity_to_json(reddit_response, {"subreddits": []}, call_openai_or_none)
         for sub in reddit_data.get("subreddits", [])[:25]:
             sources.append({
                 "type": "reddit",
@@ -292,9 +324,9 @@ Return as JSON array: [{subreddit, description, subscriber_count}]"""
 
 Return as JSON array: [{category, platform, review_count}]"""
 
-    reviews_response = call_perplexity(reviews_prompt)
+    reviews_response = call_or_none(call_perplexity, reviews_prompt)
     if reviews_response:
-        reviews_data = perplexity_to_json(reviews_response, {"categories": []}, call_openai)
+        reviews_data = perplexity_to_json(reviews_response, {"categories": []}, call_openai_or_none)
         for cat in reviews_data.get("categories", [])[:20]:
             sources.append({
                 "type": "reviews",
@@ -309,9 +341,9 @@ Return as JSON array: [{category, platform, review_count}]"""
 
 Return as JSON array: [{job_title, common_responsibilities, pain_signals}]"""
 
-    jobs_response = call_perplexity(jobs_prompt)
+    jobs_response = call_or_none(call_perplexity, jobs_prompt)
     if jobs_response:
-        jobs_data = perplexity_to_json(jobs_response, {"job_titles": []}, call_openai)
+        jobs_data = perplexity_to_json(jobs_response, {"job_titles": []}, call_openai_or_none)
         for job in jobs_data.get("job_titles", [])[:25]:
             sources.append({
                 "type": "jobs",
@@ -403,9 +435,9 @@ Return JSON: {{complaints: [{{pain, time_waste, cost_waste, frequency, business_
         else:
             continue
 
-        response = call_perplexity(prompt)
+        response = call_or_none(call_perplexity, prompt)
         if response:
-            data = perplexity_to_json(response, {"complaints": []}, call_openai)
+            data = perplexity_to_json(response, {"complaints": []}, call_openai_or_none)
             complaints = data.get("complaints", [])
 
             # Only keep complaints with time or cost data
@@ -476,7 +508,7 @@ Return top 50 clusters as JSON:
 }}"""
 
     print("   🤖 Using GPT-4o to cluster and rank by ROI (this takes ~2-3 minutes)...\n")
-    response = call_openai(prompt, model="gpt-4o", response_format="json")
+    response = call_or_none(call_openai, prompt, model="gpt-4o", response_format="json")
 
     if response:
         try:
@@ -625,7 +657,7 @@ For each idea, return JSON:
 
 ONLY return ideas that pass ALL 7 requirements above."""
 
-        response = call_claude(prompt)
+        response = call_or_none(call_claude, prompt)
         if response:
             try:
                 # Extract JSON from response
@@ -643,6 +675,7 @@ ONLY return ideas that pass ALL 7 requirements above."""
                             idea.get("solo_founder_feasible") and
                             idea.get("public_apis_only")):
 
+                            idea["cluster_rank_score"] = cluster.get("rank_score", 0)
                             ideas.append(idea)
                             print(f"      ✅ {idea.get('business', 'Unknown')[:50]}...")
                         else:
@@ -751,7 +784,8 @@ def stage2_economic_proof(idea: Dict) -> Tuple[bool, str, Dict]:
     7. Market Size Validation (0-5)
     8. Frequency Validation (0-4)
 
-    Pass criteria: ≥25/39 AND ≥6/8 signals triggered
+    Pass criteria: ≥25/39 AND ≥6/8 signals triggered AND TAM ≥ $10M
+    (STAGE2_THRESHOLDS in signals_store.py)
     """
     print(f"\n{'─'*60}")
     print(f"STAGE 2: ECONOMIC PROOF VALIDATION - Idea #{idea['id']}")
@@ -1057,13 +1091,11 @@ Return JSON:
     print(f"      Total Score: {total_score}/39")
     print(f"      Signals Triggered: {signals_triggered}/8")
 
-    # Decision criteria
-    if total_score < 25:
-        return False, f"Economic proof too weak ({total_score}/39)", evidence
-    elif signals_triggered < 6:
-        return False, f"Too few signals triggered ({signals_triggered}/8)", evidence
-    elif market_data.get("tam", 0) < 10000000:  # <$10M TAM
-        return False, f"Market too small (${market_data.get('tam', 0):,} TAM)", evidence
+    # Decision criteria (STAGE2_THRESHOLDS; rescore.py re-applies them offline)
+    scores = {name: data.get("score", 0) for name, data in evidence.items()}
+    passed, reason = stage2_decision(PIPELINE_VERSION, scores, market_data.get("tam", 0) or 0)
+    if not passed:
+        return False, reason, evidence
 
     print(f"\n✅ PASS - Strong economic validation")
     return True, "", evidence
@@ -1072,8 +1104,39 @@ Return JSON:
 # BATCH PROCESSING ENGINE
 # ═══════════════════════════════════════════════════════════
 
-def run_stage_batch(ideas: List[Dict], stage_func, stage_name: str) -> Tuple[List[Dict], List[Dict]]:
-    """Run a stage on all ideas in batch"""
+def stage_key(stage_name: str) -> str:
+    """'Stage 2: Evidence' → 'stage2' (status suffix)"""
+    return stage_name.lower().split(':')[0].replace(' ', '')
+
+def analysis_key(stage_name: str) -> str:
+    """'Stage 2: Evidence' → 'stage_2_evidence_analysis' (where the stage result is stored)"""
+    return f"{stage_name.lower().replace(' ', '_').replace(':', '')}_analysis"
+
+# Per-idea progress callback (pipeline_daemon.py streams these to its clients)
+_progress_listener: Optional[Callable[[Dict], None]] = None
+
+def set_progress_listener(listener: Optional[Callable[[Dict], None]]):
+    global _progress_listener
+    _progress_listener = listener
+
+def emit_progress(event: str, idea: Dict, stage_name: str, **fields):
+    """passed / killed / deferred / finalist for one idea at one stage"""
+    if _progress_listener:
+        _progress_listener({"event": event, "idea_id": idea.get("id"), "business": idea.get("business"),
+                            "stage": stage_name, **fields})
+
+def apply_stage_result(idea: Dict, stage_name: str, passed: bool, reason: str, analysis: Dict):
+    """Record a stage verdict on the idea (shared by run_stage_batch and distributed workers)"""
+    idea[analysis_key(stage_name)] = analysis
+    stamp(idea, stage_name, STAGE_FINGERPRINTS.get(stage_name))
+    if not passed:
+        idea["status"] = f"killed_{stage_key(stage_name)}"
+        idea["kill_reason"] = reason
+    emit_progress("passed" if passed else "killed", idea, stage_name, reason=reason)
+
+def run_stage_batch(ideas: List[Dict], stage_func, stage_name: str,
+                    workers: int = 1) -> Tuple[List[Dict], List[Dict]]:
+    """Run a stage on all ideas in batch (`workers` ideas at a time)"""
     print(f"\n{'='*80}")
     print(f"BATCH PROCESSING: {stage_name}")
     print(f"Processing {len(ideas)} ideas...")
@@ -1081,57 +1144,481 @@ def run_stage_batch(ideas: List[Dict], stage_func, stage_name: str) -> Tuple[Lis
 
     survivors = []
     killed = []
+    deferred = []
+    set_dedup_scope(stage_name)
+    count_stage_ideas(stage_name, len(ideas))
 
-    for idx, idea in enumerate(ideas, 1):
+    def run_one(item):
+        idx, idea = item
         print(f"[{idx}/{len(ideas)}] Processing Idea #{idea['id']}\n")
+        try:
+            return idea, stage_func(idea), None
+        except ProviderError as e:
+            return idea, None, e
+        except Exception as e:
+            # A malformed reply (KeyError, JSONDecodeError...) parks this idea, not the whole run
+            print(f"   ❌ {stage_name} crashed on Idea #{idea['id']}: {type(e).__name__}: {e}")
+            return idea, None, e
+
+    # Verdicts are applied in order on this thread; only the stage calls run concurrently
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        outcomes = list(pool.map(carry_scope(run_one), enumerate(ideas, 1)))
+
+    for idea, result, error in outcomes:
+        if error is not None:
+            # API failure is not a verdict - park the idea with its completed stages
+            idea["status"] = f"deferred_{stage_key(stage_name)}"
+            entry = defer_idea(idea, stage_name, error, PIPELINE_VERSION)
+            print(f"   ⏸️  DEFERRED - {error} (attempt {entry['attempts']})\n")
+            emit_progress("deferred", idea, stage_name, reason=str(error))
+            deferred.append(idea)
+            continue
 
-        passed, reason, analysis = stage_func(idea)
-
-        if passed:
-            idea[f"{stage_name.lower().replace(' ', '_').replace(':', '')}_analysis"] = analysis
-            survivors.append(idea)
-        else:
-            idea["status"] = f"killed_{stage_name.lower().split(':')[0].replace(' ', '')}"
-            idea["kill_reason"] = reason
-            idea[f"{stage_name.lower().replace(' ', '_').replace(':', '')}_analysis"] = analysis
-            killed.append(idea)
+        passed, reason, analysis = result
+        apply_stage_result(idea, stage_name, passed, reason, analysis)
+        (survivors if passed else killed).append(idea)
 
     print(f"\n{'='*80}")
     print(f"{stage_name} COMPLETE:")
     print(f"✅ {len(survivors)} passed")
     print(f"❌ {len(killed)} killed")
+    if deferred:
+        print(f"⏸️  {len(deferred)} deferred (API errors or crashes) - resume with --resume-deferred")
     print(f"{'='*80}\n")
 
     return survivors, killed
 
 # ═══════════════════════════════════════════════════════════
-# MAIN ORCHESTRATOR
+# FUNNEL
 # ═══════════════════════════════════════════════════════════
 
-def main():
-    parser = argparse.ArgumentParser(description="Ultimate Winner Machine v6.0")
-    parser.add_argument("--count", type=int, default=10, help="Number of ideas to generate")
-    args = parser.parse_args()
+PIPELINE_VERSION = "v6.0"
+PLAYBOOK_STAGE = "Stage 7: Playbook"
 
-    target_count = args.count
-    run_id = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+# Stage name → fingerprint of the stages this process runs (set by build_stages)
+STAGE_FINGERPRINTS: Dict[str, str] = {}
+_fingerprint_cache: Dict[str, Dict[str, str]] = {}
 
-    print("="*80)
-    print("🏆 ULTIMATE WINNER MACHINE v6.0 - THE SELF-IMPROVING ROI HUNTER")
-    print("="*80)
-    print(f"Run ID: {run_id}")
-    print(f"Target ideas: {target_count}")
-    print()
-    print("Philosophy: Mine quantified pain points → Generate ROI-justified ideas →")
-    print("           Filter through 7 stages → Find 8-10 validated candidates")
-    print("="*80)
+def stage_fingerprints(founder_profile: Dict) -> Dict[str, str]:
+    """
+    Stage name → hash of its prompts, models, parameters and config, chained
+    through the upstream stages (stage_fingerprint.py). The batched and
+    per-idea variants of Stages 3 and 6 share one fingerprint.
+    """
+    cache_key = json.dumps(founder_profile, sort_keys=True)
+    if cache_key in _fingerprint_cache:
+        return _fingerprint_cache[cache_key]
+
+    openai_calls = [call_openai]
+    perplexity_calls = [call_perplexity, perplexity_to_json]
+    batch_calls = [build_batch_prompt, parse_batch_response]
+    fingerprints = _fingerprint_cache[cache_key] = chain_fingerprints([
+        ("Stage 1: White Space", [stage1_white_space] + perplexity_calls + openai_calls, {}),
+        ("Stage 2: Evidence", [stage2_economic_proof, stage2_decision] + perplexity_calls + openai_calls,
+         {"thresholds": STAGE2_THRESHOLDS[PIPELINE_VERSION]}),
+        ("Stage 3: Build", [stage3_build_feasibility, v5_build, STAGE3_BATCH_SPEC] + batch_calls + openai_calls, {}),
+        ("Stage 4: Cost", [stage4_cost_analysis, v5_cost] + perplexity_calls + openai_calls, {}),
+        ("Stage 5: GTM", [stage5_gtm_validation, v5_gtm] + openai_calls, {}),
+        ("Stage 6: Founder", [stage6_founder_fit, v5_founder, stage6_batch_spec(founder_profile)]
+         + batch_calls + openai_calls, {"founder_profile": founder_profile}),
+        (PLAYBOOK_STAGE, [stage7_validation_playbook, v5_playbook], {}),
+    ])
+    return fingerprints
+
+def fingerprinted_stages() -> List[Tuple[str, str]]:
+    """(stage name, result key on the idea) for Stages 1-7 in funnel order"""
+    return [(name, "validation_playbook" if name == PLAYBOOK_STAGE else analysis_key(name))
+            for name in stage_fingerprints({})]
+
+def with_prefetch(stage_func, batched: BatchedStage):
+    """Stage function whose batch run_funnel prefetches in multi-idea calls"""
+    stage_func.prefetch = batched.prefetch
+    return stage_func
+
+def build_stages(founder_profile: Dict, batch_size: int = 0) -> List[Tuple[str, callable, Optional[str]]]:
+    """
+    (stage name, stage function, message when nobody survives) in funnel order
+    batch_size > 0 evaluates Stages 3 and 6 that many ideas per call. Stage 1 is
+    per-idea Perplexity research here, so it stays unbatched.
+    """
+    STAGE_FINGERPRINTS.update(stage_fingerprints(founder_profile))
+    build_stage = stage3_build_feasibility
+    founder_stage = lambda idea: stage6_founder_fit(idea, founder_profile)
+
+    if batch_size > 0:
+        build = BatchedStage(STAGE3_BATCH_SPEC, lambda idea: run_v5_stage(v5_build, idea, call_openai_async),
+                             call_openai, batch_size)
+        founder = BatchedStage(stage6_batch_spec(founder_profile),
+                               lambda idea: run_v5_stage(v5_founder, idea, founder_profile, call_openai_async),
+                               call_openai, batch_size)
+        build_stage = with_prefetch(lambda idea: stage3_build_feasibility(idea, build), build)
+        founder_stage = with_prefetch(lambda idea: stage6_founder_fit(idea, founder_profile, founder), founder)
+
+    return [
+        ("Stage 1: White Space", stage1_white_space, "All hit dominant players or high switching costs."),
+        ("Stage 2: Evidence", stage2_economic_proof, "Economic proof too weak."),
+        ("Stage 3: Build", build_stage, "All too complex to build."),
+        ("Stage 4: Cost", stage4_cost_analysis, None),
+        ("Stage 5: GTM", stage5_gtm_validation, None),
+        ("Stage 6: Founder", founder_stage, None),
+    ]
+
+def run_funnel(ideas_bank: List[Dict], entries: Dict[int, List[Dict]], founder_profile: Dict,
+               batch_size: int = 0, workers: int = 1, stop_before: Optional[int] = None) -> List[Dict]:
+    """
+    Run Stages 1-6. `entries` maps a stage index to ideas entering there:
+    fresh ideas enter at 0, resumed ideas at the stage they were deferred on.
+    Ideas are already in ideas_bank, so each stage only needs a save.
+    stop_before=5 ends after Stage 5 and also returns ideas entering at 5+.
+    """
+    stages = build_stages(founder_profile, batch_size)[:stop_before]
+    stage_costs = stage_cost_estimates([name for name, _, _ in stages])
+    survivors = []
 
-    # Load existing ideas
-    ideas_bank = load_ideas_bank()
-    print(f"\nExisting ideas in bank: {len(ideas_bank)}")
+    for index, (stage_name, stage_func, empty_message) in enumerate(stages):
+        batch = order_by_priority(survivors + entries.get(index, []), index, stage_costs)
+        if not batch:
+            survivors = []
+            continue
+
+        if hasattr(stage_func, "prefetch"):
+            stage_func.prefetch(batch, stage_name)
+        survivors, killed = run_stage_batch(batch, stage_func, stage_name, workers)
+        save_ideas_bank(ideas_bank)
+
+        later_entries = any(batch for i, batch in entries.items() if i > index)
+        if not survivors and not later_entries and empty_message:
+            print(f"\n⚠️  No ideas passed {stage_name.split(':')[0]}. {empty_message}")
+            return []
+
+    return survivors + [idea for i, batch in sorted(entries.items()) if i >= len(stages) for idea in batch]
+
+def run_prioritized(ideas_bank: List[Dict], entries: Dict[int, List[Dict]], founder_profile: Dict,
+                    workers: int = 1, budget_usd: float = 0.0, deadline_min: float = 0.0) -> List[Dict]:
+    """
+    Run Stages 1-6 from one priority queue of (idea, next stage) instead of stage
+    by stage: the best expected finalist value per dollar goes first (priority_scheduler.py).
+    Stops starting new work once --budget-usd or --deadline-min would be exceeded;
+    unstarted ideas are parked in the deferred queue at their next stage.
+    """
+    stages = build_stages(founder_profile)
+    stage_costs = stage_cost_estimates([name for name, _, _ in stages])
+    scheduler = StageScheduler(stage_costs)
+    finalists = list(entries.get(len(stages), []))
+    for index, batch in entries.items():
+        for idea in batch:
+            if index < len(stages):
+                scheduler.push(idea, index)
+
+    deadline = time.time() + deadline_min * 60 if deadline_min else None
+    spend_start = total_spend()
+    stopped = None
+
+    print(f"\n{'='*80}")
+    print(f"PRIORITIZED RUN: {len(scheduler)} ideas"
+          + (f" | budget ${budget_usd:.2f}" if budget_usd else "")
+          + (f" | deadline {deadline_min:.0f} min" if deadline_min else ""))
+    print(f"{'='*80}\n")
+
+    def run_one(idea: Dict, index: int):
+        stage_name, stage_func, _ = stages[index]
+        set_dedup_scope(stage_name)
+        set_cost_scope(stage_name)
+        print(f"[{stage_name.split(':')[0]}] Processing Idea #{idea['id']}\n")
+        try:
+            return stage_func(idea), None
+        except ProviderError as e:
+            return None, e
+        except Exception as e:
+            print(f"   ❌ {stage_name} crashed on Idea #{idea['id']}: {type(e).__name__}: {e}")
+            return None, e
+        finally:
+            set_cost_scope(None)
+
+    in_flight = {}
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        while scheduler or in_flight:
+            while scheduler and len(in_flight) < max(1, workers) and not stopped:
+                idea, index = scheduler.peek()
+                committed = sum(stage_costs[i] for _, i in in_flight.values())
+                if budget_usd and total_spend() - spend_start + committed + stage_costs[index] > budget_usd:
+                    stopped = f"budget ${budget_usd:.2f} reached"
+                elif deadline and time.time() > deadline:
+                    stopped = f"deadline {deadline_min:.0f} min reached"
+                else:
+                    scheduler.pop()
+                    count_stage_ideas(stages[index][0])
+                    in_flight[pool.submit(run_one, idea, index)] = (idea, index)
+            if not in_flight:
+                break
+
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                idea, index = in_flight.pop(future)
+                stage_name = stages[index][0]
+                result, error = future.result()
+                if error is not None:
+                    idea["status"] = f"deferred_{stage_key(stage_name)}"
+                    entry = defer_idea(idea, stage_name, error, PIPELINE_VERSION)
+                    print(f"   ⏸️  DEFERRED - {error} (attempt {entry['attempts']})\n")
+                    emit_progress("deferred", idea, stage_name, reason=str(error))
+                    continue
+
+                passed, reason, analysis = result
+                apply_stage_result(idea, stage_name, passed, reason, analysis)
+                print(f"   {'✅ PASSED' if passed else '❌ KILLED'} {stage_name} - Idea #{idea['id']}\n")
+                if passed and index + 1 < len(stages):
+                    scheduler.push(idea, index + 1)
+                elif passed:
+                    finalists.append(idea)
+            save_ideas_bank(ideas_bank)
+
+    if stopped:
+        parked = scheduler.drain()
+        print(f"\n⏹️  Stopped: {stopped} - {len(parked)} idea(s) parked for --resume-deferred")
+        for idea, index in parked:
+            stage_name = stages[index][0]
+            idea["status"] = f"deferred_{stage_key(stage_name)}"
+            defer_idea(idea, stage_name, TransientAPIError("scheduler", stopped), PIPELINE_VERSION)
+        save_ideas_bank(ideas_bank)
+
+    print(f"\n💵 Stages 1-6 spend: ${total_spend() - spend_start:.2f} | {len(finalists)} finalist(s)")
+    return finalists
+
+FOUNDER_STAGE_INDEX = 5
+
+def load_profiles(paths: str) -> Dict[str, Dict]:
+    """'a.json,b.json' → {"a": {...}, "b": {...}} (named by file stem)"""
+    profiles = {}
+    for path in [p.strip() for p in paths.split(",") if p.strip()]:
+        with open(path, 'r') as f:
+            profiles[os.path.splitext(os.path.basename(path))[0]] = json.load(f)
+    return profiles
+
+def run_profile_fanout(ideas_bank: List[Dict], candidates: List[Dict], profiles: Dict[str, Dict],
+                       batch_size: int = 0, workers: int = 1,
+                       resumed: Optional[List[Dict]] = None) -> Dict[str, List[Dict]]:
+    """
+    Stage 6 once per founder profile over the same Stage 1-5 survivors.
+    Verdicts go to idea["founder_fit"][profile]; an idea is killed at Stage 6
+    only if every profile killed it, and parked as deferred_stage6 if none
+    passed and some profile hit an API error. Resumed ideas only re-run the
+    profiles that have no verdict yet. Returns {profile: finalists}.
+    """
+    resumed_ids = {id(idea) for idea in resumed or []}
+    finalists = {name: [] for name in profiles}
+    for name, profile in profiles.items():
+        stage_name, stage_func, _ = build_stages(profile, batch_size)[FOUNDER_STAGE_INDEX]
+        fingerprint = stage_fingerprints(profile)[stage_name]
+        batch = [idea for idea in candidates
+                 if id(idea) not in resumed_ids
+                 or idea.get("founder_fit", {}).get(name, {}).get("verdict") not in ("PASS", "KILL")]
+        if not batch:
+            continue
+        print(f"\n{'='*80}")
+        print(f"BATCH PROCESSING: {stage_name} [{name}]")
+        print(f"Processing {len(batch)} ideas...")
+        print(f"{'='*80}\n")
+
+        set_dedup_scope(stage_name)
+        count_stage_ideas(stage_name, len(batch))
+        if hasattr(stage_func, "prefetch"):
+            stage_func.prefetch(batch, stage_name)
+
+        def run_one(idea):
+            try:
+                return stage_func(idea), None
+            except ProviderError as e:
+                return None, e
+            except Exception as e:
+                print(f"   ❌ {stage_name} [{name}] crashed on Idea #{idea['id']}: {type(e).__name__}: {e}")
+                return None, e
+
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+            outcomes = list(pool.map(carry_scope(run_one), batch))
+
+        for idea, (result, error) in zip(batch, outcomes):
+            cell = {"fingerprint": fingerprint}
+            if error is not None:
+                cell.update(verdict="DEFERRED", reason=str(error))
+                idea.setdefault("founder_fit", {})[name] = cell
+                entry = defer_idea(idea, f"{stage_name} [{name}]", error, PIPELINE_VERSION)
+                print(f"   ⏸️  Idea #{idea['id']} [{name}] DEFERRED - {error} (attempt {entry['attempts']})")
+                emit_progress("deferred", idea, stage_name, reason=str(error), profile=name)
+                continue
+            passed, reason, analysis = result
+            cell.update(verdict="PASS" if passed else "KILL", reason=reason, analysis=analysis)
+            emit_progress("passed" if passed else "killed", idea, stage_name, reason=reason, profile=name)
+            if passed:
+                finalists[name].append(idea)
+            idea.setdefault("founder_fit", {})[name] = cell
+
+        print(f"\n{'='*80}")
+        print(f"{stage_name} [{name}] COMPLETE: ✅ {len(finalists[name])} passed")
+        print(f"{'='*80}\n")
+        save_ideas_bank(ideas_bank)
+
+    for idea in candidates:
+        cells = {name: idea["founder_fit"][name] for name in profiles}
+        verdicts = [cell["verdict"] for cell in cells.values()]
+        if "PASS" in verdicts:
+            continue
+        if "DEFERRED" in verdicts:
+            idea["status"] = "deferred_stage6"
+        else:
+            idea["status"] = "killed_stage6"
+            idea["kill_reason"] = "; ".join(f"{name}: {cell['reason']}" for name, cell in cells.items())
+    save_ideas_bank(ideas_bank)
+    return finalists
+
+def fanout_deferred(idea: Dict, profiles: Optional[Dict[str, Dict]]) -> bool:
+    """A --profiles idea with a Stage 6 profile still waiting on --resume-deferred"""
+    return any(idea.get("founder_fit", {}).get(name, {}).get("verdict") == "DEFERRED" for name in profiles or {})
+
+def write_profile_matrix(candidates: List[Dict], profiles: Dict[str, Dict], run_id: str) -> str:
+    """Idea × profile Stage 6 verdicts → FOUNDER_MATRIX_<run_id>.txt (also printed)"""
+    marks = {"PASS": "✅", "KILL": "❌", "DEFERRED": "⏸️", "FAILED": "⛔"}
+    names = list(profiles)
+    lines = [f"{'IDEA':<46}" + "".join(f"{name[:12]:>14}" for name in names)]
+    for idea in candidates:
+        row = f"#{idea['id']:<5} {idea['business'][:39]:<40}"
+        for name in names:
+            row += f"{marks.get(idea.get('founder_fit', {}).get(name, {}).get('verdict'), '·'):>14}"
+        lines.append(row)
+    totals = [sum(1 for idea in candidates if idea.get("founder_fit", {}).get(name, {}).get("verdict") == "PASS")
+              for name in names]
+    lines.append(f"{'FINALISTS':<46}" + "".join(f"{total:>14}" for total in totals))
+
+    filename = f"FOUNDER_MATRIX_{run_id}.txt"
+    with open(filename, 'w') as f:
+        f.write(f"{'='*80}\n")
+        f.write(f"FOUNDER FIT MATRIX - Run {run_id}\n")
+        f.write(f"Stages 1-5 ran once per idea; Stage 6 + 7 once per profile\n")
+        f.write(f"{'='*80}\n\n")
+        f.write("\n".join(lines) + "\n")
+
+    print(f"\n{'='*80}")
+    print(f"👥 FOUNDER FIT MATRIX ({len(candidates)} ideas × {len(names)} profiles)")
+    print(f"{'='*80}")
+    for line in lines:
+        print(line)
+    print(f"\n📄 Matrix saved: {filename}")
+    return filename
+
+def write_finalist_reports(finalists: List[Dict], ideas_bank: List[Dict],
+                           profile_name: Optional[str] = None) -> List[Dict]:
+    """STAGE 7: validation playbooks + FINALIST_*.txt reports (FINALIST_<profile>_*.txt with --profiles)"""
+    print(f"\n{'='*80}")
+    print(f"STAGE 7: VALIDATION PLAYBOOK GENERATION")
+    print(f"{'='*80}\n")
+
+    written = []
+    for idea in finalists:
+        try:
+            playbook = stage7_validation_playbook(idea)
+        except ProviderError as e:
+            idea["status"] = "deferred_stage7"
+            entry = defer_idea(idea, PLAYBOOK_STAGE, e, PIPELINE_VERSION)
+            print(f"   ⏸️  DEFERRED - {e} (attempt {entry['attempts']})")
+            emit_progress("deferred", idea, PLAYBOOK_STAGE, reason=str(e))
+            continue
 
+        idea["validation_playbook"] = playbook
+        idea["status"] = "FINALIST"
+        stamp(idea, PLAYBOOK_STAGE, STAGE_FINGERPRINTS.get(PLAYBOOK_STAGE))
+        written.append(idea)
+
+        # Write finalist report
+        prefix = f"FINALIST_{profile_name}_" if profile_name else "FINALIST_"
+        filename = f"{prefix}{idea['id']}_{idea['business'][:30].replace(' ', '_').replace('/', '_')}.txt"
+        with open(filename, 'w') as f:
+            f.write(f"{'='*80}\n")
+            f.write(f"🏆 FINALIST IDEA #{idea['id']}\n")
+            f.write(f"{'='*80}\n\n")
+            f.write(f"BUSINESS: {idea['business']}\n\n")
+            f.write(f"PAIN POINT: {idea['pain']}\n\n")
+            if profile_name:
+                f.write(f"FOUNDER PROFILE: {profile_name}\n\n")
+            f.write(f"ROI STATEMENT: {idea.get('roi_statement', 'N/A')}\n\n")
+            f.write(f"ANNUAL COST: ${idea.get('current_annual_cost', 0):,}\n")
+            f.write(f"TIME WASTE: {idea.get('time_waste_description', 'Unknown')}\n")
+            f.write(f"FREQUENCY: {idea.get('frequency', 'Unknown')}\n\n")
+            f.write(f"{'='*80}\n")
+            f.write(f"VALIDATION PLAYBOOK\n")
+            f.write(f"{'='*80}\n\n")
+            f.write(playbook["playbook"])
+
+        print(f"   ✅ Generated: {filename}")
+        emit_progress("finalist", idea, PLAYBOOK_STAGE, report=filename, profile=profile_name)
+
+    save_ideas_bank(ideas_bank)
+    return written
+
+def load_resume_entries(ideas_bank: List[Dict], founder_profile: Dict) -> Dict[int, List[Dict]]:
+    """Deferred ideas grouped by the stage index they resume at"""
+    stage_index = {name: i for i, (name, _, _) in enumerate(build_stages(founder_profile))}
+    stage_index[PLAYBOOK_STAGE] = len(stage_index)
+    bank_by_hash = {idea.get("hash"): idea for idea in ideas_bank}
+
+    # Deferred too often: a terminal status instead of a deferred_* one nobody resumes
+    retired = retire_exhausted(PIPELINE_VERSION)
+    for entry in retired:
+        idea = bank_by_hash.get(entry["hash"])
+        if idea is None:
+            continue
+        for cell in idea.get("founder_fit", {}).values():
+            if cell.get("verdict") == "DEFERRED":
+                cell["verdict"] = "FAILED"
+        if idea.get("status", "").startswith("deferred"):
+            idea["status"] = f"failed_{stage_key(entry['stage'])}"
+            idea["fail_reason"] = entry["error"]
+    if retired:
+        save_ideas_bank(ideas_bank)
+
+    entries = {}
+    for entry in pending_deferred(PIPELINE_VERSION):
+        # Prefer the bank's copy so results land in the bank; fall back to the queued snapshot
+        idea = bank_by_hash.get(entry["hash"])
+        if idea is None:
+            idea = entry["idea"]
+            ideas_bank.append(idea)
+        # Per-profile Stage 6 deferrals are queued as "Stage 6: Founder [profile]"
+        stage_name = entry["stage"].split(" [")[0]
+        entries.setdefault(stage_index.get(stage_name, 0), []).append(idea)
+        print(f"   ↩️  Idea #{idea['id']} resumes at {entry['stage']} (deferred {entry['attempts']}x: {entry['error'][:60]})")
+    return entries
+
+def load_recompute_entries(ideas_bank: List[Dict], founder_profile: Dict) -> Dict[int, List[Dict]]:
+    """
+    Ideas with a stale or unstamped stage result, grouped by the first stale
+    stage index. That stage and everything downstream is dropped and re-run;
+    valid upstream results are kept.
+    """
+    fingerprints = stage_fingerprints(founder_profile)
+    stages = fingerprinted_stages()
+
+    entries = {}
+    for idea in ideas_bank:
+        if idea.get("status", "").startswith("deferred"):
+            continue  # --resume-deferred owns these
+        index = first_stale_stage(idea, stages, fingerprints)
+        if index is None:
+            continue
+        stage_name = stages[index][0]
+        invalidate_from(idea, stages, index)
+        idea["status"] = f"recompute_{stage_key(stage_name)}"
+        entries.setdefault(index, []).append(idea)
+
+    for index in sorted(entries):
+        print(f"   ♻️  {len(entries[index])} idea(s) recompute from {stages[index][0]}")
+    return entries
+
+def generate_new_ideas(ideas_bank: List[Dict], target_count: int, run_id: str,
+                       sources: Optional[List] = None) -> List[Dict]:
+    """STAGE 0A-0D plus duplicate filter; new ideas are added to ideas_bank (`sources` skips 0A)"""
     # STAGE 0A-META: Discover sources
-    sources = stage0a_meta_source_discovery()
+    if sources is None:
+        sources = stage0a_meta_source_discovery()
 
     # STAGE 0B-DEEP: Mine quantified pains
     quantified_pains = stage0b_deep_pain_mining(sources)
@@ -1148,8 +1635,13 @@ def main():
 
     # STAGE 0D: Generate ideas
     new_ideas = stage0d_idea_generation(pain_clusters, target_count)
+    ideas_to_process = add_new_ideas(ideas_bank, new_ideas, run_id)
+
+    print(f"\n✅ Generated {len(ideas_to_process)} new ideas (filtered duplicates)")
+    return ideas_to_process
 
-    # Assign IDs and filter duplicates
+def add_new_ideas(ideas_bank: List[Dict], new_ideas: List[Dict], run_id: str) -> List[Dict]:
+    """Assign IDs and filter duplicates; returns the ideas added to ideas_bank"""
     ideas_to_process = []
     next_id = len(ideas_bank) + 1
 
@@ -1164,111 +1656,155 @@ def main():
             ideas_bank.append(idea)
             next_id += 1
 
-    print(f"\n✅ Generated {len(ideas_to_process)} new ideas (filtered duplicates)")
-
-    if len(ideas_to_process) == 0:
-        print("\n⚠️  No new ideas to process. All were duplicates.")
-        return
-
-    # STAGE 1: White Space
-    survivors, killed = run_stage_batch(
-        ideas_to_process,
-        stage1_white_space,
-        "Stage 1: White Space"
-    )
-    ideas_bank.extend(killed)
-    save_ideas_bank(ideas_bank)
-
-    if not survivors:
-        print("\n⚠️  No ideas passed Stage 1. All hit dominant players or high switching costs.")
-        return
-
-    # STAGE 2: Economic Proof
-    survivors, killed = run_stage_batch(
-        survivors,
-        stage2_economic_proof,
-        "Stage 2: Evidence"
-    )
-    ideas_bank.extend(killed)
-    save_ideas_bank(ideas_bank)
-
-    if not survivors:
-        print("\n⚠️  No ideas passed Stage 2. Economic proof too weak.")
-        return
-
-    # STAGE 3: Buildability
-    survivors, killed = run_stage_batch(
-        survivors,
-        stage3_build_feasibility,
-        "Stage 3: Build"
-    )
-    ideas_bank.extend(killed)
-    save_ideas_bank(ideas_bank)
+    return ideas_to_process
+
+def run_entries(ideas_bank: List[Dict], entries: Dict[int, List[Dict]], founder_profile: Dict, run_id: str,
+                batch_size: int = 0, workers: int = 1, budget_usd: float = 0.0, deadline_min: float = 0.0,
+                profiles: Optional[Dict[str, Dict]] = None, resumed: Optional[List[Dict]] = None) -> List[Dict]:
+    """Stages 1-7 for `entries` plus the post-run bookkeeping (CLI and pipeline_daemon.py); returns finalists"""
+    spend_before = spend_stats()
+    reset_stage_counts()
+    candidates = []
+    if profiles:
+        if budget_usd or deadline_min:
+            print("\n⚠️  --budget-usd/--deadline-min are ignored with --profiles")
+        candidates = run_funnel(ideas_bank, entries, founder_profile, batch_size, workers,
+                                stop_before=FOUNDER_STAGE_INDEX)
+        by_profile = run_profile_fanout(ideas_bank, candidates, profiles, batch_size, workers,
+                                        resumed) if candidates else {}
+        finalists = []
+    elif budget_usd or deadline_min:
+        if batch_size:
+            print("\n⚠️  --batch-size is ignored with --budget-usd/--deadline-min (ideas run one step at a time by priority)")
+        finalists = run_prioritized(ideas_bank, entries, founder_profile, workers, budget_usd, deadline_min)
+    else:
+        finalists = run_funnel(ideas_bank, entries, founder_profile, batch_size, workers)
+    save_concurrency_state()
+    append_cost_ledger(run_id, {scope: usd - spend_before.get(scope, 0.0) for scope, usd in spend_stats().items()})
+    survivors = write_finalist_reports(finalists, ideas_bank) if finalists else []
+    if candidates:
+        for name, profile_finalists in by_profile.items():
+            written = write_finalist_reports(profile_finalists, ideas_bank, name) if profile_finalists else []
+            survivors += [idea for idea in written if idea not in survivors]
+        write_profile_matrix(candidates, profiles, run_id)
+
+    # Resumed ideas that reached a verdict leave the queue
+    resolve_deferred([i["hash"] for i in resumed or []
+                      if not i.get("status", "").startswith("deferred") and not fanout_deferred(i, profiles)],
+                     PIPELINE_VERSION)
+    update_predictor(ideas_bank)
+    sync_signals(ideas_bank)
+    return survivors
 
-    if not survivors:
-        print("\n⚠️  No ideas passed Stage 3. All too complex to build.")
-        return
-
-    # STAGE 4: Cost Analysis
-    survivors, killed = run_stage_batch(
-        survivors,
-        stage4_cost_analysis,
-        "Stage 4: Cost"
-    )
-    ideas_bank.extend(killed)
-    save_ideas_bank(ideas_bank)
+# ═══════════════════════════════════════════════════════════
+# MAIN ORCHESTRATOR
+# ═══════════════════════════════════════════════════════════
 
-    # STAGE 5: GTM
-    survivors, killed = run_stage_batch(
-        survivors,
-        stage5_gtm_validation,
-        "Stage 5: GTM"
-    )
-    ideas_bank.extend(killed)
-    save_ideas_bank(ideas_bank)
+def main():
+    parser = argparse.ArgumentParser(description="Ultimate Winner Machine v6.0")
+    parser.add_argument("--count", type=int, default=10, help="Number of ideas to generate")
+    parser.add_argument("--resume-deferred", action="store_true",
+                        help="Skip Stage 0 and resume ideas deferred by API errors")
+    parser.add_argument("--recompute", action="store_true",
+                        help="Skip Stage 0 and re-run only stage results whose prompts, models or thresholds changed")
+    parser.add_argument("--batch-size", type=int, default=0,
+                        help="Evaluate Stages 3 and 6 this many ideas per LLM call (0 = one call per idea)")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Ideas processed concurrently per stage (identical in-flight API calls are shared)")
+    parser.add_argument("--min-yield", type=float, default=0.0,
+                        help="Skip new ideas whose predicted finalist yield is below this (e.g. 0.02; 0 = rank only)")
+    parser.add_argument("--budget-usd", type=float, default=0.0,
+                        help="Stop starting Stage 1-6 work past this spend; best value per dollar goes first")
+    parser.add_argument("--deadline-min", type=float, default=0.0,
+                        help="Stop starting Stage 1-6 work after this many minutes; best value per dollar goes first")
+    parser.add_argument("--profiles", type=str,
+                        help="Comma-separated founder profile files: Stages 1-5 once, Stage 6 + 7 per profile")
+    parser.add_argument("--daemon", type=str, nargs="?", const="http://127.0.0.1:8765",
+                        help="Hand the run to a warm pipeline_daemon.py at this URL and stream its progress")
+    args = parser.parse_args()
 
-    # STAGE 6: Founder Fit
-    founder_profile = load_founder_profile()
-    survivors, killed = run_stage_batch(
-        survivors,
-        lambda idea: stage6_founder_fit(idea, founder_profile),
-        "Stage 6: Founder"
-    )
-    ideas_bank.extend(killed)
-    save_ideas_bank(ideas_bank)
+    if args.daemon:
+        from pipeline_daemon import submit_and_stream
+        job_type = "resume" if args.resume_deferred else "recompute" if args.recompute else "mine"
+        spec = {"type": job_type, "count": args.count, "batch_size": args.batch_size, "workers": args.workers,
+                "min_yield": args.min_yield, "budget_usd": args.budget_usd, "deadline_min": args.deadline_min}
+        if args.profiles:
+            spec["profiles"] = [os.path.abspath(p.strip()) for p in args.profiles.split(",") if p.strip()]
+        job = submit_and_stream(args.daemon, spec)
+        sys.exit(0 if job.get("status") == "done" else 1)
 
-    # STAGE 7: Validation Playbooks
-    if survivors:
-        print(f"\n{'='*80}")
-        print(f"STAGE 7: VALIDATION PLAYBOOK GENERATION")
-        print(f"{'='*80}\n")
+    target_count = args.count
+    run_id = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
 
-        for idea in survivors:
-            playbook = stage7_validation_playbook(idea)
-            idea["validation_playbook"] = playbook
-            idea["status"] = "FINALIST"
-
-            # Write finalist report
-            filename = f"FINALIST_{idea['id']}_{idea['business'][:30].replace(' ', '_').replace('/', '_')}.txt"
-            with open(filename, 'w') as f:
-                f.write(f"{'='*80}\n")
-                f.write(f"🏆 FINALIST IDEA #{idea['id']}\n")
-                f.write(f"{'='*80}\n\n")
-                f.write(f"BUSINESS: {idea['business']}\n\n")
-                f.write(f"PAIN POINT: {idea['pain']}\n\n")
-                f.write(f"ROI STATEMENT: {idea.get('roi_statement', 'N/A')}\n\n")
-                f.write(f"ANNUAL COST: ${idea.get('current_annual_cost', 0):,}\n")
-                f.write(f"TIME WASTE: {idea.get('time_waste_description', 'Unknown')}\n")
-                f.write(f"FREQUENCY: {idea.get('frequency', 'Unknown')}\n\n")
-                f.write(f"{'='*80}\n")
-                f.write(f"VALIDATION PLAYBOOK\n")
-                f.write(f"{'='*80}\n\n")
-                f.write(playbook)
-
-            print(f"   ✅ Generated: {filename}")
+    print("="*80)
+    print("🏆 ULTIMATE WINNER MACHINE v6.0 - THE SELF-IMPROVING ROI HUNTER")
+    print("="*80)
+    print(f"Run ID: {run_id}")
+    print(f"Target ideas: {target_count}")
+    print()
+    print("Philosophy: Mine quantified pain points → Generate ROI-justified ideas →")
+    print("           Filter through 7 stages → Find 8-10 validated candidates")
+    print("="*80)
 
+    # Load existing ideas
+    ideas_bank = load_ideas_bank()
+    print(f"\nExisting ideas in bank: {len(ideas_bank)}")
+    profiles = load_profiles(args.profiles) if args.profiles else {}
+    founder_profile = next(iter(profiles.values())) if profiles else load_founder_profile()
+    if profiles:
+        print(f"Founder profiles: {', '.join(profiles)}")
+
+    if args.resume_deferred:
+        print(f"\n⏩ Resuming deferred ideas (skipping Stage 0)")
+        entries = load_resume_entries(ideas_bank, founder_profile)
+        if not entries:
+            print("\n✅ No deferred ideas to resume.")
+            return
+        resumed = [idea for batch in entries.values() for idea in batch]
+    elif args.recompute:
+        print(f"\n♻️  Recomputing stale stage results (skipping Stage 0)")
+        entries = load_recompute_entries(ideas_bank, founder_profile)
+        if not entries:
+            print("\n✅ Every stored stage result matches the current prompts and thresholds.")
+            return
+        save_ideas_bank(ideas_bank)
+        resumed = []
+    else:
+        ideas_to_process = generate_new_ideas(ideas_bank, target_count, run_id)
+        if not ideas_to_process:
+            print("\n⚠️  No new ideas to process. All were duplicates.")
+            return
+        ideas_to_process, _ = screen_ideas(ideas_to_process, args.min_yield)
         save_ideas_bank(ideas_bank)
+        entries = {0: ideas_to_process}
+        resumed = []
+
+    survivors = run_entries(ideas_bank, entries, founder_profile, run_id, args.batch_size, args.workers,
+                            args.budget_usd, args.deadline_min, profiles, resumed)
+
+    dedup_lines = dedup_summary_lines()
+    if dedup_lines:
+        print(f"\n🔁 API calls per stage (identical in-flight requests coalesced):")
+        for line in dedup_lines:
+            print(f"   {line}")
+
+    concurrency_lines = concurrency_summary_lines()
+    if concurrency_lines:
+        print(f"\n🚦 Adaptive concurrency per provider/model (saved for the next run):")
+        for line in concurrency_lines:
+            print(f"   {line}")
+
+    spend = spend_stats()
+    if spend:
+        print(f"\n💵 Estimated API spend: ${sum(spend.values()):.2f}")
+        for scope, usd in spend.items():
+            print(f"   {scope}: ${usd:.2f}")
+
+    deferred_count = len(pending_deferred(PIPELINE_VERSION))
+    if deferred_count:
+        print(f"\n⏸️  {deferred_count} idea(s) waiting in the deferred queue - rerun with --resume-deferred")
 
+    if survivors:
         print(f"\n{'='*80}")
         print(f"🎉 SUCCESS! Found {len(survivors)} FINALISTS")
         print(f"{'='*80}\n")
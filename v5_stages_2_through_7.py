@@ -7,10 +7,33 @@ import time
 import json
 from typing import Dict, List
 
+from provider_client import TransientAPIError
+from signals_store import STAGE2_THRESHOLDS
+
 # Import from main file will provide these
 # call_openai, call_perplexity, web_search, load_founder_profile
+# Stages 2-6 are coroutines: the call_*_fn arguments must be async functions
+
+def as_async(fn):
+    """Wrap a blocking call_* function so it can be passed to the async stages (see run_sync)"""
+    async def call(*args, **kwargs):
+        return fn(*args, **kwargs)
+    return call
+
+def run_sync(coro):
+    """
+    Run a stage coroutine whose call_*_fn are as_async-wrapped blocking calls.
+    Those awaits never suspend, so the coroutine is stepped to completion
+    directly - no event loop is started, and none is blocked.
+    """
+    try:
+        coro.send(None)
+    except StopIteration as done:
+        return done.value
+    coro.close()
+    raise RuntimeError("run_sync: the stage suspended on real async I/O - run it on an event loop instead")
 
-def perplexity_to_json(perplexity_response: str, expected_schema: Dict, call_openai_fn) -> Dict:
+async def perplexity_to_json(perplexity_response: str, expected_schema: Dict, call_openai_fn) -> Dict:
     """
     Convert Perplexity's conversational response into structured JSON
     Uses GPT-4o-mini to extract and structure the data
@@ -27,7 +50,7 @@ Extract relevant information and return ONLY valid JSON matching the schema.
 If data is missing, use reasonable defaults (0 for numbers, [] for arrays).
 Return ONLY the JSON, no other text."""
 
-    response = call_openai_fn(prompt, model="gpt-5-mini", response_format="json")
+    response = await call_openai_fn(prompt, model="gpt-5-mini", response_format="json")
     try:
         return json.loads(response)
     except:
@@ -37,7 +60,7 @@ Return ONLY the JSON, no other text."""
 # STAGE 2: MULTI-SIGNAL EVIDENCE + MARKET SIZE
 # ═══════════════════════════════════════════════════════════
 
-def stage2_evidence_engine(idea: Dict, call_perplexity_fn, web_search_fn, call_openai_fn) -> Dict:
+async def stage2_evidence_engine(idea: Dict, call_perplexity_fn, web_search_fn, call_openai_fn) -> Dict:
     """
     7 evidence signals + market size estimation
     Returns score and decision
@@ -75,9 +98,9 @@ Scoring:
 - <10: 0 points
 """
 
-    sv_response = call_perplexity_fn(prompt_sv)
+    sv_response = await call_perplexity_fn(prompt_sv)
     schema = {"total_monthly_searches": 0, "trend": "unknown", "score": 0}
-    sv_data = perplexity_to_json(sv_response, schema, call_openai_fn) if sv_response else schema
+    sv_data = await perplexity_to_json(sv_response, schema, call_openai_fn) if sv_response else schema
 
     sv_score = sv_data.get("score", 0)
     total_score += sv_score
@@ -112,9 +135,9 @@ Scoring:
 - 10-50: 1 point
 """
 
-    diy_response = call_perplexity_fn(prompt_diy)
+    diy_response = await call_perplexity_fn(prompt_diy)
     schema = {"monthly_diy_searches": 0, "top_results": [], "score": 0}
-    diy_data = perplexity_to_json(diy_response, schema, call_openai_fn) if diy_response else schema
+    diy_data = await perplexity_to_json(diy_response, schema, call_openai_fn) if diy_response else schema
 
     diy_score = diy_data.get("score", 0)
     total_score += diy_score
@@ -146,9 +169,9 @@ Scoring:
 - 3-10: 2 points
 """
 
-    jobs_response = call_perplexity_fn(prompt_jobs)
+    jobs_response = await call_perplexity_fn(prompt_jobs)
     schema = {"pain_mentions": 0, "sample_jobs": [], "score": 0}
-    jobs_data = perplexity_to_json(jobs_response, schema, call_openai_fn) if jobs_response else schema
+    jobs_data = await perplexity_to_json(jobs_response, schema, call_openai_fn) if jobs_response else schema
 
     jobs_score = jobs_data.get("score", 0)
     total_score += jobs_score
@@ -179,9 +202,9 @@ Scoring:
 - 1-2 tools: 1 point
 """
 
-    gaps_response = call_perplexity_fn(prompt_gaps)
+    gaps_response = await call_perplexity_fn(prompt_gaps)
     schema = {"tools_found": [], "reviews_mentioning_gap": 0, "sample_complaints": [], "score": 0}
-    gaps_data = perplexity_to_json(gaps_response, schema, call_openai_fn) if gaps_response else schema
+    gaps_data = await perplexity_to_json(gaps_response, schema, call_openai_fn) if gaps_response else schema
 
     gaps_score = gaps_data.get("score", 0)
     total_score += gaps_score
@@ -216,9 +239,9 @@ Scoring:
 - 1-2: 1 point
 """
 
-    forums_response = call_perplexity_fn(prompt_forums)
+    forums_response = await call_perplexity_fn(prompt_forums)
     schema = {"threads_found": 0, "sample_threads": [], "score": 0}
-    forums_data = perplexity_to_json(forums_response, schema, call_openai_fn) if forums_response else schema
+    forums_data = await perplexity_to_json(forums_response, schema, call_openai_fn) if forums_response else schema
 
     forums_score = forums_data.get("score", 0)
     total_score += forums_score
@@ -248,9 +271,9 @@ Scoring:
 - 2-5: 1 point
 """
 
-    web_response = call_perplexity_fn(prompt_web)
+    web_response = await call_perplexity_fn(prompt_web)
     schema = {"sources_found": 0, "sample_sources": [], "score": 0}
-    web_data = perplexity_to_json(web_response, schema, call_openai_fn) if web_response else schema
+    web_data = await perplexity_to_json(web_response, schema, call_openai_fn) if web_response else schema
 
     web_score = web_data.get("score", 0)
     total_score += web_score
@@ -285,9 +308,9 @@ Scoring:
 - Single mention: 1 point
 """
 
-    cost_response = call_perplexity_fn(prompt_cost)
+    cost_response = await call_perplexity_fn(prompt_cost)
     schema = {"cost_estimates": [], "sources": [], "has_third_party_validation": False, "score": 0}
-    cost_data = perplexity_to_json(cost_response, schema, call_openai_fn) if cost_response else schema
+    cost_data = await perplexity_to_json(cost_response, schema, call_openai_fn) if cost_response else schema
 
     cost_score = cost_data.get("score", 0)
     total_score += cost_score
@@ -322,9 +345,9 @@ Scoring:
 - TAM < $1M: 0 points (too small)
 """
 
-    market_response = call_perplexity_fn(prompt_market)
+    market_response = await call_perplexity_fn(prompt_market)
     schema = {"total_businesses": 0, "addressable_percent": 0, "addressable_market": 0, "tam_estimate": "Unknown", "score": 0}
-    market_data = perplexity_to_json(market_response, schema, call_openai_fn) if market_response else schema
+    market_data = await perplexity_to_json(market_response, schema, call_openai_fn) if market_response else schema
 
     market_score = market_data.get("score", 0)
     # Market size is pass/fail, not added to score
@@ -338,16 +361,18 @@ Scoring:
     print(f"      Market Size Score: {market_score}/5")
 
     # Pass criteria: score >= 12 AND signals >= 3 AND market_size >= 3 ($10M+ TAM)
-    if total_score >= 12 and signals_triggered >= 3 and market_score >= 3:
+    # (STAGE2_THRESHOLDS in signals_store.py; rescore.py re-applies them offline)
+    t = STAGE2_THRESHOLDS["v5.0"]
+    if total_score >= t["min_total"] and signals_triggered >= t["min_signals"] and market_score >= t["min_market_score"]:
         print(f"\n✅ PASS - Strong multi-signal evidence + viable market size")
         return {"verdict": "PASS", "score": total_score, "signals": signals_triggered, "evidence": evidence}
     else:
         reasons = []
-        if total_score < 12:
+        if total_score < t["min_total"]:
             reasons.append(f"score too low ({total_score}/33)")
-        if signals_triggered < 3:
+        if signals_triggered < t["min_signals"]:
             reasons.append(f"too few signals ({signals_triggered}/7)")
-        if market_score < 3:
+        if market_score < t["min_market_score"]:
             reasons.append(f"market too small")
 
         print(f"\n❌ KILL - {', '.join(reasons)}")
@@ -358,42 +383,8 @@ Scoring:
 # STAGE 3: BUILD FEASIBILITY (DIGITAL-ONLY)
 # ═══════════════════════════════════════════════════════════
 
-def stage3_build_feasibility(idea: Dict, call_openai_fn) -> Dict:
-    """Enhanced build check with digital-only filter"""
-    print(f"\n{'─'*60}")
-    print(f"STAGE 3: BUILD FEASIBILITY (DIGITAL-ONLY) - Idea #{idea['id']}")
-    print(f"{'─'*60}")
-
-    # For v6.0 ideas: Trust Stage 0D's digital-only filtering
-    if idea.get("buildable_3_months") is not None:
-        # This is a v6.0 idea that already passed digital-only checks in Stage 0D
-        if (idea.get("buildable_3_months") and
-            idea.get("no_hardware_required") and
-            idea.get("no_certifications_required") and
-            idea.get("solo_founder_feasible") and
-            idea.get("public_apis_only")):
-            print(f"\n✅ PASS - v6.0 idea already validated in Stage 0D (digital-only, solo-buildable)")
-            return {
-                "passed": True,
-                "reason": "",
-                "verdict": "PASS",
-                "analysis": {
-                    "digital_only": True,
-                    "public_api_feasible": True,
-                    "solo_buildable": True,
-                    "no_certifications": True,
-                    "decision": "PASS",
-                    "reasoning": "Pre-validated in Stage 0D with strict digital-only filters"
-                }
-            }
-
-    # For v5.0 ideas or v6.0 ideas that need re-validation: Full check
-    prompt = f"""Analyze build feasibility for:
-
-Business: {idea['business']}
-Pain: {idea['pain']}
-
-CRITICAL REQUIREMENTS (must pass ALL):
+# Shared between the single-idea prompt and batched_stages.py
+STAGE3_CRITERIA = """CRITICAL REQUIREMENTS (must pass ALL):
 
 ✅ DIGITAL-ONLY CHECK:
 Can this be 100% delivered as web/mobile software?
@@ -438,11 +429,9 @@ Can ONE technical founder build MVP in 3 months?
 Can launch MVP without:
 - Professional licenses
 - Industry certifications (ISO, SOC 2, HIPAA) for MVP
-- Special permits
+- Special permits"""
 
-Return JSON:
-{{
-  "digital_only": true/false,
+STAGE3_FIELDS = """  "digital_only": true/false,
   "digital_reasoning": "...",
   "public_api_feasible": true/false,
   "apis_needed": ["Stripe", "Twilio", "..."],
@@ -452,39 +441,89 @@ Return JSON:
   "certification_blockers": [],
   "decision": "PASS"/"KILL",
   "reasoning": "..."
-}}
 """
 
-    response = call_openai_fn(prompt, model="gpt-5-mini", response_format="json")
-    if not response:
-        return {"verdict": "KILL", "reason": "API Error"}
+def stage3_prevalidated(idea: Dict) -> Dict:
+    """v6.0 ideas that passed Stage 0D's digital-only filters skip the LLM call (None otherwise)"""
+    if idea.get("buildable_3_months") is not None:
+        # This is a v6.0 idea that already passed digital-only checks in Stage 0D
+        if (idea.get("buildable_3_months") and
+            idea.get("no_hardware_required") and
+            idea.get("no_certifications_required") and
+            idea.get("solo_founder_feasible") and
+            idea.get("public_apis_only")):
+            print(f"\n✅ PASS - v6.0 idea already validated in Stage 0D (digital-only, solo-buildable)")
+            return {
+                "passed": True,
+                "reason": "",
+                "verdict": "PASS",
+                "analysis": {
+                    "digital_only": True,
+                    "public_api_feasible": True,
+                    "solo_buildable": True,
+                    "no_certifications": True,
+                    "decision": "PASS",
+                    "reasoning": "Pre-validated in Stage 0D with strict digital-only filters"
+                }
+            }
+    return None
+
+def evaluate_stage3(data: Dict) -> Dict:
+    """Stage 3 verdict from the model's JSON"""
+    all_checks_pass = (
+        data.get("digital_only") and
+        data.get("public_api_feasible") and
+        data.get("solo_buildable") and
+        data.get("no_certifications")
+    )
+
+    if all_checks_pass and data.get("decision") == "PASS":
+        print(f"\n✅ PASS - Digital-only, solo-buildable, no certs required")
+        return {"verdict": "PASS", "analysis": data}
+    else:
+        failed = []
+        if not data.get("digital_only"):
+            failed.append("requires hardware/physical")
+        if not data.get("public_api_feasible"):
+            failed.append("needs enterprise APIs")
+        if not data.get("solo_buildable"):
+            failed.append("too complex for solo")
+        if not data.get("no_certifications"):
+            failed.append("requires certifications")
+
+        print(f"\n❌ KILL - {', '.join(failed)}")
+        return {"verdict": "KILL", "analysis": data}
+
+async def stage3_build_feasibility(idea: Dict, call_openai_fn) -> Dict:
+    """Enhanced build check with digital-only filter"""
+    print(f"\n{'─'*60}")
+    print(f"STAGE 3: BUILD FEASIBILITY (DIGITAL-ONLY) - Idea #{idea['id']}")
+    print(f"{'─'*60}")
 
-    try:
-        data = json.loads(response)
+    # For v6.0 ideas: Trust Stage 0D's digital-only filtering
+    prevalidated = stage3_prevalidated(idea)
+    if prevalidated:
+        return prevalidated
 
-        all_checks_pass = (
-            data.get("digital_only") and
-            data.get("public_api_feasible") and
-            data.get("solo_buildable") and
-            data.get("no_certifications")
-        )
+    # For v5.0 ideas or v6.0 ideas that need re-validation: Full check
+    prompt = f"""Analyze build feasibility for:
 
-        if all_checks_pass and data.get("decision") == "PASS":
-            print(f"\n✅ PASS - Digital-only, solo-buildable, no certs required")
-            return {"verdict": "PASS", "analysis": data}
-        else:
-            failed = []
-            if not data.get("digital_only"):
-                failed.append("requires hardware/physical")
-            if not data.get("public_api_feasible"):
-                failed.append("needs enterprise APIs")
-            if not data.get("solo_buildable"):
-                failed.append("too complex for solo")
-            if not data.get("no_certifications"):
-                failed.append("requires certifications")
-
-            print(f"\n❌ KILL - {', '.join(failed)}")
-            return {"verdict": "KILL", "analysis": data}
+Business: {idea['business']}
+Pain: {idea['pain']}
+
+{STAGE3_CRITERIA}
+
+Return JSON:
+{{
+{STAGE3_FIELDS}}}
+"""
+
+    response = await call_openai_fn(prompt, model="gpt-5-mini", response_format="json")
+    if not response:
+        raise TransientAPIError("openai", "Empty response")
+
+    try:
+        return evaluate_stage3(json.loads(response))
     except json.JSONDecodeError:
         return {"verdict": "KILL", "reason": "Parse error"}
 
@@ -495,7 +534,7 @@ Return JSON:
 # STAGE 4: COST CALCULATOR
 # ═══════════════════════════════════════════════════════════
 
-def stage4_cost_calculator(idea: Dict, call_perplexity_fn, call_openai_fn) -> Dict:
+async def stage4_cost_calculator(idea: Dict, call_perplexity_fn, call_openai_fn) -> Dict:
     """Calculate problem cost with real sources"""
     print(f"\n{'─'*60}")
     print(f"STAGE 4: COST CALCULATOR - Idea #{idea['id']}")
@@ -517,7 +556,7 @@ Return specific dollar amounts and sources.
 """
 
     print(f"\n   🔍 Searching for cost evidence...")
-    cost_evidence = call_perplexity_fn(prompt_search)
+    cost_evidence = await call_perplexity_fn(prompt_search)
 
     # Calculate costs
     prompt_calc = f"""Calculate annual cost of this problem:
@@ -559,9 +598,9 @@ PASS if: total_annual_cost >= $10,000 with citable sources
 KILL if: total_annual_cost < $10,000 OR no evidence
 """
 
-    response = call_openai_fn(prompt_calc, model="gpt-5-mini", response_format="json")
+    response = await call_openai_fn(prompt_calc, model="gpt-5-mini", response_format="json")
     if not response:
-        return {"verdict": "KILL", "reason": "API Error"}
+        raise TransientAPIError("openai", "Empty response")
 
     try:
         data = json.loads(response)
@@ -581,7 +620,7 @@ KILL if: total_annual_cost < $10,000 OR no evidence
 # STAGE 5: GTM FIT (DISTRIBUTION CHANNELS)
 # ═══════════════════════════════════════════════════════════
 
-def stage5_gtm_fit(idea: Dict, call_openai_fn) -> Dict:
+async def stage5_gtm_fit(idea: Dict, call_openai_fn) -> Dict:
     """Check if customers can be acquired digitally"""
     print(f"\n{'─'*60}")
     print(f"STAGE 5: GTM FIT (DISTRIBUTION) - Idea #{idea['id']}")
@@ -642,9 +681,9 @@ Return JSON:
 PASS if: 2+ viable channels AND CAC < $500 AND time < 90 days
 """
 
-    response = call_openai_fn(prompt, model="gpt-5-mini", response_format="json")
+    response = await call_openai_fn(prompt, model="gpt-5-mini", response_format="json")
     if not response:
-        return {"verdict": "KILL", "reason": "API Error"}
+        raise TransientAPIError("openai", "Empty response")
 
     try:
         data = json.loads(response)
@@ -674,29 +713,8 @@ PASS if: 2+ viable channels AND CAC < $500 AND time < 90 days
 # STAGE 6: FOUNDER FIT (AUTHENTICITY)
 # ═══════════════════════════════════════════════════════════
 
-def stage6_founder_fit(idea: Dict, founder_profile: Dict, call_openai_fn) -> Dict:
-    """Check founder-market fit and authenticity"""
-    print(f"\n{'─'*60}")
-    print(f"STAGE 6: FOUNDER FIT (AUTHENTICITY) - Idea #{idea['id']}")
-    print(f"{'─'*60}")
-
-    prompt = f"""Founder-market fit analysis:
-
-IDEA:
-Business: {idea['business']}
-Pain: {idea['pain']}
-
-FOUNDER PROFILE:
-Background: {founder_profile.get('background', 'Unknown')}
-Skills: {', '.join(founder_profile.get('skills', []))}
-Interests: {', '.join(founder_profile.get('interests', []))}
-Network: {', '.join(founder_profile.get('network', []))}
-Motivation: {', '.join(founder_profile.get('motivation', []))}
-
-HARD CONSTRAINTS (must pass):
-{json.dumps(founder_profile.get('constraints', {}), indent=2)}
-
-ASSESSMENT:
+# Shared between the single-idea prompt and batched_stages.py
+STAGE6_ASSESSMENT = """ASSESSMENT:
 
 1. DOMAIN KNOWLEDGE:
    Does founder have ANY connection to this industry?
@@ -727,11 +745,9 @@ ASSESSMENT:
    Green flags:
    - "Genuinely curious"
    - "Would use this myself"
-   - "Find industry interesting"
+   - "Find industry interesting\""""
 
-Return JSON:
-{{
-  "domain_fit": "HIGH"/"MEDIUM"/"LOW",
+STAGE6_FIELDS = """  "domain_fit": "HIGH"/"MEDIUM"/"LOW",
   "domain_reasoning": "...",
   "content_authenticity": "CAN"/"CANNOT",
   "content_reasoning": "...",
@@ -741,35 +757,72 @@ Return JSON:
   "constraint_issues": [],
   "decision": "PASS"/"KILL",
   "reasoning": "..."
-}}
+"""
 
-PASS if: domain_fit >= MEDIUM AND content_authenticity = CAN AND hard_constraints_pass = true
+STAGE6_RULE = "PASS if: domain_fit >= MEDIUM AND content_authenticity = CAN AND hard_constraints_pass = true"
+
+def founder_profile_block(founder_profile: Dict) -> str:
+    """FOUNDER PROFILE + HARD CONSTRAINTS section of the Stage 6 prompt"""
+    return f"""FOUNDER PROFILE:
+Background: {founder_profile.get('background', 'Unknown')}
+Skills: {', '.join(founder_profile.get('skills', []))}
+Interests: {', '.join(founder_profile.get('interests', []))}
+Network: {', '.join(founder_profile.get('network', []))}
+Motivation: {', '.join(founder_profile.get('motivation', []))}
+
+HARD CONSTRAINTS (must pass):
+{json.dumps(founder_profile.get('constraints', {}), indent=2)}"""
+
+def evaluate_stage6(data: Dict) -> Dict:
+    """Stage 6 verdict from the model's JSON"""
+    domain_ok = data.get("domain_fit") in ["HIGH", "MEDIUM"]
+    can_create_content = data.get("content_authenticity") == "CAN"
+    constraints_ok = data.get("hard_constraints_pass", False)
+
+    if domain_ok and can_create_content and constraints_ok:
+        print(f"\n✅ PASS - {data.get('domain_fit')} domain fit, can create authentic content")
+        return {"verdict": "PASS", "analysis": data}
+    else:
+        reasons = []
+        if not domain_ok:
+            reasons.append(f"weak domain fit ({data.get('domain_fit')})")
+        if not can_create_content:
+            reasons.append("can't create authentic content")
+        if not constraints_ok:
+            reasons.append("violates hard constraints")
+
+        print(f"\n❌ KILL - {', '.join(reasons)}")
+        return {"verdict": "KILL", "analysis": data}
+
+async def stage6_founder_fit(idea: Dict, founder_profile: Dict, call_openai_fn) -> Dict:
+    """Check founder-market fit and authenticity"""
+    print(f"\n{'─'*60}")
+    print(f"STAGE 6: FOUNDER FIT (AUTHENTICITY) - Idea #{idea['id']}")
+    print(f"{'─'*60}")
+
+    prompt = f"""Founder-market fit analysis:
+
+IDEA:
+Business: {idea['business']}
+Pain: {idea['pain']}
+
+{founder_profile_block(founder_profile)}
+
+{STAGE6_ASSESSMENT}
+
+Return JSON:
+{{
+{STAGE6_FIELDS}}}
+
+{STAGE6_RULE}
 """
 
-    response = call_openai_fn(prompt, model="gpt-5-mini", response_format="json")
+    response = await call_openai_fn(prompt, model="gpt-5-mini", response_format="json")
     if not response:
-        return {"verdict": "KILL", "reason": "API Error"}
+        raise TransientAPIError("openai", "Empty response")
 
     try:
-        data = json.loads(response)
-        domain_ok = data.get("domain_fit") in ["HIGH", "MEDIUM"]
-        can_create_content = data.get("content_authenticity") == "CAN"
-        constraints_ok = data.get("hard_constraints_pass", False)
-
-        if domain_ok and can_create_content and constraints_ok:
-            print(f"\n✅ PASS - {data.get('domain_fit')} domain fit, can create authentic content")
-            return {"verdict": "PASS", "analysis": data}
-        else:
-            reasons = []
-            if not domain_ok:
-                reasons.append(f"weak domain fit ({data.get('domain_fit')})")
-            if not can_create_content:
-                reasons.append("can't create authentic content")
-            if not constraints_ok:
-                reasons.append("violates hard constraints")
-
-            print(f"\n❌ KILL - {', '.join(reasons)}")
-            return {"verdict": "KILL", "analysis": data}
+        return evaluate_stage6(json.loads(response))
     except json.JSONDecodeError:
         return {"verdict": "KILL", "reason": "Parse error"}
 
@@ -836,7 +889,7 @@ TASK 1.1: LinkedIn Outreach (2 hours)
 
 TASK 1.2: Forum Research (1 hour)
 □ Join relevant forums:
-  {', '.join(evidence.get('forums', {}).get('sample_threads', [{}])[:2])}
+  {', '.join(t.get('title', '') if isinstance(t, dict) else str(t) for t in evidence.get('forums', {}).get('sample_threads', [])[:2])}
 □ Read discussions about this pain
 □ Reply to 2-3 threads asking: "What tool do you use for this?"
 □ Goal: Confirm they use manual processes/no good solution
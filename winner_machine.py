@@ -11,35 +11,19 @@ Usage:
   python winner_machine.py --resume         # Continue from last checkpoint
 """
 
-import os
-import sys
 import time
 import re
 import argparse
-import gspread
 from datetime import datetime
-from google.oauth2.service_account import Credentials
 from dotenv import load_dotenv
-from openai import OpenAI
 
-load_dotenv()
-
-OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
-GOOGLE_SHEET_NAME = os.getenv("GOOGLE_SHEET_NAME", "Pain Point Research")
+from providers import lazy_client
 
-if not OPENAI_API_KEY:
-    print("❌ No OPENAI_API_KEY in .env")
-    sys.exit(1)
+load_dotenv()
 
-client = OpenAI(api_key=OPENAI_API_KEY)
+client = lazy_client("openai")  # built on first call (providers.py); exits there without OPENAI_API_KEY
 
-SCOPES = [
-    'https://www.googleapis.com/auth/spreadsheets',
-    'https://www.googleapis.com/auth/drive'
-]
-creds = Credentials.from_service_account_file('google-credentials.json', scopes=SCOPES)
-gc = gspread.authorize(creds)
-sheet = gc.open(GOOGLE_SHEET_NAME)
+sheet = lazy_client("google_sheet")  # service-account login + open on first use
 
 # ============================================================================
 # CONFIGURATION